@@ -1,7 +1,12 @@
 import os
 import sys
 import yaml
-import wx
+
+try:
+    import wx
+except ImportError:
+    # Headless use (e.g. service.batch workers), GUI-only settings are not available then
+    wx = None
 
 from logbook import CRITICAL, DEBUG, ERROR, FingersCrossedHandler, INFO, Logger, NestedSetup, NullHandler, \
     StreamHandler, TimedRotatingFileHandler, WARNING
@@ -55,7 +60,7 @@ slotColourMap = {
     FittingSlot.HIGH: wx.Colour(235, 204, 209),  # red    = high slots
     FittingSlot.RIG: '',
     FittingSlot.SUBSYSTEM: ''
-}
+} if wx is not None else {}
 
 def getClientSecret():
     return clientHash
@@ -170,6 +175,10 @@ def defPaths(customSavePath=None):
     # saveddata db location modifier, shouldn't ever need to touch this
     eos.config.saveddata_connectionstring = "sqlite:///" + saveDB + "?check_same_thread=False"
     eos.config.gamedata_connectionstring = "sqlite:///" + gameDB + "?check_same_thread=False"
+    # Memory-mapped gamedata snapshot, if one was generated for the database
+    gameSnapshot = os.path.splitext(gameDB)[0] + ".snapshot"
+    if os.path.isfile(gameSnapshot):
+        eos.config.gamedataSnapshot = gameSnapshot
 
     # initialize the settings
     from service.settings import EOSSettings
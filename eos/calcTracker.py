@@ -0,0 +1,167 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from itertools import chain
+
+from logbook import Logger
+
+pyfalog = Logger(__name__)
+
+
+class CalcTracker(object):
+    """
+    Records which attributes every calculation step of a fit reads and writes.
+
+    A step is a single item.calculateModifiedAttributes() call for one run time, and attributes are referenced
+    as (ModifiedAttributeDict, key) pairs. With this information a fit can figure out which steps have to be
+    re-run after one of its items changed, instead of clearing and recalculating everything.
+    """
+
+    def __init__(self):
+        # Steps in the order they were run for the first time: [(item, runTime), ...]
+        self.steps = []
+        self.__stepKeys = set()
+        # {stepKey: set((id(dict), key))}
+        self.reads = {}
+        self.writes = {}
+        # {stepKey: set((id(handledList), index name))}, None index stands for a plain filter function
+        self.filters = {}
+        # Steps which touched state outside of attribute dicts (cap drains, command bonuses, ...)
+        self.volatile = set()
+        # {id(dict): dict}, keeps the referenced dicts alive and resolvable
+        self.dicts = {}
+        # {id(item): charge}, charges items had when their steps were run
+        self.charges = {}
+        self.current = None
+
+    @staticmethod
+    def getStepKey(item, runTime):
+        return id(item), runTime
+
+    def begin(self, item, runTime):
+        key = self.getStepKey(item, runTime)
+        if key not in self.__stepKeys:
+            self.__stepKeys.add(key)
+            self.steps.append((item, runTime))
+        # Step is (re-)run, forget what it did last time
+        self.reads[key] = set()
+        self.writes[key] = set()
+        self.filters[key] = set()
+        self.volatile.discard(key)
+        self.charges[id(item)] = getattr(item, "charge", None)
+        self.current = key
+
+    def end(self):
+        self.current = None
+
+    def read(self, attrDict, key):
+        if self.current is None:
+            return
+        self.dicts[id(attrDict)] = attrDict
+        self.reads[self.current].add((id(attrDict), key))
+
+    def write(self, attrDict, key):
+        if self.current is None:
+            return
+        self.dicts[id(attrDict)] = attrDict
+        self.writes[self.current].add((id(attrDict), key))
+
+    def filter(self, handledList, index):
+        if self.current is None:
+            return
+        self.filters[self.current].add((id(handledList), index))
+
+    def markVolatile(self):
+        if self.current is not None:
+            self.volatile.add(self.current)
+
+    def getDictRefs(self, attrDicts):
+        """All recorded attribute refs (read or written by any step) which belong to the given dicts"""
+        dictIDs = {id(attrDict) for attrDict in attrDicts}
+        refs = set()
+        for stepRefs in chain(self.reads.values(), self.writes.values()):
+            refs.update(ref for ref in stepRefs if ref[0] in dictIDs)
+        return refs
+
+    def chargeChanged(self, item):
+        """Whether item's charge is different from the one it had when its steps were run"""
+        return self.charges.get(id(item)) is not getattr(item, "charge", None)
+
+    def getFilterSteps(self, handledLists, indexes):
+        """Steps which filtered any of the lists through any of the indexes"""
+        filters = {(id(handledList), index) for handledList in handledLists for index in indexes}
+        return {stepKey for stepKey, stepFilters in self.filters.items() if not filters.isdisjoint(stepFilters)}
+
+    def getItemSteps(self, item):
+        return {self.getStepKey(i, runTime) for i, runTime in self.steps if i is item}
+
+    def getDependentSteps(self, seeds, extraRefs=()):
+        """
+        Starting with the seed steps, collect every step that has to be re-run: steps writing to
+        an invalidated attribute (its accumulated value is rebuilt from scratch), steps reading one,
+        and steps writing something a re-run step reads later in the calculation order (otherwise the
+        re-run step would see a value it never saw during full calculation). Every re-run step
+        invalidates everything it writes, so the set is grown until it stops changing.
+
+        Returns (steps, invalidated attribute refs).
+        """
+        order = {self.getStepKey(item, runTime): i for i, (item, runTime) in enumerate(self.steps)}
+        readers = {}
+        writers = {}
+        for stepKey, refs in self.reads.items():
+            for ref in refs:
+                readers.setdefault(ref, set()).add(stepKey)
+        for stepKey, refs in self.writes.items():
+            for ref in refs:
+                writers.setdefault(ref, set()).add(stepKey)
+
+        steps = set()
+        invalid = set()
+        pendingRefs = set(extraRefs)
+        pendingSteps = set(seeds)
+        while pendingSteps or pendingRefs:
+            steps.update(pendingSteps)
+            for stepKey in pendingSteps:
+                pendingRefs.update(self.writes.get(stepKey, ()))
+            newSteps = set()
+            for stepKey in pendingSteps:
+                for ref in self.reads.get(stepKey, ()):
+                    for writer in writers.get(ref, ()):
+                        if writer not in steps and order[writer] > order[stepKey]:
+                            newSteps.add(writer)
+            pendingRefs.difference_update(invalid)
+            invalid.update(pendingRefs)
+            for ref in pendingRefs:
+                for stepKey in writers.get(ref, ()):
+                    if stepKey not in steps:
+                        newSteps.add(stepKey)
+                for stepKey in readers.get(ref, ()):
+                    if stepKey not in steps:
+                        newSteps.add(stepKey)
+            pendingRefs = set()
+            pendingSteps = newSteps
+
+        return steps, invalid
+
+    def groupRefs(self, refs):
+        """Group attribute refs by the dict they belong to: [(attrDict, set(keys)), ...]"""
+        grouped = {}
+        for dictID, key in refs:
+            grouped.setdefault(dictID, set()).add(key)
+        return [(self.dicts[dictID], keys) for dictID, keys in grouped.items()]
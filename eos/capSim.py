@@ -1,8 +1,15 @@
 import heapq
+import threading
 import time
+from collections import OrderedDict
 from math import sqrt, exp
 from functools import reduce
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 DAY = 24 * 60 * 60 * 1000
 
 
@@ -13,6 +20,57 @@ def lcm(a, b):
     return n / a
 
 
+class CapSimResultCache(object):
+    """
+    Process-wide LRU cache of simulation results, keyed by everything a simulation
+    result depends on: capacitor attributes, sorted modules and simulator settings
+    """
+
+    size = 512
+
+    def __init__(self, size=None):
+        if size is not None:
+            self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.__results = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def getKey(sim):
+        return (sim.capacitorCapacity, sim.capacitorRecharge, tuple(sorted(sim.modules)), sim.reload, sim.stagger,
+                sim.scale, sim.t_max, sim.stability_precision, sim.analytic, sim.analytic_margin)
+
+    def get(self, key):
+        with self.__lock:
+            result = self.__results.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.__results.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        with self.__lock:
+            self.__results[key] = result
+            self.__results.move_to_end(key)
+            while len(self.__results) > self.size:
+                self.__results.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self.__results)
+
+
+resultCache = CapSimResultCache()
+
+
 class CapSimulator(object):
     """Entity's EVE Capacitor Simulator"""
 
@@ -41,6 +99,29 @@ class CapSimulator(object):
         # relevant decimal digits of capacitor for LCM period optimization
         self.stability_precision = 1
 
+        # solve stable setups analytically instead of simulating them?
+        # clip/reload setups and unstable ones are always simulated.
+        self.analytic = False
+
+        # share of peak recharge rate average drain has to stay below of
+        # to be solved analytically
+        self.analytic_margin = 0.1
+
+        # reuse results of identical setups from the process-wide cache?
+        self.cache = False
+
+        # number of (time, cap) samples to record over t_max, 0 to disable.
+        # timelines need numpy and keep simulating past stability.
+        self.timeline_samples = 0
+        self.timeline = None
+
+        # results of the last run: "analytic" or "simulation", simulated
+        # activations, runtime in seconds and whether it came from cache
+        self.solver = None
+        self.cached = False
+        self.iterations = 0
+        self.runtime = 0
+
     def scale_activation(self, duration, capNeed):
         for res in self.scale_resolutions:
             mod = duration % res
@@ -120,8 +201,76 @@ class CapSimulator(object):
 
         start = time.time()
 
+        key = None
+        recordTimeline = self.timeline_samples > 0 and numpy is not None
+        if self.cache and not recordTimeline:
+            key = resultCache.getKey(self)
+            result = resultCache.get(key)
+            if result is not None:
+                (self.solver, self.t, self.iterations, self.cap_stable_eve,
+                 self.cap_stable_low, self.cap_stable_high) = result
+                self.cached = True
+                self.runtime = time.time() - start
+                return
+
+        self.cached = False
         self.reset()
 
+        self.timeline = None
+        if self.analytic and not recordTimeline and self.solve():
+            self.solver = "analytic"
+        else:
+            self.solver = "simulation"
+            self.simulate(recordTimeline)
+
+        if key is not None:
+            resultCache.put(key, (self.solver, self.t, self.iterations, self.cap_stable_eve,
+                                  self.cap_stable_low, self.cap_stable_high))
+
+        self.runtime = time.time() - start
+
+    def solve(self):
+        """
+        Calculate stable capacitor level from average drain of the grouped
+        modules, returns False if the setup has to be simulated instead
+        """
+        state = self.state
+        capCapacity = self.capacitorCapacity
+        tau = self.capacitorRecharge / 5.0
+
+        # cap boosters and reloads make cap level anything but smooth
+        if any(x[4] for x in state) or any(x[1] <= 0 for x in state):
+            return False
+
+        avgDrain = reduce(float.__add__, [x[2] / x[1] for x in state], 0.0)
+        # recharge rate of the simulator's cap formula peaks at C/(2*tau); the
+        # level at which it matches average drain is where cap stabilizes.
+        # close to the peak, activations rather than average drain decide
+        # whether cap holds
+        peakUse = 2.0 * max(avgDrain, 0.0) * tau / capCapacity
+        if peakUse > 1.0 - self.analytic_margin:
+            return False
+        capStable = 0.25 * (1.0 + sqrt(1.0 - peakUse)) ** 2
+
+        # cap oscillates around stable level, dipping lowest when all modules
+        # happen to activate together; last of those activations is the lowest
+        # level cap is at before an activation
+        capNeeds = [x[2] for x in state if x[2] > 0] or [0.0]
+        cap_low = capStable * capCapacity - sum(capNeeds) / 2.0
+        # dips are only estimated, one activation more could run cap dry
+        if cap_low <= max(capNeeds):
+            return False
+
+        self.t = 0
+        self.iterations = 0
+        self.cap_stable_eve = capStable
+        self.cap_stable_low = cap_low
+        self.cap_stable_high = min(cap_low + min(capNeeds), capCapacity)
+        return True
+
+    def simulate(self, recordTimeline=False):
+        """Simulate activations until the setup proves stable or runs dry"""
+
         push = heapq.heappush
         pop = heapq.heappop
 
@@ -143,9 +292,31 @@ class CapSimulator(object):
         t_last = 0
         t_max = self.t_max
 
+        # cap before and after an activation is sampled at most once per step, and where activations are
+        # further apart than that, cap recharging in between is sampled once per step as well
+        if recordTimeline:
+            timeline_size = self.timeline_samples * 3 + 2
+            timeline_t = numpy.empty(timeline_size)
+            timeline_cap = numpy.empty(timeline_size)
+            timeline_step = float(t_max) / self.timeline_samples
+        else:
+            timeline_size = 0
+            timeline_step = 0
+        timeline_count = 0
+        t_sample = 0 if recordTimeline else float("inf")
+        t_sampled = -timeline_step if recordTimeline else -1
+
         while 1:
             activation = pop(state)
             t_now, duration, capNeed, shot, clipSize, reloadTime = activation
+
+            while timeline_count < timeline_size and t_sampled + timeline_step < min(t_now, t_max):
+                t_sampled += timeline_step
+                timeline_t[timeline_count] = t_sampled
+                timeline_cap[timeline_count] = \
+                    ((1.0 + (sqrt(cap / capCapacity) - 1.0) * exp((t_last - t_sampled) / tau)) ** 2) * capCapacity
+                timeline_count += 1
+
             if t_now >= t_max:
                 break
 
@@ -157,11 +328,22 @@ class CapSimulator(object):
                 if t_now == t_wrap:
                     # history is repeating itself, so if we have more cap now than last
                     # time this happened, it is a stable setup.
-                    if cap >= cap_wrap:
+                    if cap >= cap_wrap and not recordTimeline:
                         break
                     cap_wrap = round(cap, stability_precision)
                     t_wrap += period
 
+            if t_now >= t_sample and timeline_count + 1 < timeline_size:
+                timeline_t[timeline_count] = timeline_t[timeline_count + 1] = t_now
+                timeline_cap[timeline_count] = cap
+                timeline_cap[timeline_count + 1] = min(max(cap - capNeed, 0.0), capCapacity)
+                timeline_count += 2
+                t_sampled = t_now
+                t_sample = t_now + timeline_step
+            elif t_now == t_sampled:
+                # other activations at the sampled time
+                timeline_cap[timeline_count - 1] = min(max(cap - capNeed, 0.0), capCapacity)
+
             cap -= capNeed
             if cap > capCapacity:
                 cap = capCapacity
@@ -192,6 +374,9 @@ class CapSimulator(object):
         self.t = t_last
         self.iterations = iterations
 
+        if recordTimeline:
+            self.timeline = (timeline_t[:timeline_count], timeline_cap[:timeline_count])
+
         # calculate EVE's stability value
         try:
             avgDrain = reduce(float.__add__, [x[2] / x[1] for x in self.state], 0.0)
@@ -206,5 +391,3 @@ class CapSimulator(object):
         else:
             self.cap_stable_low = \
                 self.cap_stable_high = 0.0
-
-        self.runtime = time.time() - start
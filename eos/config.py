@@ -9,7 +9,11 @@ pyfalog = Logger(__name__)
 
 debug = False
 gamedataCache = True
+# Results kept per cached gamedata query function, divided by the query's cost (the amount passed to cachedQuery)
+gamedataCacheSize = 4096
 saveddataCache = True
+# Path to memory-mapped gamedata snapshot (see scripts/gamedataSnapshot.py), used when it matches gamedata build
+gamedataSnapshot = None
 gamedata_version = ""
 gamedata_date = ""
 gamedata_connectionstring = 'sqlite:///' + realpath(join(dirname(abspath(__file__)), "..", "eve.db"))
@@ -26,7 +30,11 @@ pyfalog.debug("Saveddata connection string: {0}", saveddata_connectionstring)
 settings = {
     "useStaticAdaptiveArmorHardener": False,
     "strictSkillLevels": True,
-    "globalDefaultSpoolupPercentage": 1.0
+    "globalDefaultSpoolupPercentage": 1.0,
+    "incrementalCalc": False,
+    "incrementalCalcVerify": False,
+    "compactAttributeDicts": False,
+    "analyticCapSim": False
 }
 
 # Autodetect path, only change if the autodetection bugs out.
@@ -19,7 +19,7 @@
 
 import threading
 
-from sqlalchemy import MetaData, create_engine
+from sqlalchemy import MetaData, create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from . import migration
@@ -63,7 +63,7 @@ except Exception as e:
 saveddata_connectionstring = config.saveddata_connectionstring
 if saveddata_connectionstring is not None:
     if callable(saveddata_connectionstring):
-        saveddata_engine = create_engine(creator=saveddata_connectionstring, echo=config.debug)
+        saveddata_engine = create_engine("sqlite://", creator=saveddata_connectionstring, echo=config.debug)
     else:
         saveddata_engine = create_engine(saveddata_connectionstring, echo=config.debug)
 
@@ -73,6 +73,21 @@ if saveddata_connectionstring is not None:
 else:
     saveddata_meta = None
 
+# Number of statements executed against each database since startup. Per-operation counts are differences of these,
+# which also include statements run by other threads in the meantime
+queryCounts = {"gamedata": 0, "saveddata": 0}
+
+
+def _queryCounter(name):
+    def countQuery(*args):
+        queryCounts[name] += 1
+    return countQuery
+
+
+event.listen(gamedata_engine, "before_cursor_execute", _queryCounter("gamedata"))
+if saveddata_connectionstring is not None:
+    event.listen(saveddata_engine, "before_cursor_execute", _queryCounter("saveddata"))
+
 # Lock controlling any changes introduced to session
 sd_lock = threading.RLock()
 
@@ -80,8 +95,8 @@ sd_lock = threading.RLock()
 # noinspection PyPep8
 from eos.db.gamedata import alphaClones, attribute, category, effect, group, item, marketGroup, metaData, metaGroup, queries, traits, unit, dynamicAttributes
 # noinspection PyPep8
-from eos.db.saveddata import booster, cargo, character, damagePattern, databaseRepair, drone, fighter, fit, implant, implantSet, loadDefaultDatabaseValues, \
-    miscData, mutator, module, override, price, queries, skill, targetResists, user
+from eos.db.saveddata import booster, cachedFitStats, cargo, character, damagePattern, databaseRepair, drone, fighter, fit, implant, implantSet, \
+    loadDefaultDatabaseValues, miscData, mutator, module, override, price, queries, skill, targetResists, user
 
 # Import queries
 # noinspection PyPep8
@@ -18,21 +18,32 @@
 # ===============================================================================
 
 from sqlalchemy.inspection import inspect
-from sqlalchemy.orm import aliased, exc, join
+from sqlalchemy.orm import exc, join, joinedload, subqueryload
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.sql import and_, or_, select
 
 import eos.config
 from eos.db import gamedata_session
 from eos.db.gamedata.group import groups_table
 from eos.db.gamedata.metaGroup import items_table, metatypes_table
-from eos.db.util import processEager, processWhere
-from eos.gamedata import AlphaClone, Attribute, AttributeInfo, Category, DynamicItem, Group, Item, MarketGroup, MetaData, MetaGroup
+from eos.db.gamedata.snapshot import getSnapshot, resetSnapshot
+from eos.db.util import QueryCache, processEager, processWhere
+from eos.gamedata import AlphaClone, Attribute, AttributeInfo, Category, DynamicItem, Group, Item, MarketGroup, MetaData, MetaGroup, \
+    SkillRequirements
 
-cache = {}
+# Query function name -> QueryCache
+queryCaches = {}
 configVal = getattr(eos.config, "gamedataCache", None)
 if configVal is True:
     def cachedQuery(amount, *keywords):
+        """
+        Cache results of the decorated query in its own LRU. Amount is the relative cost of one cached result
+        (queries returning lists of items have higher ones), the cache keeps gamedataCacheSize // amount results.
+        """
         def deco(function):
+            queryCache = queryCaches[function.__name__] = QueryCache(
+                function.__name__, max(1, getattr(eos.config, "gamedataCacheSize", 4096) // amount))
+
             def checkAndReturn(*args, **kwargs):
                 useCache = kwargs.pop("useCache", True)
                 cacheKey = []
@@ -41,12 +52,14 @@ if configVal is True:
                     cacheKey.append(kwargs.get(keyword))
 
                 cacheKey = tuple(cacheKey)
-                handler = cache.get(cacheKey)
-                if handler is None or not useCache:
-                    handler = cache[cacheKey] = function(*args, **kwargs)
+                handler = queryCache.get(cacheKey) if useCache else QueryCache.MISSING
+                if handler is QueryCache.MISSING:
+                    handler = function(*args, **kwargs)
+                    queryCache.put(cacheKey, handler)
 
                 return handler
 
+            checkAndReturn.cache = queryCache
             return checkAndReturn
 
         return deco
@@ -64,6 +77,27 @@ else:
         return deco
 
 
+def getQueryCacheStats():
+    """Size, capacity, hit, miss and eviction counts of every cached query, by query function name"""
+    return {name: queryCache.getStats() for name, queryCache in queryCaches.items()}
+
+
+def clearQueryCaches():
+    """
+    Forget all cached query results, name lookups and other data loaded from gamedata (skill requirements, skill
+    lists, snapshot), needs to be called after gamedata is reloaded
+    """
+    # Imported here, saveddata imports this module
+    from eos.saveddata.character import Character
+    for queryCache in queryCaches.values():
+        queryCache.invalidate()
+    for nameMap in (itemNameMap, groupNameMap, categoryNameMap, metaGroupNameMap):
+        nameMap.clear()
+    SkillRequirements.reset()
+    Character.resetSkillLists()
+    resetSnapshot()
+
+
 def sqlizeString(line):
     # Escape backslashes first, as they will be as escape symbol in queries
     # Then escape percent and underscore signs
@@ -98,6 +132,33 @@ def getItem(lookfor, eager=None):
     return item
 
 
+def prefetchItems(typeIDs, details=True):
+    """
+    Load items with their group and category, and unless details is off, their attributes and effects, using a few
+    IN (...) queries per 500 items, so getItem() calls and relation access which follow hit the identity map. Returns
+    the loaded items; the identity map only holds items weakly, so the caller has to keep them referenced for as long
+    as they should stay loaded.
+    """
+    toLoad = []
+    for typeID in set(typeIDs):
+        item = gamedata_session.identity_map.get(identity_key(Item, typeID))
+        if item is None or (details and "effects" not in item.__dict__):
+            toLoad.append(typeID)
+    if not toLoad:
+        return []
+
+    options = [joinedload(Item.group).joinedload(Group.category)]
+    if details:
+        options.append(subqueryload(Item.effects))
+        # Attributes are read from snapshot when there's one
+        if getSnapshot() is None:
+            options.append(subqueryload(Item._Item__attributes))
+    items = []
+    for i in range(0, len(toLoad), 500):
+        items.extend(gamedata_session.query(Item).options(*options).filter(Item.ID.in_(toLoad[i:i + 500])).all())
+    return items
+
+
 def getMutaplasmid(lookfor, eager=None):
     if isinstance(lookfor, int):
         item = gamedata_session.query(DynamicItem).filter(DynamicItem.ID == lookfor).first()
@@ -119,7 +180,7 @@ def getItemWithBaseItemAttribute(lookfor, baseItemID, eager=None):
     # Copy over the attributes from the base, but ise the items attributes when there's an overlap
     # WARNING: the attribute object still has the old typeID. I don't believe we access this typeID anywhere in the code,
     # but should keep this in mind for now.
-    item._Item__attributes = {**base.attributes, **item.attributes}
+    item.setAttributes({**base.attributes, **item.attributes})
 
     # Expunge the item form the session. This is required to have different Abyssal / Base combinations loaded in memory.
     # Without expunging it, once one Abyssal Web is created, SQLAlchmey will use it for all others. We don't want this,
@@ -136,20 +197,23 @@ def getItems(lookfor, eager=None):
     Works well enough. Not currently used, but it's here for possible future inclusion
     """
 
+    itemCache = getattr(getItem, "cache", None)
     toGet = []
     results = []
 
     for id in lookfor:
-        if (id, None) in cache:
-            results.append(cache.get((id, None)))
+        item = itemCache.get((id, None)) if itemCache is not None else QueryCache.MISSING
+        if item is not QueryCache.MISSING:
+            results.append(item)
         else:
             toGet.append(id)
 
     if len(toGet) > 0:
         # Get items that aren't currently cached, and store them in the cache
         items = gamedata_session.query(Item).filter(Item.ID.in_(toGet)).all()
-        for item in items:
-            cache[(item.ID, None)] = item
+        if itemCache is not None:
+            for item in items:
+                itemCache.put((item.ID, None), item)
         results += items
 
     # sort the results based on the original indexing
@@ -401,6 +465,19 @@ def directAttributeRequest(itemIDs, attrIDs):
     return result
 
 
+def getSkillRequirementAttributes(attrIDs):
+    """Get (typeID, attributeID, value) rows of passed attributes for all items"""
+    q = select((Attribute.typeID, Attribute.attributeID, Attribute.value),
+               Attribute.attributeID.in_(tuple(attrIDs)))
+    return gamedata_session.execute(q).fetchall()
+
+
+def getItemNames(itemIDs):
+    """Get (typeID, typeName) rows for passed item IDs"""
+    q = select((items_table.c.typeID, items_table.c.typeName), items_table.c.typeID.in_(tuple(itemIDs)))
+    return gamedata_session.execute(q).fetchall()
+
+
 def getAbyssalTypes():
     return set([r.resultingTypeID for r in gamedata_session.query(DynamicItem.resultingTypeID).distinct()])
 
@@ -418,25 +495,3 @@ def getDynamicItem(itemID, eager=None):
     except exc.NoResultFound:
         result = None
     return result
-
-
-def getRequiredFor(itemID, attrMapping):
-    Attribute1 = aliased(Attribute)
-    Attribute2 = aliased(Attribute)
-
-    skillToLevelClauses = []
-
-    for attrSkill, attrLevel in attrMapping.items():
-        skillToLevelClauses.append(and_(Attribute1.attributeID == attrSkill, Attribute2.attributeID == attrLevel))
-
-    queryOr = or_(*skillToLevelClauses)
-
-    q = select((Attribute2.typeID, Attribute2.value),
-               and_(Attribute1.value == itemID, queryOr),
-               from_obj=[
-                   join(Attribute1, Attribute2, Attribute1.typeID == Attribute2.typeID)
-               ])
-
-    result = gamedata_session.execute(q).fetchall()
-
-    return result
@@ -0,0 +1,310 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+Read-only binary snapshot of the hot parts of gamedata: per-type attribute values and skill requirements. It is
+written by scripts/gamedataSnapshot.py and memory-mapped, so all processes using it share the same pages and
+looking an item up is an array index instead of ORM hydration.
+
+Layout: header (magic, format version, byte order, gamedata build), section table, then 8-byte aligned sections.
+Per-type data is stored in CSR form: <name>Start[row]..<name>Start[row + 1] is the slice of the row's values.
+
+This module must not import eos.db at module level, it is imported while eos.db is being set up.
+"""
+
+import mmap
+import struct
+import sys
+import threading
+from array import array
+
+from logbook import Logger
+
+import eos.config
+
+pyfalog = Logger(__name__)
+
+MAGIC = b"PYFASNAP"
+FORMAT_VERSION = 1
+# Magic, format version, byte order, gamedata build length, section count
+HEADER = struct.Struct("<8sI8sII")
+# Name, typecode, offset, item count
+SECTION = struct.Struct("<24s4sQQ")
+
+# Invtypes columns stored as attributes, same as Item.moveAttrs() does: mass, capacity, volume
+MOVED_ATTRS = ((4, "mass"), (38, "capacity"), (161, "volume"))
+
+
+def writeSnapshot(execute, path):
+    """
+    Write snapshot of gamedata to path. Execute is a callable running raw SQL against the gamedata database and
+    returning the rows, like gamedata_engine.execute. Returns number of types written.
+    """
+    from eos.gamedata import SkillRequirements
+
+    build = execute("SELECT field_value FROM metadata WHERE field_name LIKE 'client_build'").fetchone()
+    build = str(build[0]).encode("utf-8") if build is not None else b""
+
+    types = execute("SELECT typeID, mass, capacity, volume FROM invtypes ORDER BY typeID").fetchall()
+    rowMap = {row[0]: i for i, row in enumerate(types)}
+
+    typeAttrs = [{} for _ in types]
+    for typeID, attrID, value in execute("SELECT typeID, attributeID, value FROM dgmtypeattribs"):
+        row = rowMap.get(typeID)
+        if row is not None and value is not None:
+            typeAttrs[row][attrID] = value
+
+    sections = {name: array("I") for name in (
+        "typeIDs", "attrStart", "attrIDs", "skillStart", "skillIDs", "skillLevels", "attrInfoIDs", "attrNameStart")}
+    sections["attrValues"] = array("d")
+    for name in ("attrStart", "skillStart", "attrNameStart"):
+        sections[name].append(0)
+
+    for row, (typeID, mass, capacity, volume) in enumerate(types):
+        attrs = typeAttrs[row]
+        for (attrID, _), value in zip(MOVED_ATTRS, (mass, capacity, volume)):
+            if value:
+                attrs[attrID] = value
+        sections["typeIDs"].append(typeID)
+        for attrID in sorted(attrs):
+            sections["attrIDs"].append(attrID)
+            sections["attrValues"].append(attrs[attrID])
+        sections["attrStart"].append(len(sections["attrIDs"]))
+        for srqIDAttr, srqLvlAttr in SkillRequirements.srqIDMap.items():
+            if srqIDAttr in attrs and srqLvlAttr in attrs:
+                sections["skillIDs"].append(int(attrs[srqIDAttr]))
+                sections["skillLevels"].append(int(attrs[srqLvlAttr]))
+        sections["skillStart"].append(len(sections["skillIDs"]))
+
+    typeIndex = array("I", bytes(4 * (types[-1][0] + 1 if types else 0)))
+    for row, (typeID, *_) in enumerate(types):
+        typeIndex[typeID] = row + 1
+    sections["typeIndex"] = typeIndex
+
+    names = bytearray()
+    for attrID, attrName in execute("SELECT attributeID, attributeName FROM dgmattribs ORDER BY attributeID"):
+        sections["attrInfoIDs"].append(attrID)
+        names += (attrName or "").encode("utf-8")
+        sections["attrNameStart"].append(len(names))
+    sections["attrNames"] = array("B", names)
+
+    offset = HEADER.size + len(build) + SECTION.size * len(sections)
+    table = []
+    for name, data in sections.items():
+        offset += -offset % 8
+        table.append((name, data, offset))
+        offset += len(data) * data.itemsize
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, sys.byteorder.encode("ascii"), len(build), len(sections)))
+        f.write(build)
+        for name, data, offset in table:
+            f.write(SECTION.pack(name.encode("ascii"), data.typecode.encode("ascii"), offset, len(data)))
+        for name, data, offset in table:
+            f.write(bytes(offset - f.tell()))
+            data.tofile(f)
+
+    return len(types)
+
+
+class SnapshotAttribute(object):
+    """Attribute of an item read from snapshot, stands in for gamedata Attribute in Item.attributes"""
+
+    __slots__ = ("attributeID", "name", "value")
+
+    def __init__(self, attributeID, name, value):
+        self.attributeID = attributeID
+        self.name = name
+        self.value = value
+
+    @property
+    def ID(self):
+        return self.attributeID
+
+    @property
+    def info(self):
+        import eos.db
+        return eos.db.getAttributeInfo(self.attributeID)
+
+    # Same proxies to attribute info as gamedata Attribute has
+    @property
+    def description(self):
+        return self.info.description
+
+    @property
+    def published(self):
+        return self.info.published
+
+    @property
+    def displayName(self):
+        return self.info.displayName
+
+    @property
+    def highIsGood(self):
+        return self.info.highIsGood
+
+    @property
+    def iconID(self):
+        return self.info.iconID
+
+    @property
+    def icon(self):
+        return getattr(self.info, "icon", None)
+
+    @property
+    def unit(self):
+        return self.info.unit
+
+
+class GamedataSnapshot(object):
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__view = view = memoryview(self.__mmap)
+        magic, version, byteorder, buildLength, sectionCount = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("{} is not a gamedata snapshot of format version {}".format(path, FORMAT_VERSION))
+        if byteorder.rstrip(b"\0").decode("ascii") != sys.byteorder:
+            raise ValueError("{} was written on a machine with different byte order".format(path))
+        self.path = path
+        self.build = bytes(view[HEADER.size:HEADER.size + buildLength]).decode("utf-8")
+
+        self.__sections = {}
+        position = HEADER.size + buildLength
+        for _ in range(sectionCount):
+            name, typecode, offset, count = SECTION.unpack_from(view, position)
+            position += SECTION.size
+            typecode = typecode.rstrip(b"\0").decode("ascii")
+            size = array(typecode).itemsize * count
+            self.__sections[name.rstrip(b"\0").decode("ascii")] = view[offset:offset + size].cast(typecode)
+
+        sections = self.__sections
+        self.__typeIndex = sections["typeIndex"]
+        self.__attrStart = sections["attrStart"]
+        self.__attrIDs = sections["attrIDs"]
+        self.__attrValues = sections["attrValues"]
+        self.__skillStart = sections["skillStart"]
+
+        # Attribute names are few and needed for every item, decode them once
+        names = bytes(sections["attrNames"])
+        nameStart = sections["attrNameStart"]
+        self.__attrNames = {attrID: names[nameStart[i]:nameStart[i + 1]].decode("utf-8")
+                            for i, attrID in enumerate(sections["attrInfoIDs"])}
+
+    def __len__(self):
+        return len(self.__sections["typeIDs"])
+
+    def __contains__(self, typeID):
+        return self.getRow(typeID) is not None
+
+    def getRow(self, typeID):
+        if typeID is None or typeID < 0:
+            return None
+        try:
+            row = self.__typeIndex[typeID] - 1
+        except (IndexError, TypeError):
+            return None
+        return row if row >= 0 else None
+
+    def __slice(self, starts, typeID):
+        row = self.getRow(typeID)
+        if row is None:
+            return 0, 0
+        return starts[row], starts[row + 1]
+
+    def getAttributes(self, typeID):
+        """Get {attributeID: value} of item"""
+        start, end = self.__slice(self.__attrStart, typeID)
+        return dict(zip(self.__attrIDs[start:end], self.__attrValues[start:end]))
+
+    def getItemAttributes(self, typeID):
+        """Get {attributeName: SnapshotAttribute} of item, as Item.attributes has it"""
+        attrNames = self.__attrNames
+        attrs = {}
+        for attrID, value in self.getAttributes(typeID).items():
+            name = attrNames.get(attrID)
+            if name is not None:
+                attrs[name] = SnapshotAttribute(attrID, name, value)
+        return attrs
+
+    def getAttributeName(self, attrID):
+        return self.__attrNames.get(attrID)
+
+    def iterSkillRequirements(self):
+        """Yield (typeID, ((skillID, level), ...)) of all items having skill requirements"""
+        skillStart = self.__skillStart
+        skillIDs = self.__sections["skillIDs"]
+        skillLevels = self.__sections["skillLevels"]
+        for row, typeID in enumerate(self.__sections["typeIDs"]):
+            start, end = skillStart[row], skillStart[row + 1]
+            if start != end:
+                yield typeID, tuple(zip(skillIDs[start:end], skillLevels[start:end]))
+
+    def close(self):
+        for section in self.__sections.values():
+            section.release()
+        self.__sections = {}
+        self.__typeIndex = self.__attrStart = self.__attrIDs = self.__attrValues = self.__skillStart = None
+        self.__view.release()
+        self.__mmap.close()
+
+
+# Opened snapshot, False if there's none or it couldn't be used
+_snapshot = None
+_snapshotLock = threading.Lock()
+
+
+def getSnapshot():
+    """
+    Get snapshot configured in eos.config.gamedataSnapshot, or None if there is none or it doesn't match the
+    gamedata build in use
+    """
+    global _snapshot
+    if _snapshot is None:
+        with _snapshotLock:
+            if _snapshot is None:
+                _snapshot = _openSnapshot(getattr(eos.config, "gamedataSnapshot", None)) or False
+    return _snapshot or None
+
+
+def _openSnapshot(path):
+    if not path:
+        return None
+    try:
+        snapshot = GamedataSnapshot(path)
+    except (OSError, ValueError, KeyError) as e:
+        pyfalog.warning("Failed to open gamedata snapshot {0}: {1}", path, e)
+        return None
+    if snapshot.build != str(eos.config.gamedata_version):
+        pyfalog.warning("Gamedata snapshot {0} is for build {1}, gamedata is {2}; not using it",
+                        path, snapshot.build, eos.config.gamedata_version)
+        snapshot.close()
+        return None
+    pyfalog.info("Using gamedata snapshot {0} with {1} types", path, len(snapshot))
+    return snapshot
+
+
+def resetSnapshot():
+    """Close current snapshot, next getSnapshot() call opens the configured one again"""
+    global _snapshot
+    with _snapshotLock:
+        if _snapshot:
+            _snapshot.close()
+        _snapshot = None
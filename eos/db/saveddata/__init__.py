@@ -14,5 +14,6 @@ __all__ = [
     "targetResists",
     "override",
     "implantSet",
+    "cachedFitStats",
     "loadDefaultDatabaseValues"
 ]
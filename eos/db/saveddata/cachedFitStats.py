@@ -0,0 +1,37 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+from sqlalchemy import Table, Column, Float, ForeignKey, Integer, LargeBinary, String
+from sqlalchemy.orm import mapper, synonym
+
+from eos.db import saveddata_meta
+from eos.saveddata.cachedFitStats import CachedFitStats
+
+
+cachedFitStats_table = Table("cachedFitStats", saveddata_meta,
+                             Column("fitID", ForeignKey("fits.ID"), primary_key=True),
+                             Column("fitHash", String, nullable=False),
+                             Column("skillHash", String, nullable=False),
+                             Column("gamedataVersion", String, nullable=True),
+                             Column("data", LargeBinary, nullable=False),
+                             Column("time", Float, nullable=False))
+
+
+mapper(CachedFitStats, cachedFitStats_table,
+       properties={"ID": synonym("fitID")})
@@ -19,19 +19,30 @@
 
 import sys
 
-from sqlalchemy.sql import and_
+from sqlalchemy.sql import and_, union
 from sqlalchemy import desc, select
 from sqlalchemy import func
+from sqlalchemy.orm import subqueryload
+from sqlalchemy.orm.util import identity_key
 
 from eos.db import saveddata_session, sd_lock
-from eos.db.saveddata.fit import projectedFits_table
+from eos.db.gamedata.queries import prefetchItems
+from eos.db.saveddata.booster import boosters_table
+from eos.db.saveddata.cargo import cargo_table
+from eos.db.saveddata.drone import drones_table
+from eos.db.saveddata.fighter import fighters_table
+from eos.db.saveddata.fit import commandFits_table, fits_table, projectedFits_table
+from eos.db.saveddata.implant import fitImplants_table, implants_table
+from eos.db.saveddata.module import modules_table
+from eos.db.saveddata.skill import skills_table
 from eos.db.util import processEager, processWhere
 from eos.saveddata.price import Price
+from eos.saveddata.cachedFitStats import CachedFitStats
 from eos.saveddata.user import User
 from eos.saveddata.ssocharacter import SsoCharacter
 from eos.saveddata.damagePattern import DamagePattern
 from eos.saveddata.targetResists import TargetResists
-from eos.saveddata.character import Character
+from eos.saveddata.character import Character, Skill
 from eos.saveddata.implantSet import ImplantSet
 from eos.saveddata.fit import Fit
 from eos.saveddata.module import Module
@@ -186,6 +197,18 @@ def getCharacter(lookfor, eager=None):
     return character
 
 
+def getCharacterSkillLevels(characterID):
+    """Get (skillID, level) rows of skills stored for character, without loading Skill objects"""
+    with sd_lock:
+        return saveddata_session.execute(select((skills_table.c.itemID, skills_table.c._Skill__level)).where(
+            skills_table.c.characterID == characterID)).fetchall()
+
+
+def getCharacterSkill(characterID, skillID):
+    with sd_lock:
+        return saveddata_session.query(Skill).get((characterID, skillID))
+
+
 def getCharacterList(eager=None):
     eager = processEager(eager)
     with sd_lock:
@@ -203,9 +226,53 @@ def getCharactersForUser(lookfor, eager=None):
     return characters
 
 
+def getFitItemIDs(fitIDs):
+    """
+    Get typeIDs of everything used by fits and by fits projected onto or commanding them: ships, modes, modules,
+    charges, drones, fighters, implants, boosters and cargo
+    """
+    fitIDs = set(fitIDs)
+    newIDs = set(fitIDs)
+    typeIDs = set()
+    with sd_lock:
+        while newIDs:
+            chunks = [list(newIDs)[i:i + 500] for i in range(0, len(newIDs), 500)]
+            linkedIDs = set()
+            for chunk in chunks:
+                linkedIDs.update(row[0] for row in saveddata_session.execute(union(
+                    select([projectedFits_table.c.sourceID]).where(projectedFits_table.c.victimID.in_(chunk)),
+                    select([commandFits_table.c.boosterID]).where(commandFits_table.c.boostedID.in_(chunk)))))
+                columns = [(fits_table.c.ID, fits_table.c.shipID), (fits_table.c.ID, fits_table.c.modeID),
+                           (modules_table.c.fitID, modules_table.c.itemID),
+                           (modules_table.c.fitID, modules_table.c.baseItemID),
+                           (modules_table.c.fitID, modules_table.c.chargeID),
+                           (drones_table.c.fitID, drones_table.c.itemID),
+                           (fighters_table.c.fitID, fighters_table.c.itemID),
+                           (boosters_table.c.fitID, boosters_table.c.itemID),
+                           (cargo_table.c.fitID, cargo_table.c.itemID)]
+                selects = [select([typeColumn]).where(fitColumn.in_(chunk)) for fitColumn, typeColumn in columns]
+                selects.append(select([implants_table.c.itemID]).select_from(
+                    implants_table.join(fitImplants_table, fitImplants_table.c.implantID == implants_table.c.ID)).where(
+                    fitImplants_table.c.fitID.in_(chunk)))
+                typeIDs.update(row[0] for row in saveddata_session.execute(union(*selects)))
+            newIDs = linkedIDs - fitIDs
+            fitIDs.update(newIDs)
+    typeIDs.discard(None)
+    return typeIDs
+
+
+def prefetchFitItems(fitIDs):
+    """Load gamedata of all items used by fits in bulk, see getFitItemIDs() and prefetchItems()"""
+    return prefetchItems(getFitItemIDs(fitIDs))
+
+
 @cachedQuery(Fit, 1, "lookfor")
 def getFit(lookfor, eager=None):
     if isinstance(lookfor, int):
+        prefetched = None
+        if saveddata_session.identity_map.get(identity_key(Fit, lookfor)) is None:
+            # Fit isn't loaded yet; instead of items loading one by one as it gets calculated, get them all at once
+            prefetched = prefetchFitItems((lookfor,))
         if eager is None:
             with sd_lock:
                 fit = saveddata_session.query(Fit).get(lookfor)
@@ -216,6 +283,10 @@ def getFit(lookfor, eager=None):
     else:
         raise TypeError("Need integer as argument")
 
+    if fit is not None and prefetched:
+        # Identity map holds items weakly, keep prefetched ones alive along with the fit
+        fit.prefetchedItems = prefetched
+
     if fit and fit.isInvalid:
         with sd_lock:
             removeInvalid([fit])
@@ -224,6 +295,12 @@ def getFit(lookfor, eager=None):
     return fit
 
 
+def getLoadedFit(fitID):
+    """Fit if it is loaded already, None otherwise; never queries the database"""
+    with sd_lock:
+        return saveddata_session.identity_map.get(identity_key(Fit, fitID))
+
+
 def getFitsWithShip(shipID, ownerID=None, where=None, eager=None):
     """
     Get all the fits using a certain ship.
@@ -326,6 +403,72 @@ def getFitList(eager=None):
     return fits
 
 
+# Fit relations the bulk loader fetches along with fits, with nested relations of their items
+bulkFitRelations = (
+    ("_Fit__modules", "mutators"),
+    ("_Fit__projectedModules", "mutators"),
+    ("_Fit__drones",),
+    ("_Fit__projectedDrones",),
+    ("_Fit__fighters", "_Fighter__abilities"),
+    ("_Fit__projectedFighters", "_Fighter__abilities"),
+    ("_Fit__cargo",),
+    ("_Fit__implants",),
+    ("_Fit__boosters", "_Booster__sideEffects"),
+    ("_Fit__character",),
+    ("_Fit__damagePattern",),
+    ("_Fit__targetResists",),
+    ("victimOf",),
+    ("boostedOf",),
+)
+
+
+class FitStream(object):
+    """
+    Sized iterable of fits loaded in chunks, see getFitStream(). Every chunk takes one query for its fits, one per
+    relation in bulkFitRelations and a few for gamedata of items the fits use. Loaded fits aren't kept anywhere,
+    so memory use is bounded by chunk size as long as the consumer doesn't hold on to them.
+    """
+
+    def __init__(self, fitIDs, chunkSize):
+        self.fitIDs = fitIDs
+        self.chunkSize = chunkSize
+
+    def __len__(self):
+        return len(self.fitIDs)
+
+    def __iter__(self):
+        for i in range(0, len(self.fitIDs), self.chunkSize):
+            chunkIDs = self.fitIDs[i:i + self.chunkSize]
+            # Reference prefetched items until the chunk is consumed
+            prefetched = prefetchFitItems(chunkIDs)
+            options = []
+            for relations in bulkFitRelations:
+                option = subqueryload(relations[0])
+                for relation in relations[1:]:
+                    option = option.subqueryload(relation)
+                options.append(option)
+            with sd_lock:
+                fits = removeInvalid(saveddata_session.query(Fit).options(*options).filter(Fit.ID.in_(chunkIDs)).all())
+            positions = {fitID: position for position, fitID in enumerate(chunkIDs)}
+            fits.sort(key=lambda fit: positions[fit.ID])
+            yield from fits
+            del prefetched
+
+
+def getFitStream(fitIDs=None, where=None, chunkSize=100):
+    """
+    Get FitStream of fits with passed IDs in that order, or of all fits matching where clause (all fits by default)
+    in ID order, with their modules, drones, fighters, cargo, implants, boosters and projections loaded in bulk
+    """
+    if fitIDs is None:
+        query = saveddata_session.query(Fit.ID)
+        if where is not None:
+            query = query.filter(where)
+        with sd_lock:
+            fitIDs = [row[0] for row in query.order_by(Fit.ID)]
+    return FitStream(list(fitIDs), chunkSize)
+
+
 @cachedQuery(Price, 1, "typeID")
 def getPrice(typeID):
     if isinstance(typeID, int):
@@ -343,6 +486,31 @@ def clearPrices():
     return deleted_rows
 
 
+def getCachedFitStats(fitIDs=None):
+    """
+    Stored stats of the given fits (all by default) as (CachedFitStats, fit ID, fit character ID) tuples. Fit ID
+    is None for stats left behind by removed fits
+    """
+    query = saveddata_session.query(CachedFitStats, Fit.ID, Fit.characterID).outerjoin(
+        Fit, Fit.ID == CachedFitStats.fitID)
+    with sd_lock:
+        if fitIDs is None:
+            return query.all()
+        fitIDs = list(fitIDs)
+        results = []
+        # Stay below SQLite's limit of bound parameters
+        for i in range(0, len(fitIDs), 500):
+            results.extend(query.filter(CachedFitStats.fitID.in_(fitIDs[i:i + 500])).all())
+    return results
+
+
+def clearCachedFitStats():
+    with sd_lock:
+        deleted_rows = saveddata_session.query(CachedFitStats).delete()
+    commit()
+    return deleted_rows
+
+
 def getMiscData(field):
     if isinstance(field, str):
         with sd_lock:
@@ -459,7 +627,11 @@ def searchFits(nameLike, where=None, eager=None):
     filter = processWhere(Fit.name.like(nameLike, escape="\\"), where)
     eager = processEager(eager)
     with sd_lock:
+        # Fits get their ship items on load, fetch them all at once instead of one by one
+        ships = prefetchItems((row[0] for row in saveddata_session.query(Fit.shipID).filter(filter).distinct()),
+                              details=False)
         fits = removeInvalid(saveddata_session.query(Fit).options(*eager).filter(filter).all())
+        del ships
 
     return fits
 
@@ -17,6 +17,9 @@
 # along with eos.  If not, see <http://www.gnu.org/licenses/>.
 # ===============================================================================
 
+import threading
+from collections import OrderedDict
+
 from sqlalchemy.orm import eagerload
 from sqlalchemy.sql import and_
 
@@ -71,3 +74,59 @@ def processWhere(clause, where):
             clause = and_(clause, where)
 
     return clause
+
+
+class QueryCache(object):
+    """
+    Bounded, thread-safe LRU mapping of query arguments to query results. Only bookkeeping is done under the lock,
+    so two threads missing the same key at once may both run the query; the later result wins.
+    """
+
+    MISSING = object()
+
+    def __init__(self, name, maxSize):
+        self.name = name
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def get(self, key, default=MISSING):
+        with self.__lock:
+            try:
+                value = self.__entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxSize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key=MISSING):
+        """Drop single entry, or all of them if no key is passed"""
+        with self.__lock:
+            if key is self.MISSING:
+                self.__entries.clear()
+            else:
+                self.__entries.pop(key, None)
+
+    def getStats(self):
+        with self.__lock:
+            return {"size": len(self.__entries), "maxSize": self.maxSize, "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
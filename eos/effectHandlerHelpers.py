@@ -26,87 +26,286 @@ from utils.deprecated import deprecated
 pyfalog = Logger(__name__)
 
 
+def _itemSkillKeys(element):
+    from eos.gamedata import SkillRequirements
+    return SkillRequirements.getKeys(element.item.ID)
+
+
+def _chargeSkillKeys(element):
+    from eos.gamedata import SkillRequirements
+    return SkillRequirements.getKeys(element.charge.ID)
+
+
+def _itemGroupKeys(element):
+    yield element.item.group.name
+
+
+def _chargeGroupKeys(element):
+    yield element.charge.group.name
+
+
+class IndexedFilter(object):
+    """
+    Declarative filter for filtered* methods of handled lists. Lists resolve it through
+    indexes instead of testing every element; it can still be called like a filter lambda.
+    """
+
+    # Functions returning index keys of an element
+    INDEX_KEYS = {
+        "itemSkill": _itemSkillKeys,
+        "chargeSkill": _chargeSkillKeys,
+        "itemGroup": _itemGroupKeys,
+        "chargeGroup": _chargeGroupKeys,
+    }
+
+    def __init__(self, index, values):
+        self.index = index
+        self.values = values
+
+    def __call__(self, element):
+        return any(key in self.values for key in self.INDEX_KEYS[self.index](element))
+
+    def __repr__(self):
+        return "IndexedFilter({}, {})".format(self.index, self.values)
+
+
+def _skillKey(skill):
+    # Skills can be passed as names, IDs, skill items or character skills
+    if isinstance(skill, (str, int)):
+        return skill
+    if hasattr(skill, "item"):
+        return skill.item.ID
+    return skill.ID
+
+
+def itemRequiresSkill(*skills):
+    """Filter elements whose item requires any of passed skills"""
+    return IndexedFilter("itemSkill", tuple(_skillKey(s) for s in skills))
+
+
+def chargeRequiresSkill(*skills):
+    """Filter elements whose charge requires any of passed skills"""
+    return IndexedFilter("chargeSkill", tuple(_skillKey(s) for s in skills))
+
+
+def itemGroupIs(*groups):
+    """Filter elements whose item belongs to any of passed groups (names)"""
+    return IndexedFilter("itemGroup", groups)
+
+
+def chargeGroupIs(*groups):
+    """Filter elements whose charge belongs to any of passed groups (names)"""
+    return IndexedFilter("chargeGroup", groups)
+
+
 class HandledList(list):
-    def filteredItemPreAssign(self, filter, *args, **kwargs):
+
+    # CalcTracker of the fit being calculated, told which lists calculation steps filter
+    tracker = None
+
+    def __init__(self, *args, **kwargs):
+        list.__init__(self, *args, **kwargs)
+        # {index name: {key: [element, ...]}}, filled on demand
+        self.__indexes = {}
+
+    def invalidateIndexes(self):
+        """Drop indexes, they are rebuilt on next use; call it when items or charges of elements change"""
+        self.__indexes = {}
+
+    def __getIndexes(self):
+        try:
+            return self.__indexes
+        except AttributeError:
+            indexes = self.__indexes = {}
+            return indexes
+
+    @staticmethod
+    def __getKeys(name, element):
+        try:
+            return list(IndexedFilter.INDEX_KEYS[name](element))
+        except AttributeError:
+            return ()
+
+    def __getIndex(self, name):
+        indexes = self.__getIndexes()
+        index = indexes.get(name)
+        if index is None:
+            index = indexes[name] = {}
+            for element in self:
+                for key in self.__getKeys(name, element):
+                    index.setdefault(key, []).append(element)
+        return index
+
+    def __indexAdd(self, element, position=None):
+        """Add element to already built indexes, keeping them in list order"""
+        indexes = self.__getIndexes()
+        if not indexes:
+            return
+        preceding = None
+        if position is not None and position < len(self) - 1:
+            preceding = {id(e) for e in self[:position]}
+        for name, index in indexes.items():
+            for key in self.__getKeys(name, element):
+                elements = index.setdefault(key, [])
+                if preceding is None:
+                    elements.append(element)
+                else:
+                    i = 0
+                    while i < len(elements) and id(elements[i]) in preceding:
+                        i += 1
+                    elements.insert(i, element)
+
+    def __indexRemove(self, element):
+        """Remove one occurrence of element from already built indexes"""
+        for index in self.__getIndexes().values():
+            # Keys of the element may have changed since it was indexed, look it up everywhere
+            for key, elements in list(index.items()):
+                for i, e in enumerate(elements):
+                    if e is element:
+                        del elements[i]
+                        break
+                if not elements:
+                    del index[key]
+
+    def __position(self, idx):
+        length = len(self)
+        if idx < 0:
+            idx += length
+        return min(max(idx, 0), length)
+
+    def __filter(self, filter):
+        indexed = isinstance(filter, IndexedFilter)
+        if self.tracker is not None:
+            self.tracker.filter(self, filter.index if indexed else None)
+        if indexed:
+            index = self.__getIndex(filter.index)
+            if len(filter.values) == 1:
+                return index.get(filter.values[0], ())
+            matched = set()
+            for value in filter.values:
+                matched.update(id(e) for e in index.get(value, ()))
+            return [e for e in self if id(e) in matched]
+        return self.__scan(filter)
+
+    def __scan(self, filter):
         for element in self:
             try:
-                if filter(element):
-                    element.preAssignItemAttr(*args, **kwargs)
+                matches = filter(element)
+            except AttributeError:
+                continue
+            if matches:
+                yield element
+
+    def filteredItemPreAssign(self, filter, *args, **kwargs):
+        for element in self.__filter(filter):
+            try:
+                element.preAssignItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.increaseItemAttr(*args, **kwargs)
+                element.increaseItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.multiplyItemAttr(*args, **kwargs)
+                element.multiplyItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemBoost(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.boostItemAttr(*args, **kwargs)
+                element.boostItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredItemForce(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.forceItemAttr(*args, **kwargs)
+                element.forceItemAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargePreAssign(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.preAssignChargeAttr(*args, **kwargs)
+                element.preAssignChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeIncrease(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.increaseChargeAttr(*args, **kwargs)
+                element.increaseChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeMultiply(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.multiplyChargeAttr(*args, **kwargs)
+                element.multiplyChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeBoost(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.boostChargeAttr(*args, **kwargs)
+                element.boostChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
     def filteredChargeForce(self, filter, *args, **kwargs):
-        for element in self:
+        for element in self.__filter(filter):
             try:
-                if filter(element):
-                    element.forceChargeAttr(*args, **kwargs)
+                element.forceChargeAttr(*args, **kwargs)
             except AttributeError:
                 pass
 
+    def append(self, thing):
+        list.append(self, thing)
+        self.__indexAdd(thing)
+
+    def insert(self, idx, thing):
+        position = self.__position(idx)
+        list.insert(self, idx, thing)
+        self.__indexAdd(thing, position)
+
+    def extend(self, things):
+        things = list(things)
+        list.extend(self, things)
+        for thing in things:
+            self.__indexAdd(thing)
+
+    def pop(self, *args):
+        thing = list.pop(self, *args)
+        self.__indexRemove(thing)
+        return thing
+
+    def __setitem__(self, idx, thing):
+        if isinstance(idx, slice):
+            self.invalidateIndexes()
+            list.__setitem__(self, idx, thing)
+            return
+        position = self.__position(idx)
+        oldThing = self[idx]
+        list.__setitem__(self, idx, thing)
+        self.__indexRemove(oldThing)
+        self.__indexAdd(thing, position)
+
+    def __delitem__(self, idx):
+        if isinstance(idx, slice):
+            self.invalidateIndexes()
+            list.__delitem__(self, idx)
+            return
+        thing = self[idx]
+        list.__delitem__(self, idx)
+        self.__indexRemove(thing)
+
     def remove(self, thing):
         # We must flag it as modified, otherwise it not be removed from the database
         # @todo: flag_modified isn't in os x skel. need to rebuild to include
@@ -114,6 +313,7 @@ class HandledList(list):
         if thing.isInvalid:  # see GH issue #324
             thing.itemID = 0
         list.remove(self, thing)
+        self.__indexRemove(thing)
 
     def sort(self, *args, **kwargs):
         # We need it here to prevent external users from accidentally sorting the list as alot of
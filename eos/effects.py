@@ -20,6 +20,7 @@
 
 import eos.config
 from eos.const import FittingModuleState
+from eos.effectHandlerHelpers import itemRequiresSkill, chargeRequiresSkill, itemGroupIs, chargeGroupIs
 from eos.utils.spoolSupport import SpoolType, SpoolOptions, calculateSpoolup, resolveSpoolOptions
 
 
@@ -437,7 +438,7 @@ class Effect89(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -454,7 +455,7 @@ class Effect91(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True)
 
@@ -471,7 +472,7 @@ class Effect92(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True)
 
@@ -488,7 +489,7 @@ class Effect93(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True)
 
@@ -505,7 +506,7 @@ class Effect95(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -522,7 +523,7 @@ class Effect96(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -594,7 +595,7 @@ class Effect157(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -612,7 +613,7 @@ class Effect159(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -630,7 +631,7 @@ class Effect160(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -648,7 +649,7 @@ class Effect161(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -667,7 +668,7 @@ class Effect162(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -685,7 +686,7 @@ class Effect172(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -703,7 +704,7 @@ class Effect173(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -721,7 +722,7 @@ class Effect174(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -740,7 +741,7 @@ class Effect212(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronics Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Electronics Upgrades'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level)
 
 
@@ -788,7 +789,7 @@ class Effect227(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus'))
 
 
@@ -807,7 +808,7 @@ class Effect230(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level)
 
 
@@ -838,7 +839,7 @@ class Effect242(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'speedFactor', implant.getModifiedItemAttr('speedFBonus'))
 
 
@@ -856,7 +857,7 @@ class Effect244(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -896,7 +897,7 @@ class Effect272(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'duration', container.getModifiedItemAttr('durationSkillBonus') * level)
 
 
@@ -915,7 +916,7 @@ class Effect273(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Upgrades'),
                                       'power', container.getModifiedItemAttr('powerNeedBonus') * level)
 
 
@@ -948,7 +949,7 @@ class Effect279(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -966,7 +967,7 @@ class Effect287(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -985,7 +986,7 @@ class Effect290(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level)
 
 
@@ -1004,7 +1005,7 @@ class Effect298(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'falloff', container.getModifiedItemAttr('falloffBonus') * level)
 
 
@@ -1040,7 +1041,7 @@ class Effect391(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'miningAmount', container.getModifiedItemAttr('miningAmountBonus') * level)
 
 
@@ -1123,7 +1124,7 @@ class Effect396(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Grid Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Grid Upgrades'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level)
 
 
@@ -1161,7 +1162,7 @@ class Effect408(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -1180,7 +1181,7 @@ class Effect414(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'speed', container.getModifiedItemAttr('turretSpeeBonus') * level)
 
 
@@ -1311,7 +1312,7 @@ class Effect506(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level)
 
 
@@ -1350,7 +1351,7 @@ class Effect508(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -1372,7 +1373,7 @@ class Effect511(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -1393,7 +1394,7 @@ class Effect512(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -1412,7 +1413,7 @@ class Effect514(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -1430,7 +1431,7 @@ class Effect516(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -1446,7 +1447,7 @@ class Effect521(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -1512,7 +1513,7 @@ class Effect542(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -1530,7 +1531,7 @@ class Effect549(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMB'),
                                       skill='Minmatar Battleship')
 
@@ -1552,7 +1553,7 @@ class Effect550(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB'),
                                       skill='Gallente Battleship')
 
@@ -1569,7 +1570,7 @@ class Effect553(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship')
 
 
@@ -1592,7 +1593,7 @@ class Effect562(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -1610,7 +1611,7 @@ class Effect581(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level)
 
 
@@ -1626,7 +1627,7 @@ class Effect582(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'speed', skill.getModifiedItemAttr('rofBonus') * skill.level)
 
 
@@ -1644,7 +1645,7 @@ class Effect584(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'damageMultiplier', implant.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -1660,7 +1661,7 @@ class Effect587(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -1676,7 +1677,7 @@ class Effect588(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -1692,7 +1693,7 @@ class Effect589(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -1710,7 +1711,7 @@ class Effect590(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Pulse Weapons'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level)
 
 
@@ -1798,7 +1799,7 @@ class Effect602(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser')
 
 
@@ -1818,7 +1819,7 @@ class Effect604(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB2'), skill='Minmatar Battleship')
 
 
@@ -1857,7 +1858,7 @@ class Effect623(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount',
                                      container.getModifiedItemAttr('miningAmountBonus') * level)
 
@@ -1910,7 +1911,7 @@ class Effect660(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -1928,7 +1929,7 @@ class Effect661(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -1946,7 +1947,7 @@ class Effect662(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -1964,7 +1965,7 @@ class Effect668(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill(skill),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill(skill),
                                         'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -1995,7 +1996,7 @@ class Effect675(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Pulse Weapons'),
                                       'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level)
 
 
@@ -2013,7 +2014,7 @@ class Effect677(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'cpu', container.getModifiedItemAttr('cpuNeedBonus') * level)
 
 
@@ -2195,7 +2196,7 @@ class Effect744(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('CPU Management'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('CPU Management'),
                                       'duration', container.getModifiedItemAttr('scanspeedBonus') * level)
 
 
@@ -2211,7 +2212,7 @@ class Effect754(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -2230,7 +2231,7 @@ class Effect757(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -2248,7 +2249,7 @@ class Effect760(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -2265,7 +2266,7 @@ class Effect763(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                                '%sDamage' % dmgType,
                                                container.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=True)
@@ -2288,7 +2289,7 @@ class Effect784(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context or 'booster' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosionDelay', container.getModifiedItemAttr('maxFlightTimeBonus') * level,
                                         stackingPenalties=penalized)
 
@@ -2339,7 +2340,7 @@ class Effect848(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cloakingTargetingDelay',
                                       skill.getModifiedItemAttr('cloakingTargetingDelayBonus') * skill.level)
 
@@ -2392,7 +2393,7 @@ class Effect874(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -2409,7 +2410,7 @@ class Effect882(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -2425,7 +2426,7 @@ class Effect887(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship')
 
 
@@ -2441,7 +2442,7 @@ class Effect889(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Missile Launcher Operation'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -2458,7 +2459,7 @@ class Effect891(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship')
 
 
@@ -2474,7 +2475,7 @@ class Effect892(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship')
 
 
@@ -2491,7 +2492,7 @@ class Effect896(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemMultiply(itemGroupIs('Cloaking Device'),
                                          'cpu', container.getModifiedItemAttr('cloakingCpuNeedBonus'))
 
 
@@ -2509,7 +2510,7 @@ class Effect898(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -2527,7 +2528,7 @@ class Effect899(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -2543,7 +2544,7 @@ class Effect900(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'thermalDamage', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -2560,7 +2561,7 @@ class Effect907(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -2591,7 +2592,7 @@ class Effect912(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -2623,7 +2624,7 @@ class Effect919(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -2704,7 +2705,7 @@ class Effect968(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser')
 
@@ -2740,7 +2741,7 @@ class Effect989(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -2756,7 +2757,7 @@ class Effect991(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -2772,7 +2773,7 @@ class Effect996(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates')
 
@@ -2789,7 +2790,7 @@ class Effect998(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates')
 
 
@@ -2805,7 +2806,7 @@ class Effect999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates')
 
@@ -2837,7 +2838,7 @@ class Effect1003(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2853,7 +2854,7 @@ class Effect1004(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2869,7 +2870,7 @@ class Effect1005(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2885,7 +2886,7 @@ class Effect1006(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2901,7 +2902,7 @@ class Effect1007(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2917,7 +2918,7 @@ class Effect1008(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2933,7 +2934,7 @@ class Effect1009(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2949,7 +2950,7 @@ class Effect1010(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2965,7 +2966,7 @@ class Effect1011(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2981,7 +2982,7 @@ class Effect1012(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -2997,7 +2998,7 @@ class Effect1013(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3013,7 +3014,7 @@ class Effect1014(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3029,7 +3030,7 @@ class Effect1015(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Pulse Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3045,7 +3046,7 @@ class Effect1016(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Beam Laser Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3061,7 +3062,7 @@ class Effect1017(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Blaster Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3077,7 +3078,7 @@ class Effect1018(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Railgun Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3093,7 +3094,7 @@ class Effect1019(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Autocannon Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3109,7 +3110,7 @@ class Effect1020(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Artillery Specialization'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -3125,7 +3126,7 @@ class Effect1021(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates')
 
@@ -3143,7 +3144,7 @@ class Effect1024(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -3160,7 +3161,7 @@ class Effect1025(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -3179,7 +3180,7 @@ class Effect1030(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -3195,7 +3196,7 @@ class Effect1033(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers')
 
 
@@ -3212,7 +3213,7 @@ class Effect1034(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers')
 
 
@@ -3228,7 +3229,7 @@ class Effect1035(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers')
 
 
@@ -3245,7 +3246,7 @@ class Effect1036(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers')
 
 
@@ -3261,7 +3262,7 @@ class Effect1046(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -3277,7 +3278,7 @@ class Effect1047(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -3294,7 +3295,7 @@ class Effect1048(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -3310,7 +3311,7 @@ class Effect1049(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -3326,7 +3327,7 @@ class Effect1056(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3343,7 +3344,7 @@ class Effect1057(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3360,7 +3361,7 @@ class Effect1058(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3377,7 +3378,7 @@ class Effect1060(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3395,7 +3396,7 @@ class Effect1061(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3412,7 +3413,7 @@ class Effect1062(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3429,7 +3430,7 @@ class Effect1063(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3446,7 +3447,7 @@ class Effect1080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3463,7 +3464,7 @@ class Effect1081(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers')
 
@@ -3480,7 +3481,7 @@ class Effect1082(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers')
 
@@ -3513,7 +3514,7 @@ class Effect1087(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -3532,7 +3533,7 @@ class Effect1099(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -3550,7 +3551,7 @@ class Effect1176(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'speedFactor', container.getModifiedItemAttr('speedFBonus') * level)
 
 
@@ -3566,7 +3567,7 @@ class Effect1179(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship2'),
                                       skill='Assault Frigates')
 
@@ -3583,7 +3584,7 @@ class Effect1181(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers')
 
@@ -3600,7 +3601,7 @@ class Effect1182(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -3617,7 +3618,7 @@ class Effect1183(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers')
 
@@ -3635,7 +3636,7 @@ class Effect1184(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -3670,7 +3671,7 @@ class Effect1190(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'duration', container.getModifiedItemAttr('iceHarvestCycleBonus') * level)
 
 
@@ -3722,7 +3723,7 @@ class Effect1215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -3740,7 +3741,7 @@ class Effect1218(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -3756,7 +3757,7 @@ class Effect1219(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAB'),
                                       skill='Amarr Battleship')
 
@@ -3775,7 +3776,7 @@ class Effect1220(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -3791,7 +3792,7 @@ class Effect1221(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -3807,7 +3808,7 @@ class Effect1222(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -3824,7 +3825,7 @@ class Effect1228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -3842,7 +3843,7 @@ class Effect1230(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -3859,7 +3860,7 @@ class Effect1232(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -3876,7 +3877,7 @@ class Effect1233(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -3893,7 +3894,7 @@ class Effect1234(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -3909,7 +3910,7 @@ class Effect1239(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -3925,7 +3926,7 @@ class Effect1240(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -3942,7 +3943,7 @@ class Effect1255(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'durationBonus', implant.getModifiedItemAttr('implantSetBloodraider'))
 
 
@@ -3958,7 +3959,7 @@ class Effect1256(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capacitor Emission Systems'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'))
 
 
@@ -3975,7 +3976,7 @@ class Effect1261(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'velocityBonus', implant.getModifiedItemAttr('implantSetSerpentis'))
 
 
@@ -3991,7 +3992,7 @@ class Effect1264(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors')
 
@@ -4008,7 +4009,7 @@ class Effect1268(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors')
 
@@ -4028,7 +4029,7 @@ class Effect1281(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         penalized = 'implant' not in context
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', container.getModifiedItemAttr('repairBonus'),
                                       stackingPenalties=penalized)
 
@@ -4049,7 +4050,7 @@ class Effect1318(BaseEffect):
         groups = ('ECM', 'Burst Jammer')
         level = container.level if 'skill' in context else 1
         for scanType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+            fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                           'scan{0}StrengthBonus'.format(scanType),
                                           container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
                                           stackingPenalties=False if 'skill' in context else True)
@@ -4069,7 +4070,7 @@ class Effect1360(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Sensor Linking'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -4087,7 +4088,7 @@ class Effect1361(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -4105,7 +4106,7 @@ class Effect1370(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Target Painting'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -4124,7 +4125,7 @@ class Effect1372(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -4140,7 +4141,7 @@ class Effect1395(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'))
 
 
@@ -4157,7 +4158,7 @@ class Effect1397(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'shieldBoostMultiplier', implant.getModifiedItemAttr('implantSetGuristas'))
 
 
@@ -4176,7 +4177,7 @@ class Effect1409(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Astrometrics'),
                                       'duration', container.getModifiedItemAttr('durationBonus') * level)
 
 
@@ -4196,7 +4197,7 @@ class Effect1410(BaseEffect):
 
         level = container.level if 'skill' in context else 1
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -4212,7 +4213,7 @@ class Effect1412(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -4229,7 +4230,7 @@ class Effect1434(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for sensorType in ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Electronic Warfare'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Electronic Warfare'),
                                           'scan{0}StrengthBonus'.format(sensorType),
                                           ship.getModifiedItemAttr('shipBonusCB'), stackingPenalties=True,
                                           skill='Caldari Battleship')
@@ -4247,7 +4248,7 @@ class Effect1441(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship')
 
 
@@ -4263,7 +4264,7 @@ class Effect1442(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -4281,7 +4282,7 @@ class Effect1443(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -4299,7 +4300,7 @@ class Effect1445(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Sensor Linking'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context)
 
@@ -4318,7 +4319,7 @@ class Effect1446(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context)
 
@@ -4337,7 +4338,7 @@ class Effect1448(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context)
 
@@ -4354,7 +4355,7 @@ class Effect1449(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Sensor Linking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Sensor Linking'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level)
 
 
@@ -4370,7 +4371,7 @@ class Effect1450(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level)
 
 
@@ -4386,7 +4387,7 @@ class Effect1451(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level)
 
 
@@ -4405,7 +4406,7 @@ class Effect1452(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties='skill' not in context and 'implant' not in context)
 
@@ -4422,7 +4423,7 @@ class Effect1453(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'falloffEffectiveness', skill.getModifiedItemAttr('falloffBonus') * skill.level)
 
 
@@ -4442,7 +4443,7 @@ class Effect1472(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level,
                                         stackingPenalties=penalize)
 
@@ -4461,7 +4462,7 @@ class Effect1500(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level)
 
 
@@ -4477,7 +4478,7 @@ class Effect1550(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus',
                                       skill.getModifiedItemAttr('scanSkillTargetPaintStrengthBonus') * skill.level)
 
@@ -4495,7 +4496,7 @@ class Effect1551(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMF2'),
                                       skill='Minmatar Frigate')
 
@@ -4534,7 +4535,7 @@ class Effect1579(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'armorHpBonus', implant.getModifiedItemAttr('implantSetSansha') or 1)
 
 
@@ -4565,7 +4566,7 @@ class Effect1585(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -4581,7 +4582,7 @@ class Effect1586(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -4597,7 +4598,7 @@ class Effect1587(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -4615,7 +4616,7 @@ class Effect1588(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -4635,7 +4636,7 @@ class Effect1590(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         penalize = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeVelocity', container.getModifiedItemAttr('aoeVelocityBonus') * level,
                                         stackingPenalties=penalize)
 
@@ -4654,7 +4655,7 @@ class Effect1592(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'emDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -4672,7 +4673,7 @@ class Effect1593(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -4690,7 +4691,7 @@ class Effect1594(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -4708,7 +4709,7 @@ class Effect1595(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod)
 
 
@@ -4726,7 +4727,7 @@ class Effect1596(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod)
 
 
@@ -4744,7 +4745,7 @@ class Effect1597(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod)
 
 
@@ -4810,7 +4811,7 @@ class Effect1634(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'capacitorNeed', container.getModifiedItemAttr('shieldBoostCapacitorBonus') * level)
 
 
@@ -4828,7 +4829,7 @@ class Effect1635(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'duration', container.getModifiedItemAttr('durationSkillBonus') * level,
                                       stackingPenalties='skill' not in context)
 
@@ -4846,7 +4847,7 @@ class Effect1638(BaseEffect):
     @staticmethod
     def handler(fit, skill, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Gunnery') or mod.item.requiresSkill('Missile Launcher Operation'),
+            itemRequiresSkill('Gunnery', 'Missile Launcher Operation'),
             'power', skill.getModifiedItemAttr('powerNeedBonus') * skill.level)
 
 
@@ -4864,15 +4865,15 @@ class Effect1643(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'))
 
 
@@ -4890,15 +4891,15 @@ class Effect1644(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'))
 
 
@@ -4914,15 +4915,15 @@ class Effect1645(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'))
 
 
@@ -4940,15 +4941,15 @@ class Effect1646(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'))
 
 
@@ -4965,7 +4966,7 @@ class Effect1650(BaseEffect):
     @staticmethod
     def handler(fit, skill, context):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(itemRequiresSkill(skill),
                                          'consumptionQuantity', amount * skill.level)
 
 
@@ -4983,7 +4984,7 @@ class Effect1657(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         mod = src.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', src.getModifiedItemAttr('damageMultiplierBonus') * mod)
 
 
@@ -5121,7 +5122,7 @@ class Effect1720(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
             'shieldBonus', module.getModifiedItemAttr('shieldBoostMultiplier'),
             stackingPenalties=True)
 
@@ -5154,7 +5155,7 @@ class Effect1730(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill(skill),
+        fit.drones.filteredItemBoost(itemRequiresSkill(skill),
                                      'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -5186,7 +5187,7 @@ class Effect1763(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', container.getModifiedItemAttr('rofBonus') * level)
 
 
@@ -5206,7 +5207,7 @@ class Effect1764(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', container.getModifiedItemAttr('speedFactor') * level,
                                         stackingPenalties=penalized)
 
@@ -5224,7 +5225,7 @@ class Effect1773(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -5446,15 +5447,15 @@ class Effect1848(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('mindlinkBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('mindlinkBonus'))
 
 
@@ -5472,7 +5473,7 @@ class Effect1851(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemBoost(itemRequiresSkill(skill),
                                       'speed', skill.getModifiedItemAttr('rofBonus') * skill.level)
 
 
@@ -5488,7 +5489,7 @@ class Effect1862(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -5504,7 +5505,7 @@ class Effect1863(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -5520,7 +5521,7 @@ class Effect1864(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate')
 
@@ -5538,7 +5539,7 @@ class Effect1882(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('miningAmountBonus'))
 
 
@@ -5555,7 +5556,7 @@ class Effect1885(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
 
 
@@ -5572,7 +5573,7 @@ class Effect1886(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
 
 
@@ -5588,7 +5589,7 @@ class Effect1896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'duration', ship.getModifiedItemAttr('eliteBonusBarge2'), skill='Exhumers')
 
 
@@ -5605,7 +5606,7 @@ class Effect1910(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships')
 
@@ -5624,7 +5625,7 @@ class Effect1911(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanGravimetricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships')
 
@@ -5643,7 +5644,7 @@ class Effect1912(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanMagnetometricStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships')
 
@@ -5662,7 +5663,7 @@ class Effect1913(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanRadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships')
 
@@ -5681,7 +5682,7 @@ class Effect1914(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanLadarStrengthBonus', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships')
 
@@ -5701,7 +5702,7 @@ class Effect1921(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships')
 
 
@@ -5719,7 +5720,7 @@ class Effect1922(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships')
 
 
@@ -5750,7 +5751,7 @@ class Effect1964(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -5766,7 +5767,7 @@ class Effect1969(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -5783,7 +5784,7 @@ class Effect1996(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -5815,7 +5816,7 @@ class Effect2008(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cynosural Field Generator',
+        fit.modules.filteredItemBoost(itemGroupIs('Cynosural Field Generator'),
                                       'duration', ship.getModifiedItemAttr('durationBonus'))
 
 
@@ -5834,7 +5835,7 @@ class Effect2013(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', container.getModifiedItemAttr('droneMaxVelocityBonus') * level, stackingPenalties=True)
 
 
@@ -5852,7 +5853,7 @@ class Effect2014(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         stacking = False if 'skill' in context else True
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxRange',
                                      container.getModifiedItemAttr('rangeSkillBonus') * level,
                                      stackingPenalties=stacking)
@@ -5870,7 +5871,7 @@ class Effect2015(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', module.getModifiedItemAttr('hullHpBonus'))
 
 
@@ -5886,7 +5887,7 @@ class Effect2016(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', module.getModifiedItemAttr('hullHpBonus'))
 
 
@@ -5903,7 +5904,7 @@ class Effect2017(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', container.getModifiedItemAttr('hullHpBonus') * level)
 
 
@@ -5921,7 +5922,7 @@ class Effect2019(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'shieldBonus', container.getModifiedItemAttr('damageHP') * level)
 
 
@@ -5939,7 +5940,7 @@ class Effect2020(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'armorDamageAmount', container.getModifiedItemAttr('damageHP') * level,
                                      stackingPenalties=True)
 
@@ -6009,7 +6010,7 @@ class Effect2053(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
 
@@ -6025,7 +6026,7 @@ class Effect2054(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6042,7 +6043,7 @@ class Effect2055(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6059,7 +6060,7 @@ class Effect2056(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Shield Resistance Amplifier',
+        fit.modules.filteredItemBoost(itemGroupIs('Shield Resistance Amplifier'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6076,7 +6077,7 @@ class Effect2105(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
 
@@ -6092,7 +6093,7 @@ class Effect2106(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6109,7 +6110,7 @@ class Effect2107(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6126,7 +6127,7 @@ class Effect2108(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Coating',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Coating'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6143,7 +6144,7 @@ class Effect2109(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Plating Energized'),
                                       'emDamageResistanceBonus', skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
 
@@ -6159,7 +6160,7 @@ class Effect2110(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Plating Energized'),
                                       'explosiveDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6176,7 +6177,7 @@ class Effect2111(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Plating Energized'),
                                       'kineticDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6193,7 +6194,7 @@ class Effect2112(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Plating Energized',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Plating Energized'),
                                       'thermalDamageResistanceBonus',
                                       skill.getModifiedItemAttr('hardeningBonus') * skill.level)
 
@@ -6211,7 +6212,7 @@ class Effect2130(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -6229,7 +6230,7 @@ class Effect2131(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -6245,7 +6246,7 @@ class Effect2132(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -6262,7 +6263,7 @@ class Effect2133(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus2'))
 
 
@@ -6281,9 +6282,9 @@ class Effect2134(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Shield Booster'), 'maxRange',
                                       ship.getModifiedItemAttr('maxRangeBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Shield Booster'), 'maxRange',
                                       ship.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -6303,9 +6304,9 @@ class Effect2135(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Armor Repairer'), 'maxRange',
                                       src.getModifiedItemAttr('maxRangeBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Armor Repairer'), 'maxRange',
                                       src.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -6321,7 +6322,7 @@ class Effect2143(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC2'),
                                       skill='Minmatar Cruiser')
 
@@ -6338,7 +6339,7 @@ class Effect2155(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships')
 
@@ -6355,7 +6356,7 @@ class Effect2156(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships')
 
 
@@ -6371,7 +6372,7 @@ class Effect2157(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships')
 
@@ -6388,7 +6389,7 @@ class Effect2158(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships')
 
 
@@ -6404,7 +6405,7 @@ class Effect2160(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships')
 
 
@@ -6420,7 +6421,7 @@ class Effect2161(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships')
 
@@ -6440,7 +6441,7 @@ class Effect2179(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -6457,7 +6458,7 @@ class Effect2181(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -6475,7 +6476,7 @@ class Effect2186(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('shipBonusGB2'), skill='Gallente Battleship')
 
 
@@ -6492,7 +6493,7 @@ class Effect2187(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGB2'),
                                      skill='Gallente Battleship')
 
@@ -6511,7 +6512,7 @@ class Effect2188(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -6527,7 +6528,7 @@ class Effect2189(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -6544,7 +6545,7 @@ class Effect2200(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Light Missiles') or mod.charge.requiresSkill('Rockets'),
+            chargeRequiresSkill('Light Missiles', 'Rockets'),
             'kineticDamage', ship.getModifiedItemAttr('eliteBonusInterdictors1'), skill='Interdictors')
 
 
@@ -6560,7 +6561,7 @@ class Effect2201(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusInterdictors1'), skill='Interdictors')
 
 
@@ -6579,7 +6580,7 @@ class Effect2215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -6613,7 +6614,7 @@ class Effect2249(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'miningAmount', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -6630,7 +6631,7 @@ class Effect2250(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -6648,9 +6649,9 @@ class Effect2251(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('maxGangModules'))
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('maxGangModules'))
 
 
@@ -6675,7 +6676,7 @@ class Effect2252(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemForce(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemForce(itemRequiresSkill('Cloaking'),
                                       'moduleReactivationDelay',
                                       container.getModifiedItemAttr('covertOpsAndReconOpsCloakModuleDelay'))
 
@@ -6698,7 +6699,7 @@ class Effect2253(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemForce(itemGroupIs('Cloaking Device'),
                                       'cloakingTargetingDelay',
                                       ship.getModifiedItemAttr('covertOpsStealthBomberTargettingDelay'))
 
@@ -6768,7 +6769,7 @@ class Effect2305(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('eliteBonusReconShip2'),
                                       skill='Recon Ships')
 
@@ -6787,7 +6788,7 @@ class Effect2354(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Armor Repair Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -6804,7 +6805,7 @@ class Effect2355(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -6820,7 +6821,7 @@ class Effect2356(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Capacitor Emission Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level)
 
 
@@ -6895,7 +6896,7 @@ class Effect2444(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'))
 
 
@@ -6911,7 +6912,7 @@ class Effect2445(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'cpu', module.getModifiedItemAttr('cpuPenaltyPercent'))
 
 
@@ -6929,7 +6930,7 @@ class Effect2456(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Upgrades'),
                                       'cpuPenaltyPercent',
                                       container.getModifiedItemAttr('miningUpgradeCPUReductionBonus') * level)
 
@@ -6965,7 +6966,7 @@ class Effect2479(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'duration', module.getModifiedItemAttr('iceHarvestCycleBonus'))
 
 
@@ -7014,7 +7015,7 @@ class Effect2489(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusMC'),
                                       skill='Minmatar Cruiser')
 
@@ -7031,7 +7032,7 @@ class Effect2490(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser')
 
@@ -7050,7 +7051,7 @@ class Effect2491(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                       'ecmBurstRange', container.getModifiedItemAttr('rangeSkillBonus') * level,
                                       stackingPenalties=False if 'skill' in context else True)
 
@@ -7070,7 +7071,7 @@ class Effect2492(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -7087,7 +7088,7 @@ class Effect2503(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB2'),
                                       skill='Gallente Battleship')
 
@@ -7107,7 +7108,7 @@ class Effect2504(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -7123,7 +7124,7 @@ class Effect2561(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                         skill='Assault Frigates')
 
@@ -7232,7 +7233,7 @@ class Effect2611(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusGunship1'),
                                       skill='Assault Frigates')
 
@@ -7297,7 +7298,7 @@ class Effect2647(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -7314,7 +7315,7 @@ class Effect2648(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -7331,7 +7332,7 @@ class Effect2649(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Light'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -7373,7 +7374,7 @@ class Effect2688(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'))
 
 
@@ -7389,7 +7390,7 @@ class Effect2689(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'capacitorNeed', module.getModifiedItemAttr('capNeedBonus'))
 
 
@@ -7405,7 +7406,7 @@ class Effect2690(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'cpu', module.getModifiedItemAttr('cpuNeedBonus'))
 
 
@@ -7421,7 +7422,7 @@ class Effect2691(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'cpu', module.getModifiedItemAttr('cpuNeedBonus'))
 
 
@@ -7437,7 +7438,7 @@ class Effect2693(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True)
 
@@ -7454,7 +7455,7 @@ class Effect2694(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True)
 
@@ -7471,7 +7472,7 @@ class Effect2695(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True)
 
@@ -7488,7 +7489,7 @@ class Effect2696(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True)
 
@@ -7505,7 +7506,7 @@ class Effect2697(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True)
 
@@ -7522,7 +7523,7 @@ class Effect2698(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True)
 
@@ -7539,7 +7540,7 @@ class Effect2706(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'))
 
 
@@ -7555,7 +7556,7 @@ class Effect2707(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'))
 
 
@@ -7571,7 +7572,7 @@ class Effect2708(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'power', module.getModifiedItemAttr('drawback'))
 
 
@@ -7617,7 +7618,7 @@ class Effect2714(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'cpu', module.getModifiedItemAttr('drawback'))
 
 
@@ -7694,7 +7695,7 @@ class Effect2727(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemIncrease(itemGroupIs('Gas Cloud Harvester'),
                                          'maxGroupActive', skill.level)
 
 
@@ -7711,7 +7712,7 @@ class Effect2734(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
@@ -7749,7 +7750,7 @@ class Effect2736(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Repair Unit',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Repair Unit'),
                                       'armorDamageAmount', booster.getModifiedItemAttr(cls.attr))
 
 
@@ -7786,7 +7787,7 @@ class Effect2739(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'maxRange', booster.getModifiedItemAttr(cls.attr))
 
 
@@ -7805,7 +7806,7 @@ class Effect2741(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'falloff', booster.getModifiedItemAttr(cls.attr))
 
 
@@ -7860,7 +7861,7 @@ class Effect2747(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'trackingSpeed', booster.getModifiedItemAttr(cls.attr))
 
 
@@ -7879,7 +7880,7 @@ class Effect2748(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', booster.getModifiedItemAttr(cls.attr))
 
 
@@ -7897,7 +7898,7 @@ class Effect2749(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeVelocity', booster.getModifiedItemAttr(cls.attr))
 
 
@@ -7914,7 +7915,7 @@ class Effect2756(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for type in ('Gravimetric', 'Magnetometric', 'Ladar', 'Radar'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                           'scan{0}StrengthBonus'.format(type), ship.getModifiedItemAttr('shipBonusCC'),
                                           skill='Caldari Cruiser')
 
@@ -8053,7 +8054,7 @@ class Effect2791(BaseEffect):
 
     @classmethod
     def handler(cls, fit, booster, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', booster.getModifiedItemAttr(cls.attr))
 
 
@@ -8088,7 +8089,7 @@ class Effect2794(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Salvaging'),
                                          'accessDifficultyBonus', container.getModifiedItemAttr('accessDifficultyBonus'),
                                          position='post')
 
@@ -8138,7 +8139,7 @@ class Effect2797(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -8155,7 +8156,7 @@ class Effect2798(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Projectile Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True)
 
@@ -8172,7 +8173,7 @@ class Effect2799(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Missile Launcher Operation'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -8189,7 +8190,7 @@ class Effect2801(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -8206,7 +8207,7 @@ class Effect2802(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True)
 
@@ -8223,7 +8224,7 @@ class Effect2803(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True)
 
@@ -8240,7 +8241,7 @@ class Effect2804(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Hybrid Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -8258,7 +8259,7 @@ class Effect2805(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB2'),
                                       skill='Amarr Battleship')
 
@@ -8276,7 +8277,7 @@ class Effect2809(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -8292,7 +8293,7 @@ class Effect2810(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers')
 
@@ -8309,7 +8310,7 @@ class Effect2812(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                       'ecmBurstRange', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship')
 
 
@@ -8345,7 +8346,7 @@ class Effect2847(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'trackingSpeed', container.getModifiedItemAttr('trackingSpeedBonus') * level)
 
 
@@ -8363,7 +8364,7 @@ class Effect2848(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemIncrease(lambda module: module.item.requiresSkill('Archaeology'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Archaeology'),
                                          'accessDifficultyBonus',
                                          container.getModifiedItemAttr('accessDifficultyBonusModifier'), position='post')
 
@@ -8383,7 +8384,7 @@ class Effect2849(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemIncrease(lambda c: c.item.requiresSkill('Hacking'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Hacking'),
                                          'accessDifficultyBonus',
                                          container.getModifiedItemAttr('accessDifficultyBonusModifier'), position='post')
 
@@ -8400,7 +8401,7 @@ class Effect2850(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'duration', module.getModifiedItemAttr('durationBonus'))
 
 
@@ -8417,7 +8418,7 @@ class Effect2851(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                                '%sDamage' % dmgType,
                                                container.getModifiedItemAttr('missileDamageMultiplierBonus'),
                                                stackingPenalties=True)
@@ -8435,7 +8436,7 @@ class Effect2853(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cloakingTargetingDelay', module.getModifiedItemAttr('cloakingTargetingDelayBonus'))
 
 
@@ -8502,7 +8503,7 @@ class Effect2867(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'damageMultiplier', module.getModifiedItemAttr('damageMultiplierBonus'),
                                      stackingPenalties=True)
 
@@ -8519,7 +8520,7 @@ class Effect2868(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'armorDamageAmount', implant.getModifiedItemAttr('repairBonus'),
                                       stackingPenalties=True)
 
@@ -8536,7 +8537,7 @@ class Effect2872(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Defender Missiles'),
                                            'maxVelocity', container.getModifiedItemAttr('missileVelocityBonus'))
 
 
@@ -8552,7 +8553,7 @@ class Effect2881(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8568,7 +8569,7 @@ class Effect2882(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8584,7 +8585,7 @@ class Effect2883(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8600,7 +8601,7 @@ class Effect2884(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8616,7 +8617,7 @@ class Effect2885(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gas Cloud Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gas Cloud Harvesting'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'))
 
 
@@ -8632,7 +8633,7 @@ class Effect2887(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8648,7 +8649,7 @@ class Effect2888(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8664,7 +8665,7 @@ class Effect2889(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8680,7 +8681,7 @@ class Effect2890(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8696,7 +8697,7 @@ class Effect2891(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8712,7 +8713,7 @@ class Effect2892(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8728,7 +8729,7 @@ class Effect2893(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8744,7 +8745,7 @@ class Effect2894(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8760,7 +8761,7 @@ class Effect2899(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8776,7 +8777,7 @@ class Effect2900(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8792,7 +8793,7 @@ class Effect2901(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8808,7 +8809,7 @@ class Effect2902(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8824,7 +8825,7 @@ class Effect2903(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8840,7 +8841,7 @@ class Effect2904(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8856,7 +8857,7 @@ class Effect2905(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8872,7 +8873,7 @@ class Effect2906(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8888,7 +8889,7 @@ class Effect2907(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'emDamage', implant.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8904,7 +8905,7 @@ class Effect2908(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosiveDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8920,7 +8921,7 @@ class Effect2909(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'kineticDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8936,7 +8937,7 @@ class Effect2910(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'thermalDamage', container.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -8952,7 +8953,7 @@ class Effect2911(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Data Miners',
+        fit.modules.filteredItemBoost(itemGroupIs('Data Miners'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'))
 
 
@@ -8969,7 +8970,7 @@ class Effect2967(BaseEffect):
     @staticmethod
     def handler(fit, skill, context):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(itemRequiresSkill(skill),
                                          'consumptionQuantity', amount * skill.level)
 
 
@@ -8985,7 +8986,7 @@ class Effect2979(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Hull Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Hull Repair Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level)
 
 
@@ -9001,7 +9002,7 @@ class Effect2980(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Hull Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Hull Repair Systems'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level)
 
 
@@ -9101,7 +9102,7 @@ class Effect3024(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops')
 
@@ -9136,7 +9137,7 @@ class Effect3026(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops')
 
@@ -9154,7 +9155,7 @@ class Effect3027(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'),
                                         skill='Covert Ops')
 
@@ -9171,7 +9172,7 @@ class Effect3028(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Bomb Deployment'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps1'), skill='Covert Ops')
 
 
@@ -9273,7 +9274,7 @@ class Effect3036(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Bomb',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Bomb'),
                                       'moduleReactivationDelay', skill.getModifiedItemAttr('reactivationDelayBonus') * skill.level)
 
 
@@ -9319,7 +9320,7 @@ class Effect3061(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'heatDamage', module.getModifiedItemAttr('heatDamageBonus'))
 
 
@@ -9335,7 +9336,7 @@ class Effect3169(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'cpu',
                                       src.getModifiedItemAttr('shieldTransportCpuNeedBonus'))
 
 
@@ -9355,7 +9356,7 @@ class Effect3172(BaseEffect):
     def handler(fit, ship, context):
         # This is actually level-less bonus, anyway you have to train cruisers 5
         # and will get 100% (20%/lvl as stated by description)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'armorDamageAmount', ship.getModifiedItemAttr('droneArmorDamageAmountBonus'))
 
 
@@ -9375,7 +9376,7 @@ class Effect3173(BaseEffect):
     def handler(fit, ship, context):
         # This is actually level-less bonus, anyway you have to train cruisers 5
         # and will get 100% (20%/lvl as stated by description)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'shieldBonus', ship.getModifiedItemAttr('droneShieldBonusBonus'))
 
 
@@ -9497,7 +9498,7 @@ class Effect3212(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('FoF Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('FoF Missiles'),
                                         'aoeCloudSize', container.getModifiedItemAttr('aoeCloudSizeBonus') * level)
 
 
@@ -9514,7 +9515,7 @@ class Effect3234(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -9531,7 +9532,7 @@ class Effect3235(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -9548,7 +9549,7 @@ class Effect3236(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -9565,7 +9566,7 @@ class Effect3237(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -9661,7 +9662,7 @@ class Effect3264(BaseEffect):
     @staticmethod
     def handler(fit, skill, context):
         amount = -skill.getModifiedItemAttr('consumptionQuantityBonus')
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill(skill),
+        fit.modules.filteredItemIncrease(itemRequiresSkill(skill),
                                          'consumptionQuantity', amount * skill.level)
 
 
@@ -9677,7 +9678,7 @@ class Effect3267(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Industrial Reconfiguration'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Industrial Reconfiguration'),
                                       'consumptionQuantity', ship.getModifiedItemAttr('shipBonusORECapital1'),
                                       skill='Capital Industrial Ships')
 
@@ -9694,7 +9695,7 @@ class Effect3297(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAB'),
                                       skill='Amarr Battleship')
 
@@ -9712,7 +9713,7 @@ class Effect3298(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAC'),
                                       skill='Amarr Cruiser')
 
@@ -9731,7 +9732,7 @@ class Effect3299(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonusAF'),
                                       skill='Amarr Frigate')
 
@@ -9841,7 +9842,7 @@ class Effect3343(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers')
 
@@ -9858,7 +9859,7 @@ class Effect3355(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers')
 
@@ -9875,7 +9876,7 @@ class Effect3356(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers')
 
@@ -9892,7 +9893,7 @@ class Effect3357(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                         skill='Heavy Interdiction Cruisers')
 
@@ -9910,7 +9911,7 @@ class Effect3366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -9926,7 +9927,7 @@ class Effect3367(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships')
 
@@ -9943,7 +9944,7 @@ class Effect3369(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships')
 
@@ -9960,7 +9961,7 @@ class Effect3370(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships')
 
@@ -9977,7 +9978,7 @@ class Effect3371(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusElectronicAttackShip2'),
                                       skill='Electronic Attack Ships')
 
@@ -10010,7 +10011,7 @@ class Effect3379(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'capacitorNeed', implant.getModifiedItemAttr('capNeedBonus'))
 
 
@@ -10040,9 +10041,9 @@ class Effect3380(BaseEffect):
             if module.charge is None:
                 fit.ship.boostItemAttr('mass', module.getModifiedItemAttr('massBonusPercentage'))
                 fit.ship.boostItemAttr('signatureRadius', module.getModifiedItemAttr('signatureRadiusBonus'))
-                fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                               'speedBoostFactor', module.getModifiedItemAttr('speedBoostFactorBonus'))
-                fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+                fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                           'speedFactor', module.getModifiedItemAttr('speedFactorBonus'))
 
             fit.ship.forceItemAttr('disallowAssistance', 1)
@@ -10060,7 +10061,7 @@ class Effect3392(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops')
 
 
@@ -10107,7 +10108,7 @@ class Effect3415(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -10123,7 +10124,7 @@ class Effect3416(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -10139,7 +10140,7 @@ class Effect3417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -10155,7 +10156,7 @@ class Effect3424(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders')
 
 
@@ -10171,7 +10172,7 @@ class Effect3425(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusViolators1'), skill='Marauders')
 
 
@@ -10187,7 +10188,7 @@ class Effect3427(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusViolatorsRole2'))
 
 
@@ -10203,7 +10204,7 @@ class Effect3439(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusViolators1'),
                                       skill='Marauders')
 
@@ -10221,7 +10222,7 @@ class Effect3447(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -10269,7 +10270,7 @@ class Effect3468(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Disrupt Field Generator',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Disrupt Field Generator'),
                                       'warpScrambleRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors2'),
                                       skill='Heavy Interdiction Cruisers')
 
@@ -10286,7 +10287,7 @@ class Effect3473(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxTractorVelocity', ship.getModifiedItemAttr('eliteBonusViolatorsRole3'))
 
 
@@ -10303,7 +10304,7 @@ class Effect3478(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -10319,7 +10320,7 @@ class Effect3480(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship')
 
 
@@ -10338,7 +10339,7 @@ class Effect3483(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -10355,7 +10356,7 @@ class Effect3484(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -10376,7 +10377,7 @@ class Effect3487(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -10393,7 +10394,7 @@ class Effect3489(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -10409,7 +10410,7 @@ class Effect3493(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cargo Scanner',
+        fit.modules.filteredItemBoost(itemGroupIs('Cargo Scanner'),
                                       'cargoScanRange', ship.getModifiedItemAttr('cargoScannerRangeBonus'))
 
 
@@ -10425,7 +10426,7 @@ class Effect3494(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Survey Scanner',
+        fit.modules.filteredItemBoost(itemGroupIs('Survey Scanner'),
                                       'surveyScanRange', ship.getModifiedItemAttr('surveyScannerRangeBonus'))
 
 
@@ -10446,7 +10447,7 @@ class Effect3495(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         groups = ('Stasis Web', 'Warp Scrambler')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', ship.getModifiedItemAttr('eliteBonusInterceptorRole'))
 
 
@@ -10463,7 +10464,7 @@ class Effect3496(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'agilityBonus', implant.getModifiedItemAttr('implantSetThukker'))
 
 
@@ -10480,7 +10481,7 @@ class Effect3498(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'scanStrengthBonus', implant.getModifiedItemAttr('implantSetSisters'))
 
 
@@ -10497,7 +10498,7 @@ class Effect3499(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'boosterAttributeModifier',
                                                  implant.getModifiedItemAttr('implantSetSyndicate'))
 
@@ -10515,7 +10516,7 @@ class Effect3513(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'rangeSkillBonus', implant.getModifiedItemAttr('implantSetMordus'))
 
 
@@ -10531,7 +10532,7 @@ class Effect3514(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusInterceptor2'), skill='Interceptors')
 
 
@@ -10547,7 +10548,7 @@ class Effect3519(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'),
                                       'cpu', skill.getModifiedItemAttr('cpuNeedBonus') * skill.level)
 
 
@@ -10563,7 +10564,7 @@ class Effect3520(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'),
                                       'power', skill.getModifiedItemAttr('powerNeedBonus') * skill.level)
 
 
@@ -10581,7 +10582,7 @@ class Effect3526(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cynosural Field Generator',
+        fit.modules.filteredItemBoost(itemGroupIs('Cynosural Field Generator'),
                                       'consumptionQuantity',
                                       container.getModifiedItemAttr('consumptionQuantityBonusPercentage') * level)
 
@@ -10631,7 +10632,7 @@ class Effect3561(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'trackingSpeedBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level)
 
@@ -10648,7 +10649,7 @@ class Effect3568(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers')
 
@@ -10665,7 +10666,7 @@ class Effect3569(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'maxRangeBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers')
 
@@ -10682,7 +10683,7 @@ class Effect3570(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers')
 
@@ -10699,7 +10700,7 @@ class Effect3571(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'trackingSpeedBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers')
 
@@ -10719,7 +10720,7 @@ class Effect3586(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context else True
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level,
                                       stackingPenalties=penalized)
@@ -10737,7 +10738,7 @@ class Effect3587(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser')
 
@@ -10755,7 +10756,7 @@ class Effect3588(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate')
 
@@ -10773,7 +10774,7 @@ class Effect3589(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate')
 
@@ -10790,7 +10791,7 @@ class Effect3590(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser')
 
@@ -10809,7 +10810,7 @@ class Effect3591(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus',
                                       container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level)
 
@@ -11030,7 +11031,7 @@ class Effect3649(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusViolators1'),
                                       skill='Marauders')
 
@@ -11047,7 +11048,7 @@ class Effect3650(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'))
 
 
@@ -11063,7 +11064,7 @@ class Effect3651(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'))
 
 
@@ -11079,7 +11080,7 @@ class Effect3652(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Weapon Disruptor',
+        fit.modules.filteredItemBoost(itemGroupIs('Weapon Disruptor'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'))
 
 
@@ -11095,7 +11096,7 @@ class Effect3653(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Projectors',
+        fit.modules.filteredItemBoost(itemGroupIs('Burst Projectors'),
                                       'maxRange', implant.getModifiedItemAttr('rangeSkillBonus'))
 
 
@@ -11111,7 +11112,7 @@ class Effect3655(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                       stackingPenalties=True)
 
@@ -11128,7 +11129,7 @@ class Effect3656(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True)
 
@@ -11195,7 +11196,7 @@ class Effect3668(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mining Laser',
+        fit.modules.filteredItemBoost(itemGroupIs('Mining Laser'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -11211,7 +11212,7 @@ class Effect3669(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Frequency Mining Laser',
+        fit.modules.filteredItemBoost(itemGroupIs('Frequency Mining Laser'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -11227,7 +11228,7 @@ class Effect3670(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Strip Miner',
+        fit.modules.filteredItemBoost(itemGroupIs('Strip Miner'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -11243,7 +11244,7 @@ class Effect3671(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemBoost(itemGroupIs('Gas Cloud Harvester'),
                                       'maxRange', implant.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -11260,7 +11261,7 @@ class Effect3672(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'maxRangeBonus', implant.getModifiedItemAttr('implantSetORE'))
 
 
@@ -11277,7 +11278,7 @@ class Effect3677(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship')
 
 
@@ -11403,7 +11404,7 @@ class Effect3703(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -11420,7 +11421,7 @@ class Effect3705(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -11436,7 +11437,7 @@ class Effect3706(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -11483,7 +11484,7 @@ class Effect3739(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonusTractorBeamRange'))
 
 
@@ -11499,7 +11500,7 @@ class Effect3740(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam', 'maxTractorVelocity',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'), 'maxTractorVelocity',
                                       ship.getModifiedItemAttr('roleBonusTractorBeamVelocity'))
 
 
@@ -11536,15 +11537,15 @@ class Effect3744(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusICS2'), skill='Industrial Command Ships')
 
 
@@ -11560,7 +11561,7 @@ class Effect3745(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Survey Scanner', 'surveyScanRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Survey Scanner'), 'surveyScanRange',
                                       src.getModifiedItemAttr('roleBonusSurveyScannerRange'))
 
 
@@ -11576,7 +11577,7 @@ class Effect3765(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemMultiply(itemGroupIs('Missile Launcher Torpedo'),
                                          'power', ship.getModifiedItemAttr('stealthBomberLauncherPower'))
 
 
@@ -11592,7 +11593,7 @@ class Effect3766(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterceptor'),
                                       skill='Interceptors')
 
@@ -11609,7 +11610,7 @@ class Effect3767(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships')
 
@@ -11859,7 +11860,7 @@ class Effect3861(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusMinmatarPropulsion'),
                                       skill='Minmatar Propulsion Systems')
 
@@ -11876,7 +11877,7 @@ class Effect3863(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusCaldariPropulsion'),
                                       skill='Caldari Propulsion Systems')
 
@@ -11893,7 +11894,7 @@ class Effect3864(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('subsystemBonusAmarrPropulsion'),
                                       skill='Amarr Propulsion Systems')
 
@@ -11974,7 +11975,7 @@ class Effect3869(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusMinmatarPropulsion2'),
                                       skill='Minmatar Propulsion Systems')
 
@@ -11991,7 +11992,7 @@ class Effect3872(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', src.getModifiedItemAttr('subsystemBonusAmarrPropulsion2'),
                                       skill='Amarr Propulsion Systems')
 
@@ -12008,7 +12009,7 @@ class Effect3875(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'capacitorNeed', module.getModifiedItemAttr('subsystemBonusGallentePropulsion'),
                                       skill='Gallente Propulsion Systems')
 
@@ -12089,7 +12090,7 @@ class Effect3959(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusAmarrDefensive'),
                                       skill='Amarr Defensive Systems')
 
@@ -12107,7 +12108,7 @@ class Effect3961(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', module.getModifiedItemAttr('subsystemBonusGallenteDefensive'),
                                       skill='Gallente Defensive Systems')
 
@@ -12125,10 +12126,10 @@ class Effect3962(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
                                       skill='Minmatar Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive'),
                                       skill='Minmatar Defensive Systems')
 
@@ -12146,7 +12147,7 @@ class Effect3964(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', module.getModifiedItemAttr('subsystemBonusCaldariDefensive'),
                                       skill='Caldari Defensive Systems')
 
@@ -12357,7 +12358,7 @@ class Effect4002(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'maxVelocity', beacon.getModifiedItemAttr('missileVelocityMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12392,7 +12393,7 @@ class Effect4016(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Gunnery'),
                                          'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                          stackingPenalties=True)
 
@@ -12410,7 +12411,7 @@ class Effect4017(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'thermalDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12428,7 +12429,7 @@ class Effect4018(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'emDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12446,7 +12447,7 @@ class Effect4019(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12464,7 +12465,7 @@ class Effect4020(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'kineticDamage', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12482,7 +12483,7 @@ class Effect4021(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemMultiply(itemRequiresSkill('Drones'),
                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                         stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12500,7 +12501,7 @@ class Effect4022(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Gunnery'),
                                          'trackingSpeed', module.getModifiedItemAttr('trackingSpeedMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12518,7 +12519,7 @@ class Effect4023(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'aoeVelocity', beacon.getModifiedItemAttr('aoeVelocityMultiplier'))
 
 
@@ -12739,7 +12740,7 @@ class Effect4045(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'empFieldRange', module.getModifiedItemAttr('empFieldRangeMultiplier'))
 
 
@@ -12756,7 +12757,7 @@ class Effect4046(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'emDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'))
 
 
@@ -12773,7 +12774,7 @@ class Effect4047(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'thermalDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'))
 
 
@@ -12790,7 +12791,7 @@ class Effect4048(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'kineticDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'))
 
 
@@ -12807,7 +12808,7 @@ class Effect4049(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Smart Bomb',
+        fit.modules.filteredItemMultiply(itemGroupIs('Smart Bomb'),
                                          'explosiveDamage', module.getModifiedItemAttr('smartbombDamageMultiplier'))
 
 
@@ -12824,7 +12825,7 @@ class Effect4054(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Energy Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True)
 
@@ -12842,7 +12843,7 @@ class Effect4055(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Projectile Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True)
 
@@ -12860,7 +12861,7 @@ class Effect4056(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Hybrid Turret'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True)
 
@@ -12878,7 +12879,7 @@ class Effect4057(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12896,7 +12897,7 @@ class Effect4058(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12914,7 +12915,7 @@ class Effect4059(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12932,7 +12933,7 @@ class Effect4060(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12950,7 +12951,7 @@ class Effect4061(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12968,7 +12969,7 @@ class Effect4062(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'emDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -12986,7 +12987,7 @@ class Effect4063(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -13023,7 +13024,7 @@ class Effect4088(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Remote Armor Repair Systems'),
                                          'armorDamageAmount',
                                          module.getModifiedItemAttr('armorDamageAmountMultiplierRemote'),
                                          stackingPenalties=True)
@@ -13042,7 +13043,7 @@ class Effect4089(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Shield Emission Systems'),
                                          'shieldBonus', module.getModifiedItemAttr('shieldBonusMultiplierRemote'),
                                          stackingPenalties=True, penaltyGroup='postMul')
 
@@ -13092,7 +13093,7 @@ class Effect4093(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusAmarrOffensive'),
                                       skill='Amarr Offensive Systems')
 
@@ -13109,7 +13110,7 @@ class Effect4104(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusCaldariOffensive'),
                                       skill='Caldari Offensive Systems')
 
@@ -13126,7 +13127,7 @@ class Effect4106(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', module.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                       skill='Gallente Offensive Systems')
 
@@ -13143,7 +13144,7 @@ class Effect4114(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems')
 
@@ -13160,7 +13161,7 @@ class Effect4115(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems')
 
@@ -13178,7 +13179,7 @@ class Effect4122(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
 
 
@@ -13367,7 +13368,7 @@ class Effect4161(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseMaxScanDeviation',
                                         container.getModifiedItemAttr('maxScanDeviationModifier') * level)
 
@@ -13391,7 +13392,7 @@ class Effect4162(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         penalized = False if 'skill' in context or 'implant' in context else True
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', container.getModifiedItemAttr('scanStrengthBonus') * level,
                                         stackingPenalties=penalized)
 
@@ -13408,7 +13409,7 @@ class Effect4165(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusCF2'),
                                         skill='Caldari Frigate')
 
@@ -13425,7 +13426,7 @@ class Effect4166(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusMF2'),
                                         skill='Minmatar Frigate')
 
@@ -13442,7 +13443,7 @@ class Effect4167(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusGF2'),
                                         skill='Gallente Frigate')
 
@@ -13459,7 +13460,7 @@ class Effect4168(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops')
 
@@ -13544,7 +13545,7 @@ class Effect4215(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', module.getModifiedItemAttr('subsystemBonusAmarrOffensive2'),
                                       skill='Amarr Offensive Systems')
 
@@ -13561,7 +13562,7 @@ class Effect4216(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'powerTransferAmount',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'powerTransferAmount',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems')
 
 
@@ -13577,7 +13578,7 @@ class Effect4217(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'energyNeutralizerAmount',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'energyNeutralizerAmount',
                                       src.getModifiedItemAttr('subsystemBonusAmarrCore2'), skill='Amarr Core Systems')
 
 
@@ -13593,13 +13594,13 @@ class Effect4248(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                         skill='Caldari Offensive Systems')
 
@@ -13616,16 +13617,16 @@ class Effect4250(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'),
                                      skill='Gallente Offensive Systems')
 
@@ -13642,7 +13643,7 @@ class Effect4251(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems')
 
@@ -13660,7 +13661,7 @@ class Effect4256(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems')
 
@@ -13772,7 +13773,7 @@ class Effect4273(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'maxRange',
                                       src.getModifiedItemAttr('subsystemBonusGallenteCore2'), skill='Gallente Core Systems')
 
 
@@ -13788,7 +13789,7 @@ class Effect4274(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('subsystemBonusMinmatarCore2'), skill='Minmatar Core Systems')
 
 
@@ -13868,7 +13869,7 @@ class Effect4282(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                       skill='Gallente Offensive Systems')
 
@@ -13885,7 +13886,7 @@ class Effect4283(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', module.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                       skill='Caldari Offensive Systems')
 
@@ -13902,7 +13903,7 @@ class Effect4286(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems')
 
 
@@ -13918,7 +13919,7 @@ class Effect4288(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'), skill='Gallente Offensive Systems')
 
 
@@ -13934,7 +13935,7 @@ class Effect4290(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems', 'Remote Armor Repair Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive2'),
                                       skill='Minmatar Offensive Systems')
 
@@ -13951,7 +13952,7 @@ class Effect4292(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', src.getModifiedItemAttr('subsystemBonusCaldariOffensive2'),
                                       skill='Caldari Offensive Systems')
 
@@ -13968,15 +13969,15 @@ class Effect4321(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanLadarStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanLadarStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanRadarStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanRadarStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'maxRange',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanGravimetricStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanGravimetricStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scanMagnetometricStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scanMagnetometricStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore2'), skill='Caldari Core Systems')
 
 
@@ -13992,13 +13993,13 @@ class Effect4327(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems')
 
 
@@ -14014,7 +14015,7 @@ class Effect4330(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', module.getModifiedItemAttr('subsystemBonusAmarrOffensive3'),
                                       skill='Amarr Offensive Systems')
 
@@ -14031,7 +14032,7 @@ class Effect4331(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles', 'Heavy Assault Missiles'),
                                         'maxVelocity', src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'),
                                         skill='Caldari Offensive Systems')
 
@@ -14081,7 +14082,7 @@ class Effect4347(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', module.getModifiedItemAttr('subsystemBonusGallenteOffensive3'),
                                       skill='Gallente Offensive Systems')
 
@@ -14098,7 +14099,7 @@ class Effect4351(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'trackingSpeed', module.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems')
 
@@ -14115,7 +14116,7 @@ class Effect4358(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'maxRange', module.getModifiedItemAttr('ecmRangeBonus'),
                                       stackingPenalties=True)
 
@@ -14133,7 +14134,7 @@ class Effect4360(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
 
 
@@ -14149,13 +14150,13 @@ class Effect4362(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', src.getModifiedItemAttr('subsystemBonusAmarrOffensive2'), skill='Amarr Offensive Systems')
 
 
@@ -14171,7 +14172,7 @@ class Effect4366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -14202,7 +14203,7 @@ class Effect4370(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCC2'),
                                       skill='Caldari Cruiser')
 
@@ -14219,7 +14220,7 @@ class Effect4372(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusCB3'),
                                       skill='Caldari Battleship')
 
@@ -14236,37 +14237,37 @@ class Effect4373(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusAmarrOffensive'), skill='Amarr Offensive Systems')
 
 
@@ -14283,7 +14284,7 @@ class Effect4377(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -14299,7 +14300,7 @@ class Effect4378(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -14315,7 +14316,7 @@ class Effect4379(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -14331,7 +14332,7 @@ class Effect4380(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -14347,7 +14348,7 @@ class Effect4384(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                         skill='Recon Ships')
 
@@ -14364,7 +14365,7 @@ class Effect4385(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                         skill='Recon Ships')
 
@@ -14382,7 +14383,7 @@ class Effect4393(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops')
 
@@ -14399,7 +14400,7 @@ class Effect4394(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'), skill='Covert Ops')
 
 
@@ -14416,7 +14417,7 @@ class Effect4395(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops')
 
@@ -14433,7 +14434,7 @@ class Effect4396(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusCovertOps2'),
                                         skill='Covert Ops')
 
@@ -14450,7 +14451,7 @@ class Effect4397(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -14467,7 +14468,7 @@ class Effect4398(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -14483,7 +14484,7 @@ class Effect4399(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -14499,7 +14500,7 @@ class Effect4400(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -14515,7 +14516,7 @@ class Effect4413(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -14532,7 +14533,7 @@ class Effect4415(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -14548,7 +14549,7 @@ class Effect4416(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -14564,7 +14565,7 @@ class Effect4417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -14642,7 +14643,7 @@ class Effect4456(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanMagnetometricStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetFederationNavy'))
 
@@ -14660,7 +14661,7 @@ class Effect4457(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanRadarStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetImperialNavy'))
 
@@ -14678,7 +14679,7 @@ class Effect4458(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanLadarStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetRepublicFleet'))
 
@@ -14696,7 +14697,7 @@ class Effect4459(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanGravimetricStrengthPercent',
                                                  implant.getModifiedItemAttr('implantSetCaldariNavy'))
 
@@ -14714,7 +14715,7 @@ class Effect4460(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanRadarStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGImperialNavy'))
 
@@ -14732,7 +14733,7 @@ class Effect4461(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanMagnetometricStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGFederationNavy'))
 
@@ -14750,7 +14751,7 @@ class Effect4462(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanGravimetricStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGCaldariNavy'))
 
@@ -14768,7 +14769,7 @@ class Effect4463(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda target: target.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'scanLadarStrengthModifier',
                                                  implant.getModifiedItemAttr('implantSetLGRepublicFleet'))
 
@@ -14785,7 +14786,7 @@ class Effect4464(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusMF'), stackingPenalties=True, skill='Minmatar Frigate')
 
 
@@ -14803,7 +14804,7 @@ class Effect4471(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -14819,7 +14820,7 @@ class Effect4472(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser')
 
 
@@ -14851,7 +14852,7 @@ class Effect4474(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATC2'))
 
 
@@ -14867,7 +14868,7 @@ class Effect4475(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATC2'))
 
 
@@ -14883,7 +14884,7 @@ class Effect4476(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATF2'))
 
 
@@ -14899,7 +14900,7 @@ class Effect4477(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'))
 
 
@@ -14915,7 +14916,7 @@ class Effect4478(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Propulsion Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Propulsion Module'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusATF1'))
 
 
@@ -14931,7 +14932,7 @@ class Effect4479(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Survey Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Survey Probe'),
                                         'explosionDelay', ship.getModifiedItemAttr('eliteBonusCovertOps3'),
                                         skill='Covert Ops')
 
@@ -14949,7 +14950,7 @@ class Effect4482(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -14965,7 +14966,7 @@ class Effect4484(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship')
 
 
@@ -14981,7 +14982,7 @@ class Effect4485(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -15042,7 +15043,7 @@ class Effect4510(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -15059,7 +15060,7 @@ class Effect4512(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -15076,7 +15077,7 @@ class Effect4513(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -15093,7 +15094,7 @@ class Effect4515(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -15110,7 +15111,7 @@ class Effect4516(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -15126,7 +15127,7 @@ class Effect4527(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'falloff', module.getModifiedItemAttr('falloffBonus'),
                                       stackingPenalties=True)
 
@@ -15143,7 +15144,7 @@ class Effect4555(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'emDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -15159,7 +15160,7 @@ class Effect4556(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'explosiveDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -15175,7 +15176,7 @@ class Effect4557(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'kineticDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -15191,7 +15192,7 @@ class Effect4558(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'),
                                         'thermalDamage', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -15208,7 +15209,7 @@ class Effect4559(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         for attr in ('maxRange', 'falloff', 'trackingSpeed'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           attr, module.getModifiedItemAttr('%sBonus' % attr),
                                           stackingPenalties=True)
 
@@ -15234,92 +15235,92 @@ class Effect4575(BaseEffect):
                                   stackingPenalties=True)
 
         #  Remote Shield Repper Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'duration',
                                       src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus'),
                                       )
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'maxRange',
                                       src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
                                       stackingPenalties=True
                                       )
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'capacitorNeed',
                                       src.getModifiedItemAttr('industrialCoreRemoteLogisticsDurationBonus')
                                       )
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'),
                                       'falloffEffectiveness',
                                       src.getModifiedItemAttr('industrialCoreRemoteLogisticsRangeBonus'),
                                       stackingPenalties=True
                                       )
 
         #  Local Shield Repper Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'duration',
                                       src.getModifiedItemAttr('industrialCoreLocalLogisticsDurationBonus'),
                                       )
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'shieldBonus',
                                       src.getModifiedItemAttr('industrialCoreLocalLogisticsAmountBonus'),
                                       stackingPenalties=True
                                       )
 
         # Mining Burst Bonuses
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff1Value',
                                       src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'),
                                       )
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff2Value',
                                       src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'),
                                       )
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff3Value',
                                       src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'),
                                       )
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'),
                                       'warfareBuff4Value',
                                       src.getModifiedItemAttr('industrialCoreBonusMiningBurstStrength'),
                                       )
 
         #  Command Burst Range Bonus
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'),
                                       'maxRange',
                                       src.getModifiedItemAttr('industrialCoreBonusCommandBurstRange'),
                                       stackingPenalties=True
                                       )
 
         # Drone Bonuses
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'),
                                      'duration',
                                      src.getModifiedItemAttr('industrialCoreBonusDroneIceHarvesting'),
                                      )
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount',
                                      src.getModifiedItemAttr('industrialCoreBonusDroneMining'),
                                      )
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity',
                                      src.getModifiedItemAttr('industrialCoreBonusDroneVelocity'),
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
                                      stackingPenalties=True
                                      )
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity',
                                      src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
                                      )
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP',
                                      src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
                                      )
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp',
                                      src.getModifiedItemAttr('industrialCoreBonusDroneDamageHP'),
                                      )
@@ -15345,7 +15346,7 @@ class Effect4576(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers')
 
@@ -15362,7 +15363,7 @@ class Effect4577(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Tracking Computer',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Tracking Computer'),
                                       'falloffBonus', ship.getModifiedItemAttr('eliteBonusLogistics2'),
                                       skill='Logistics Cruisers')
 
@@ -15379,7 +15380,7 @@ class Effect4579(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Stasis Webifying Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Stasis Webifying Drone'),
                                      'speedFactor', module.getModifiedItemAttr('webSpeedFactorBonus'))
 
 
@@ -15395,7 +15396,7 @@ class Effect4619(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -15412,7 +15413,7 @@ class Effect4620(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -15446,7 +15447,7 @@ class Effect4622(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'))
 
 
@@ -15462,7 +15463,7 @@ class Effect4623(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusATF2'))
 
 
@@ -15478,7 +15479,7 @@ class Effect4624(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusATC2'))
 
 
@@ -15494,7 +15495,7 @@ class Effect4625(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusATC2'))
 
 
@@ -15511,7 +15512,7 @@ class Effect4626(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -15530,7 +15531,7 @@ class Effect4635(BaseEffect):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+                chargeRequiresSkill('Cruise Missiles', 'Torpedoes'),
                 '{0}Damage'.format(damageType), ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -15547,7 +15548,7 @@ class Effect4636(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            chargeRequiresSkill('Cruise Missiles', 'Torpedoes'),
             'aoeVelocity', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
 
 
@@ -15565,7 +15566,7 @@ class Effect4637(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Cruise Missiles') or mod.charge.requiresSkill('Torpedoes'),
+            chargeRequiresSkill('Cruise Missiles', 'Torpedoes'),
             'maxVelocity', ship.getModifiedItemAttr('shipBonusCB3'), skill='Caldari Battleship')
 
 
@@ -15603,7 +15604,7 @@ class Effect4643(BaseEffect):
     def handler(fit, ship, context):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusAC'),
                                             skill='Amarr Cruiser')
 
@@ -15621,7 +15622,7 @@ class Effect4645(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         groups = ('Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault', 'Missile Launcher Heavy')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                       skill='Heavy Assault Cruisers')
 
@@ -15640,7 +15641,7 @@ class Effect4648(BaseEffect):
     def handler(fit, ship, context):
         sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
         for type in sensorTypes:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'scan{0}StrengthBonus'.format(type),
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops')
 
 
@@ -15673,7 +15674,7 @@ class Effect4667(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
                                       skill='ORE Industrial')
 
@@ -15690,7 +15691,7 @@ class Effect4668(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'duration', ship.getModifiedItemAttr('shipBonusOreIndustrial1'),
                                       skill='ORE Industrial')
 
@@ -15707,7 +15708,7 @@ class Effect4669(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxTractorVelocity', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
                                       skill='ORE Industrial')
 
@@ -15724,7 +15725,7 @@ class Effect4670(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Tractor Beam',
+        fit.modules.filteredItemBoost(itemGroupIs('Tractor Beam'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusOreIndustrial2'),
                                       skill='ORE Industrial')
 
@@ -15746,11 +15747,11 @@ class Effect4728(BaseEffect):
         damages = ('em', 'thermal', 'kinetic', 'explosive')
         for damage in damages:
             # Nerf missile damage
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                             '{0}Damage'.format(damage),
                                             beacon.getModifiedItemAttr('systemEffectDamageReduction'))
             # Nerf smartbomb damage
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Smart Bomb',
+            fit.modules.filteredItemBoost(itemGroupIs('Smart Bomb'),
                                           '{0}Damage'.format(damage),
                                           beacon.getModifiedItemAttr('systemEffectDamageReduction'))
             # Nerf armor resistances
@@ -15763,7 +15764,7 @@ class Effect4728(BaseEffect):
         fit.drones.filteredItemBoost(lambda drone: True,
                                      'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'))
         # Nerf turret damage output
-        fit.modules.filteredItemBoost(lambda module: module.item.requiresSkill('Gunnery'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                       'damageMultiplier', beacon.getModifiedItemAttr('systemEffectDamageReduction'))
 
 
@@ -15795,7 +15796,7 @@ class Effect4775(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate')
 
@@ -15812,7 +15813,7 @@ class Effect4782(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusATF2'))
 
 
@@ -15828,7 +15829,7 @@ class Effect4789(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusATF1'))
 
 
@@ -15844,7 +15845,7 @@ class Effect4793(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'))
 
 
@@ -15860,7 +15861,7 @@ class Effect4794(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Light',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Light'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'))
 
 
@@ -15876,7 +15877,7 @@ class Effect4795(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('shipBonusATC1'))
 
 
@@ -15894,7 +15895,7 @@ class Effect4799(BaseEffect):
     def handler(fit, ship, context):
         sensorTypes = ('Gravimetric', 'Ladar', 'Magnetometric', 'Radar')
         for type in sensorTypes:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Burst Jammer',
+            fit.modules.filteredItemBoost(itemGroupIs('Burst Jammer'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('eliteBonusBlackOps1'), skill='Black Ops')
 
@@ -15913,7 +15914,7 @@ class Effect4804(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill(skill), 'accessDifficultyBonus',
+        fit.modules.filteredItemMultiply(itemRequiresSkill(skill), 'accessDifficultyBonus',
                                          skill.getModifiedItemAttr('accessDifficultyBonusAbsolutePercent') * skill.level)
 
 
@@ -15929,7 +15930,7 @@ class Effect4809(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanGravimetricStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True)
 
@@ -15946,7 +15947,7 @@ class Effect4810(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanLadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True)
 
@@ -15963,7 +15964,7 @@ class Effect4811(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanMagnetometricStrengthBonus',
                                       module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True)
@@ -15981,7 +15982,7 @@ class Effect4812(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                       'scanRadarStrengthBonus', module.getModifiedItemAttr('ecmStrengthBonusPercent'),
                                       stackingPenalties=True)
 
@@ -15998,7 +15999,7 @@ class Effect4814(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'consumptionQuantity',
+        fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'consumptionQuantity',
                                       skill.getModifiedItemAttr('consumptionQuantityBonusPercent') * skill.level)
 
 
@@ -16014,7 +16015,7 @@ class Effect4817(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Salvager',
+        fit.modules.filteredItemBoost(itemGroupIs('Salvager'),
                                       'duration', implant.getModifiedItemAttr('durationBonus'))
 
 
@@ -16030,7 +16031,7 @@ class Effect4820(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Energy Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'))
 
 
@@ -16047,7 +16048,7 @@ class Effect4821(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Hybrid Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'))
 
 
@@ -16063,7 +16064,7 @@ class Effect4822(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Projectile Turret'),
                                          'power', ship.getModifiedItemAttr('bcLargeTurretPower'))
 
 
@@ -16079,7 +16080,7 @@ class Effect4823(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Energy Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'))
 
 
@@ -16096,7 +16097,7 @@ class Effect4824(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Hybrid Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'))
 
 
@@ -16112,7 +16113,7 @@ class Effect4825(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Projectile Turret'),
                                          'cpu', ship.getModifiedItemAttr('bcLargeTurretCPU'))
 
 
@@ -16128,7 +16129,7 @@ class Effect4826(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Energy Turret'),
                                          'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'))
 
 
@@ -16145,7 +16146,7 @@ class Effect4827(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Large Hybrid Turret'),
                                          'capacitorNeed', ship.getModifiedItemAttr('bcLargeTurretCap'))
 
 
@@ -16162,7 +16163,7 @@ class Effect4867(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'powerEngineeringOutputBonus',
                                                  implant.getModifiedItemAttr('implantSetChristmas'))
 
@@ -16180,7 +16181,7 @@ class Effect4868(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'capacitorCapacityBonus',
                                                  implant.getModifiedItemAttr('implantSetChristmas'))
 
@@ -16198,7 +16199,7 @@ class Effect4869(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'cpuOutputBonus2', implant.getModifiedItemAttr('implantSetChristmas'))
 
 
@@ -16215,7 +16216,7 @@ class Effect4871(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'capRechargeBonus', implant.getModifiedItemAttr('implantSetChristmas'))
 
 
@@ -16231,7 +16232,7 @@ class Effect4896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -16247,7 +16248,7 @@ class Effect4897(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -16263,7 +16264,7 @@ class Effect4898(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -16279,7 +16280,7 @@ class Effect4901(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -16297,7 +16298,7 @@ class Effect4902(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('MWDSignatureRadiusBonus'))
 
 
@@ -16314,7 +16315,7 @@ class Effect4906(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.drones.filteredItemMultiply(lambda drone: drone.item.requiresSkill('Fighters'),
+        fit.drones.filteredItemMultiply(itemRequiresSkill('Fighters'),
                                         'damageMultiplier', beacon.getModifiedItemAttr('damageMultiplierMultiplier'),
                                         stackingPenalties=True, penaltyGroup='postMul')
 
@@ -16361,7 +16362,7 @@ class Effect4923(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Micro Jump Drive Operation'),
                                       'duration', skill.getModifiedItemAttr('durationBonus') * skill.level)
 
 
@@ -16508,7 +16509,7 @@ class Effect4934(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate')
 
@@ -16544,7 +16545,7 @@ class Effect4941(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -16571,7 +16572,7 @@ class Effect4945(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Breaker',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Breaker'),
                                       'duration', skill.getModifiedItemAttr('durationBonus') * skill.level)
 
 
@@ -16587,7 +16588,7 @@ class Effect4946(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Breaker',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Breaker'),
                                       'capacitorNeed', skill.getModifiedItemAttr('capNeedBonus') * skill.level)
 
 
@@ -16603,7 +16604,7 @@ class Effect4950(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -16622,7 +16623,7 @@ class Effect4951(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
             'shieldBonus', container.getModifiedItemAttr('shieldBoostMultiplier'))
 
 
@@ -16658,7 +16659,7 @@ class Effect4967(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Operation') or mod.item.requiresSkill('Capital Shield Operation'),
+            itemRequiresSkill('Shield Operation', 'Capital Shield Operation'),
             'duration', module.getModifiedItemAttr('durationSkillBonus'))
 
 
@@ -16678,9 +16679,9 @@ class Effect4970(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('boosterShieldBoostAmountPenalty'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('boosterShieldBoostAmountPenalty'))
 
 
@@ -16696,7 +16697,7 @@ class Effect4972(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Light',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Light'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -16712,7 +16713,7 @@ class Effect4973(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rocket'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -16729,7 +16730,7 @@ class Effect4974(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('eliteBonusViolators2'), skill='Marauders')
 
 
@@ -16745,7 +16746,7 @@ class Effect4975(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusATF2'))
 
 
@@ -16762,9 +16763,9 @@ class Effect4976(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'duration',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Resistance Shift Hardener'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Resistance Phasing'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -16780,7 +16781,7 @@ class Effect4989(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', implant.getModifiedItemAttr('aoeCloudSizeBonus'))
 
 
@@ -16797,7 +16798,7 @@ class Effect4990(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('rookieSETCapBonus'))
 
 
@@ -16815,7 +16816,7 @@ class Effect4991(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSETDamageBonus'))
 
 
@@ -16907,7 +16908,7 @@ class Effect4999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSHTOptimalBonus'))
 
 
@@ -16923,7 +16924,7 @@ class Effect5000(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('rookieMissileKinDamageBonus'))
 
 
@@ -17009,7 +17010,7 @@ class Effect5013(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSHTDamageBonus'))
 
 
@@ -17029,7 +17030,7 @@ class Effect5014(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('rookieDroneBonus'))
 
 
@@ -17045,7 +17046,7 @@ class Effect5015(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxTargetRangeBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'))
 
 
@@ -17061,7 +17062,7 @@ class Effect5016(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'scanResolutionBonus', ship.getModifiedItemAttr('rookieDampStrengthBonus'))
 
 
@@ -17077,7 +17078,7 @@ class Effect5017(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('rookieArmorRepBonus'))
 
 
@@ -17108,7 +17109,7 @@ class Effect5019(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('rookieTargetPainterStrengthBonus'))
 
 
@@ -17125,7 +17126,7 @@ class Effect5020(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('rookieSPTDamageBonus'))
 
 
@@ -17142,7 +17143,7 @@ class Effect5021(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('rookieShieldBoostBonus'))
 
 
@@ -17159,7 +17160,7 @@ class Effect5028(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for type in ('Gravimetric', 'Ladar', 'Radar', 'Magnetometric'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM',
+            fit.modules.filteredItemBoost(itemGroupIs('ECM'),
                                           'scan{0}StrengthBonus'.format(type),
                                           ship.getModifiedItemAttr('rookieECMStrengthBonus'))
 
@@ -17176,7 +17177,7 @@ class Effect5029(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount',
                                      src.getModifiedItemAttr('roleBonusDroneMiningYield'),
                                      )
@@ -17197,7 +17198,7 @@ class Effect5030(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount', container.getModifiedItemAttr('rookieDroneBonus'))
 
 
@@ -17219,7 +17220,7 @@ class Effect5035(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for type in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          type, ship.getModifiedItemAttr('rookieDroneBonus'))
 
 
@@ -17235,7 +17236,7 @@ class Effect5036(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -17251,7 +17252,7 @@ class Effect5045(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -17267,7 +17268,7 @@ class Effect5048(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusGF'), skill='Amarr Frigate')
 
 
@@ -17283,7 +17284,7 @@ class Effect5051(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Salvaging'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Salvaging'),
                                       'duration', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -17299,7 +17300,7 @@ class Effect5055(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Ice Harvesting'),
                                          'duration', ship.getModifiedItemAttr('iceHarvestCycleBonus'))
 
 
@@ -17315,7 +17316,7 @@ class Effect5058(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Mining'),
                                          'miningAmount', module.getModifiedItemAttr('miningAmountMultiplier'))
 
 
@@ -17332,7 +17333,7 @@ class Effect5059(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'),
                                       'duration', container.getModifiedItemAttr('shipBonusORE3'), skill='Mining Barge')
 
 
@@ -17349,7 +17350,7 @@ class Effect5066(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Target Painting'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -17396,7 +17397,7 @@ class Effect5069(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Mercoxit Processing'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Mercoxit Processing'),
                                         'specialisationAsteroidYieldMultiplier',
                                         module.getModifiedItemAttr('miningAmountBonus'))
 
@@ -17413,7 +17414,7 @@ class Effect5079(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -17431,7 +17432,7 @@ class Effect5080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -17466,7 +17467,7 @@ class Effect5087(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -17483,7 +17484,7 @@ class Effect5090(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -17499,7 +17500,7 @@ class Effect5103(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -17515,7 +17516,7 @@ class Effect5104(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -17531,7 +17532,7 @@ class Effect5105(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -17547,7 +17548,7 @@ class Effect5106(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -17563,7 +17564,7 @@ class Effect5107(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -17579,7 +17580,7 @@ class Effect5108(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusGF2'),
                                       skill='Gallente Frigate')
 
@@ -17597,7 +17598,7 @@ class Effect5109(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -17614,7 +17615,7 @@ class Effect5110(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -17631,7 +17632,7 @@ class Effect5111(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -17647,7 +17648,7 @@ class Effect5119(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Scanner Probe',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Scanner Probe'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonus2AF'),
                                         skill='Amarr Frigate')
 
@@ -17665,7 +17666,7 @@ class Effect5121(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('energyTransferAmountBonus'))
 
 
@@ -17681,7 +17682,7 @@ class Effect5122(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser')
 
 
@@ -17697,7 +17698,7 @@ class Effect5123(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -17713,7 +17714,7 @@ class Effect5124(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -17729,7 +17730,7 @@ class Effect5125(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser')
 
@@ -17746,7 +17747,7 @@ class Effect5126(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -17762,7 +17763,7 @@ class Effect5127(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -17778,7 +17779,7 @@ class Effect5128(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -17795,7 +17796,7 @@ class Effect5129(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMC'),
                                       skill='Minmatar Cruiser')
 
@@ -17814,7 +17815,7 @@ class Effect5131(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'speed', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -17831,7 +17832,7 @@ class Effect5132(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -17847,7 +17848,7 @@ class Effect5133(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -17866,7 +17867,7 @@ class Effect5136(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -17882,7 +17883,7 @@ class Effect5139(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('shipBonusOREfrig1'),
                                       skill='Mining Frigate')
 
@@ -17900,7 +17901,7 @@ class Effect5142(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemMultiply(itemGroupIs('Gas Cloud Harvester'),
                                          'miningAmount', module.getModifiedItemAttr('miningAmountMultiplier'))
 
 
@@ -17917,7 +17918,7 @@ class Effect5153(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -17934,7 +17935,7 @@ class Effect5156(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Gas Cloud Harvester',
+        fit.modules.filteredItemBoost(itemGroupIs('Gas Cloud Harvester'),
                                       'duration', module.getModifiedItemAttr('shipBonusOREfrig2'), skill='Mining Frigate')
 
 
@@ -17951,9 +17952,9 @@ class Effect5162(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Resistance Shift Hardener', 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Resistance Shift Hardener'), 'capacitorNeed',
                                       src.getModifiedItemAttr('capNeedBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Resistance Phasing'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Resistance Phasing'), 'capacitorNeed',
                                       src.getModifiedItemAttr('capNeedBonus') * lvl)
 
 
@@ -17970,7 +17971,7 @@ class Effect5165(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -17986,7 +17987,7 @@ class Effect5168(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.drones.filteredItemIncrease(lambda drone: drone.item.requiresSkill('Salvage Drone Operation'),
+        fit.drones.filteredItemIncrease(itemRequiresSkill('Salvage Drone Operation'),
                                         'accessDifficultyBonus',
                                         container.getModifiedItemAttr('accessDifficultyBonus') * container.level)
 
@@ -18065,7 +18066,7 @@ class Effect5185(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('shipBonus2AF'),
                                       skill='Amarr Frigate')
 
@@ -18082,7 +18083,7 @@ class Effect5187(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Sensor Dampener',
+        fit.modules.filteredItemBoost(itemGroupIs('Sensor Dampener'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser')
 
@@ -18099,7 +18100,7 @@ class Effect5188(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Hybrid Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Hybrid Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True)
 
@@ -18116,7 +18117,7 @@ class Effect5189(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True)
 
@@ -18133,7 +18134,7 @@ class Effect5190(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Projectile Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Projectile Weapon'),
                                       'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                       stackingPenalties=True)
 
@@ -18151,7 +18152,7 @@ class Effect5201(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Armor Reinforcer',
+        fit.modules.filteredItemBoost(itemGroupIs('Armor Reinforcer'),
                                       'massAddition', container.getModifiedItemAttr('massPenaltyReduction') * level)
 
 
@@ -18167,7 +18168,7 @@ class Effect5205(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSETTracking'))
 
 
@@ -18183,7 +18184,7 @@ class Effect5206(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSETOptimal'))
 
 
@@ -18199,7 +18200,7 @@ class Effect5207(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', ship.getModifiedItemAttr('rookieNosDrain'))
 
 
@@ -18215,7 +18216,7 @@ class Effect5208(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', ship.getModifiedItemAttr('rookieNeutDrain'))
 
 
@@ -18232,7 +18233,7 @@ class Effect5209(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'speedFactor', ship.getModifiedItemAttr('rookieWebAmount'))
 
 
@@ -18264,7 +18265,7 @@ class Effect5213(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'maxVelocity', ship.getModifiedItemAttr('rookieRocketVelocity'))
 
 
@@ -18280,7 +18281,7 @@ class Effect5214(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('rookieLightMissileVelocity'))
 
 
@@ -18296,7 +18297,7 @@ class Effect5215(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSHTTracking'))
 
 
@@ -18312,7 +18313,7 @@ class Effect5216(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('rookieSHTFalloff'))
 
 
@@ -18328,7 +18329,7 @@ class Effect5217(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('rookieSPTTracking'))
 
 
@@ -18344,7 +18345,7 @@ class Effect5218(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('rookieSPTFalloff'))
 
 
@@ -18360,7 +18361,7 @@ class Effect5219(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('rookieSPTOptimal'))
 
 
@@ -18376,7 +18377,7 @@ class Effect5220(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18392,7 +18393,7 @@ class Effect5221(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18408,7 +18409,7 @@ class Effect5222(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18424,7 +18425,7 @@ class Effect5223(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18440,7 +18441,7 @@ class Effect5224(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18456,7 +18457,7 @@ class Effect5225(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18472,7 +18473,7 @@ class Effect5226(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18488,7 +18489,7 @@ class Effect5227(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18504,7 +18505,7 @@ class Effect5228(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -18524,7 +18525,7 @@ class Effect5229(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', container.getModifiedItemAttr('shipBonusRole8'))
 
 
@@ -18580,7 +18581,7 @@ class Effect5234(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'explosiveDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -18597,7 +18598,7 @@ class Effect5237(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'kineticDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -18615,7 +18616,7 @@ class Effect5240(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'thermalDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -18633,7 +18634,7 @@ class Effect5243(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'emDamage', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -18650,7 +18651,7 @@ class Effect5259(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemBoost(itemGroupIs('Cloaking Device'),
                                       'cpu', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships')
 
 
@@ -18667,7 +18668,7 @@ class Effect5260(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cpu', ship.getModifiedItemAttr('eliteBonusCovertOps1'), skill='Covert Ops')
 
 
@@ -18699,7 +18700,7 @@ class Effect5262(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Cloaking'),
                                          'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'))
 
 
@@ -18715,7 +18716,7 @@ class Effect5263(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Cynosural Field Theory'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Cynosural Field Theory'),
                                          'covertCloakCPUAdd', module.getModifiedItemAttr('covertCloakCPUPenalty'))
 
 
@@ -18747,7 +18748,7 @@ class Effect5265(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'),
                                          'warfareLinkCPUAdd', module.getModifiedItemAttr('warfareLinkCPUPenalty'))
 
 
@@ -18764,7 +18765,7 @@ class Effect5266(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemBoost(itemGroupIs('Cloaking Device'),
                                       'cpu', ship.getModifiedItemAttr('eliteIndustrialCovertCloakBonus'),
                                       skill='Transport Ships')
 
@@ -18782,7 +18783,7 @@ class Effect5267(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'power', module.getModifiedItemAttr('drawback'))
 
 
@@ -18799,7 +18800,7 @@ class Effect5268(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'power', module.getModifiedItemAttr('drawback'))
 
 
@@ -18841,7 +18842,7 @@ class Effect5293(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
 
 
@@ -18857,7 +18858,7 @@ class Effect5294(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer')
 
 
@@ -18873,7 +18874,7 @@ class Effect5295(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
 
 
@@ -18889,11 +18890,11 @@ class Effect5300(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
 
 
@@ -18909,7 +18910,7 @@ class Effect5303(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer')
 
 
@@ -18925,7 +18926,7 @@ class Effect5304(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer')
 
 
@@ -18941,7 +18942,7 @@ class Effect5305(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer')
 
@@ -18958,7 +18959,7 @@ class Effect5306(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer')
 
@@ -18975,7 +18976,7 @@ class Effect5307(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer')
 
 
@@ -18991,7 +18992,7 @@ class Effect5308(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer')
 
 
@@ -19007,7 +19008,7 @@ class Effect5309(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer')
 
 
@@ -19024,7 +19025,7 @@ class Effect5310(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGD2'), skill='Gallente Destroyer')
 
 
@@ -19040,7 +19041,7 @@ class Effect5311(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer')
 
 
@@ -19056,11 +19057,11 @@ class Effect5316(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer')
 
 
@@ -19076,7 +19077,7 @@ class Effect5317(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMD1'),
                                       skill='Minmatar Destroyer')
 
@@ -19093,7 +19094,7 @@ class Effect5318(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMD2'), skill='Minmatar Destroyer')
 
 
@@ -19109,7 +19110,7 @@ class Effect5319(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer')
 
@@ -19126,7 +19127,7 @@ class Effect5320(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer')
 
@@ -19143,7 +19144,7 @@ class Effect5321(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('shipBonusMD2'),
                                       skill='Minmatar Destroyer')
 
@@ -19228,7 +19229,7 @@ class Effect5326(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                      skill='Amarr Battlecruiser')
 
@@ -19246,7 +19247,7 @@ class Effect5331(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusABC2'), skill='Amarr Battlecruiser')
 
 
@@ -19262,7 +19263,7 @@ class Effect5332(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser')
 
@@ -19279,7 +19280,7 @@ class Effect5333(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser')
 
@@ -19296,7 +19297,7 @@ class Effect5334(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser')
 
 
@@ -19385,7 +19386,7 @@ class Effect5339(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser')
 
@@ -19403,7 +19404,7 @@ class Effect5340(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser')
 
@@ -19420,7 +19421,7 @@ class Effect5341(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
                                       skill='Gallente Battlecruiser')
 
@@ -19439,7 +19440,7 @@ class Effect5342(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser')
 
@@ -19456,7 +19457,7 @@ class Effect5343(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC1'),
                                      skill='Gallente Battlecruiser')
 
@@ -19474,7 +19475,7 @@ class Effect5348(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for layer in ('shieldCapacity', 'armorHP', 'hp'):
-            fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+            fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                          layer, ship.getModifiedItemAttr('shipBonusGBC1'), skill='Gallente Battlecruiser')
 
 
@@ -19490,7 +19491,7 @@ class Effect5349(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser')
 
 
@@ -19506,7 +19507,7 @@ class Effect5350(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser')
 
 
@@ -19523,7 +19524,7 @@ class Effect5351(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMBC1'),
                                       skill='Minmatar Battlecruiser')
 
@@ -19540,7 +19541,7 @@ class Effect5352(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC1'),
                                       skill='Minmatar Battlecruiser')
 
@@ -19557,7 +19558,7 @@ class Effect5353(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser')
 
 
@@ -19573,7 +19574,7 @@ class Effect5354(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser')
 
@@ -19590,7 +19591,7 @@ class Effect5355(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser')
 
@@ -19607,7 +19608,7 @@ class Effect5356(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusCBC1'), skill='Caldari Battlecruiser')
 
 
@@ -19623,7 +19624,7 @@ class Effect5357(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
                                       skill='Caldari Battlecruiser')
 
@@ -19640,7 +19641,7 @@ class Effect5358(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC1'),
                                       skill='Gallente Battlecruiser')
 
@@ -19657,7 +19658,7 @@ class Effect5359(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser')
 
@@ -19674,7 +19675,7 @@ class Effect5360(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMBC1'), skill='Minmatar Battlecruiser')
 
 
@@ -19690,7 +19691,7 @@ class Effect5361(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMBC2'), skill='Minmatar Battlecruiser')
 
 
@@ -19709,7 +19710,7 @@ class Effect5364(BaseEffect):
     @staticmethod
     def handler(fit, booster, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Capital Repair Systems'),
+            itemRequiresSkill('Repair Systems', 'Capital Repair Systems'),
             'armorDamageAmount', booster.getModifiedItemAttr('armorDamageAmountBonus') or 0)
 
 
@@ -19726,7 +19727,7 @@ class Effect5365(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('eliteBonusViolators2'),
                                       skill='Marauders')
 
@@ -19743,7 +19744,7 @@ class Effect5366(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusATC2'))
 
 
@@ -19759,7 +19760,7 @@ class Effect5367(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGB2'),
                                       skill='Gallente Battleship')
 
@@ -19776,7 +19777,7 @@ class Effect5378(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser')
 
@@ -19793,7 +19794,7 @@ class Effect5379(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCBC1'),
                                         skill='Caldari Battlecruiser')
 
@@ -19810,7 +19811,7 @@ class Effect5380(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGBC2'),
                                       skill='Gallente Battlecruiser')
 
@@ -19827,7 +19828,7 @@ class Effect5381(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusABC1'),
                                       skill='Amarr Battlecruiser')
 
@@ -19845,7 +19846,7 @@ class Effect5382(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -19862,7 +19863,7 @@ class Effect5383(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -19879,7 +19880,7 @@ class Effect5384(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -19896,7 +19897,7 @@ class Effect5385(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -19912,7 +19913,7 @@ class Effect5386(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -19928,7 +19929,7 @@ class Effect5387(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -19944,7 +19945,7 @@ class Effect5388(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -19960,7 +19961,7 @@ class Effect5389(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -19976,7 +19977,7 @@ class Effect5397(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseMaxScanDeviation',
                                         module.getModifiedItemAttr('maxScanDeviationModifierModule'),
                                         stackingPenalties=True)
@@ -19994,7 +19995,7 @@ class Effect5398(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Astrometrics'),
                                       'duration', module.getModifiedItemAttr('scanDurationBonus'))
 
 
@@ -20010,7 +20011,7 @@ class Effect5399(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', module.getModifiedItemAttr('scanStrengthBonusModule'),
                                         stackingPenalties=True)
 
@@ -20027,7 +20028,7 @@ class Effect5402(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
                                         skill='Amarr Battlecruiser')
 
@@ -20044,7 +20045,7 @@ class Effect5403(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusABC2'),
                                         skill='Amarr Battlecruiser')
 
@@ -20061,7 +20062,7 @@ class Effect5410(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusABC2'),
                                       skill='Amarr Battlecruiser')
 
@@ -20078,7 +20079,7 @@ class Effect5411(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer')
 
 
@@ -20094,7 +20095,7 @@ class Effect5417(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -20110,7 +20111,7 @@ class Effect5418(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -20126,7 +20127,7 @@ class Effect5419(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -20142,7 +20143,7 @@ class Effect5420(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -20159,7 +20160,7 @@ class Effect5424(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship')
 
 
@@ -20175,7 +20176,7 @@ class Effect5427(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship')
 
 
@@ -20191,7 +20192,7 @@ class Effect5428(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship')
 
 
@@ -20207,7 +20208,7 @@ class Effect5429(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
                                         skill='Minmatar Battleship')
 
@@ -20224,7 +20225,7 @@ class Effect5430(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('shipBonusMB2'),
                                         skill='Minmatar Battleship')
 
@@ -20242,7 +20243,7 @@ class Effect5431(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -20263,7 +20264,7 @@ class Effect5433(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Hacking'),
                                          'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level)
 
 
@@ -20283,7 +20284,7 @@ class Effect5437(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Archaeology'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Archaeology'),
                                          'virusCoherence', container.getModifiedItemAttr('virusCoherenceBonus') * level)
 
 
@@ -20300,7 +20301,7 @@ class Effect5440(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Light Missiles'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -20317,7 +20318,7 @@ class Effect5444(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -20333,7 +20334,7 @@ class Effect5445(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -20349,7 +20350,7 @@ class Effect5456(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -20365,7 +20366,7 @@ class Effect5457(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -20381,7 +20382,7 @@ class Effect5459(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Hacking'), 'virusStrength', src.getModifiedItemAttr('virusStrengthBonus'))
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Hacking'), 'virusStrength', src.getModifiedItemAttr('virusStrengthBonus'))
 
 
 class Effect5460(BaseEffect):
@@ -20562,7 +20563,7 @@ class Effect5480(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'implantBonusVelocity', implant.getModifiedItemAttr('implantSetChristmas'))
 
 
@@ -20579,7 +20580,7 @@ class Effect5482(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'agilityBonus', implant.getModifiedItemAttr('implantSetChristmas'))
 
 
@@ -20596,7 +20597,7 @@ class Effect5483(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'shieldCapacityBonus', implant.getModifiedItemAttr('implantSetChristmas'))
 
 
@@ -20613,7 +20614,7 @@ class Effect5484(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Special Edition Implant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Special Edition Implant'),
                                                  'armorHpBonus2', implant.getModifiedItemAttr('implantSetChristmas'))
 
 
@@ -20629,7 +20630,7 @@ class Effect5485(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -20645,7 +20646,7 @@ class Effect5486(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusMBC2'),
                                       skill='Minmatar Battlecruiser')
 
@@ -20663,7 +20664,7 @@ class Effect5496(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy Assault',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy Assault'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships')
 
 
@@ -20680,7 +20681,7 @@ class Effect5497(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Heavy'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships')
 
 
@@ -20696,7 +20697,7 @@ class Effect5498(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'aoeVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships')
 
@@ -20713,7 +20714,7 @@ class Effect5499(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships')
 
@@ -20730,7 +20731,7 @@ class Effect5500(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'aoeCloudSize', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                         skill='Command Ships')
 
@@ -20747,7 +20748,7 @@ class Effect5501(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                       skill='Command Ships')
 
@@ -20764,7 +20765,7 @@ class Effect5502(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('eliteBonusCommandShips1'),
                                       skill='Command Ships')
 
@@ -20781,7 +20782,7 @@ class Effect5503(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                      skill='Command Ships')
 
@@ -20798,7 +20799,7 @@ class Effect5504(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'maxVelocity', ship.getModifiedItemAttr('eliteBonusCommandShips2'),
                                      skill='Command Ships')
 
@@ -20815,7 +20816,7 @@ class Effect5505(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusCommandShips1'), skill='Command Ships')
 
 
@@ -20833,7 +20834,7 @@ class Effect5514(BaseEffect):
     def handler(fit, ship, context):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType),
                                             ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships')
 
@@ -20852,7 +20853,7 @@ class Effect5521(BaseEffect):
     def handler(fit, ship, context):
         damageTypes = ('em', 'explosive', 'kinetic', 'thermal')
         for damageType in damageTypes:
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                             '{0}Damage'.format(damageType),
                                             ship.getModifiedItemAttr('eliteBonusCommandShips2'), skill='Command Ships')
 
@@ -20869,7 +20870,7 @@ class Effect5539(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -20885,7 +20886,7 @@ class Effect5540(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -20901,7 +20902,7 @@ class Effect5541(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -20917,7 +20918,7 @@ class Effect5542(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -20933,7 +20934,7 @@ class Effect5552(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers')
 
@@ -20950,7 +20951,7 @@ class Effect5553(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'maxVelocity', ship.getModifiedItemAttr('eliteBonusHeavyGunship1'),
                                         skill='Heavy Assault Cruisers')
 
@@ -20967,7 +20968,7 @@ class Effect5554(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGC2'),
                                       skill='Gallente Cruiser')
 
@@ -20984,7 +20985,7 @@ class Effect5555(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'maxVelocity', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -21000,7 +21001,7 @@ class Effect5556(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -21016,7 +21017,7 @@ class Effect5557(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                      skill='Heavy Assault Cruisers')
 
@@ -21033,7 +21034,7 @@ class Effect5558(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'trackingSpeed', ship.getModifiedItemAttr('eliteBonusHeavyGunship2'),
                                      skill='Heavy Assault Cruisers')
 
@@ -21050,7 +21051,7 @@ class Effect5559(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -21066,7 +21067,7 @@ class Effect5560(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Micro Jump Drive',
+        fit.modules.filteredItemBoost(itemGroupIs('Micro Jump Drive'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('roleBonusMarauder'))
 
 
@@ -21082,37 +21083,37 @@ class Effect5564(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusCaldariOffensive'), skill='Caldari Offensive Systems')
 
 
@@ -21128,37 +21129,37 @@ class Effect5568(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusGallenteOffensive'), skill='Gallente Offensive Systems')
 
 
@@ -21174,38 +21175,38 @@ class Effect5570(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'),
                                       'war'
                                       'fareBuff1Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff3Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff4Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff1Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'buffDuration', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'),
                                       'warfareBuff2Value', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive'), skill='Minmatar Offensive Systems')
 
 
@@ -21221,15 +21222,15 @@ class Effect5572(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
 
 
@@ -21245,15 +21246,15 @@ class Effect5573(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
 
 
@@ -21269,15 +21270,15 @@ class Effect5574(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
 
 
@@ -21293,15 +21294,15 @@ class Effect5575(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandShips3'), skill='Command Ships')
 
 
@@ -21320,7 +21321,7 @@ class Effect5607(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capacitor Emission Systems'),
                                       'capacitorNeed', container.getModifiedItemAttr('capNeedBonus') * level)
 
 
@@ -21337,7 +21338,7 @@ class Effect5610(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -21353,7 +21354,7 @@ class Effect5611(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusGB2'), skill='Gallente Battleship')
 
 
@@ -21370,7 +21371,7 @@ class Effect5618(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
 
 
@@ -21386,7 +21387,7 @@ class Effect5619(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -21402,7 +21403,7 @@ class Effect5620(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -21418,7 +21419,7 @@ class Effect5621(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -21434,7 +21435,7 @@ class Effect5622(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -21450,7 +21451,7 @@ class Effect5628(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -21466,7 +21467,7 @@ class Effect5629(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21483,7 +21484,7 @@ class Effect5630(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21500,7 +21501,7 @@ class Effect5631(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21517,7 +21518,7 @@ class Effect5632(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21534,7 +21535,7 @@ class Effect5633(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -21550,7 +21551,7 @@ class Effect5634(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21567,7 +21568,7 @@ class Effect5635(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21584,7 +21585,7 @@ class Effect5636(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusMB'), skill='Minmatar Battleship')
 
 
@@ -21600,7 +21601,7 @@ class Effect5637(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21617,7 +21618,7 @@ class Effect5638(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21634,7 +21635,7 @@ class Effect5639(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusMB'),
                                         skill='Minmatar Battleship')
 
@@ -21651,7 +21652,7 @@ class Effect5644(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -21674,7 +21675,7 @@ class Effect5647(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'),
                                       'cpu', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -21726,7 +21727,7 @@ class Effect5673(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusInterceptor2'),
                                       skill='Interceptors')
 
@@ -21744,7 +21745,7 @@ class Effect5676(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCD2'), skill='Caldari Destroyer')
 
 
@@ -21760,7 +21761,7 @@ class Effect5688(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', ship.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer')
 
 
@@ -21794,7 +21795,7 @@ class Effect5717(BaseEffect):
 
     @staticmethod
     def handler(fit, implant, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.group.name == 'Cyberimplant',
+        fit.appliedImplants.filteredItemMultiply(itemGroupIs('Cyberimplant'),
                                                  'WarpSBonus', implant.getModifiedItemAttr('implantSetWarpSpeed'))
 
 
@@ -21810,7 +21811,7 @@ class Effect5721(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -21826,7 +21827,7 @@ class Effect5722(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGD1'), skill='Gallente Destroyer')
 
 
@@ -21842,7 +21843,7 @@ class Effect5723(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'signatureRadiusBonus', ship.getModifiedItemAttr('eliteBonusInterdictors2'),
                                       skill='Interdictors')
 
@@ -21859,7 +21860,7 @@ class Effect5724(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -21875,7 +21876,7 @@ class Effect5725(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -21891,7 +21892,7 @@ class Effect5726(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -21907,7 +21908,7 @@ class Effect5733(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosiveDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -21923,7 +21924,7 @@ class Effect5734(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'kineticDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -21939,7 +21940,7 @@ class Effect5735(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -21955,7 +21956,7 @@ class Effect5736(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'thermalDamage', ship.getModifiedItemAttr('eliteBonusViolatorsRole1'))
 
 
@@ -21971,7 +21972,7 @@ class Effect5737(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -21987,9 +21988,9 @@ class Effect5738(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole8'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', ship.getModifiedItemAttr('shipBonusRole8'))
 
 
@@ -22066,7 +22067,7 @@ class Effect5769(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'),
                                      'structureDamageAmount', container.getModifiedItemAttr('damageHP') * level)
 
 
@@ -22083,7 +22084,7 @@ class Effect5778(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -22100,7 +22101,7 @@ class Effect5779(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -22119,7 +22120,7 @@ class Effect5793(BaseEffect):
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
         for attr in ('maxRangeBonus', 'falloffBonus'):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                           attr, container.getModifiedItemAttr('scanSkillEwStrengthBonus') * level)
 
 
@@ -22135,7 +22136,7 @@ class Effect5802(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
 
 
@@ -22151,7 +22152,7 @@ class Effect5803(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22167,7 +22168,7 @@ class Effect5804(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22183,7 +22184,7 @@ class Effect5805(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22199,7 +22200,7 @@ class Effect5806(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22215,7 +22216,7 @@ class Effect5807(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22231,7 +22232,7 @@ class Effect5808(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22247,7 +22248,7 @@ class Effect5809(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22263,7 +22264,7 @@ class Effect5810(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22279,7 +22280,7 @@ class Effect5811(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGB2'),
                                         skill='Gallente Battleship')
 
@@ -22296,7 +22297,7 @@ class Effect5812(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGB2'),
                                         skill='Gallente Battleship')
 
@@ -22314,7 +22315,7 @@ class Effect5813(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -22331,7 +22332,7 @@ class Effect5814(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -22348,7 +22349,7 @@ class Effect5815(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -22365,7 +22366,7 @@ class Effect5816(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22382,7 +22383,7 @@ class Effect5817(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22399,7 +22400,7 @@ class Effect5818(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22416,7 +22417,7 @@ class Effect5819(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22433,7 +22434,7 @@ class Effect5820(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'speedFactor', module.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -22450,7 +22451,7 @@ class Effect5821(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22466,7 +22467,7 @@ class Effect5822(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22482,7 +22483,7 @@ class Effect5823(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22498,7 +22499,7 @@ class Effect5824(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -22515,7 +22516,7 @@ class Effect5825(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -22532,7 +22533,7 @@ class Effect5826(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -22548,7 +22549,7 @@ class Effect5827(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusAF'), skill='Amarr Frigate')
 
 
@@ -22565,7 +22566,7 @@ class Effect5829(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'duration', ship.getModifiedItemAttr('shipBonusORE3'), skill='Mining Barge')
 
 
@@ -22582,7 +22583,7 @@ class Effect5832(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Mining') or mod.item.requiresSkill('Ice Harvesting'),
+            itemRequiresSkill('Mining', 'Ice Harvesting'),
             'maxRange', ship.getModifiedItemAttr('shipBonusORE2'), skill='Mining Barge')
 
 
@@ -22615,7 +22616,7 @@ class Effect5840(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'duration', ship.getModifiedItemAttr('eliteBonusBarge2'), skill='Exhumers')
 
 
@@ -22631,7 +22632,7 @@ class Effect5852(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'),
                                       'miningAmount', module.getModifiedItemAttr('eliteBonusExpedition1'),
                                       skill='Expedition Frigates')
 
@@ -22664,7 +22665,7 @@ class Effect5862(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'emDamage', ship.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -22680,7 +22681,7 @@ class Effect5863(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'kineticDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship')
 
@@ -22697,7 +22698,7 @@ class Effect5864(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'thermalDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship')
 
@@ -22714,7 +22715,7 @@ class Effect5865(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', ship.getModifiedItemAttr('shipBonusCB'),
                                         skill='Caldari Battleship')
 
@@ -22731,7 +22732,7 @@ class Effect5866(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusGB'), skill='Gallente Battleship')
 
 
@@ -22749,7 +22750,7 @@ class Effect5867(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosionDelay', ship.getModifiedItemAttr('shipBonusRole8'))
 
 
@@ -22796,7 +22797,7 @@ class Effect5870(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusCI2'), skill='Caldari Industrial')
 
 
@@ -22812,7 +22813,7 @@ class Effect5871(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', ship.getModifiedItemAttr('shipBonusMI2'), skill='Minmatar Industrial')
 
 
@@ -22828,7 +22829,7 @@ class Effect5872(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusAI2'),
                                       skill='Amarr Industrial')
 
@@ -22845,7 +22846,7 @@ class Effect5873(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', ship.getModifiedItemAttr('shipBonusGI2'),
                                       skill='Gallente Industrial')
 
@@ -22914,7 +22915,7 @@ class Effect5889(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'),
                                       'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
 
 
@@ -22930,7 +22931,7 @@ class Effect5890(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
 
 
@@ -22946,7 +22947,7 @@ class Effect5891(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'),
                                       'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
 
 
@@ -22962,7 +22963,7 @@ class Effect5892(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
 
 
@@ -22978,7 +22979,7 @@ class Effect5893(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Tactical Shield Manipulation'),
                                       'overloadHardeningBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
 
 
@@ -22994,9 +22995,9 @@ class Effect5896(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadShieldBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
 
 
@@ -23012,9 +23013,9 @@ class Effect5899(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadArmorDamageAmount', ship.getModifiedItemAttr('roleBonusOverheatDST'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadSelfDurationBonus', ship.getModifiedItemAttr('roleBonusOverheatDST'))
 
 
@@ -23046,7 +23047,7 @@ class Effect5901(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Reinforced Bulkhead',
+        fit.modules.filteredItemBoost(itemGroupIs('Reinforced Bulkhead'),
                                       'cpu', ship.getModifiedItemAttr('cpuNeedBonus'))
 
 
@@ -23080,7 +23081,7 @@ class Effect5912(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemMultiply(itemGroupIs('Remote Capacitor Transmitter'),
                                          'powerTransferAmount', beacon.getModifiedItemAttr('energyTransferAmountBonus'),
                                          stackingPenalties=True, penaltyGroup='postMul')
 
@@ -23114,7 +23115,7 @@ class Effect5914(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Neutralizer'),
                                          'energyNeutralizerAmount',
                                          beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul')
@@ -23133,7 +23134,7 @@ class Effect5915(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemMultiply(itemGroupIs('Energy Nosferatu'),
                                          'powerTransferAmount',
                                          beacon.getModifiedItemAttr('energyWarfareStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul')
@@ -23152,7 +23153,7 @@ class Effect5916(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'explosiveDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -23170,7 +23171,7 @@ class Effect5917(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'kineticDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -23188,7 +23189,7 @@ class Effect5918(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'thermalDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -23206,7 +23207,7 @@ class Effect5919(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'emDamage', beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
 
@@ -23224,7 +23225,7 @@ class Effect5920(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Missile Launcher Operation'),
                                            'aoeCloudSize', beacon.getModifiedItemAttr('aoeCloudSizeMultiplier'))
 
 
@@ -23241,7 +23242,7 @@ class Effect5921(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Target Painting'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Target Painting'),
                                          'signatureRadiusBonus',
                                          beacon.getModifiedItemAttr('targetPainterStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul')
@@ -23260,7 +23261,7 @@ class Effect5922(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemMultiply(itemGroupIs('Stasis Web'),
                                          'speedFactor', beacon.getModifiedItemAttr('stasisWebStrengthMultiplier'),
                                          stackingPenalties=True, penaltyGroup='postMul')
 
@@ -23278,7 +23279,7 @@ class Effect5923(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'energyNeutralizerAmount',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
@@ -23297,7 +23298,7 @@ class Effect5924(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanGravimetricStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
@@ -23316,7 +23317,7 @@ class Effect5925(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanLadarStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
@@ -23335,7 +23336,7 @@ class Effect5926(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanMagnetometricStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
@@ -23354,7 +23355,7 @@ class Effect5927(BaseEffect):
 
     @staticmethod
     def handler(fit, beacon, context):
-        fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Bomb Deployment'),
+        fit.modules.filteredChargeMultiply(chargeRequiresSkill('Bomb Deployment'),
                                            'scanRadarStrengthBonus',
                                            beacon.getModifiedItemAttr('smartbombDamageMultiplier'),
                                            stackingPenalties=True, penaltyGroup='postMul')
@@ -23420,7 +23421,7 @@ class Effect5938(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            chargeRequiresSkill('Rockets', 'Light Missiles'),
             'aoeCloudSize', ship.getModifiedItemAttr('shipBonusCF2'), skill='Caldari Frigate')
 
 
@@ -23436,7 +23437,7 @@ class Effect5939(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rocket',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rocket'),
                                       'speed', ship.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -23452,7 +23453,7 @@ class Effect5940(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('eliteBonusInterdictors1'), skill='Interdictors')
 
 
@@ -23468,7 +23469,7 @@ class Effect5944(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
 
 
@@ -23520,7 +23521,7 @@ class Effect5956(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -23536,7 +23537,7 @@ class Effect5957(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers')
 
@@ -23554,7 +23555,7 @@ class Effect5958(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusGC'), skill='Gallente Cruiser')
 
 
@@ -23570,7 +23571,7 @@ class Effect5959(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusHeavyInterdictors1'),
                                       skill='Heavy Interdiction Cruisers')
 
@@ -23655,7 +23656,7 @@ class Effect6006(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr1'),
                                       skill='Amarr Tactical Destroyer')
 
@@ -23672,7 +23673,7 @@ class Effect6007(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerAmarr2'),
                                       skill='Amarr Tactical Destroyer')
 
@@ -23707,7 +23708,7 @@ class Effect6009(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Astrometrics'), 'cpu', src.getModifiedItemAttr('roleBonusT3ProbeCPU'))
+        fit.modules.filteredItemBoost(itemRequiresSkill('Astrometrics'), 'cpu', src.getModifiedItemAttr('roleBonusT3ProbeCPU'))
 
 
 class Effect6010(BaseEffect):
@@ -23743,7 +23744,7 @@ class Effect6011(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            itemRequiresSkill('Small Energy Turret'),
             'maxRange',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -23867,7 +23868,7 @@ class Effect6020(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships')
 
 
@@ -23883,7 +23884,7 @@ class Effect6021(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships')
 
 
@@ -23899,7 +23900,7 @@ class Effect6025(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships')
 
 
@@ -23915,7 +23916,7 @@ class Effect6027(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('eliteBonusReconShip1'),
                                       skill='Recon Ships')
 
@@ -23932,7 +23933,7 @@ class Effect6032(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'),
                                       'power', ship.getModifiedItemAttr('powerTransferPowerNeedBonus'))
 
 
@@ -23965,7 +23966,7 @@ class Effect6037(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar1'),
                                       skill='Minmatar Tactical Destroyer')
 
@@ -23982,7 +23983,7 @@ class Effect6038(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusTacticalDestroyerMinmatar2'),
                                       skill='Minmatar Tactical Destroyer')
 
@@ -24000,7 +24001,7 @@ class Effect6039(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            itemRequiresSkill('Small Projectile Turret'),
             'trackingSpeed',
             1 / module.getModifiedItemAttr('modeTrackingPostDiv'),
             stackingPenalties=True,
@@ -24021,7 +24022,7 @@ class Effect6040(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            itemRequiresSkill('High Speed Maneuvering'),
             'signatureRadiusBonus',
             1 / module.getModifiedItemAttr('modeMWDSigPenaltyPostDiv'),
             stackingPenalties=True,
@@ -24068,7 +24069,7 @@ class Effect6045(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser')
 
 
@@ -24084,7 +24085,7 @@ class Effect6046(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser')
 
 
@@ -24100,7 +24101,7 @@ class Effect6047(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser')
 
 
@@ -24116,7 +24117,7 @@ class Effect6048(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Sentry Drone Interfacing'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Sentry Drone Interfacing'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC3'), skill='Gallente Cruiser')
 
 
@@ -24132,7 +24133,7 @@ class Effect6051(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24148,7 +24149,7 @@ class Effect6052(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24164,7 +24165,7 @@ class Effect6053(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'damageMultiplier', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24180,7 +24181,7 @@ class Effect6054(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24196,7 +24197,7 @@ class Effect6055(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24212,7 +24213,7 @@ class Effect6056(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Heavy Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Heavy Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24228,7 +24229,7 @@ class Effect6057(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24244,7 +24245,7 @@ class Effect6058(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24260,7 +24261,7 @@ class Effect6059(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24276,7 +24277,7 @@ class Effect6060(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24292,7 +24293,7 @@ class Effect6061(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24308,7 +24309,7 @@ class Effect6062(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Light Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Light Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusGC2'), skill='Gallente Cruiser')
 
 
@@ -24346,7 +24347,7 @@ class Effect6076(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredChargeMultiply(
-            lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            chargeRequiresSkill('Missile Launcher Operation'),
             'maxVelocity',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -24386,7 +24387,7 @@ class Effect6083(BaseEffect):
     def handler(fit, ship, context):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
             fit.modules.filteredChargeBoost(
-                lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+                chargeRequiresSkill('Rockets', 'Light Missiles'),
                 '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -24402,7 +24403,7 @@ class Effect6085(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari1'),
                                       skill='Caldari Tactical Destroyer')
 
@@ -24421,7 +24422,7 @@ class Effect6088(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser')
 
@@ -24440,7 +24441,7 @@ class Effect6093(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser')
 
@@ -24459,7 +24460,7 @@ class Effect6096(BaseEffect):
     @staticmethod
     def handler(fit, ship, context):
         for damageType in ('em', 'explosive', 'kinetic', 'thermal'):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                             '{0}Damage'.format(damageType), ship.getModifiedItemAttr('shipBonusMC2'),
                                             skill='Minmatar Cruiser')
 
@@ -24476,7 +24477,7 @@ class Effect6098(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'),
                                       'reloadTime', ship.getModifiedItemAttr('shipBonusTacticalDestroyerCaldari2'),
                                       skill='Caldari Tactical Destroyer')
 
@@ -24493,7 +24494,7 @@ class Effect6104(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Infomorph Psychology'),
                                          'duration', ship.getModifiedItemAttr('entosisDurationMultiplier') or 1)
 
 
@@ -24509,7 +24510,7 @@ class Effect6110(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', module.getModifiedItemAttr('missileVelocityBonus'),
                                         stackingPenalties=True)
 
@@ -24526,7 +24527,7 @@ class Effect6111(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosionDelay', module.getModifiedItemAttr('explosionDelayBonus'),
                                         stackingPenalties=True)
 
@@ -24543,7 +24544,7 @@ class Effect6112(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeCloudSize', module.getModifiedItemAttr('aoeCloudSizeBonus'),
                                         stackingPenalties=True)
 
@@ -24561,7 +24562,7 @@ class Effect6113(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'aoeVelocity', module.getModifiedItemAttr('aoeVelocityBonus'),
                                         stackingPenalties=True)
 
@@ -24646,7 +24647,7 @@ class Effect6135(BaseEffect):
                 ('missileVelocityBonus', 'maxVelocity'),
                 ('explosionDelayBonus', 'explosionDelay'),
         ):
-            fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+            fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                             tgtAttr, container.getModifiedItemAttr(srcAttr),
                                             stackingPenalties=True)
 
@@ -24702,7 +24703,7 @@ class Effect6149(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'speed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente1'),
                                       skill='Gallente Tactical Destroyer')
 
@@ -24719,7 +24720,7 @@ class Effect6150(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusTacticalDestroyerGallente2'),
                                       skill='Gallente Tactical Destroyer')
 
@@ -24761,7 +24762,7 @@ class Effect6152(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            itemRequiresSkill('Small Hybrid Turret'),
             'maxRange',
             1 / module.getModifiedItemAttr('modeMaxRangePostDiv'),
             stackingPenalties=True,
@@ -24782,7 +24783,7 @@ class Effect6153(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            itemRequiresSkill('High Speed Maneuvering'),
             'capacitorNeed',
             1 / module.getModifiedItemAttr('modeMWDCapPostDiv')
         )
@@ -24801,7 +24802,7 @@ class Effect6154(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering'),
+            itemRequiresSkill('High Speed Maneuvering'),
             'speedFactor',
             1 / module.getModifiedItemAttr('modeMWDVelocityPostDiv'),
             stackingPenalties=True,
@@ -24822,7 +24823,7 @@ class Effect6155(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Repair Systems'),
+            itemRequiresSkill('Repair Systems'),
             'duration',
             1 / module.getModifiedItemAttr('modeArmorRepDurationPostDiv')
         )
@@ -24873,11 +24874,11 @@ class Effect6166(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'speedFactorBonus', ship.getModifiedItemAttr('shipBonusAT'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'speedBoostFactorBonus', ship.getModifiedItemAttr('shipBonusAT'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Propulsion Jamming'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Propulsion Jamming'),
                                       'massBonusPercentage', ship.getModifiedItemAttr('shipBonusAT'))
 
 
@@ -24893,7 +24894,7 @@ class Effect6170(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Infomorph Psychology'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Infomorph Psychology'),
                                          'entosisCPUAdd', ship.getModifiedItemAttr('entosisCPUPenalty'))
 
 
@@ -24924,9 +24925,9 @@ class Effect6172(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'))
 
 
@@ -24943,9 +24944,9 @@ class Effect6173(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'))
 
 
@@ -24961,9 +24962,9 @@ class Effect6174(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'falloff', ship.getModifiedItemAttr('roleBonusCBC'))
 
 
@@ -24980,7 +24981,7 @@ class Effect6175(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'maxVelocity', skill.getModifiedItemAttr('roleBonusCBC'))
 
 
@@ -24997,7 +24998,7 @@ class Effect6176(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', ship.getModifiedItemAttr('roleBonusCBC'))
 
 
@@ -25013,7 +25014,7 @@ class Effect6177(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusCBC2'),
                                       skill='Caldari Battlecruiser')
 
@@ -25030,7 +25031,7 @@ class Effect6178(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusMBC2'),
                                       skill='Minmatar Battlecruiser')
 
@@ -25178,7 +25179,7 @@ class Effect6196(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusExpedition2'), skill='Expedition Frigates')
 
 
@@ -25248,7 +25249,7 @@ class Effect6214(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'power',
                                       src.getModifiedItemAttr('roleBonusCD'))
 
 
@@ -25313,7 +25314,7 @@ class Effect6230(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships')
 
 
@@ -25329,7 +25330,7 @@ class Effect6232(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships')
 
 
@@ -25345,7 +25346,7 @@ class Effect6233(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships')
 
 
@@ -25361,7 +25362,7 @@ class Effect6234(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships')
 
 
@@ -25377,7 +25378,7 @@ class Effect6237(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships')
 
 
@@ -25393,7 +25394,7 @@ class Effect6238(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships')
 
 
@@ -25409,7 +25410,7 @@ class Effect6239(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'), 'duration',
                                       src.getModifiedItemAttr('shipBonusOREfrig2'), skill='Mining Frigate')
 
 
@@ -25425,7 +25426,7 @@ class Effect6241(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
 
 
@@ -25441,7 +25442,7 @@ class Effect6242(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer')
 
 
@@ -25457,7 +25458,7 @@ class Effect6245(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAD2'), skill='Amarr Destroyer')
 
 
@@ -25473,7 +25474,7 @@ class Effect6246(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAD1'), skill='Amarr Destroyer')
 
 
@@ -25489,7 +25490,7 @@ class Effect6253(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -25505,7 +25506,7 @@ class Effect6256(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship')
 
 
@@ -25521,7 +25522,7 @@ class Effect6257(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAB'), skill='Amarr Battleship')
 
 
@@ -25537,7 +25538,7 @@ class Effect6260(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAB2'), skill='Amarr Battleship')
 
 
@@ -25553,7 +25554,7 @@ class Effect6267(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships')
 
@@ -25570,7 +25571,7 @@ class Effect6272(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
                                       skill='Electronic Attack Ships')
 
@@ -25587,7 +25588,7 @@ class Effect6273(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip1'),
                                       skill='Electronic Attack Ships')
 
@@ -25604,7 +25605,7 @@ class Effect6278(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusElectronicAttackShip3'),
                                       skill='Electronic Attack Ships')
 
@@ -25621,7 +25622,7 @@ class Effect6281(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -25637,7 +25638,7 @@ class Effect6285(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate')
 
 
@@ -25653,7 +25654,7 @@ class Effect6287(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -25669,7 +25670,7 @@ class Effect6291(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonus3AF'), skill='Amarr Frigate')
 
 
@@ -25685,7 +25686,7 @@ class Effect6294(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -25701,7 +25702,7 @@ class Effect6299(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser')
 
 
@@ -25717,7 +25718,7 @@ class Effect6300(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -25733,9 +25734,9 @@ class Effect6301(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusAC2'), skill='Amarr Cruiser')
 
 
@@ -25751,7 +25752,7 @@ class Effect6305(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusAC3'), skill='Amarr Cruiser')
 
 
@@ -25767,7 +25768,7 @@ class Effect6307(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer')
 
 
@@ -25783,7 +25784,7 @@ class Effect6308(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer')
 
 
@@ -25799,7 +25800,7 @@ class Effect6309(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusMD1'), skill='Minmatar Destroyer')
 
 
@@ -25815,7 +25816,7 @@ class Effect6310(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('shipBonusMD1'),
                                         skill='Minmatar Destroyer')
 
@@ -25833,15 +25834,15 @@ class Effect6315(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
 
 
@@ -25858,15 +25859,15 @@ class Effect6316(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
 
 
@@ -25882,7 +25883,7 @@ class Effect6317(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Micro Jump Drive Operation'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer2'), skill='Command Destroyers')
 
 
@@ -26026,7 +26027,7 @@ class Effect6326(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer')
 
 
@@ -26042,7 +26043,7 @@ class Effect6327(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer')
 
 
@@ -26058,7 +26059,7 @@ class Effect6328(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCD1'), skill='Caldari Destroyer')
 
 
@@ -26074,7 +26075,7 @@ class Effect6329(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                         'explosiveDamage', src.getModifiedItemAttr('shipBonusCD1'),
                                         skill='Caldari Destroyer')
 
@@ -26156,15 +26157,15 @@ class Effect6334(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
 
 
@@ -26244,15 +26245,15 @@ class Effect6339(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('eliteBonusCommandDestroyer1'), skill='Command Destroyers')
 
 
@@ -26333,7 +26334,7 @@ class Effect6350(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredChargeBoost(
-            lambda mod: mod.charge.requiresSkill('Light Missiles') or mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+            chargeRequiresSkill('Light Missiles', 'Rockets'), 'kineticDamage',
             src.getModifiedItemAttr('shipBonus3CF'), skill='Caldari Frigate')
 
 
@@ -26349,7 +26350,7 @@ class Effect6351(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCC3'), skill='Caldari Cruiser')
 
 
@@ -26365,9 +26366,9 @@ class Effect6352(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'))
 
 
@@ -26383,9 +26384,9 @@ class Effect6353(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'cpu',
                                       src.getModifiedItemAttr('roleBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'capacitorNeed',
                                       src.getModifiedItemAttr('roleBonus'))
 
 
@@ -26401,19 +26402,19 @@ class Effect6354(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'trackingSpeedBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'trackingSpeedBonus',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'explosionDelayBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'explosionDelayBonus',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'maxRangeBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'maxRangeBonus',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'falloffBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'falloffBonus',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'missileVelocityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'missileVelocityBonus',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'aoeVelocityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'aoeVelocityBonus',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'aoeCloudSizeBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'aoeCloudSizeBonus',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -26429,9 +26430,9 @@ class Effect6355(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'capacitorNeed',
                                       src.getModifiedItemAttr('roleBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'cpu', src.getModifiedItemAttr('roleBonus'))
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'cpu', src.getModifiedItemAttr('roleBonus'))
 
 
 class Effect6356(BaseEffect):
@@ -26446,9 +26447,9 @@ class Effect6356(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'))
 
 
@@ -26464,7 +26465,7 @@ class Effect6357(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Navigation'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Navigation'), 'maxRange',
                                       src.getModifiedItemAttr('shipBonusGF2'), skill='Gallente Frigate')
 
 
@@ -26480,7 +26481,7 @@ class Effect6358(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Navigation'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Navigation'),
                                          'warpScrambleStrength', ship.getModifiedItemAttr('roleBonus'))
 
 
@@ -26496,7 +26497,7 @@ class Effect6359(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'aoeVelocity',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'aoeVelocity',
                                         src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -26512,11 +26513,11 @@ class Effect6360(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusMF2'), skill='Minmatar Frigate')
 
 
@@ -26532,7 +26533,7 @@ class Effect6361(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonus3MF'), skill='Minmatar Frigate')
 
 
@@ -26548,7 +26549,7 @@ class Effect6362(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonus'))
 
 
@@ -26567,9 +26568,9 @@ class Effect6368(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Shield Booster', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Shield Booster'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('falloffBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Shield Booster',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Shield Booster'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'))
 
 
@@ -26585,7 +26586,7 @@ class Effect6369(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -26602,7 +26603,7 @@ class Effect6370(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('shipBonusCC'), skill='Caldari Cruiser')
 
 
@@ -26618,7 +26619,7 @@ class Effect6371(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusGC'),
                                       skill='Gallente Cruiser')
 
@@ -26635,7 +26636,7 @@ class Effect6372(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusAC2'),
                                       skill='Amarr Cruiser')
 
@@ -26656,9 +26657,9 @@ class Effect6373(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Armor Repairer', 'falloffEffectiveness',
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Armor Repairer'), 'falloffEffectiveness',
                                       src.getModifiedItemAttr('falloffBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Ancillary Remote Armor Repairer',
+        fit.modules.filteredItemBoost(itemGroupIs('Ancillary Remote Armor Repairer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('falloffBonus'))
 
 
@@ -26676,7 +26677,7 @@ class Effect6374(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.group.name == 'Logistic Drone', 'structureDamageAmount',
+        fit.drones.filteredItemBoost(itemGroupIs('Logistic Drone'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('droneArmorDamageAmountBonus'))
 
 
@@ -26693,9 +26694,9 @@ class Effect6377(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates')
 
 
@@ -26712,9 +26713,9 @@ class Effect6378(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'), 'capacitorNeed',
                                       src.getModifiedItemAttr('eliteBonusLogiFrig1'), skill='Logistics Frigates')
 
 
@@ -26799,7 +26800,7 @@ class Effect6385(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemForce(lambda mod: mod.item.group.name == 'Cloaking Device',
+        fit.modules.filteredItemForce(itemGroupIs('Cloaking Device'),
                                       'maxVelocityModifier', src.getModifiedItemAttr('velocityPenaltyReduction'))
 
 
@@ -26823,7 +26824,7 @@ class Effect6386(BaseEffect):
                 'aoeCloudSizeBonus',
                 'missileVelocityBonus'
         ):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'),
                                           attr, src.getModifiedItemAttr('scanSkillEwStrengthBonus') * level)
 
 
@@ -26839,19 +26840,19 @@ class Effect6395(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'missileVelocityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'missileVelocityBonus',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'aoeVelocityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'aoeVelocityBonus',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'maxRangeBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'maxRangeBonus',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'explosionDelayBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'explosionDelayBonus',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'aoeCloudSizeBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'aoeCloudSizeBonus',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'trackingSpeedBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'trackingSpeedBonus',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Weapon Disruption'), 'falloffBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Weapon Disruption'), 'falloffBonus',
                                       src.getModifiedItemAttr('shipBonusAC'), skill='Amarr Cruiser')
 
 
@@ -26887,7 +26888,7 @@ class Effect6400(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         groups = ('Structure Warp Scrambler', 'Structure Disruption Battery', 'Structure Stasis Webifier')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
                                       skill='Structure Electronic Systems')
 
@@ -26905,7 +26906,7 @@ class Effect6401(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         groups = ('Structure Energy Neutralizer', 'Structure Area Denial Module')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('capNeedBonus'),
                                       skill='Structure Engineering Systems')
 
@@ -26960,11 +26961,11 @@ class Effect6404(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Energy Neutralizer'),
                                       'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
                                       stackingPenalties=True)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Energy Neutralizer'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True)
 
@@ -26982,7 +26983,7 @@ class Effect6405(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Energy Neutralizer'),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'),
                                       stackingPenalties=True)
 
@@ -27002,15 +27003,15 @@ class Effect6406(BaseEffect):
     def handler(fit, src, context):
         groups = ('Structure ECM Battery', 'Structure Disruption Battery')
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'falloff', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'maxRange', src.getModifiedItemAttr('structureRigEwarOptimalBonus'),
                                       stackingPenalties=True)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'falloffEffectiveness', src.getModifiedItemAttr('structureRigEwarFalloffBonus'),
                                       stackingPenalties=True)
 
@@ -27029,7 +27030,7 @@ class Effect6407(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         groups = ('Structure ECM Battery', 'Structure Disruption Battery')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigEwarCapUseBonus'),
                                       stackingPenalties=True)
 
@@ -27081,7 +27082,7 @@ class Effect6410(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Structure Guided Bomb',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Structure Guided Bomb'),
                                         'aoeCloudSize', src.getModifiedItemAttr('structureRigMissileExplosionRadiusBonus'),
                                         stackingPenalties=True)
 
@@ -27099,7 +27100,7 @@ class Effect6411(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.group.name == 'Structure Guided Bomb',
+        fit.modules.filteredChargeBoost(chargeGroupIs('Structure Guided Bomb'),
                                         'maxVelocity', src.getModifiedItemAttr('structureRigMissileVelocityBonus'),
                                         stackingPenalties=True)
 
@@ -27117,7 +27118,7 @@ class Effect6412(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Area Denial Module'),
                                       'empFieldRange', src.getModifiedItemAttr('structureRigPDRangeBonus'),
                                       stackingPenalties=True)
 
@@ -27135,7 +27136,7 @@ class Effect6413(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Area Denial Module',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Area Denial Module'),
                                       'capacitorNeed', src.getModifiedItemAttr('structureRigPDCapUseBonus'),
                                       stackingPenalties=True)
 
@@ -27152,7 +27153,7 @@ class Effect6417(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemIncrease(itemGroupIs('Structure Doomsday Weapon'),
                                          'lightningWeaponDamageLossTarget',
                                          src.getModifiedItemAttr('structureRigDoomsdayDamageLossTargetBonus'))
 
@@ -27199,7 +27200,7 @@ class Effect6423(BaseEffect):
                     ('missileVelocityBonus', 'maxVelocity'),
                     ('explosionDelayBonus', 'explosionDelay'),
             ):
-                fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                                 tgtAttr, module.getModifiedItemAttr(srcAttr),
                                                 stackingPenalties=True, *args, **kwargs)
 
@@ -27217,13 +27218,13 @@ class Effect6424(BaseEffect):
     @staticmethod
     def handler(fit, module, context, *args, **kwargs):
         if 'projected' in context:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, *args, **kwargs)
 
@@ -27306,13 +27307,13 @@ class Effect6428(BaseEffect):
     @staticmethod
     def handler(fit, module, context, **kwargs):
         if 'projected' in context:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, **kwargs)
 
@@ -27640,7 +27641,7 @@ class Effect6475(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemIncrease(itemGroupIs('Structure Doomsday Weapon'),
                                          'lightningWeaponTargetAmount',
                                          src.getModifiedItemAttr('structureRigDoomsdayTargetAmountBonus'))
 
@@ -27728,17 +27729,17 @@ class Effect6479(BaseEffect):
                     ('missileVelocityBonus', 'maxVelocity'),
                     ('explosionDelayBonus', 'explosionDelay'),
             ):
-                fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                                 tgtAttr, module.getModifiedItemAttr(srcAttr),
                                                 stackingPenalties=True, *args, **kwargs)
 
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, *args, **kwargs)
 
@@ -27861,7 +27862,7 @@ class Effect6501(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought')
 
 
@@ -27899,7 +27900,7 @@ class Effect6503(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtA3'), skill='Amarr Dreadnought')
 
 
@@ -27915,29 +27916,29 @@ class Effect6504(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusDreadnoughtC1'), skill='Caldari Dreadnought')
 
 
@@ -27975,7 +27976,7 @@ class Effect6506(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought')
 
 
@@ -27991,7 +27992,7 @@ class Effect6507(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG2'), skill='Gallente Dreadnought')
 
 
@@ -28007,7 +28008,7 @@ class Effect6508(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG3'), skill='Gallente Dreadnought')
 
 
@@ -28023,7 +28024,7 @@ class Effect6509(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought')
 
 
@@ -28039,7 +28040,7 @@ class Effect6510(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought')
 
 
@@ -28055,7 +28056,7 @@ class Effect6511(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'), 'duration',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM2'), skill='Minmatar Dreadnought')
 
 
@@ -28169,19 +28170,19 @@ class Effect6534(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryM4'), skill='Minmatar Carrier')
 
 
@@ -28198,19 +28199,19 @@ class Effect6535(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryG4'), skill='Gallente Carrier')
 
 
@@ -28227,19 +28228,19 @@ class Effect6536(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusForceAuxiliaryC4'), skill='Caldari Carrier')
 
 
@@ -28255,7 +28256,7 @@ class Effect6537(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusRole1'))
 
 
@@ -28340,9 +28341,9 @@ class Effect6549(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG2'), skill='Gallente Carrier')
 
 
@@ -28381,9 +28382,9 @@ class Effect6552(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier')
 
 
@@ -28399,9 +28400,9 @@ class Effect6555(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('speedFactor'), stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('speedFactor'), stackingPenalties=True)
 
 
@@ -28419,16 +28420,16 @@ class Effect6556(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True)
 
 
@@ -28444,39 +28445,39 @@ class Effect6557(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretTrackingSpeed',
                                        src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'falloff',
                                      src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True)
 
@@ -28513,40 +28514,40 @@ class Effect6559(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('aoeCloudSizeBonus'), stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'falloff',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'falloff',
                                      src.getModifiedItemAttr('falloffBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeFalloff', src.getModifiedItemAttr('falloffBonus'),
                                        stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretTrackingSpeed',
                                        src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('trackingSpeedBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('maxRangeBonus'),
                                        stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('aoeVelocityBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('maxRangeBonus'), stackingPenalties=True)
 
 
@@ -28563,13 +28564,13 @@ class Effect6560(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
@@ -28587,7 +28588,7 @@ class Effect6561(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Light Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Light Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('maxVelocityBonus') * lvl)
 
 
@@ -28604,7 +28605,7 @@ class Effect6562(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shieldBonus') * lvl)
 
 
@@ -28621,13 +28622,13 @@ class Effect6563(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Heavy Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Heavy Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Heavy Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Heavy Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
@@ -28658,7 +28659,7 @@ class Effect6565(BaseEffect):
             'structureRigEwarCapUseBonus',
             'structureRigMissileExplosionRadiusBonus'
         ]:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Jury Rigging'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Jury Rigging'),
                                       attr, src.getModifiedItemAttr('structureRoleBonus'))
 
 
@@ -28674,18 +28675,18 @@ class Effect6566(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('fighterBonusShieldCapacityPercent'))
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('fighterBonusVelocityPercent'), stackingPenalties=True, penaltyGroup='postMul')
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul')
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDuration',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'fighterAbilityAttackTurretDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul')
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDuration',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesDuration',
                                        src.getModifiedItemAttr('fighterBonusROFPercent'), stackingPenalties=True, penaltyGroup='postMul')
-        fit.fighters.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldRechargeRate',
+        fit.fighters.filteredItemMultiply(itemRequiresSkill('Fighters'), 'shieldRechargeRate',
                                        src.getModifiedItemAttr('fighterBonusShieldRechargePercent'))
 
 
@@ -28707,7 +28708,7 @@ class Effect6567(BaseEffect):
             attr = 'scan{}Strength'.format(scanType)
             bonus = src.getModifiedItemAttr('scan{}StrengthPercent'.format(scanType))
             fit.ship.boostItemAttr(attr, bonus, stackingPenalties=True)
-            fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), attr, bonus,
+            fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), attr, bonus,
                                            stackingPenalties=True)
 
         # EW cap need increase
@@ -28753,7 +28754,7 @@ class Effect6571(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Autocannon Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Autocannon Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
 
@@ -28770,7 +28771,7 @@ class Effect6572(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Artillery Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Artillery Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
 
@@ -28787,7 +28788,7 @@ class Effect6573(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Blaster Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Blaster Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
 
@@ -28804,7 +28805,7 @@ class Effect6574(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Railgun Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Railgun Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
 
@@ -28821,7 +28822,7 @@ class Effect6575(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Pulse Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Pulse Laser Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
 
@@ -28838,7 +28839,7 @@ class Effect6576(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Beam Laser Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Beam Laser Specialization'),
                                       'damageMultiplier', src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
 
 
@@ -28855,7 +28856,7 @@ class Effect6577(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missile Specialization'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('XL Cruise Missile Specialization'), 'speed',
                                       src.getModifiedItemAttr('rofBonus') * lvl)
 
 
@@ -28872,7 +28873,7 @@ class Effect6578(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('XL Torpedo Specialization'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('XL Torpedo Specialization'), 'speed',
                                       src.getModifiedItemAttr('rofBonus') * lvl)
 
 
@@ -28888,11 +28889,11 @@ class Effect6580(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'structureDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('shipBonusRole2'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'armorDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'), 'armorDamageAmount',
                                      src.getModifiedItemAttr('shipBonusRole2'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'), 'shieldBonus',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'), 'shieldBonus',
                                      src.getModifiedItemAttr('shipBonusRole2'))
 
 
@@ -28915,23 +28916,23 @@ class Effect6581(BaseEffect):
                 ('Capital Shield Emission Systems', 'shieldBonus', True),
                 ('Capital Capacitor Emission Systems', 'powerTransferAmount', False),
                 ('Capital Remote Hull Repair Systems', 'structureDamageAmount', False)):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'duration',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsDurationBonus'))
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), amtAttr,
                                           src.getModifiedItemAttr('siegeRemoteLogisticsAmountBonus'),
                                           stackingPenalties=stack)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'maxRange',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'maxRange',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'falloffEffectiveness',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'falloffEffectiveness',
                                           src.getModifiedItemAttr('siegeRemoteLogisticsRangeBonus'), stackingPenalties=True)
 
         # Local armor/shield rep effects (duration / amoutn)
         for skill, amtAttr in (
                 ('Capital Shield Operation', 'shieldBonus'),
                 ('Capital Repair Systems', 'armorDamageAmount')):
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), 'duration',
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), 'duration',
                                           src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'))
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill(skill), amtAttr,
+            fit.modules.filteredItemBoost(itemRequiresSkill(skill), amtAttr,
                                           src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'))
 
         # Speed bonus
@@ -28966,7 +28967,7 @@ class Effect6581(BaseEffect):
         fit.ship.forceItemAttr('disallowAssistance', src.getModifiedItemAttr('disallowAssistance'))
 
         # new in April 2016 release
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('droneDamageBonus'), stackingPenalties=True)
 
         fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('siegeModeWarpStatus'))
@@ -28997,7 +28998,7 @@ class Effect6582(BaseEffect):
                                                   mod.item.requiresSkill('Capital Projectile Turret'),
                                       'damageMultiplier', src.getModifiedItemAttr('siegeTurretDamageBonus'))
 
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Motion Prediction'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Motion Prediction'),
                                          'damageMultiplier', src.getModifiedItemAttr('siegeHAWTurretDamageBonus'),
                                          stackingPenalties=True)
 
@@ -29012,10 +29013,10 @@ class Effect6582(BaseEffect):
                                                   mod.item.requiresSkill('XL Cruise Missiles'),
                                       'speed', src.getModifiedItemAttr('siegeLauncherROFBonus'))
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Target Navigation Prediction'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Target Navigation Prediction'),
                                       'speed', src.getModifiedItemAttr('siegeHAWMissileROFBonus'))
 
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'),
                                         'maxVelocity', src.getModifiedItemAttr('siegeTorpedoVelocityBonus'),
                                         stackingPenalties=True)
 
@@ -29024,11 +29025,11 @@ class Effect6582(BaseEffect):
                                                   mod.item.requiresSkill('Capital Repair Systems'),
                                       'duration', src.getModifiedItemAttr('siegeLocalLogisticsDurationBonus'))
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                       stackingPenalties=True)
 
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('siegeLocalLogisticsAmountBonus'),
                                       stackingPenalties=True)
 
@@ -29127,19 +29128,19 @@ class Effect6595(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierA4'), skill='Amarr Carrier')
 
 
@@ -29156,19 +29157,19 @@ class Effect6596(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierC4'), skill='Caldari Carrier')
 
 
@@ -29185,19 +29186,19 @@ class Effect6597(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierG4'), skill='Gallente Carrier')
 
 
@@ -29214,19 +29215,19 @@ class Effect6598(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusCarrierM4'), skill='Minmatar Carrier')
 
 
@@ -29286,13 +29287,13 @@ class Effect6601(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierG1'), skill='Gallente Carrier')
 
@@ -29309,13 +29310,13 @@ class Effect6602(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusCarrierM1'), skill='Minmatar Carrier')
 
@@ -29333,13 +29334,13 @@ class Effect6603(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA1'), skill='Amarr Carrier')
 
@@ -29357,13 +29358,13 @@ class Effect6604(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierC1'), skill='Caldari Carrier')
 
@@ -29380,13 +29381,13 @@ class Effect6605(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG1'), skill='Gallente Carrier')
 
@@ -29403,13 +29404,13 @@ class Effect6606(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier')
 
@@ -29427,19 +29428,19 @@ class Effect6607(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Armored Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Armored Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierA5'), skill='Amarr Carrier')
 
 
@@ -29456,19 +29457,19 @@ class Effect6608(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Shield Command') or mod.item.requiresSkill('Information Command'),
+            itemRequiresSkill('Shield Command', 'Information Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierC5'), skill='Caldari Carrier')
 
 
@@ -29485,19 +29486,19 @@ class Effect6609(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Armored Command'),
+            itemRequiresSkill('Skirmish Command', 'Armored Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierG5'), skill='Gallente Carrier')
 
 
@@ -29514,19 +29515,19 @@ class Effect6610(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff4Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff1Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff3Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'buffDuration', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier')
         fit.modules.filteredItemBoost(
-            lambda mod: mod.item.requiresSkill('Skirmish Command') or mod.item.requiresSkill('Shield Command'),
+            itemRequiresSkill('Skirmish Command', 'Shield Command'),
             'warfareBuff2Value', src.getModifiedItemAttr('shipBonusSupercarrierM5'), skill='Minmatar Carrier')
 
 
@@ -29542,7 +29543,7 @@ class Effect6611(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusSupercarrierC2'), skill='Caldari Carrier')
 
 
@@ -29558,10 +29559,10 @@ class Effect6612(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA2'), skill='Amarr Carrier')
 
@@ -29578,7 +29579,7 @@ class Effect6613(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'))
 
 
@@ -29594,9 +29595,9 @@ class Effect6614(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
                                       src.getModifiedItemAttr('shipBonusRole2'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Upgrades'), 'capacityBonus',
                                       src.getModifiedItemAttr('shipBonusRole2'))
 
 
@@ -29612,7 +29613,7 @@ class Effect6615(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationWeaponDisruptionBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier')
 
@@ -29629,7 +29630,7 @@ class Effect6616(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationECMJammerBurstProjector', src.getModifiedItemAttr('shipBonusSupercarrierC4'),
                                       skill='Caldari Carrier')
 
@@ -29646,7 +29647,7 @@ class Effect6617(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationSensorDampeningBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierG4'), skill='Gallente Carrier')
 
@@ -29663,7 +29664,7 @@ class Effect6618(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'),
                                       'durationTargetIlluminationBurstProjector',
                                       src.getModifiedItemAttr('shipBonusSupercarrierM4'), skill='Minmatar Carrier')
 
@@ -29680,7 +29681,7 @@ class Effect6619(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'))
 
 
@@ -29696,7 +29697,7 @@ class Effect6620(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Missile Launcher Operation'), 'reloadTime',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Missile Launcher Operation'), 'reloadTime',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtC3'), skill='Caldari Dreadnought')
 
 
@@ -29756,7 +29757,7 @@ class Effect6623(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierG2'), skill='Gallente Carrier')
 
 
@@ -29773,7 +29774,7 @@ class Effect6624(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('shipBonusSupercarrierM2'), skill='Minmatar Carrier')
 
 
@@ -29789,9 +29790,9 @@ class Effect6625(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityEnergyNeutralizerOptimalRange',
                                        src.getModifiedItemAttr('shipBonusCarrierA2'), skill='Amarr Carrier')
 
@@ -29808,9 +29809,9 @@ class Effect6626(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierC2'), skill='Caldari Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityECMRangeOptimal', src.getModifiedItemAttr('shipBonusCarrierC2'),
                                        skill='Caldari Carrier')
 
@@ -29827,9 +29828,9 @@ class Effect6627(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierG2'), skill='Gallente Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityWarpDisruptionRange', src.getModifiedItemAttr('shipBonusCarrierG2'),
                                        skill='Gallente Carrier')
 
@@ -29846,9 +29847,9 @@ class Effect6628(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'), 'fighterSquadronOrbitRange',
                                        src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Support Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Support Fighters'),
                                        'fighterAbilityStasisWebifierOptimalRange',
                                        src.getModifiedItemAttr('shipBonusCarrierM2'), skill='Minmatar Carrier')
 
@@ -29884,7 +29885,7 @@ class Effect6634(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan')
 
 
@@ -29900,11 +29901,11 @@ class Effect6635(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC1'), skill='Caldari Titan')
 
 
@@ -29920,7 +29921,7 @@ class Effect6636(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan')
 
 
@@ -29936,7 +29937,7 @@ class Effect6637(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan')
 
 
@@ -29952,11 +29953,11 @@ class Effect6638(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Cruise', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher XL Cruise'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Torpedo', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher XL Torpedo', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher XL Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanC2'), skill='Caldari Titan')
 
 
@@ -29972,10 +29973,10 @@ class Effect6639(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesExplosionRadius',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier')
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileExplosionRadius',
                                        src.getModifiedItemAttr('shipBonusSupercarrierA4'), skill='Amarr Carrier')
 
@@ -29992,7 +29993,7 @@ class Effect6640(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole1'))
 
 
@@ -30008,9 +30009,9 @@ class Effect6641(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'armorHPBonusAdd',
                                       src.getModifiedItemAttr('shipBonusRole2'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Upgrades'), 'capacityBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Upgrades'), 'capacityBonus',
                                       src.getModifiedItemAttr('shipBonusRole2'))
 
 
@@ -30027,7 +30028,7 @@ class Effect6642(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Doomsday Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Doomsday Operation'), 'duration',
                                       src.getModifiedItemAttr('rofBonus') * lvl)
 
 
@@ -30153,7 +30154,7 @@ class Effect6653(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusTitanA2'), skill='Amarr Titan')
 
 
@@ -30169,7 +30170,7 @@ class Effect6654(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan')
 
 
@@ -30185,7 +30186,7 @@ class Effect6655(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Projectile Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Projectile Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusTitanM2'), skill='Minmatar Titan')
 
 
@@ -30201,7 +30202,7 @@ class Effect6656(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'maxVelocity',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'maxVelocity',
                                         src.getModifiedItemAttr('shipBonusRole3'))
 
 
@@ -30217,23 +30218,23 @@ class Effect6657(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Cruise Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('XL Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusTitanC5'), skill='Caldari Titan')
 
 
@@ -30279,10 +30280,10 @@ class Effect6658(BaseEffect):
                                         'maxVelocity', src.getModifiedItemAttr('missileVelocityBonus'))
 
         # Tanking
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('armorDamageAmountBonus'),
                                       stackingPenalties=True)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', src.getModifiedItemAttr('shieldBoostMultiplier'),
                                       stackingPenalties=True)
 
@@ -30305,7 +30306,7 @@ class Effect6658(BaseEffect):
         fit.ship.boostItemAttr('remoteRepairImpedance', src.getModifiedItemAttr('remoteRepairImpedanceBonus'))
         fit.ship.boostItemAttr('remoteAssistanceImpedance', src.getModifiedItemAttr('remoteAssistanceImpedanceBonus'))
         fit.ship.boostItemAttr('sensorDampenerResistance', src.getModifiedItemAttr('sensorDampenerResistanceBonus'))
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Micro Jump Drive Operation'),
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Micro Jump Drive Operation'),
                                          'activationBlocked', src.getModifiedItemAttr('activationBlockedStrenght'))
         fit.ship.boostItemAttr('targetPainterResistance', src.getModifiedItemAttr('targetPainterResistanceBonus'))
         fit.ship.boostItemAttr('weaponDisruptionResistance', src.getModifiedItemAttr('weaponDisruptionResistanceBonus'))
@@ -30327,7 +30328,7 @@ class Effect6661(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('shipBonusCarrierM3'), skill='Minmatar Carrier')
 
 
@@ -30343,7 +30344,7 @@ class Effect6662(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusCarrierG3'), skill='Gallente Carrier')
 
 
@@ -30360,18 +30361,18 @@ class Effect6663(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('damageMultiplierBonus') * lvl)
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'), 'miningDroneAmountPercent',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'), 'miningDroneAmountPercent',
                                      src.getModifiedItemAttr('miningAmountBonus') * lvl)
 
 
@@ -30388,14 +30389,14 @@ class Effect6664(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('rangeSkillBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('rangeSkillBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal',
                                        src.getModifiedItemAttr('rangeSkillBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal',
                                        src.getModifiedItemAttr('rangeSkillBonus') * lvl)
 
@@ -30413,13 +30414,13 @@ class Effect6665(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus') * lvl)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('armorHpBonus') * lvl)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shieldCapacityBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shieldCapacityBonus') * lvl)
 
 
@@ -30436,9 +30437,9 @@ class Effect6667(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('maxVelocityBonus') * lvl)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('maxVelocityBonus') * lvl)
 
 
@@ -30454,13 +30455,13 @@ class Effect6669(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('hullHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('hullHpBonus'))
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('hullHpBonus'))
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'))
 
@@ -30477,14 +30478,14 @@ class Effect6670(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxRange',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxRange',
                                      src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesRange',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesRange',
                                        src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackTurretRangeOptimal', src.getModifiedItemAttr('rangeSkillBonus'),
                                        stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'),
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'),
                                        'fighterAbilityAttackMissileRangeOptimal',
                                        src.getModifiedItemAttr('rangeSkillBonus'), stackingPenalties=True)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'))
@@ -30502,9 +30503,9 @@ class Effect6671(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'maxVelocity',
                                      src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True)
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'maxVelocity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'maxVelocity',
                                        src.getModifiedItemAttr('droneMaxVelocityBonus'), stackingPenalties=True)
         fit.ship.boostItemAttr('cpuOutput', src.getModifiedItemAttr('drawback'))
 
@@ -30548,7 +30549,7 @@ class Effect6679(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Doomsday Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Doomsday Weapon'),
                                       'duration', src.getModifiedItemAttr('durationBonus'),
                                       skill='Structure Doomsday Operation')
 
@@ -30565,7 +30566,7 @@ class Effect6681(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('shipBonusRole3'))
 
 
@@ -30664,17 +30665,17 @@ class Effect6686(BaseEffect):
                     ('missileVelocityBonus', 'maxVelocity'),
                     ('explosionDelayBonus', 'explosionDelay'),
             ):
-                fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+                fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                                 tgtAttr, module.getModifiedItemAttr(srcAttr),
                                                 stackingPenalties=True, *args, **kwargs)
 
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, *args, **kwargs)
 
@@ -30832,13 +30833,13 @@ class Effect6694(BaseEffect):
     @staticmethod
     def handler(fit, module, context, *args, **kwargs):
         if 'projected' in context:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'trackingSpeed', module.getModifiedItemAttr('trackingSpeedBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'maxRange', module.getModifiedItemAttr('maxRangeBonus'),
                                           stackingPenalties=True, *args, **kwargs)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Gunnery'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Gunnery'),
                                           'falloff', module.getModifiedItemAttr('falloffBonus'),
                                           stackingPenalties=True, *args, **kwargs)
 
@@ -30879,9 +30880,9 @@ class Effect6697(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Armor', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Armor'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Resource Processing', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Resource Processing'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -30898,9 +30899,9 @@ class Effect6698(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Navigation', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Navigation'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Anchor', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Anchor'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -30917,7 +30918,7 @@ class Effect6699(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Drones', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Drones'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -30934,11 +30935,11 @@ class Effect6700(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Electronic Systems', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Electronic Systems'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Scanning', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Scanning'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Targeting', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Targeting'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -30955,7 +30956,7 @@ class Effect6701(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Projectile Weapon', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Projectile Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -30972,7 +30973,7 @@ class Effect6702(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Energy Weapon', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Energy Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -30989,7 +30990,7 @@ class Effect6703(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Hybrid Weapon', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Hybrid Weapon'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -31006,7 +31007,7 @@ class Effect6704(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Launcher', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Launcher'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -31023,7 +31024,7 @@ class Effect6705(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Rig Shield', 'drawback',
+        fit.modules.filteredItemBoost(itemGroupIs('Rig Shield'), 'drawback',
                                       src.getModifiedItemAttr('rigDrawbackBonus') * lvl)
 
 
@@ -31040,7 +31041,7 @@ class Effect6706(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.appliedImplants.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Cybernetics'),
+        fit.appliedImplants.filteredItemMultiply(itemRequiresSkill('Cybernetics'),
                                                  'armorRepairBonus', src.getModifiedItemAttr('implantSetSerpentis2'))
 
 
@@ -31056,7 +31057,7 @@ class Effect6708(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('armorRepairBonus'))
 
 
@@ -31072,7 +31073,7 @@ class Effect6709(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusRole1'))
 
 
@@ -31088,7 +31089,7 @@ class Effect6710(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought')
 
 
@@ -31104,7 +31105,7 @@ class Effect6711(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole3'))
 
 
@@ -31120,7 +31121,7 @@ class Effect6712(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'speedFactor',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan')
 
 
@@ -31137,7 +31138,7 @@ class Effect6713(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Burst Projector Operation'), 'speedFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Burst Projector Operation'), 'speedFactor',
                                       src.getModifiedItemAttr('shipBonusSupercarrierM1'), skill='Minmatar Carrier')
 
 
@@ -31176,13 +31177,13 @@ class Effect6717(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'), 'capacitorNeed',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining'), 'duration',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'), 'duration',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting'), 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Ice Harvesting'), 'capacitorNeed',
                                       src.getModifiedItemAttr('miningDurationRoleBonus'))
 
 
@@ -31198,11 +31199,11 @@ class Effect6720(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldBonus',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldBonus',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'structureDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'structureDamageAmount',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorDamageAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorDamageAmount',
                                      src.getModifiedItemAttr('shipBonusMC'), skill='Minmatar Cruiser')
 
 
@@ -31218,11 +31219,11 @@ class Effect6721(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'maxRange',
                                       src.getModifiedItemAttr('eliteBonusLogistics1'),
                                       skill='Logistics Cruisers')
@@ -31240,10 +31241,10 @@ class Effect6722(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'falloffEffectiveness',
                                       src.getModifiedItemAttr('roleBonusRepairRange'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'maxRange',
                                       src.getModifiedItemAttr('roleBonusRepairRange'))
 
@@ -31260,7 +31261,7 @@ class Effect6723(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusMC2'), skill='Minmatar Cruiser')
 
 
@@ -31276,7 +31277,7 @@ class Effect6724(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'duration',
                                       src.getModifiedItemAttr('eliteBonusLogistics3'), skill='Logistics Cruisers')
 
 
@@ -31292,7 +31293,7 @@ class Effect6725(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'falloff',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'), 'falloff',
                                       src.getModifiedItemAttr('shipBonus2AF'), skill='Amarr Frigate')
 
 
@@ -31308,7 +31309,7 @@ class Effect6726(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Cloaking'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Cloaking'), 'cpu',
                                       src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -31527,9 +31528,9 @@ class Effect6762(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'miningAmount',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Specialization'), 'miningAmount',
                                      src.getModifiedItemAttr('miningAmountBonus') * lvl)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Drone Specialization'), 'maxVelocity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Specialization'), 'maxVelocity',
                                      src.getModifiedItemAttr('maxVelocityBonus') * lvl)
 
 
@@ -31547,7 +31548,7 @@ class Effect6763(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level if 'skill' in context else 1
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration', src.getModifiedItemAttr('rofBonus') * lvl)
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'), 'duration', src.getModifiedItemAttr('rofBonus') * lvl)
 
 
 class Effect6764(BaseEffect):
@@ -31563,9 +31564,9 @@ class Effect6764(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'), 'duration',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Specialization'), 'duration',
                                      src.getModifiedItemAttr('rofBonus') * lvl)
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Specialization'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Specialization'),
                                      'maxVelocity', src.getModifiedItemAttr('maxVelocityBonus') * lvl)
 
 
@@ -31582,7 +31583,7 @@ class Effect6765(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Spatial Phenomena Generation'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Spatial Phenomena Generation'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -31598,9 +31599,9 @@ class Effect6766(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupActive',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupActive',
                                          src.getModifiedItemAttr('maxGangModules'))
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Leadership'), 'maxGroupOnline',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Leadership'), 'maxGroupOnline',
                                          src.getModifiedItemAttr('maxGangModules'))
 
 
@@ -31618,7 +31619,7 @@ class Effect6769(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'maxRange',
                                       src.getModifiedItemAttr('areaOfEffectBonus') * src.level)
 
 
@@ -31635,7 +31636,7 @@ class Effect6770(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Armored Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -31652,7 +31653,7 @@ class Effect6771(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -31669,7 +31670,7 @@ class Effect6772(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Information Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -31686,7 +31687,7 @@ class Effect6773(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Skirmish Command'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -31703,7 +31704,7 @@ class Effect6774(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -31720,13 +31721,13 @@ class Effect6776(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Armored Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Armored Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
 
 
@@ -31743,13 +31744,13 @@ class Effect6777(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
 
 
@@ -31766,13 +31767,13 @@ class Effect6778(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Information Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Information Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
 
 
@@ -31789,13 +31790,13 @@ class Effect6779(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff3Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff4Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff1Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Skirmish Command'), 'warfareBuff2Multiplier',
                                         src.getModifiedItemAttr('commandStrengthBonus') * lvl)
 
 
@@ -31812,10 +31813,10 @@ class Effect6780(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Value', src.getModifiedItemAttr('commandStrengthBonus') * lvl)
 
 
 class Effect6782(BaseEffect):
@@ -31831,7 +31832,7 @@ class Effect6782(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'),
                                       'reloadTime',
                                       src.getModifiedItemAttr('reloadTimeBonus') * lvl)
 
@@ -31856,7 +31857,7 @@ class Effect6783(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'maxRange',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'maxRange',
                                       src.getModifiedItemAttr('roleBonusCommandBurstAoERange'))
 
 
@@ -31872,15 +31873,15 @@ class Effect6786(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Multiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Multiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Multiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Multiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Multiplier',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusICS3'), skill='Industrial Command Ships')
 
 
@@ -31896,31 +31897,31 @@ class Effect6787(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount',
                                      src.getModifiedItemAttr('shipBonusICS4'),
                                      skill='Industrial Command Ships'
@@ -31939,7 +31940,7 @@ class Effect6788(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'),
                                      'duration',
                                      src.getModifiedItemAttr('shipBonusICS5'),
                                      skill='Industrial Command Ships'
@@ -31965,7 +31966,7 @@ class Effect6789(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('industrialBonusDroneDamage'))
 
@@ -31982,7 +31983,7 @@ class Effect6790(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Ice Harvesting Drone Operation'), 'duration',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'), 'duration',
                                      src.getModifiedItemAttr('roleBonusDroneIceHarvestingSpeed'))
 
 
@@ -31998,31 +31999,31 @@ class Effect6792(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'damageMultiplier',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'shieldCapacity',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'armorHP',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'hp',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships'
                                      )
 
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Mining Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Mining Drone Operation'),
                                      'miningAmount',
                                      src.getModifiedItemAttr('shipBonusORECapital4'),
                                      skill='Capital Industrial Ships'
@@ -32041,15 +32042,15 @@ class Effect6793(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Mining Foreman'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Mining Foreman'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusORECapital2'), skill='Capital Industrial Ships')
 
 
@@ -32065,15 +32066,15 @@ class Effect6794(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff4Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff4Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'buffDuration',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff1Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff1Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff3Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff3Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Command'), 'warfareBuff2Value',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Command'), 'warfareBuff2Value',
                                       src.getModifiedItemAttr('shipBonusORECapital3'), skill='Capital Industrial Ships')
 
 
@@ -32089,7 +32090,7 @@ class Effect6795(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Ice Harvesting Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Ice Harvesting Drone Operation'),
                                      'duration',
                                      src.getModifiedItemAttr('shipBonusORECapital5'),
                                      skill='Capital Industrial Ships'
@@ -32109,7 +32110,7 @@ class Effect6796(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Hybrid Turret'),
+            itemRequiresSkill('Small Hybrid Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -32130,7 +32131,7 @@ class Effect6797(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+            itemRequiresSkill('Small Projectile Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -32151,7 +32152,7 @@ class Effect6798(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('Small Energy Turret'),
+            itemRequiresSkill('Small Energy Turret'),
             'damageMultiplier',
             1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
             stackingPenalties=True,
@@ -32173,7 +32174,7 @@ class Effect6799(BaseEffect):
     def handler(fit, module, context):
         types = ('thermal', 'em', 'explosive', 'kinetic')
         for type in types:
-            fit.modules.filteredChargeMultiply(lambda mod: mod.charge.requiresSkill('Rockets') or mod.charge.requiresSkill('Light Missiles'),
+            fit.modules.filteredChargeMultiply(chargeRequiresSkill('Rockets', 'Light Missiles'),
                                                '{}Damage'.format(type),
                                                1 / module.getModifiedItemAttr('modeDamageBonusPostDiv'),
                                                stackingPenalties=True,
@@ -32210,7 +32211,7 @@ class Effect6801(BaseEffect):
     @staticmethod
     def handler(fit, module, context):
         fit.modules.filteredItemMultiply(
-            lambda mod: mod.item.requiresSkill('High Speed Maneuvering') or mod.item.requiresSkill('Afterburner'),
+            itemRequiresSkill('High Speed Maneuvering', 'Afterburner'),
             'speedFactor',
             1 / module.getModifiedItemAttr('modeVelocityPostDiv'),
             stackingPenalties=True,
@@ -32231,9 +32232,9 @@ class Effect6807(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         lvl = src.level
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'buffDuration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Invulnerability Core Operation'), 'buffDuration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Invulnerability Core Operation'), 'duration',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Invulnerability Core Operation'), 'duration',
                                       src.getModifiedItemAttr('durationBonus') * lvl)
 
 
@@ -32249,7 +32250,7 @@ class Effect6844(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Defender Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Defender Missiles'),
                                         'maxVelocity', skill.getModifiedItemAttr('missileVelocityBonus') * skill.level)
 
 
@@ -32265,7 +32266,7 @@ class Effect6845(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Defender Missiles'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Defender Missiles'),
                                       'moduleReactivationDelay', ship.getModifiedItemAttr('shipBonusRole1'))
 
 
@@ -32282,7 +32283,7 @@ class Effect6851(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Energy Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole3'))
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Energy Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole3'))
 
 
 class Effect6852(BaseEffect):
@@ -32297,7 +32298,7 @@ class Effect6852(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusTitanM1'), skill='Minmatar Titan')
 
 
@@ -32313,9 +32314,9 @@ class Effect6853(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusTitanA1'), skill='Amarr Titan')
 
 
@@ -32331,9 +32332,9 @@ class Effect6855(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'),
                                       'energyNeutralizerAmount', src.getModifiedItemAttr('shipBonusDreadnoughtA1'), skill='Amarr Dreadnought')
 
 
@@ -32349,7 +32350,7 @@ class Effect6856(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusDreadnoughtM1'), skill='Minmatar Dreadnought')
 
 
@@ -32365,9 +32366,9 @@ class Effect6857(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'maxRange', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'falloffEffectiveness', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier')
 
 
@@ -32383,7 +32384,7 @@ class Effect6858(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'),
                                       'powerTransferAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryA1'), skill='Amarr Carrier')
 
 
@@ -32400,7 +32401,7 @@ class Effect6859(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Nosferatu', 'cpu', src.getModifiedItemAttr('shipBonusRole4'))
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Nosferatu'), 'cpu', src.getModifiedItemAttr('shipBonusRole4'))
 
 
 class Effect6860(BaseEffect):
@@ -32415,7 +32416,7 @@ class Effect6860(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'power',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'power',
                                       src.getModifiedItemAttr('shipBonusRole5'))
 
 
@@ -32431,7 +32432,7 @@ class Effect6861(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Remote Armor Repair Systems'), 'power', src.getModifiedItemAttr('shipBonusRole5'))
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Remote Armor Repair Systems'), 'power', src.getModifiedItemAttr('shipBonusRole5'))
 
 
 class Effect6862(BaseEffect):
@@ -32446,7 +32447,7 @@ class Effect6862(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'duration', src.getModifiedItemAttr('shipBonusForceAuxiliaryM1'), skill='Minmatar Carrier')
 
 
@@ -32477,9 +32478,9 @@ class Effect6866(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Rockets'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Rockets'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Light Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Light Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCF'), skill='Caldari Frigate')
 
 
@@ -32495,7 +32496,7 @@ class Effect6867(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Projectile Turret'),
                                       'speed', src.getModifiedItemAttr('shipBonusMF'), skill='Minmatar Frigate')
 
 
@@ -32522,9 +32523,9 @@ class Effect6871(BaseEffect):
             bonus = None
 
         if bonus is not None:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', bonus, stackingPenalties=True)
-            fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+            fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'shieldBonus', bonus, stackingPenalties=True)
 
 
@@ -32540,7 +32541,7 @@ class Effect6872(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange', src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships')
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange', src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships')
 
 
 class Effect6873(BaseEffect):
@@ -32570,9 +32571,9 @@ class Effect6874(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'explosionDelay', src.getModifiedItemAttr('shipBonusCC2'), skill='Caldari Cruiser')
 
 
@@ -32603,7 +32604,7 @@ class Effect6878(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusBlackOps4'), stackingPenalties=True, skill='Black Ops')
 
 
@@ -32619,7 +32620,7 @@ class Effect6879(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('eliteBonusBlackOps3'), stackingPenalties=True, skill='Black Ops')
 
 
@@ -32635,11 +32636,11 @@ class Effect6880(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Cruise', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Cruise'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Rapid Heavy', 'speed',
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Rapid Heavy'), 'speed',
                                       src.getModifiedItemAttr('shipBonus2CB'), skill='Caldari Battleship')
 
 
@@ -32655,9 +32656,9 @@ class Effect6881(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosionDelay',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'explosionDelay',
                                         src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosionDelay',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'explosionDelay',
                                         src.getModifiedItemAttr('shipBonusCB'), skill='Caldari Battleship')
 
 
@@ -32673,9 +32674,9 @@ class Effect6883(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Repair Systems'),
                                       'armorDamageAmount', src.getModifiedItemAttr('shipBonusForceAuxiliaryM2'), skill='Minmatar Carrier')
 
 
@@ -32709,9 +32710,9 @@ class Effect6895(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMETFittingReduction'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Energy Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Energy Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMETFittingReduction'))
 
 
@@ -32729,9 +32730,9 @@ class Effect6896(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMHTFittingReduction'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMHTFittingReduction'))
 
 
@@ -32747,9 +32748,9 @@ class Effect6897(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'power', src.getModifiedItemAttr('subsystemMPTFittingReduction'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Projectile Turret'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Projectile Turret'),
                                       'cpu', src.getModifiedItemAttr('subsystemMPTFittingReduction'))
 
 
@@ -32809,9 +32810,9 @@ class Effect6900(BaseEffect):
     @staticmethod
     def handler(fit, src, context):
         groups = ('Missile Launcher Heavy', 'Missile Launcher Rapid Light', 'Missile Launcher Heavy Assault')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'cpu', src.getModifiedItemAttr('subsystemMMissileFittingReduction'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+        fit.modules.filteredItemBoost(itemGroupIs(*groups),
                                       'power', src.getModifiedItemAttr('subsystemMMissileFittingReduction'))
 
 
@@ -32911,7 +32912,7 @@ class Effect6921(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'),
                                         skill='Amarr Defensive Systems')
 
@@ -32928,7 +32929,7 @@ class Effect6923(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles') or mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles', 'Heavy Assault Missiles'),
                                       'maxVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive'),
                                       skill='Minmatar Offensive Systems')
 
@@ -32945,7 +32946,7 @@ class Effect6924(BaseEffect):
 
     @staticmethod
     def handler(fit, container, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'),
                                       'aoeVelocity', container.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems')
 
@@ -32962,10 +32963,10 @@ class Effect6925(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'maxVelocity', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                      skill='Gallente Offensive Systems')
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'),
                                      'trackingSpeed', src.getModifiedItemAttr('subsystemBonusGallenteOffensive2'),
                                      skill='Gallente Offensive Systems')
 
@@ -33013,7 +33014,7 @@ class Effect6928(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner', 'High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusCaldariPropulsion2'),
                                       skill='Caldari Propulsion Systems')
 
@@ -33030,7 +33031,7 @@ class Effect6929(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner') or mod.item.requiresSkill('High Speed Maneuvering'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner', 'High Speed Maneuvering'),
                                       'overloadSpeedFactorBonus', src.getModifiedItemAttr('subsystemBonusGallentePropulsion2'),
                                       skill='Gallente Propulsion Systems')
 
@@ -33143,7 +33144,7 @@ class Effect6936(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'),
                                       'overloadRangeBonus', src.getModifiedItemAttr('subsystemBonusMinmatarCore3'),
                                       skill='Minmatar Core Systems')
 
@@ -33160,7 +33161,7 @@ class Effect6937(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'overloadRangeBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'overloadRangeBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteCore3'), skill='Gallente Core Systems')
 
 
@@ -33176,7 +33177,7 @@ class Effect6938(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'ECM', 'overloadECMStrengthBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('ECM'), 'overloadECMStrengthBonus',
                                       src.getModifiedItemAttr('subsystemBonusCaldariCore3'), skill='Caldari Core Systems')
 
 
@@ -33192,9 +33193,9 @@ class Effect6939(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrDefensive2'), skill='Amarr Defensive Systems')
 
 
@@ -33210,9 +33211,9 @@ class Effect6940(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems')
 
 
@@ -33228,7 +33229,7 @@ class Effect6941(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Tactical Shield Manipulation'),
                                       'overloadHardeningBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
                                       skill='Caldari Defensive Systems')
 
@@ -33245,11 +33246,11 @@ class Effect6942(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Hull Upgrades'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Tactical Shield Manipulation'), 'overloadHardeningBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Tactical Shield Manipulation'), 'overloadHardeningBonus',
                                       src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems')
 
 
@@ -33266,10 +33267,10 @@ class Effect6943(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
                                       skill='Amarr Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusAmarrDefensive3'),
                                       skill='Amarr Defensive Systems')
 
@@ -33287,10 +33288,10 @@ class Effect6944(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
                                       skill='Gallente Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusGallenteDefensive3'),
                                       skill='Gallente Defensive Systems')
 
@@ -33308,10 +33309,10 @@ class Effect6945(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadShieldBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
                                       skill='Caldari Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Operation'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusCaldariDefensive3'),
                                       skill='Caldari Defensive Systems')
 
@@ -33329,10 +33330,10 @@ class Effect6946(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems', 'Shield Operation'),
                                       'overloadArmorDamageAmount', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
                                       skill='Minmatar Defensive Systems')
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems') or mod.item.requiresSkill('Shield Operation'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems', 'Shield Operation'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarDefensive3'),
                                       skill='Minmatar Defensive Systems')
 
@@ -33349,7 +33350,7 @@ class Effect6947(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'),
                                         'baseSensorStrength', src.getModifiedItemAttr('subsystemBonusCaldariDefensive2'),
                                         skill='Caldari Defensive Systems')
 
@@ -33366,7 +33367,7 @@ class Effect6949(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('subsystemBonusGallenteDefensive2'), skill='Gallente Defensive Systems')
 
 
@@ -33382,7 +33383,7 @@ class Effect6951(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('subsystemBonusMinmatarDefensive2'), skill='Minmatar Defensive Systems')
 
 
@@ -33417,9 +33418,9 @@ class Effect6954(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'power',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'power',
                                       src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Leadership'), 'cpu',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Leadership'), 'cpu',
                                       src.getModifiedItemAttr('subsystemCommandBurstFittingReduction'))
 
 
@@ -33484,7 +33485,7 @@ class Effect6958(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusAmarrOffensive3'), skill='Amarr Offensive Systems')
 
 
@@ -33500,7 +33501,7 @@ class Effect6959(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'), 'overloadSelfDurationBonus',
                                       src.getModifiedItemAttr('subsystemBonusGallenteOffensive3'), skill='Gallente Offensive Systems')
 
 
@@ -33516,7 +33517,7 @@ class Effect6960(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusCaldariOffensive3'),
                                       skill='Caldari Offensive Systems')
 
@@ -33533,7 +33534,7 @@ class Effect6961(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Shield Emission Systems') or mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Shield Emission Systems', 'Remote Armor Repair Systems'),
                                       'overloadSelfDurationBonus', src.getModifiedItemAttr('subsystemBonusMinmatarOffensive3'),
                                       skill='Minmatar Offensive Systems')
 
@@ -33598,17 +33599,17 @@ class Effect6981(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG1'), skill='Gallente Titan')
 
 
@@ -33624,17 +33625,17 @@ class Effect6982(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'emDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'explosiveDamage',
                                       src.getModifiedItemAttr('shipBonusTitanG2'), skill='Gallente Titan')
 
 
@@ -33669,13 +33670,13 @@ class Effect6984(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'shieldCapacity',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'shieldCapacity',
                                        src.getModifiedItemAttr('shipBonusRole4'))
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackTurretDamageMultiplier',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityAttackTurretDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'))
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityAttackMissileDamageMultiplier',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityAttackMissileDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'))
-        fit.fighters.filteredItemBoost(lambda mod: mod.item.requiresSkill('Fighters'), 'fighterAbilityMissilesDamageMultiplier',
+        fit.fighters.filteredItemBoost(itemRequiresSkill('Fighters'), 'fighterAbilityMissilesDamageMultiplier',
                                        src.getModifiedItemAttr('shipBonusRole4'))
 
 
@@ -33691,17 +33692,17 @@ class Effect6985(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Torpedoes'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'thermalDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought')
-        fit.modules.filteredChargeBoost(lambda mod: mod.item.requiresSkill('XL Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(itemRequiresSkill('XL Cruise Missiles'), 'kineticDamage',
                                       src.getModifiedItemAttr('shipBonusDreadnoughtG1'), skill='Gallente Dreadnought')
 
 
@@ -33717,7 +33718,7 @@ class Effect6986(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capital Shield Emission Systems'), 'shieldBonus',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capital Shield Emission Systems'), 'shieldBonus',
                                       src.getModifiedItemAttr('shipBonusForceAuxiliaryG1'), skill='Gallente Carrier')
 
 
@@ -33733,17 +33734,17 @@ class Effect6987(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'structureDamageAmount', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'shieldBonus', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'armorDamageAmount', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'armorHP', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'shieldCapacity', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Repair Drone Operation'),
                                         'hp', src.getModifiedItemAttr('shipBonusRole2'))
 
 
@@ -33759,7 +33760,7 @@ class Effect6992(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole1'))
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'), 'damageMultiplier', src.getModifiedItemAttr('shipBonusRole1'))
 
 
 class Effect6993(BaseEffect):
@@ -33775,18 +33776,18 @@ class Effect6993(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileAOECloudPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterCapacitorCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterAOEVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorRepairAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMissileVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretTrackingPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretOptimalRangePenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterShieldBoostAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterTurretFalloffPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterArmorHPPenalty', src.getModifiedItemAttr('shipBonusRole2'))
-        fit.boosters.filteredItemBoost(lambda mod: mod.item.group.name == 'Booster', 'boosterMaxVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterMissileAOECloudPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterCapacitorCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterAOEVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterArmorRepairAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterMissileVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterTurretTrackingPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterShieldCapacityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterTurretOptimalRangePenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterShieldBoostAmountPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterTurretFalloffPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterArmorHPPenalty', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.boosters.filteredItemBoost(itemGroupIs('Booster'), 'boosterMaxVelocityPenalty', src.getModifiedItemAttr('shipBonusRole2'))
 
 
 class Effect6994(BaseEffect):
@@ -33801,7 +33802,7 @@ class Effect6994(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('eliteBonusReconShip1'), skill='Recon Ships')
 
 
@@ -33833,7 +33834,7 @@ class Effect6996(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships')
 
 
@@ -33849,7 +33850,7 @@ class Effect6997(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Repair Systems'), 'armorDamageAmount',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Repair Systems'), 'armorDamageAmount',
                                       src.getModifiedItemAttr('eliteBonusCovertOps4'), skill='Covert Ops')
 
 
@@ -33865,7 +33866,7 @@ class Effect6999(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo',
+        fit.modules.filteredItemMultiply(itemGroupIs('Missile Launcher Torpedo'),
                                          'cpu', ship.getModifiedItemAttr('stealthBomberLauncherCPU'))
 
 
@@ -33881,7 +33882,7 @@ class Effect7000(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'falloff',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'), 'falloff',
                                       src.getModifiedItemAttr('shipBonusGF'), skill='Gallente Frigate')
 
 
@@ -33897,7 +33898,7 @@ class Effect7001(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Missile Launcher Torpedo', 'speed', src.getModifiedItemAttr('shipBonusRole1'))
+        fit.modules.filteredItemBoost(itemGroupIs('Missile Launcher Torpedo'), 'speed', src.getModifiedItemAttr('shipBonusRole1'))
 
 
 class Effect7002(BaseEffect):
@@ -33912,8 +33913,8 @@ class Effect7002(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'power', src.getModifiedItemAttr('shipBonusRole3'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Bomb Deployment'), 'cpu', src.getModifiedItemAttr('shipBonusRole3'))
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'), 'power', src.getModifiedItemAttr('shipBonusRole3'))
+        fit.modules.filteredItemBoost(itemRequiresSkill('Bomb Deployment'), 'cpu', src.getModifiedItemAttr('shipBonusRole3'))
 
 
 class Effect7003(BaseEffect):
@@ -33928,7 +33929,7 @@ class Effect7003(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops')
 
 
@@ -34002,7 +34003,7 @@ class Effect7013(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'kineticDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -34018,7 +34019,7 @@ class Effect7014(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'thermalDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -34034,7 +34035,7 @@ class Effect7015(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'emDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -34050,7 +34051,7 @@ class Effect7016(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'explosiveDamage',
                                         src.getModifiedItemAttr('eliteBonusGunship1'), skill='Assault Frigates')
 
 
@@ -34066,7 +34067,7 @@ class Effect7017(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Missile Launcher Operation'), 'aoeVelocity',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Missile Launcher Operation'), 'aoeVelocity',
                                         src.getModifiedItemAttr('eliteBonusGunship2'), stackingPenalties=True, skill='Assault Frigates')
 
 
@@ -34082,7 +34083,7 @@ class Effect7018(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Energy Turret'), 'speed',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Energy Turret'), 'speed',
                                       src.getModifiedItemAttr('shipBonusAF'), stackingPenalties=False, skill='Amarr Frigate')
 
 
@@ -34099,7 +34100,7 @@ class Effect7020(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Stasis Web', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Stasis Web'), 'maxRange',
                                       src.getModifiedItemAttr('stasisWebRangeBonus'), stackingPenalties=False)
 
 
@@ -34132,7 +34133,7 @@ class Effect7024(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'trackingSpeed',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'trackingSpeed',
                                      src.getModifiedItemAttr('eliteBonusGunship2'), skill='Assault Frigates')
 
 
@@ -34211,11 +34212,11 @@ class Effect7030(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Guided Bomb Launcher',
+        fit.modules.filteredItemBoost(itemGroupIs('Structure Guided Bomb Launcher'),
                                       'speed', ship.getModifiedItemAttr('structureAoERoFRoleBonus'))
         for attr in ['duration', 'durationTargetIlluminationBurstProjector', 'durationWeaponDisruptionBurstProjector',
                      'durationECMJammerBurstProjector', 'durationSensorDampeningBurstProjector', 'capacitorNeed']:
-            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Structure Burst Projector',
+            fit.modules.filteredItemBoost(itemGroupIs('Structure Burst Projector'),
                                           attr, ship.getModifiedItemAttr('structureAoERoFRoleBonus'))
 
 
@@ -34231,7 +34232,7 @@ class Effect7031(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34247,7 +34248,7 @@ class Effect7032(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34263,7 +34264,7 @@ class Effect7033(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'),
                                         'emDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34279,7 +34280,7 @@ class Effect7034(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34295,7 +34296,7 @@ class Effect7035(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34311,7 +34312,7 @@ class Effect7036(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34327,7 +34328,7 @@ class Effect7037(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'thermalDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34343,7 +34344,7 @@ class Effect7038(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Assault Missiles'),
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Assault Missiles'),
                                         'kineticDamage', src.getModifiedItemAttr('shipBonusCBC2'), skill='Caldari Battlecruiser')
 
 
@@ -34361,7 +34362,7 @@ class Effect7039(BaseEffect):
     def handler(fit, src, context):
         groups = ('Structure Anti-Subcapital Missile', 'Structure Anti-Capital Missile')
         for dmgType in ('em', 'kinetic', 'explosive', 'thermal'):
-            fit.modules.filteredChargeMultiply(lambda mod: mod.item.group.name in groups,
+            fit.modules.filteredChargeMultiply(itemGroupIs(*groups),
                                                '%sDamage' % dmgType,
                                                src.getModifiedItemAttr('hiddenMissileDamageMultiplier'))
 
@@ -34546,9 +34547,9 @@ class Effect7052(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'signatureRadiusBonus',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'), 'signatureRadiusBonus',
                                       src.getModifiedItemAttr('targetPainterStrengthModifierFlagCruisers'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Target Painter', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Target Painter'), 'maxRange',
                                       src.getModifiedItemAttr('targetPainterRangeModifierFlagCruisers'))
 
 
@@ -34564,35 +34565,35 @@ class Effect7055(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Hybrid Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Hybrid Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Projectile Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Projectile Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Energy Turret'), 'damageMultiplier',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Energy Turret'), 'damageMultiplier',
                                       src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Heavy Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Heavy Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Torpedoes'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Torpedoes'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'thermalDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'thermalDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'explosiveDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'explosiveDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'kineticDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'kineticDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Cruise Missiles'), 'emDamage',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Cruise Missiles'), 'emDamage',
                                         src.getModifiedItemAttr('shipBonusRole7'))
 
 
@@ -34763,7 +34764,7 @@ class Effect7071(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -34780,7 +34781,7 @@ class Effect7072(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -34797,7 +34798,7 @@ class Effect7073(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Precursor Weapon'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -34814,7 +34815,7 @@ class Effect7074(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -34831,7 +34832,7 @@ class Effect7075(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -34848,7 +34849,7 @@ class Effect7076(BaseEffect):
     @staticmethod
     def handler(fit, container, context):
         level = container.level if 'skill' in context else 1
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Disintegrator Specialization'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Disintegrator Specialization'),
                                       'damageMultiplier', container.getModifiedItemAttr('damageMultiplierBonus') * level)
 
 
@@ -34864,7 +34865,7 @@ class Effect7077(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Precursor Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('damageMultiplier'),
                                          stackingPenalties=True)
 
@@ -34881,7 +34882,7 @@ class Effect7078(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemMultiply(itemGroupIs('Precursor Weapon'),
                                          'speed', module.getModifiedItemAttr('speedMultiplier'),
                                          stackingPenalties=True)
 
@@ -34898,7 +34899,7 @@ class Effect7079(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Precursor Weapon'),
                                       'speed', ship.getModifiedItemAttr('shipBonusPBS1'), skill='Precursor Battleship')
 
 
@@ -34914,7 +34915,7 @@ class Effect7080(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Large Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Large Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBS2'), skill='Precursor Battleship')
 
 
@@ -34931,7 +34932,7 @@ class Effect7085(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser')
 
 
@@ -34948,7 +34949,7 @@ class Effect7086(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'trackingSpeed', ship.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser')
 
 
@@ -34965,7 +34966,7 @@ class Effect7087(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusPF2'), skill='Precursor Frigate')
 
 
@@ -34982,7 +34983,7 @@ class Effect7088(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPF1'), skill='Precursor Frigate')
 
 
@@ -34998,7 +34999,7 @@ class Effect7091(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Capacitor Emission Systems'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusRole2'))
+        fit.modules.filteredItemBoost(itemRequiresSkill('Capacitor Emission Systems'), 'capacitorNeed', src.getModifiedItemAttr('shipBonusRole2'))
 
 
 class Effect7092(BaseEffect):
@@ -35019,7 +35020,7 @@ class Effect7092(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'))
 
 
@@ -35042,7 +35043,7 @@ class Effect7093(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Energy Pulse Weapons'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Energy Pulse Weapons'),
                                       'capacitorNeed', ship.getModifiedItemAttr('shipBonusRole2'))
 
 
@@ -35064,7 +35065,7 @@ class Effect7094(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Remote Armor Repair Systems'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Remote Armor Repair Systems'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusRole1'))
 
 
@@ -35080,7 +35081,7 @@ class Effect7097(BaseEffect):
 
     @staticmethod
     def handler(fit, skill, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Precursor Weapon',
+        fit.modules.filteredItemBoost(itemGroupIs('Precursor Weapon'),
                                       'damageMultiplier', skill.getModifiedItemAttr('damageMultiplierBonus') * skill.level)
 
 
@@ -35097,7 +35098,7 @@ class Effect7111(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemMultiply(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemMultiply(itemRequiresSkill('Small Precursor Weapon'),
                                          'damageMultiplier', module.getModifiedItemAttr('smallWeaponDamageMultiplier'),
                                          stackingPenalties=True)
 
@@ -35120,7 +35121,7 @@ class Effect7112(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Energy Neutralizer', 'capacitorNeed',
+        fit.modules.filteredItemBoost(itemGroupIs('Energy Neutralizer'), 'capacitorNeed',
                                       src.getModifiedItemAttr('shipBonusRole2'))
 
 
@@ -35136,7 +35137,7 @@ class Effect7116(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredChargeBoost(lambda mod: mod.charge.requiresSkill('Astrometrics'), 'baseSensorStrength',
+        fit.modules.filteredChargeBoost(chargeRequiresSkill('Astrometrics'), 'baseSensorStrength',
                                         src.getModifiedItemAttr('eliteBonusReconShip2'), skill='Recon Ships')
 
 
@@ -35171,7 +35172,7 @@ class Effect7118(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Small Precursor Weapon'), 'damageMultiplierBonusPerCycle',
                                          src.getModifiedItemAttr('eliteBonusCovertOps3'), skill='Covert Ops')
 
 
@@ -35187,7 +35188,7 @@ class Effect7119(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'), 'damageMultiplierBonusPerCycle',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('Medium Precursor Weapon'), 'damageMultiplierBonusPerCycle',
                                          src.getModifiedItemAttr('eliteBonusReconShip3'), skill='Recon Ships')
 
 
@@ -35205,11 +35206,11 @@ class Effect7142(BaseEffect):
     def handler(fit, src, context):
         fit.ship.increaseItemAttr('warpScrambleStatus', src.getModifiedItemAttr('warpScrambleStrength'))
         fit.ship.boostItemAttr('mass', src.getModifiedItemAttr('massBonusPercentage'), stackingPenalties=True)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'), 'speedFactor',
                                       src.getModifiedItemAttr('speedFactorBonus'), stackingPenalties=True)
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Afterburner'), 'speedBoostFactor',
+        fit.modules.filteredItemBoost(itemRequiresSkill('Afterburner'), 'speedBoostFactor',
                                       src.getModifiedItemAttr('speedBoostFactorBonus'))
-        fit.modules.filteredItemIncrease(lambda mod: mod.item.requiresSkill('High Speed Maneuvering'), 'activationBlocked',
+        fit.modules.filteredItemIncrease(itemRequiresSkill('High Speed Maneuvering'), 'activationBlocked',
                                          src.getModifiedItemAttr('activationBlockedStrenght'))
         fit.ship.boostItemAttr('maxVelocity', src.getModifiedItemAttr('maxVelocityBonus'), stackingPenalties=True)
 
@@ -35226,7 +35227,7 @@ class Effect7154(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPD1'),
                                       skill='Precursor Destroyer')
 
@@ -35243,7 +35244,7 @@ class Effect7155(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'damageMultiplier', ship.getModifiedItemAttr('shipBonusPBC1'),
                                       skill='Precursor Battlecruiser')
 
@@ -35260,7 +35261,7 @@ class Effect7156(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('maxRangeBonus'))
 
 
@@ -35276,7 +35277,7 @@ class Effect7157(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Small Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Small Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('shipBonusPD2'),
                                       skill='Precursor Destroyer')
 
@@ -35357,7 +35358,7 @@ class Effect7162(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill('Medium Precursor Weapon'),
+        fit.modules.filteredItemBoost(itemRequiresSkill('Medium Precursor Weapon'),
                                       'maxRange', ship.getModifiedItemAttr('roleBonusCBC'))
 
 
@@ -35401,7 +35402,7 @@ class Effect7167(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Remote Capacitor Transmitter', 'maxRange', src.getModifiedItemAttr('shipBonusRole1'))
+        fit.modules.filteredItemBoost(itemGroupIs('Remote Capacitor Transmitter'), 'maxRange', src.getModifiedItemAttr('shipBonusRole1'))
 
 
 class Effect7168(BaseEffect):
@@ -35416,7 +35417,7 @@ class Effect7168(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusRole3'))
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'), 'maxRange', src.getModifiedItemAttr('shipBonusRole3'))
 
 
 class Effect7169(BaseEffect):
@@ -35431,7 +35432,8 @@ class Effect7169(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser')
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser')
 
 
 class Effect7170(BaseEffect):
@@ -35446,7 +35448,8 @@ class Effect7170(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser')
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'),
+                                      'capacitorNeed', src.getModifiedItemAttr('shipBonusPC2'), skill='Precursor Cruiser')
 
 
 class Effect7171(BaseEffect):
@@ -35461,7 +35464,8 @@ class Effect7171(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'maxRange', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser')
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'),
+                                      'maxRange', src.getModifiedItemAttr('shipBonusPC1'), skill='Precursor Cruiser')
 
 
 class Effect7172(BaseEffect):
@@ -35476,7 +35480,8 @@ class Effect7172(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'capacitorNeed', src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers')
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'),
+                                      'capacitorNeed', src.getModifiedItemAttr('eliteBonusLogistics1'), skill='Logistics Cruisers')
 
 
 class Effect7173(BaseEffect):
@@ -35491,7 +35496,8 @@ class Effect7173(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mutadaptive Remote Armor Repairer', 'armorDamageAmount', src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers')
+        fit.modules.filteredItemBoost(itemGroupIs('Mutadaptive Remote Armor Repairer'),
+                                      'armorDamageAmount', src.getModifiedItemAttr('eliteBonusLogistics2'), skill='Logistics Cruisers')
 
 
 class Effect7176(BaseEffect):
@@ -35507,7 +35513,7 @@ class Effect7176(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'damageMultiplier',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'damageMultiplier',
                                      src.getModifiedItemAttr('damageMultiplierBonus'))
 
 
@@ -35523,11 +35529,11 @@ class Effect7177(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'hp',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'hp',
                                      src.getModifiedItemAttr('hullHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'armorHP',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'armorHP',
                                      src.getModifiedItemAttr('armorHpBonus'))
-        fit.drones.filteredItemBoost(lambda mod: mod.item.requiresSkill('Drones'), 'shieldCapacity',
+        fit.drones.filteredItemBoost(itemRequiresSkill('Drones'), 'shieldCapacity',
                                      src.getModifiedItemAttr('shieldCapacityBonus'))
 
 
@@ -35543,7 +35549,7 @@ class Effect7179(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Strip Miner',
+        fit.modules.filteredItemBoost(itemGroupIs('Strip Miner'),
                                       'duration', module.getModifiedItemAttr('miningDurationMultiplier'))
 
 
@@ -35559,7 +35565,7 @@ class Effect7180(BaseEffect):
 
     @staticmethod
     def handler(fit, module, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Mining Laser',
+        fit.modules.filteredItemBoost(itemGroupIs('Mining Laser'),
                                       'duration', module.getModifiedItemAttr('miningDurationMultiplier'))
 
 
@@ -35575,7 +35581,7 @@ class Effect7183(BaseEffect):
 
     @staticmethod
     def handler(fit, src, context):
-        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == 'Warp Scrambler', 'maxRange',
+        fit.modules.filteredItemBoost(itemGroupIs('Warp Scrambler'), 'maxRange',
                                       src.getModifiedItemAttr('warpScrambleRangeBonus'), stackingPenalties=False)
 
 
@@ -35591,7 +35597,7 @@ class Effect7184(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'hp', ship.getModifiedItemAttr('shipBonusRole8'))
 
 
@@ -35607,7 +35613,7 @@ class Effect7185(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'shieldCapacity', ship.getModifiedItemAttr('shipBonusRole8'))
 
 
@@ -35623,5 +35629,5 @@ class Effect7186(BaseEffect):
 
     @staticmethod
     def handler(fit, ship, context):
-        fit.drones.filteredItemBoost(lambda drone: drone.item.requiresSkill('Medium Drone Operation'),
+        fit.drones.filteredItemBoost(itemRequiresSkill('Medium Drone Operation'),
                                      'armorHP', ship.getModifiedItemAttr('shipBonusRole8'))
@@ -25,6 +25,8 @@ from sqlalchemy.orm import reconstructor
 
 import eos.effects
 import eos.db
+from eos.const import FittingModuleState
+from eos.db.gamedata.snapshot import getSnapshot
 from eos.saveddata.price import Price as types_Price
 from .eqBase import EqBase
 
@@ -203,6 +205,104 @@ class Effect(EqBase):
             return getattr(self.__effectDef, key, None)
 
 
+class SkillRequirements(object):
+    """
+    Skill requirements of all items, loaded from gamedata with a single pass on first use.
+    Item.requiresSkill(), Item.requiredSkills and Item.requiredFor are served from it.
+    """
+
+    # { requiredSkillX attribute ID : requiredSkillXLevel attribute ID }, in order of requirements
+    srqIDMap = OrderedDict(((182, 277), (183, 278), (184, 279), (1285, 1286), (1289, 1287), (1290, 1288)))
+
+    # { typeID : ((skillID, level), ...) }
+    __requirements = None
+    # { typeID : frozenset(skill IDs and names) }
+    __keys = None
+    # { skillID : ((typeID, level), ...) }
+    __requiredFor = None
+    # { skillID : skill name }
+    __names = None
+
+    @classmethod
+    def __iterRequirements(cls):
+        snapshot = getSnapshot()
+        if snapshot is not None:
+            yield from snapshot.iterSkillRequirements()
+            return
+
+        attrs = {}
+        for typeID, attrID, value in eos.db.getSkillRequirementAttributes(
+                set(cls.srqIDMap.keys()).union(cls.srqIDMap.values())):
+            attrs.setdefault(typeID, {})[attrID] = value
+
+        for typeID, typeAttrs in attrs.items():
+            reqs = []
+            for srqIDAttr, srqLvlAttr in cls.srqIDMap.items():
+                if srqIDAttr in typeAttrs and srqLvlAttr in typeAttrs:
+                    reqs.append((int(typeAttrs[srqIDAttr]), int(typeAttrs[srqLvlAttr])))
+            if reqs:
+                yield typeID, tuple(reqs)
+
+    @classmethod
+    def __load(cls):
+        requirements = {}
+        requiredFor = {}
+        for typeID, reqs in cls.__iterRequirements():
+            requirements[typeID] = reqs
+            for skillID, level in reqs:
+                requiredFor.setdefault(skillID, []).append((typeID, level))
+
+        names = dict(eos.db.getItemNames(requiredFor.keys())) if requiredFor else {}
+        keys = {}
+        for typeID, reqs in requirements.items():
+            typeKeys = set()
+            for skillID, _ in reqs:
+                typeKeys.add(skillID)
+                if skillID in names:
+                    typeKeys.add(names[skillID])
+            keys[typeID] = frozenset(typeKeys)
+
+        cls.__requirements = requirements
+        cls.__keys = keys
+        cls.__requiredFor = {skillID: tuple(reqFor) for skillID, reqFor in requiredFor.items()}
+        cls.__names = names
+
+    @classmethod
+    def getRequirements(cls, typeID):
+        """Get ((skillID, level), ...) required by item"""
+        if cls.__requirements is None:
+            cls.__load()
+        return cls.__requirements.get(typeID, ())
+
+    @classmethod
+    def getKeys(cls, typeID):
+        """Get frozenset of IDs and names of skills required by item"""
+        if cls.__keys is None:
+            cls.__load()
+        return cls.__keys.get(typeID, frozenset())
+
+    @classmethod
+    def getRequiredFor(cls, skillID):
+        """Get ((typeID, level), ...) of items which require the skill"""
+        if cls.__requiredFor is None:
+            cls.__load()
+        return cls.__requiredFor.get(skillID, ())
+
+    @classmethod
+    def getName(cls, skillID):
+        if cls.__names is None:
+            cls.__load()
+        return cls.__names.get(skillID)
+
+    @classmethod
+    def reset(cls):
+        """Forget loaded requirements, they are loaded again on next use"""
+        cls.__requirements = None
+        cls.__keys = None
+        cls.__requiredFor = None
+        cls.__names = None
+
+
 class Item(EqBase):
     MOVE_ATTRS = (4,  # Mass
                   38,  # Capacity
@@ -238,18 +338,40 @@ class Item(EqBase):
         self.__requiredSkills = None
         self.__requiredFor = None
         self.__moved = False
+        self.__snapshotAttributes = None
         self.__offensive = None
         self.__assistive = None
         self.__overrides = None
         self.__priceObj = None
+        self.__effectBuckets = {}
 
     @property
     def attributes(self):
         if not self.__moved:
-            self.moveAttrs()
+            snapshot = getSnapshot()
+            if snapshot is not None and self.ID in snapshot:
+                # Snapshot has moved attributes already, and doesn't need the ORM collection loaded
+                self.__snapshotAttributes = snapshot.getItemAttributes(self.ID)
+                self.__moved = True
+            else:
+                self.moveAttrs()
 
+        if self.__snapshotAttributes is not None:
+            return self.__snapshotAttributes
         return self.__attributes
 
+    def setAttributes(self, attributes):
+        """
+        Replace attributes of item with passed {name: attribute} dict, used to give mutated items attributes of
+        their base item. With a snapshot in use they can be snapshot attributes, which can't be put into the mapped
+        collection, so they are stored in the plain dict Item.attributes serves snapshot attributes from.
+        """
+        if getSnapshot() is not None:
+            self.__snapshotAttributes = dict(attributes)
+            self.__moved = True
+        else:
+            self.__attributes = attributes
+
     def getAttribute(self, key, default=None):
         if key in self.attributes:
             return self.attributes[key].value
@@ -263,13 +385,50 @@ class Item(EqBase):
 
         return False
 
+    def getEffectBucket(self, runTime, state=None, projected=False, gang=False, overheat=False, effectType=None):
+        """
+        Get tuple of effects which have to be run at passed run time and conditions.
+
+        state is the state of the item the effects are run for; effects requiring a higher state are left out.
+        If it's None, effects of all types are included. If projected is set, only projected effects are
+        included, if gang is set - only gang effects, and if overheat is set - only overheat effects.
+        effectType limits the bucket to effects of exactly that type (e.g. "passive" for items without state).
+        Buckets are built on first request and stored on the item, so that calculation doesn't have
+        to check effect properties over and over again.
+        """
+        key = (runTime, state, projected, gang, overheat, effectType)
+        try:
+            return self.__effectBuckets[key]
+        except KeyError:
+            bucket = tuple(e for e in self.effects.values() if self.__effectFits(e, *key))
+            self.__effectBuckets[key] = bucket
+            return bucket
+
+    @staticmethod
+    def __effectFits(effect, runTime, state, projected, gang, overheat, effectType):
+        if effect.runTime != runTime or not effect.activeByDefault:
+            return False
+        if effectType is not None and not effect.isType(effectType):
+            return False
+        if gang and not effect.isType("gang"):
+            return False
+        if overheat:
+            return effect.isType("overheat")
+        if projected and not effect.isType("projected"):
+            return False
+        if state is None:
+            return True
+        return effect.isType("offline") or \
+            (effect.isType("passive") and state >= FittingModuleState.ONLINE) or \
+            (effect.isType("active") and state >= FittingModuleState.ACTIVE)
+
     @property
     def overrides(self):
         if self.__overrides is None:
             self.__overrides = {}
             overrides = eos.db.getOverrides(self.ID)
             for x in overrides:
-                if x.attr.name in self.__attributes:
+                if x.attr.name in self.attributes:
                     self.__overrides[x.attr.name] = x
 
         return self.__overrides
@@ -289,50 +448,24 @@ class Item(EqBase):
         eos.db.saveddata_session.delete(override)
         eos.db.commit()
 
-    srqIDMap = {182: 277, 183: 278, 184: 279, 1285: 1286, 1289: 1287, 1290: 1288}
+    srqIDMap = SkillRequirements.srqIDMap
 
     @property
     def requiredSkills(self):
         if self.__requiredSkills is None:
             requiredSkills = OrderedDict()
+            for skillID, skillLvl in SkillRequirements.getRequirements(self.ID):
+                requiredSkills[eos.db.getItem(skillID)] = skillLvl
             self.__requiredSkills = requiredSkills
-            # Map containing attribute IDs we may need for required skills
-            # { requiredSkillX : requiredSkillXLevel }
-            combinedAttrIDs = set(self.srqIDMap.keys()).union(set(self.srqIDMap.values()))
-            # Map containing result of the request
-            # { attributeID : attributeValue }
-            skillAttrs = {}
-            # Get relevant attribute values from db (required skill IDs and levels) for our item
-            for attrInfo in eos.db.directAttributeRequest((self.ID,), tuple(combinedAttrIDs)):
-                attrID = attrInfo[1]
-                attrVal = attrInfo[2]
-                skillAttrs[attrID] = attrVal
-            # Go through all attributeID pairs
-            for srqIDAtrr, srqLvlAttr in self.srqIDMap.items():
-                # Check if we have both in returned result
-                if srqIDAtrr in skillAttrs and srqLvlAttr in skillAttrs:
-                    skillID = int(skillAttrs[srqIDAtrr])
-                    skillLvl = skillAttrs[srqLvlAttr]
-                    # Fetch item from database and fill map
-                    item = eos.db.getItem(skillID)
-                    requiredSkills[item] = skillLvl
         return self.__requiredSkills
 
     @property
     def requiredFor(self):
         if self.__requiredFor is None:
-            self.__requiredFor = dict()
-
-            # Map containing attribute IDs we may need for required skills
-
-            # Get relevant attribute values from db (required skill IDs and levels) for our item
-            q = eos.db.getRequiredFor(self.ID, self.srqIDMap)
-
-            for itemID, lvl in q:
-                # Fetch item from database and fill map
-                item = eos.db.getItem(itemID)
-                self.__requiredFor[item] = lvl
-
+            requiredFor = dict()
+            for itemID, lvl in SkillRequirements.getRequiredFor(self.ID):
+                requiredFor[eos.db.getItem(itemID)] = lvl
+            self.__requiredFor = requiredFor
         return self.__requiredFor
 
     factionMap = {
@@ -429,19 +562,18 @@ class Item(EqBase):
         return self.__offensive
 
     def requiresSkill(self, skill, level=None):
-        for s, l in self.requiredSkills.items():
-            if isinstance(skill, str):
-                if s.name == skill and (level is None or l == level):
-                    return True
-
-            elif isinstance(skill, int) and (level is None or l == level):
-                if s.ID == skill:
-                    return True
+        if isinstance(skill, (str, int)):
+            key = skill
+        elif hasattr(skill, "item"):
+            key = skill.item.ID
+        else:
+            key = skill.ID
 
-            elif skill == s and (level is None or l == level):
-                return True
+        if level is None:
+            return key in SkillRequirements.getKeys(self.ID)
 
-            elif hasattr(skill, "item") and skill.item == s and (level is None or l == level):
+        for skillID, skillLvl in SkillRequirements.getRequirements(self.ID):
+            if (skillID == key or SkillRequirements.getName(skillID) == key) and skillLvl == level:
                 return True
 
         return False
@@ -18,10 +18,20 @@
 # ===============================================================================
 
 import itertools
+from collections import OrderedDict
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class Graph(object):
-    def __init__(self, fit, function, data=None):
+    # Grids of recently evaluated graphs, {(fit calc generation, graph type, data): (axes, values)}
+    gridCache = OrderedDict()
+    gridCacheSize = 64
+
+    def __init__(self, fit, function, data=None, vectorFunction=None):
         self.fit = fit
         self.data = {}
         if data is not None:
@@ -29,6 +39,9 @@ class Graph(object):
                 self.setData(Data(name, d))
 
         self.function = function
+        # Optional version of function taking data names as keyword arguments, with
+        # broadcastable arrays as values, and returning an array of results
+        self.vectorFunction = vectorFunction
 
     def clearData(self):
         self.data.clear()
@@ -53,11 +66,68 @@ class Graph(object):
 
             yield point, self.function(point)
 
+    def prepare(self):
+        """Called before the grid is evaluated"""
+        pass
+
+    def getBreakpoints(self, name):
+        """Values of named data around which results change abruptly, to sample more densely"""
+        return ()
+
+    def getGrid(self):
+        """
+        Evaluate over every combination of non-constant data, needs numpy. Returns list
+        of (name, samples) pairs of non-constant data, and ndarray of results with one
+        dimension per pair. Results are cached until the fit is recalculated.
+        """
+        key = (self.fit.calcGeneration, type(self).__name__,
+               tuple(sorted((data.name, data.dataString) for data in self.data.values())))
+        cache = Graph.gridCache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        self.prepare()
+        constants = {}
+        axes = []
+        for data in self.data.values():
+            if data.isConstant():
+                constants[data.name] = next(iter(data))
+            else:
+                axes.append((data.name, numpy.array(data.sample(self.getBreakpoints(data.name)))))
+
+        grid = self._evaluateGrid(constants, axes)
+        cache[key] = grid
+        while len(cache) > self.gridCacheSize:
+            cache.popitem(last=False)
+        return grid
+
+    def _evaluateGrid(self, constants, axes):
+
+        shape = tuple(len(samples) for _, samples in axes)
+        if self.vectorFunction is not None:
+            inputs = dict(constants)
+            grid = numpy.meshgrid(*[samples for _, samples in axes], indexing="ij", sparse=True)
+            for (name, _), values in zip(axes, grid):
+                inputs[name] = values
+            return axes, numpy.broadcast_to(self.vectorFunction(**inputs), shape)
+
+        values = numpy.empty(shape)
+        for index in numpy.ndindex(*shape):
+            point = dict(constants)
+            for (name, samples), i in zip(axes, index):
+                point[name] = samples[i]
+            values[index] = self.function(point)
+        # Cached grids are shared
+        values.flags.writeable = False
+        return axes, values
+
 
 class Data(object):
     def __init__(self, name, dataString, step=None):
         self.name = name
         self.step = step
+        self.dataString = dataString
         self.data = self.parseString(dataString)
 
     def parseString(self, dataString):
@@ -82,6 +152,14 @@ class Data(object):
     def isConstant(self):
         return len(self.data) == 1 and self.data[0].isConstant()
 
+    def sample(self, breakpoints=()):
+        """Sorted list of values, ranges refined around breakpoints"""
+        values = set()
+        for data in self.data:
+            values.update(data.sample(breakpoints))
+        values.discard(None)
+        return sorted(values)
+
 
 class Constant(object):
     def __init__(self, const):
@@ -93,6 +171,9 @@ class Constant(object):
     def __iter__(self):
         yield self.value
 
+    def sample(self, breakpoints=()):
+        return [self.value]
+
     @staticmethod
     def isConstant():
         return True
@@ -115,6 +196,21 @@ class Range(object):
             i += 1
             yield current
 
+    # Offsets of extra samples around breakpoints, in steps; the tiny ones make cliffs vertical
+    refinement = (-0.5, -0.25, -0.1, -0.001, 0, 0.001, 0.1, 0.25, 0.5)
+
+    def sample(self, breakpoints=()):
+        """Regular steps plus extra samples around breakpoints within range"""
+        samples = list(self)
+        step = self.step or (self.end - self.start) / 50.0
+        for breakpoint in breakpoints:
+            if self.start < breakpoint < self.end:
+                for offset in self.refinement:
+                    value = breakpoint + offset * step
+                    if self.start < value <= self.end:
+                        samples.append(value)
+        return samples
+
     @staticmethod
     def isConstant():
         return False
@@ -23,6 +23,11 @@ from eos.graph import Graph
 from eos.const import FittingModuleState, FittingHardpoint
 from logbook import Logger
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 pyfalog = Logger(__name__)
 
 
@@ -34,9 +39,14 @@ class FitDpsGraph(Graph):
         "velocity"       : 0
     }
 
+    # calcDpsArray() is available
+    vectorized = numpy is not None
+
     def __init__(self, fit, data=None):
-        Graph.__init__(self, fit, self.calcDps, data if data is not None else self.defaults)
+        Graph.__init__(self, fit, self.calcDps, data if data is not None else self.defaults,
+                       self.calcDpsArray if self.vectorized else None)
         self.fit = fit
+        self.arrays = None
 
     def calcDps(self, data):
         ew = {'signatureRadius': [], 'velocity': []}
@@ -192,3 +202,183 @@ class FitDpsGraph(Graph):
         rangeEq = ((max(0, distance - turretOptimal)) / turretFalloff) ** 2
 
         return 0.5 ** rangeEq
+
+    def prepare(self):
+        """
+        Extract everything DPS at a point depends on from the fit into arrays, for
+        calcDpsArray(). getGrid() calls it, otherwise it has to be called again after
+        the fit is recalculated.
+        """
+        fit = self.fit
+        painters = []
+        webs = []
+        turrets = []
+        missiles = []
+        drones = 0
+        sentries = []
+        fighters = []
+
+        def turretRow(dps, item):
+            return (dps, item.getModifiedItemAttr("trackingSpeed"), item.maxRange or 0, item.falloff or 0,
+                    item.getModifiedItemAttr("optimalSigRadius"), item.getModifiedItemAttr("turretDamageScalingRadius"))
+
+        for mod in fit.modules:
+            if mod.isEmpty or mod.state < FittingModuleState.ACTIVE:
+                continue
+            effects = mod.item.effects
+            if "remoteTargetPaintFalloff" in effects or "structureModuleEffectTargetPainter" in effects:
+                painters.append((mod.getModifiedItemAttr("signatureRadiusBonus") / 100, mod.maxRange or 0,
+                                 mod.falloff or 0))
+            if "remoteWebifierFalloff" in effects or "structureModuleEffectStasisWebifier" in effects:
+                webs.append((mod.getModifiedItemAttr("speedFactor") / 100, mod.getModifiedItemAttr("maxRange"),
+                             mod.falloff or 0,
+                             mod.getModifiedItemAttr("falloffEffectiveness") > 0))
+
+            if mod.hardpoint == FittingHardpoint.TURRET:
+                turrets.append(turretRow(mod.getDps(targetResists=fit.targetResists).total, mod))
+            elif mod.hardpoint == FittingHardpoint.MISSILE and mod.maxRange is not None:
+                missiles.append((mod.getDps(targetResists=fit.targetResists).total, mod.maxRange,
+                                 mod.getModifiedChargeAttr("aoeCloudSize"), mod.getModifiedChargeAttr("aoeVelocity"),
+                                 mod.getModifiedChargeAttr("aoeDamageReductionFactor")))
+
+        for drone in fit.drones:
+            dps = drone.getDps(targetResists=fit.targetResists).total
+            if drone.getModifiedItemAttr("maxVelocity") > 1:
+                drones += dps
+            else:
+                sentries.append(turretRow(dps, drone))
+
+        for fighter in fit.fighters:
+            if not fighter.active:
+                continue
+            for ability in fighter.abilities:
+                if not ability.dealsDamage or not ability.active:
+                    continue
+                prefix = ability.attrPrefix
+                reductionFactor = fighter.getModifiedItemAttr("{}ReductionFactor".format(prefix), None)
+                if reductionFactor is None:
+                    reductionFactor = fighter.getModifiedItemAttr("{}DamageReductionFactor".format(prefix))
+                reductionSensitivity = fighter.getModifiedItemAttr("{}ReductionSensitivity".format(prefix), None)
+                if reductionSensitivity is None:
+                    reductionSensitivity = fighter.getModifiedItemAttr("{}DamageReductionSensitivity".format(prefix))
+                fighters.append((ability.getDps(targetResists=fit.targetResists).total,
+                                 fighter.getModifiedItemAttr("{}ExplosionRadius".format(prefix)),
+                                 fighter.getModifiedItemAttr("{}ExplosionVelocity".format(prefix)),
+                                 log(reductionFactor) / log(reductionSensitivity)))
+
+        def columns(rows, width):
+            # One (n, 1) array per value, to broadcast against flattened points
+            table = numpy.array(rows, dtype=float).reshape(len(rows), width)
+            return [table[:, i:i + 1] for i in range(width)]
+
+        self.arrays = {
+            "painters": columns(painters, 3),
+            "webs": columns(webs, 4),
+            "turrets": columns(turrets, 6),
+            "missiles": columns(missiles, 5),
+            "drones": drones,
+            "sentries": columns(sentries, 6),
+            "fighters": columns(fighters, 4),
+            "droneControlRange": fit.extraAttributes["droneControlRange"],
+        }
+
+    def getBreakpoints(self, name):
+        """Optimal and falloff ranges, missile flight ranges, web and painter ranges, drone control range"""
+        if name != "distance" or self.arrays is None:
+            return ()
+        arrays = self.arrays
+        ranges = [arrays["droneControlRange"]]
+        for weapons in (arrays["turrets"], arrays["sentries"]):
+            optimal, falloff = weapons[2], weapons[3]
+            ranges.extend(optimal.ravel())
+            ranges.extend((optimal + falloff).ravel())
+        ranges.extend(arrays["missiles"][1].ravel())
+        ranges.extend(arrays["webs"][1].ravel())
+        ranges.extend(arrays["painters"][1].ravel())
+        # Graph distances are in km
+        return sorted(set(r / 1000 for r in ranges if r == r))
+
+    def calcDpsArray(self, distance, velocity, signatureRadius, angle):
+        """
+        DPS for any number of points in one pass, same as calcDps(). Inputs are scalars or
+        broadcastable arrays, signatureRadius may be None; returns array of their broadcast shape.
+        """
+        if self.arrays is None:
+            self.prepare()
+        arrays = self.arrays
+        noSignature = signatureRadius is None
+        distance, velocity, signatureRadius, angle = numpy.broadcast_arrays(
+            numpy.asarray(distance, dtype=float), numpy.asarray(velocity, dtype=float),
+            numpy.asarray(0 if noSignature else signatureRadius, dtype=float), numpy.asarray(angle, dtype=float))
+        shape = distance.shape
+        distance = distance.reshape(1, -1) * 1000
+        velocity = velocity.reshape(1, -1)
+        signatureRadius = signatureRadius.reshape(1, -1)
+        angle = angle.reshape(1, -1)
+
+        with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            bonus, optimal, falloff = arrays["painters"]
+            if not noSignature:
+                signatureRadius = signatureRadius * self.stackedMultiplier(
+                    1 + bonus * self.rangeMultiplier(distance, optimal, falloff))
+
+            speedFactor, optimal, falloff, hasFalloff = arrays["webs"]
+            webs = numpy.where(distance <= optimal, 1 + speedFactor,
+                               numpy.where(hasFalloff > 0,
+                                           1 + speedFactor * self.rangeMultiplier(distance, optimal, falloff), 1))
+            velocity = velocity * self.stackedMultiplier(webs)
+
+            transversal = numpy.sin(numpy.radians(angle)) * velocity
+            signature = None if noSignature else signatureRadius
+            total = numpy.zeros(distance.shape)
+
+            dps, tracking, optimal, falloff, sigRes, dmgScaling = arrays["turrets"]
+            total += (dps * self.turretMultiplier(distance, transversal, signature, tracking, optimal, falloff,
+                                                  sigRes, dmgScaling)).sum(axis=0)
+
+            dps, maxRange, explosionRadius, explosionVelocity, exponent = arrays["missiles"]
+            total += (numpy.where(maxRange >= distance, dps, 0) * self.explosionMultiplier(
+                velocity, signature, explosionRadius, explosionVelocity, exponent)).sum(axis=0)
+
+            dps, tracking, optimal, falloff, sigRes, dmgScaling = arrays["sentries"]
+            droneDps = arrays["drones"] + (dps * self.turretMultiplier(
+                distance, transversal, signature, tracking, optimal, falloff, sigRes, dmgScaling)).sum(axis=0)
+            total += numpy.where(distance <= arrays["droneControlRange"], droneDps, 0)
+
+            dps, explosionRadius, explosionVelocity, exponent = arrays["fighters"]
+            total += (dps * self.explosionMultiplier(velocity, signature, explosionRadius, explosionVelocity,
+                                                     exponent)).sum(axis=0)
+
+        return total.reshape(shape)
+
+    @staticmethod
+    def rangeMultiplier(distance, optimal, falloff):
+        overshoot = numpy.maximum(0, distance - optimal)
+        return 0.5 ** numpy.where(overshoot > 0, (overshoot / falloff) ** 2, 0)
+
+    @staticmethod
+    def stackedMultiplier(bonuses):
+        """Stacking penalized product of (n, points) bonuses, strongest first at every point"""
+        if len(bonuses) == 0:
+            return 1
+        order = numpy.argsort(-numpy.abs(bonuses - 1), axis=0, kind="stable")
+        bonuses = numpy.take_along_axis(bonuses, order, axis=0)
+        penalties = numpy.exp(-numpy.arange(len(bonuses)) ** 2 / 7.1289).reshape(-1, 1)
+        return numpy.prod(1 + (bonuses - 1) * penalties, axis=0)
+
+    @classmethod
+    def turretMultiplier(cls, distance, transversal, signatureRadius, tracking, optimal, falloff, sigRes, dmgScaling):
+        signatureRadius = sigRes if signatureRadius is None else signatureRadius
+        trackingEq = numpy.where(transversal != 0,
+                                 ((transversal / (distance * tracking)) * (sigRes / signatureRadius)) ** 2, 0)
+        chanceToHit = 0.5 ** trackingEq * cls.rangeMultiplier(distance, optimal, falloff)
+        multiplier = numpy.where(chanceToHit > 0.01, (chanceToHit ** 2 + chanceToHit + 0.0499) / 2, chanceToHit * 3)
+        return numpy.where(dmgScaling > 0, numpy.minimum(1, (signatureRadius / dmgScaling) ** 2), multiplier)
+
+    @staticmethod
+    def explosionMultiplier(velocity, signatureRadius, explosionRadius, explosionVelocity, exponent):
+        signatureRadius = explosionRadius if signatureRadius is None else signatureRadius
+        sigRadiusFactor = signatureRadius / explosionRadius
+        velocityFactor = numpy.where(velocity != 0,
+                                     (explosionVelocity / explosionRadius * signatureRadius / velocity) ** exponent, 1)
+        return numpy.minimum(numpy.minimum(sigRadiusFactor, velocityFactor), 1)
@@ -19,6 +19,13 @@
 
 import collections
 from math import exp
+
+import eos.config
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 # TODO: This needs to be moved out, we shouldn't have *ANY* dependencies back to other modules/methods inside eos.
 # This also breaks writing any tests. :(
 from eos.db.gamedata.queries import getAttributeInfo
@@ -27,6 +34,134 @@ defaultValuesCache = {}
 cappingAttrKeyCache = {}
 
 
+def _getCappingKey(key):
+    # It's possible that various attributes are capped by other attributes,
+    # it's defined by reference maxAttributeID
+    try:
+        return cappingAttrKeyCache[key]
+    except KeyError:
+        attrInfo = getAttributeInfo(key)
+        if attrInfo is None:
+            cappingId = cappingAttrKeyCache[key] = None
+        else:
+            # see GH issue #620
+            cappingId = cappingAttrKeyCache[key] = attrInfo.maxAttributeID
+        if cappingId is None:
+            return None
+        cappingAttrInfo = getAttributeInfo(cappingId)
+        return None if cappingAttrInfo is None else cappingAttrInfo.name
+
+
+def _getDefaultValue(key):
+    try:
+        return defaultValuesCache[key]
+    except KeyError:
+        attrInfo = getAttributeInfo(key)
+        if attrInfo is None:
+            default = defaultValuesCache[key] = 0.0
+        else:
+            dv = attrInfo.defaultValue
+            default = defaultValuesCache[key] = dv if dv is not None else 0.0
+        return default
+
+
+# Stacking penalty coefficients: n-th most significant modification in a group is applied
+# as 1 + (multiplier - 1) * exp(-n ** 2 / 7.1289)
+penaltyCoefficients = [exp(- i ** 2 / 7.1289) for i in range(16)]
+
+
+def _getPenaltyCoefficients(count):
+    while len(penaltyCoefficients) < count:
+        i = len(penaltyCoefficients)
+        penaltyCoefficients.append(exp(- i ** 2 / 7.1289))
+    return penaltyCoefficients
+
+
+def _penaltyOrder(_val):
+    return -abs(_val - 1)
+
+
+def _splitPenalized(penalizedMultipliers):
+    """Bonuses and penalties are penalized separately, return them as two lists"""
+    return [_val for _val in penalizedMultipliers if _val > 1], [_val for _val in penalizedMultipliers if _val < 1]
+
+
+def _getChainFactor(multipliers):
+    """Combined factor of multipliers stacking with each other, most significant one first"""
+    coefficients = _getPenaltyCoefficients(len(multipliers))
+    factor = 1
+    for i, bonus in enumerate(multipliers):
+        factor *= 1 + (bonus - 1) * coefficients[i]
+    return factor
+
+
+def _getChainFactors(chains):
+    """Same as _getChainFactor() for many unsorted non-empty chains at once"""
+    if numpy is None:
+        return [_getChainFactor(sorted(chain, key=_penaltyOrder)) for chain in chains]
+    lengths = numpy.fromiter((len(chain) for chain in chains), dtype=numpy.intp, count=len(chains))
+    starts = numpy.zeros(len(chains), dtype=numpy.intp)
+    numpy.cumsum(lengths[:-1], out=starts[1:])
+    values = numpy.fromiter((_val for chain in chains for _val in chain), dtype=numpy.float64, count=lengths.sum())
+    chainIndices = numpy.repeat(numpy.arange(len(chains)), lengths)
+    # The most significant bonuses take the smallest penalty; lexsort is stable, like list.sort()
+    order = numpy.lexsort((-numpy.abs(values - 1), chainIndices))
+    ranks = numpy.arange(len(values)) - numpy.repeat(starts, lengths)
+    coefficients = numpy.array(_getPenaltyCoefficients(int(lengths.max())), dtype=numpy.float64)
+    factors = 1 + (values[order] - 1) * coefficients[ranks]
+    return numpy.multiply.reduceat(factors, starts).tolist()
+
+
+def _applyModifications(val, preIncrease, multiplier, penalizedMultiplierGroups, postIncrease):
+    # We'll do stuff in the following order:
+    # preIncrease > multiplier > stacking penalized multipliers > postIncrease
+    val += preIncrease
+    val *= multiplier
+    # Each group is penalized independently
+    # Things in different groups will not be stack penalized between each other
+    for penalizedMultipliers in penalizedMultiplierGroups.values():
+        for chain in _splitPenalized(penalizedMultipliers):
+            if chain:
+                chain.sort(key=_penaltyOrder)
+                val *= _getChainFactor(chain)
+    val += postIncrease
+    return val
+
+
+def _capValue(key, val, cappingValue):
+    # Cap value if we have cap defined
+    if cappingValue is not None:
+        val = min(val, cappingValue)
+    if key in (50, 30, 48, 11):
+        val = round(val, 2)
+    return val
+
+
+def finalizeAttributeDicts(attrDicts):
+    """
+    Calculate final values of all pending attributes of given dicts in one go, so that reading them later is
+    a plain lookup. Stacking penalties of all attributes are evaluated together.
+    """
+    pending = []
+    chains = []
+    chainOwners = []
+    for attrDict in attrDicts:
+        for key, val, preIncrease, multiplier, penalizedMultiplierGroups, postIncrease, cappingValue in \
+                attrDict.getPendingModifications():
+            for penalizedMultipliers in penalizedMultiplierGroups.values():
+                for chain in _splitPenalized(penalizedMultipliers):
+                    if chain:
+                        chains.append(chain)
+                        chainOwners.append(len(pending))
+            pending.append([attrDict, key, (val + preIncrease) * multiplier, postIncrease, cappingValue])
+    if chains:
+        for owner, factor in zip(chainOwners, _getChainFactors(chains)):
+            pending[owner][2] *= factor
+    for attrDict, key, val, postIncrease, cappingValue in pending:
+        attrDict.setFinalValue(key, val + postIncrease, cappingValue)
+    return len(pending)
+
+
 class ItemAttrShortcut(object):
     def getModifiedItemAttr(self, key, default=0):
         return_value = self.itemModifiedAttributes.get(key)
@@ -59,11 +194,24 @@ class ChargeAttrShortcut(object):
 
 class ModifiedAttributeDict(collections.MutableMapping):
     overrides_enabled = False
+    # CalcTracker which records attribute reads and writes of the calculation currently running, if any
+    tracker = None
+    # SkillModifierCache which records modifications done by skills, if any
+    recorder = None
+    # Both of the above are process-global: fits must be calculated by one thread at a time. Background
+    # calculations are done in separate worker processes instead (see service.batch)
 
     class CalculationPlaceholder(object):
         def __init__(self):
             pass
 
+    @classmethod
+    def create(cls, fit=None, parent=None):
+        """Make attribute dict using storage backend selected in eos config"""
+        if eos.config.settings["compactAttributeDicts"]:
+            return CompactModifiedAttributeDict(fit=fit, parent=parent)
+        return cls(fit=fit, parent=parent)
+
     def __init__(self, fit=None, parent=None):
         self.parent = parent
         self.fit = fit
@@ -101,6 +249,13 @@ class ModifiedAttributeDict(collections.MutableMapping):
         self.__penalizedMultipliers.clear()
         self.__postIncreases.clear()
 
+    def clearKeys(self, keys):
+        """Drop everything calculated for given attributes, leaving the rest of the dict intact"""
+        for key in keys:
+            for tbl in (self.__intermediary, self.__modified, self.__affectedBy, self.__forced, self.__preAssigns,
+                        self.__preIncreases, self.__multipliers, self.__penalizedMultipliers, self.__postIncreases):
+                tbl.pop(key, None)
+
     @property
     def original(self):
         return self.__original
@@ -127,6 +282,10 @@ class ModifiedAttributeDict(collections.MutableMapping):
         self.__mutators = val
 
     def __getitem__(self, key):
+        if self.tracker is not None:
+            self.tracker.read(self, key)
+        if self.recorder is not None:
+            self.recorder.read(self, key)
         # Check if we have final calculated value
         key_value = self.__modified.get(key)
         if key_value is self.CalculationPlaceholder:
@@ -171,6 +330,10 @@ class ModifiedAttributeDict(collections.MutableMapping):
         return val.value if hasattr(val, "value") else val
 
     def __setitem__(self, key, val):
+        if self.tracker is not None:
+            self.tracker.write(self, key)
+        if self.recorder is not None:
+            self.recorder.write(self, key)
         self.__intermediary[key] = val
 
     def __iter__(self):
@@ -183,6 +346,8 @@ class ModifiedAttributeDict(collections.MutableMapping):
 
     def __placehold(self, key):
         """Create calculation placeholder in item's modified attribute dict"""
+        if self.tracker is not None:
+            self.tracker.write(self, key)
         self.__modified[key] = self.CalculationPlaceholder
 
     def __len__(self):
@@ -192,94 +357,67 @@ class ModifiedAttributeDict(collections.MutableMapping):
         keys.update(iter(self.__intermediary.keys()))
         return len(keys)
 
-    def __calculateValue(self, key):
-        # It's possible that various attributes are capped by other attributes,
-        # it's defined by reference maxAttributeID
-        try:
-            cappingKey = cappingAttrKeyCache[key]
-        except KeyError:
-            attrInfo = getAttributeInfo(key)
-            if attrInfo is None:
-                cappingId = cappingAttrKeyCache[key] = None
-            else:
-                # see GH issue #620
-                cappingId = cappingAttrKeyCache[key] = attrInfo.maxAttributeID
-            if cappingId is None:
-                cappingKey = None
-            else:
-                cappingAttrInfo = getAttributeInfo(cappingId)
-                cappingKey = None if cappingAttrInfo is None else cappingAttrInfo.name
-
-        if cappingKey:
-            cappingValue = self.original.get(cappingKey, self.__calculateValue(cappingKey))
-            cappingValue = cappingValue.value if hasattr(cappingValue, "value") else cappingValue
+    def __getCappingValue(self, key):
+        cappingKey = _getCappingKey(key)
+        if not cappingKey:
+            return None
+        if self.tracker is not None:
+            self.tracker.read(self, cappingKey)
+        if cappingKey in self.original:
+            cappingValue = self.original[cappingKey]
         else:
-            cappingValue = None
+            cappingValue = self.__calculateValue(cappingKey)
+        return cappingValue.value if hasattr(cappingValue, "value") else cappingValue
+
+    def __getBaseValue(self, key):
+        # Grab initial value, priorities are:
+        # Results of ongoing calculation > preAssign > original > 0
+        if key in self.__intermediary:
+            return self.__intermediary[key]
+        if key in self.__preAssigns:
+            return self.__preAssigns[key]
+        return self.getOriginal(key, _getDefaultValue(key))
+
+    def __calculateValue(self, key):
+        cappingValue = self.__getCappingValue(key)
 
         # If value is forced, we don't have to calculate anything,
         # just return forced value instead
         force = self.__forced[key] if key in self.__forced else None
         if force is not None:
-            if cappingValue is not None:
-                force = min(force, cappingValue)
-            if key in (50, 30, 48, 11):
-                force = round(force, 2)
-            return force
+            return _capValue(key, force, cappingValue)
         # Grab our values if they're there, otherwise we'll take default values
         preIncrease = self.__preIncreases.get(key, 0)
         multiplier = self.__multipliers.get(key, 1)
         penalizedMultiplierGroups = self.__penalizedMultipliers.get(key, {})
         postIncrease = self.__postIncreases.get(key, 0)
 
-        # Grab initial value, priorities are:
-        # Results of ongoing calculation > preAssign > original > 0
-        try:
-            default = defaultValuesCache[key]
-        except KeyError:
-            attrInfo = getAttributeInfo(key)
-            if attrInfo is None:
-                default = defaultValuesCache[key] = 0.0
-            else:
-                dv = attrInfo.defaultValue
-                default = defaultValuesCache[key] = dv if dv is not None else 0.0
-
-        val = self.__intermediary.get(key,
-                                      self.__preAssigns.get(key,
-                                                            self.getOriginal(key, default)
-                                                            )
-                                      )
-
-        # We'll do stuff in the following order:
-        # preIncrease > multiplier > stacking penalized multipliers > postIncrease
-        val += preIncrease
-        val *= multiplier
-        # Each group is penalized independently
-        # Things in different groups will not be stack penalized between each other
-        for penalizedMultipliers in penalizedMultiplierGroups.values():
-            # A quick explanation of how this works:
-            # 1: Bonuses and penalties are calculated seperately, so we'll have to filter each of them
-            l1 = [_val for _val in penalizedMultipliers if _val > 1]
-            l2 = [_val for _val in penalizedMultipliers if _val < 1]
-            # 2: The most significant bonuses take the smallest penalty,
-            # This means we'll have to sort
-            abssort = lambda _val: -abs(_val - 1)
-            l1.sort(key=abssort)
-            l2.sort(key=abssort)
-            # 3: The first module doesn't get penalized at all
-            # Any module after the first takes penalties according to:
-            # 1 + (multiplier - 1) * math.exp(- math.pow(i, 2) / 7.1289)
-            for l in (l1, l2):
-                for i in range(len(l)):
-                    bonus = l[i]
-                    val *= 1 + (bonus - 1) * exp(- i ** 2 / 7.1289)
-        val += postIncrease
-
-        # Cap value if we have cap defined
-        if cappingValue is not None:
-            val = min(val, cappingValue)
-        if key in (50, 30, 48, 11):
-            val = round(val, 2)
-        return val
+        val = _applyModifications(self.__getBaseValue(key), preIncrease, multiplier, penalizedMultiplierGroups,
+                                  postIncrease)
+        return _capValue(key, val, cappingValue)
+
+    def getPendingModifications(self):
+        """
+        Return modifications of all attributes which are waiting to be calculated, as
+        (key, base value, preIncrease, multiplier, penalized multiplier groups, postIncrease, capping value) tuples.
+        Forced attributes need no calculation and are finalized right away.
+        """
+        pending = []
+        for key, value in self.__modified.items():
+            if value is not self.CalculationPlaceholder:
+                continue
+            cappingValue = self.__getCappingValue(key)
+            force = self.__forced.get(key)
+            if force is not None:
+                self.__modified[key] = _capValue(key, force, cappingValue)
+                continue
+            pending.append((key, self.__getBaseValue(key), self.__preIncreases.get(key, 0),
+                            self.__multipliers.get(key, 1), self.__penalizedMultipliers.get(key, {}),
+                            self.__postIncreases.get(key, 0), cappingValue))
+        return pending
+
+    def setFinalValue(self, key, val, cappingValue):
+        self.__modified[key] = _capValue(key, val, cappingValue)
 
     def __handleSkill(self, skillName):
         """
@@ -306,10 +444,19 @@ class ModifiedAttributeDict(collections.MutableMapping):
     def iterAfflictions(self):
         return self.__affectedBy.__iter__()
 
+    def __record(self, operation, *args, **kwargs):
+        """Pass fully resolved modification to the recorder, so that it can be applied again as-is"""
+        if self.__tmpModifier:
+            modifier = self.__tmpModifier
+        else:
+            modifier = self.fit.getModifier() if self.fit is not None else None
+        self.recorder.record(self, operation, args, kwargs, modifier)
+
     def __afflict(self, attributeName, operation, bonus, used=True):
         """Add modifier to list of things affecting current item"""
-        # Do nothing if no fit is assigned
-        if self.fit is None:
+        # Do nothing if no fit is assigned or fit doesn't want to know what affects its items
+        if self.fit is None or not self.fit.trackAfflictions:
+            self.__tmpModifier = None
             return
         # Create dictionary for given attribute and give it alias
         if attributeName not in self.__affectedBy:
@@ -335,6 +482,8 @@ class ModifiedAttributeDict(collections.MutableMapping):
 
     def preAssign(self, attributeName, value):
         """Overwrites original value of the entity with given one, allowing further modification"""
+        if self.recorder is not None:
+            self.__record("preAssign", attributeName, value)
         self.__preAssigns[attributeName] = value
         self.__placehold(attributeName)
         self.__afflict(attributeName, "=", value, value != self.getOriginal(attributeName))
@@ -355,6 +504,8 @@ class ModifiedAttributeDict(collections.MutableMapping):
             tbl = self.__postIncreases
         else:
             raise ValueError("position should be either pre or post")
+        if self.recorder is not None:
+            self.__record("increase", attributeName, increase, position=position)
         if attributeName not in tbl:
             tbl[attributeName] = 0
         tbl[attributeName] += increase
@@ -369,6 +520,10 @@ class ModifiedAttributeDict(collections.MutableMapping):
         if skill:
             multiplier *= self.__handleSkill(skill)
 
+        if self.recorder is not None:
+            self.__record("multiply", attributeName, multiplier, stackingPenalties=stackingPenalties,
+                          penaltyGroup=penaltyGroup, resist=resist)
+
         # If we're asked to do stacking penalized multiplication, append values
         # to per penalty group lists
         if stackingPenalties:
@@ -411,6 +566,8 @@ class ModifiedAttributeDict(collections.MutableMapping):
 
     def force(self, attributeName, value):
         """Force value to attribute and prohibit any changes to it"""
+        if self.recorder is not None:
+            self.__record("force", attributeName, value)
         self.__forced[attributeName] = value
         self.__placehold(attributeName)
         self.__afflict(attributeName, "\u2263", value)
@@ -435,6 +592,367 @@ class ModifiedAttributeDict(collections.MutableMapping):
         return resist or 1.0
 
 
+# Process-wide attribute name <-> integer ID tables used by compact attribute dicts
+attributeIDs = {}
+attributeNames = []
+
+
+def internAttribute(name):
+    try:
+        return attributeIDs[name]
+    except KeyError:
+        attrID = attributeIDs[name] = len(attributeNames)
+        attributeNames.append(name)
+        return attrID
+
+
+class AttributeSlots(object):
+    """Everything a compact attribute dict stores for a single attribute"""
+    __slots__ = ("intermediary", "modified", "forced", "preAssign", "preIncrease", "multiplier", "penalized",
+                 "postIncrease")
+
+    def __init__(self):
+        self.intermediary = None
+        self.modified = None
+        self.forced = None
+        self.preAssign = None
+        self.preIncrease = 0
+        self.multiplier = 1
+        self.penalized = None
+        self.postIncrease = 0
+
+
+class CompactModifiedAttributeDict(ModifiedAttributeDict):
+    """
+    Alternative storage for ModifiedAttributeDict. Instead of a dict per modification type, keeps one
+    dict of interned attribute IDs to AttributeSlots, creates affliction storage only when needed and
+    caches the mutator map instead of rebuilding it on every original value lookup.
+    """
+
+    def __init__(self, fit=None, parent=None):
+        # Base class storage is not used at all, so its constructor is not called
+        self.parent = parent
+        self.fit = fit
+        self.__original = None
+        self.__overrides = {}
+        self.__mutators = {}
+        self.__mutatorMap = None
+        # {attrID: AttributeSlots}
+        self.__slots = {}
+        self.__affectedBy = None
+        self.__tmpModifier = None
+
+    def __getSlots(self, key):
+        attrID = internAttribute(key)
+        slots = self.__slots.get(attrID)
+        if slots is None:
+            slots = self.__slots[attrID] = AttributeSlots()
+        return slots
+
+    def __peekSlots(self, key):
+        attrID = attributeIDs.get(key)
+        return None if attrID is None else self.__slots.get(attrID)
+
+    def clear(self):
+        self.__slots.clear()
+        self.__affectedBy = None
+
+    def clearKeys(self, keys):
+        for key in keys:
+            attrID = attributeIDs.get(key)
+            if attrID is not None:
+                self.__slots.pop(attrID, None)
+            if self.__affectedBy is not None:
+                self.__affectedBy.pop(key, None)
+
+    @property
+    def original(self):
+        return self.__original
+
+    @original.setter
+    def original(self, val):
+        self.__original = val
+        for slots in self.__slots.values():
+            slots.modified = None
+
+    @property
+    def overrides(self):
+        return self.__overrides
+
+    @overrides.setter
+    def overrides(self, val):
+        self.__overrides = val
+
+    @property
+    def mutators(self):
+        mutatorMap = self.__mutatorMap
+        # Mutator collection can be changed in place, rebuild map when its size doesn't match
+        if mutatorMap is None or len(mutatorMap) != len(self.__mutators):
+            mutatorMap = self.__mutatorMap = {x.attribute.name: x for x in self.__mutators.values()}
+        return mutatorMap
+
+    @mutators.setter
+    def mutators(self, val):
+        self.__mutators = val
+        self.__mutatorMap = None
+
+    def __getitem__(self, key):
+        if self.tracker is not None:
+            self.tracker.read(self, key)
+        if self.recorder is not None:
+            self.recorder.read(self, key)
+        slots = self.__peekSlots(key)
+        if slots is not None:
+            # Check if we have final calculated value
+            key_value = slots.modified
+            if key_value is self.CalculationPlaceholder:
+                key_value = slots.modified = self.__calculateValue(key, slots)
+            if key_value is not None:
+                return key_value
+            # Then in values which are not yet calculated
+            if slots.intermediary is not None:
+                return slots.intermediary
+        # Original value is the least priority
+        return self.getOriginal(key)
+
+    def __delitem__(self, key):
+        slots = self.__peekSlots(key)
+        if slots is not None:
+            slots.modified = None
+            slots.intermediary = None
+
+    def getOriginal(self, key, default=None):
+        val = None
+        if self.overrides_enabled and self.overrides:
+            val = self.overrides.get(key, val)
+
+        # mutators are overriden by overrides. x_x
+        if self.__mutators:
+            val = self.mutators.get(key, val)
+
+        if val is None:
+            if self.original:
+                val = self.original.get(key, val)
+
+        if val is None and val != default:
+            val = default
+
+        return val.value if hasattr(val, "value") else val
+
+    def __setitem__(self, key, val):
+        if self.tracker is not None:
+            self.tracker.write(self, key)
+        if self.recorder is not None:
+            self.recorder.write(self, key)
+        self.__getSlots(key).intermediary = val
+
+    def __iterKeys(self):
+        keys = set(self.original) if self.original is not None else set()
+        for attrID, slots in self.__slots.items():
+            if slots.modified is not None:
+                keys.add(attributeNames[attrID])
+        return keys
+
+    def __iter__(self):
+        return iter(self.__iterKeys())
+
+    def __contains__(self, key):
+        if self.original is not None and key in self.original:
+            return True
+        slots = self.__peekSlots(key)
+        return slots is not None and (slots.modified is not None or slots.intermediary is not None)
+
+    def __len__(self):
+        keys = self.__iterKeys()
+        for attrID, slots in self.__slots.items():
+            if slots.intermediary is not None:
+                keys.add(attributeNames[attrID])
+        return len(keys)
+
+    def __placehold(self, key, slots):
+        """Create calculation placeholder in item's modified attribute dict"""
+        if self.tracker is not None:
+            self.tracker.write(self, key)
+        slots.modified = self.CalculationPlaceholder
+
+    def __getCappingValue(self, key):
+        cappingKey = _getCappingKey(key)
+        if not cappingKey:
+            return None
+        if self.tracker is not None:
+            self.tracker.read(self, cappingKey)
+        if cappingKey in self.original:
+            cappingValue = self.original[cappingKey]
+        else:
+            cappingValue = self.__calculateValue(cappingKey, self.__getSlots(cappingKey))
+        return cappingValue.value if hasattr(cappingValue, "value") else cappingValue
+
+    def __getBaseValue(self, key, slots):
+        # Grab initial value, priorities are:
+        # Results of ongoing calculation > preAssign > original > 0
+        if slots.intermediary is not None:
+            return slots.intermediary
+        if slots.preAssign is not None:
+            return slots.preAssign
+        return self.getOriginal(key, _getDefaultValue(key))
+
+    def __calculateValue(self, key, slots):
+        cappingValue = self.__getCappingValue(key)
+
+        # If value is forced, we don't have to calculate anything,
+        # just return forced value instead
+        if slots.forced is not None:
+            return _capValue(key, slots.forced, cappingValue)
+
+        val = _applyModifications(self.__getBaseValue(key, slots), slots.preIncrease, slots.multiplier,
+                                  slots.penalized or {}, slots.postIncrease)
+        return _capValue(key, val, cappingValue)
+
+    def getPendingModifications(self):
+        pending = []
+        for attrID, slots in list(self.__slots.items()):
+            if slots.modified is not self.CalculationPlaceholder:
+                continue
+            key = attributeNames[attrID]
+            cappingValue = self.__getCappingValue(key)
+            if slots.forced is not None:
+                slots.modified = _capValue(key, slots.forced, cappingValue)
+                continue
+            pending.append((key, self.__getBaseValue(key, slots), slots.preIncrease, slots.multiplier,
+                            slots.penalized or {}, slots.postIncrease, cappingValue))
+        return pending
+
+    def setFinalValue(self, key, val, cappingValue):
+        self.__getSlots(key).modified = _capValue(key, val, cappingValue)
+
+    def __handleSkill(self, skillName):
+        """Register skill as modifier and return its level, see ModifiedAttributeDict"""
+        fit = self.fit
+        if not fit:
+            fit = self.parent.owner
+        skill = fit.character.getSkill(skillName)
+        self.__tmpModifier = skill
+        return skill.level
+
+    def getAfflictions(self, key):
+        if self.__affectedBy is None:
+            return {}
+        return self.__affectedBy.get(key, {})
+
+    def iterAfflictions(self):
+        return iter(self.__affectedBy or ())
+
+    def __record(self, operation, *args, **kwargs):
+        if self.__tmpModifier:
+            modifier = self.__tmpModifier
+        else:
+            modifier = self.fit.getModifier() if self.fit is not None else None
+        self.recorder.record(self, operation, args, kwargs, modifier)
+
+    def __afflict(self, attributeName, operation, bonus, used=True):
+        """Add modifier to list of things affecting current item"""
+        # Do nothing if no fit is assigned or fit doesn't want to know what affects its items
+        if self.fit is None or not self.fit.trackAfflictions:
+            self.__tmpModifier = None
+            return
+        if self.__affectedBy is None:
+            self.__affectedBy = {}
+        affs = self.__affectedBy.setdefault(attributeName, {})
+        origin = self.fit.getOrigin()
+        fit = origin if origin and origin != self.fit else self.fit
+        affs = affs.setdefault(fit, [])
+
+        if self.__tmpModifier:
+            modifier = self.__tmpModifier
+            self.__tmpModifier = None
+        else:
+            modifier = self.fit.getModifier()
+
+        affs.append((modifier, operation, bonus, used))
+
+    def preAssign(self, attributeName, value):
+        """Overwrites original value of the entity with given one, allowing further modification"""
+        if self.recorder is not None:
+            self.__record("preAssign", attributeName, value)
+        slots = self.__getSlots(attributeName)
+        slots.preAssign = value
+        self.__placehold(attributeName, slots)
+        self.__afflict(attributeName, "=", value, value != self.getOriginal(attributeName))
+
+    def increase(self, attributeName, increase, position="pre", skill=None, **kwargs):
+        """Increase value of given attribute by given number"""
+        if skill:
+            increase *= self.__handleSkill(skill)
+
+        if 'effect' in kwargs:
+            increase *= ModifiedAttributeDict.getResistance(self.fit, kwargs['effect']) or 1
+
+        if position not in ("pre", "post"):
+            raise ValueError("position should be either pre or post")
+        if self.recorder is not None:
+            self.__record("increase", attributeName, increase, position=position)
+        slots = self.__getSlots(attributeName)
+        if position == "pre":
+            slots.preIncrease += increase
+        else:
+            slots.postIncrease += increase
+        self.__placehold(attributeName, slots)
+        self.__afflict(attributeName, "+", increase, increase != 0)
+
+    def multiply(self, attributeName, multiplier, stackingPenalties=False, penaltyGroup="default", skill=None, resist=True, *args, **kwargs):
+        """Multiply value of given attribute by given factor"""
+        if multiplier is None:  # See GH issue 397
+            return
+
+        if skill:
+            multiplier *= self.__handleSkill(skill)
+
+        if self.recorder is not None:
+            self.__record("multiply", attributeName, multiplier, stackingPenalties=stackingPenalties,
+                          penaltyGroup=penaltyGroup, resist=resist)
+
+        slots = self.__getSlots(attributeName)
+        if stackingPenalties:
+            if slots.penalized is None:
+                slots.penalized = {}
+            slots.penalized.setdefault(penaltyGroup, []).append(multiplier)
+        else:
+            slots.multiplier *= multiplier
+
+        self.__placehold(attributeName, slots)
+
+        afflictPenal = ""
+        if stackingPenalties:
+            afflictPenal += "s"
+        if resist:
+            afflictPenal += "r"
+
+        self.__afflict(attributeName, "%s*" % afflictPenal, multiplier, multiplier != 1)
+
+    def boost(self, attributeName, boostFactor, skill=None, *args, **kwargs):
+        """Boost value by some percentage"""
+        if skill:
+            boostFactor *= self.__handleSkill(skill)
+
+        resist = None
+
+        if 'effect' in kwargs:
+            resist = ModifiedAttributeDict.getResistance(self.fit, kwargs['effect']) or 1
+            boostFactor *= resist
+
+        # We just transform percentage boost into multiplication factor
+        self.multiply(attributeName, 1 + boostFactor / 100.0, resist=(True if resist else False), *args, **kwargs)
+
+    def force(self, attributeName, value):
+        """Force value to attribute and prohibit any changes to it"""
+        if self.recorder is not None:
+            self.__record("force", attributeName, value)
+        slots = self.__getSlots(attributeName)
+        slots.forced = value
+        self.__placehold(attributeName, slots)
+        self.__afflict(attributeName, "\u2263", value)
+
+
 class Affliction(object):
     def __init__(self, affliction_type, amount):
         self.type = affliction_type
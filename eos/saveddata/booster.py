@@ -63,7 +63,7 @@ class Booster(HandledItem, ItemAttrShortcut):
 
     def build(self):
         """ Build object. Assumes proper and valid item already set """
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create()
         self.__itemModifiedAttributes.original = self.__item.attributes
         self.__itemModifiedAttributes.overrides = self.__item.overrides
         self.__slot = self.__calculateSlot(self.__item)
@@ -0,0 +1,70 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+# Copyright (C) 2011 Anton Vorobyov
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+import pickle
+from time import time
+
+from logbook import Logger
+from sqlalchemy.orm import reconstructor
+
+pyfalog = Logger(__name__)
+
+
+class CachedFitStats(object):
+    """
+    Stored FitStats of a fit, along with the fit content hash, character skill hash and game data version they
+    were calculated with. Stats are valid only as long as all three stay the same.
+    """
+
+    def __init__(self, fitID):
+        self.fitID = fitID
+        self.fitHash = None
+        self.skillHash = None
+        self.gamedataVersion = None
+        self.data = None
+        self.time = 0
+        self.__stats = None
+
+    @reconstructor
+    def init(self):
+        self.__stats = None
+
+    @property
+    def stats(self):
+        if self.__stats is None and self.data is not None:
+            try:
+                self.__stats = pickle.loads(self.data)
+            except Exception as e:
+                # Stored by a version of pyfa with different stats
+                pyfalog.warning("Unable to load cached stats of fit {0}: {1}", self.fitID, e)
+        return self.__stats
+
+    def update(self, fitHash, skillHash, gamedataVersion, stats):
+        self.fitHash = fitHash
+        self.skillHash = skillHash
+        self.gamedataVersion = gamedataVersion
+        self.data = pickle.dumps(stats, pickle.HIGHEST_PROTOCOL)
+        self.time = time()
+        self.__stats = stats
+
+    def isValid(self, fitHash, skillHash, gamedataVersion):
+        return (
+            self.fitHash == fitHash and self.skillHash == skillHash and self.gamedataVersion == gamedataVersion and
+            self.stats is not None)
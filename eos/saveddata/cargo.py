@@ -35,7 +35,7 @@ class Cargo(HandledItem, ItemAttrShortcut):
         self.__item = item
         self.itemID = item.ID if item is not None else None
         self.amount = 0
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create()
         self.__itemModifiedAttributes.original = item.attributes
         self.__itemModifiedAttributes.overrides = item.overrides
 
@@ -50,7 +50,7 @@ class Cargo(HandledItem, ItemAttrShortcut):
                 pyfalog.error("Item (id: {0}) does not exist", self.itemID)
                 return
 
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create()
         self.__itemModifiedAttributes.original = self.__item.attributes
         self.__itemModifiedAttributes.overrides = self.__item.overrides
 
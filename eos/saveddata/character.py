@@ -18,6 +18,8 @@
 # ===============================================================================
 
 import time
+from array import array
+from hashlib import sha1
 
 from logbook import Logger
 from itertools import chain
@@ -28,14 +30,23 @@ import eos
 import eos.db
 import eos.config
 from eos.effectHandlerHelpers import HandledItem, HandledImplantList
+from eos.gamedata import SkillRequirements
+from eos.modifiedAttributeDict import ModifiedAttributeDict
 
 pyfalog = Logger(__name__)
 
 
 class Character(object):
+    """
+    Skill levels are kept in a compact array indexed like getSkillIndexMap(), Skill objects are only created for
+    skills which get inspected, modified or affect the fit during calculation. Skills without a stored row use defaultLevel.
+    initSkills is kept for callers, there is nothing to initialize upfront anymore.
+    """
     __itemList = None
     __itemIDMap = None
     __itemNameMap = None
+    __itemIndexMap = None
+    __effectSkillIDs = None
 
     def __init__(self, name, defaultLevel=None, initSkills=True):
         self.savedName = name
@@ -43,13 +54,14 @@ class Character(object):
         self.defaultLevel = defaultLevel
         self.__skills = []
         self.__skillIdMap = {}
+        self.__levels = None
+        self.__storedSkillIDs = set()
+        self.__storedSkillsLoaded = True
         self.dirtySkills = set()
         self.alphaClone = None
         self.__secStatus = 0.0
-
-        if initSkills:
-            for item in self.getSkillList():
-                self.addSkill(Skill(self, item.ID, self.defaultLevel))
+        self.__skillFingerprint = object()
+        self.__skillLevelsHash = None
 
         self.__implants = HandledImplantList()
 
@@ -57,14 +69,11 @@ class Character(object):
     def init(self):
 
         self.__skillIdMap = {}
-
-        for skill in self.__skills:
-            self.__skillIdMap[skill.itemID] = skill
-
-        # get a list of skills that the character does no have, and add them (removal of old skills happens in the
-        # Skill loading)
-        for skillID in set(self.getSkillIDMap().keys()).difference(set(self.__skillIdMap.keys())):
-            self.addSkill(Skill(self, skillID, self.defaultLevel))
+        self.__levels = None
+        self.__storedSkillIDs = None
+        self.__storedSkillsLoaded = False
+        self.__skillFingerprint = object()
+        self.__skillLevelsHash = None
 
         self.dirtySkills = set()
 
@@ -102,6 +111,70 @@ class Character(object):
 
         return cls.__itemNameMap
 
+    @classmethod
+    def getSkillIndexMap(cls):
+        """Get {skillID: index} of skills into skill level arrays"""
+        if cls.__itemIndexMap is None:
+            cls.__itemIndexMap = {skill.ID: index for index, skill in enumerate(cls.getSkillList())}
+
+        return cls.__itemIndexMap
+
+    @classmethod
+    def getEffectSkillIDs(cls):
+        """Get IDs of skills which have effects, others never change anything when calculated"""
+        if cls.__effectSkillIDs is None:
+            cls.__effectSkillIDs = tuple(skill.ID for skill in cls.getSkillList() if skill.effects)
+
+        return cls.__effectSkillIDs
+
+    @classmethod
+    def resetSkillLists(cls):
+        """Forget skill list and maps built from it, they are built again from gamedata on next use"""
+        cls.__itemList = None
+        cls.__itemIDMap = None
+        cls.__itemNameMap = None
+        cls.__itemIndexMap = None
+        cls.__effectSkillIDs = None
+
+    def __getLevels(self):
+        """Get array('b') of levels skills without Skill object have, -1 meaning not learned"""
+        if self.__levels is None:
+            levels = self.__getDefaultLevels()
+            storedIDs = set()
+            if self.ID is not None:
+                indexMap = self.getSkillIndexMap()
+                for skillID, level in eos.db.getCharacterSkillLevels(self.ID):
+                    storedIDs.add(skillID)
+                    index = indexMap.get(skillID)
+                    if index is not None:
+                        levels[index] = -1 if level is None else level
+            self.__levels = levels
+            if self.__storedSkillIDs is None:
+                self.__storedSkillIDs = storedIDs
+
+        return self.__levels
+
+    def __getDefaultLevels(self):
+        return array("b", [-1 if self.defaultLevel is None else self.defaultLevel]) * len(self.getSkillIndexMap())
+
+    def __loadStoredSkills(self):
+        """Load all stored Skill rows with one query, when many skills are about to be needed"""
+        if not self.__storedSkillsLoaded:
+            for skill in self.__skills:
+                self.__skillIdMap.setdefault(skill.itemID, skill)
+            self.__storedSkillsLoaded = True
+
+    def __createSkill(self, item):
+        levels = self.__getLevels()
+        skill = None
+        if item.ID in self.__storedSkillIDs:
+            skill = eos.db.getCharacterSkill(self.ID, item.ID)
+        if skill is None:
+            level = levels[self.getSkillIndexMap()[item.ID]]
+            skill = Skill(self, item, level if level >= 0 else None)
+        self.__skillIdMap[item.ID] = skill
+        return skill
+
     @classmethod
     def getAll5(cls):
         all5 = eos.db.getCharacter("All 5")
@@ -134,7 +207,37 @@ class Character(object):
     def clearSkills(self):
         del self.__skills[:]
         self.__skillIdMap.clear()
+        # Stored rows are deleted on next flush, don't read levels from them
+        self.__levels = self.__getDefaultLevels()
+        self.__storedSkillIDs = set()
+        self.__storedSkillsLoaded = True
         self.dirtySkills.clear()
+        self.skillsChanged()
+
+    @property
+    def skillFingerprint(self):
+        """Token which is replaced every time skill levels of the character may have changed"""
+        return self.__skillFingerprint
+
+    def skillsChanged(self):
+        self.__skillFingerprint = object()
+
+    @property
+    def skillHash(self):
+        """
+        Hash of skill levels, clone and implants of the character. Unlike skillFingerprint, it stays the same
+        across sessions as long as those do, so it can be stored along with calculated data.
+        """
+        if self.__skillLevelsHash is None or self.__skillLevelsHash[0] is not self.__skillFingerprint:
+            levels = array("b", self.__getLevels())
+            indexMap = self.getSkillIndexMap()
+            for skillID, skill in self.__skillIdMap.items():
+                if skillID in indexMap:
+                    levels[indexMap[skillID]] = -1 if skill.activeLevel is None else skill.activeLevel
+            self.__skillLevelsHash = (self.__skillFingerprint, sha1(levels.tobytes()).hexdigest())
+        implants = sorted((implant.itemID, implant.active) for implant in self.implants)
+        key = (self.__skillLevelsHash[1], self.alphaCloneID, implants)
+        return sha1(repr(key).encode()).hexdigest()
 
     @property
     def ro(self):
@@ -195,13 +298,29 @@ class Character(object):
     def alphaCloneID(self, cloneID):
         self.__alphaCloneID = cloneID
         self.alphaClone = eos.db.getAlphaClone(cloneID) if cloneID is not None else None
+        self.skillsChanged()
 
     @property
     def skills(self):
-        return self.__skills
+        """All skills of the character; creates Skill objects for every skill, prefer getSkill() where possible"""
+        self.__loadStoredSkills()
+        for item in self.getSkillList():
+            if item.ID not in self.__skillIdMap:
+                self.__createSkill(item)
+
+        return list(self.__skillIdMap.values())
+
+    @property
+    def loadedSkills(self):
+        """Skill objects created so far; state set during calculation only lives on these"""
+        return list(self.__skillIdMap.values())
 
     def addSkill(self, skill):
-        if skill.itemID in self.__skillIdMap:
+        self.__getLevels()
+        if skill.itemID not in self.__skillIdMap and skill.itemID in self.__storedSkillIDs:
+            # Replace stored row rather than adding another one for the same skill
+            self.__loadStoredSkills()
+        if skill.itemID in self.__skillIdMap and self.__skillIdMap[skill.itemID] is not skill:
             oldSkill = self.__skillIdMap[skill.itemID]
             if skill.level > oldSkill.level:
                 # if new skill is higher, remove old skill (new skill will still append)
@@ -210,10 +329,14 @@ class Character(object):
                 return
 
         self.__skillIdMap[skill.itemID] = skill
+        self.skillsChanged()
 
     def removeSkill(self, skill):
         self.__skills.remove(skill)
-        del self.__skillIdMap[skill.itemID]
+        self.__skillIdMap.pop(skill.itemID, None)
+        if self.__storedSkillIDs is not None:
+            self.__storedSkillIDs.discard(skill.itemID)
+        self.skillsChanged()
 
     def getSkill(self, item):
         if isinstance(item, str):
@@ -224,8 +347,7 @@ class Character(object):
         skill = self.__skillIdMap.get(item.ID)
 
         if skill is None:
-            skill = Skill(self, item, self.defaultLevel, False, True)
-            self.addSkill(skill)
+            skill = self.__createSkill(item)
 
         return skill
 
@@ -252,32 +374,77 @@ class Character(object):
             skill.revert()
 
         self.dirtySkills = set()
+        self.skillsChanged()
 
+    # Only skills which have Skill objects are filtered; skills affecting the fit get them during calculation
     def filteredSkillIncrease(self, filter, *args, **kwargs):
-        for element in self.skills:
+        for element in self.loadedSkills:
             if filter(element):
                 element.increaseItemAttr(*args, **kwargs)
 
     def filteredSkillMultiply(self, filter, *args, **kwargs):
-        for element in self.skills:
+        for element in self.loadedSkills:
             if filter(element):
                 element.multiplyItemAttr(*args, **kwargs)
 
     def filteredSkillBoost(self, filter, *args, **kwargs):
-        for element in self.skills:
+        for element in self.loadedSkills:
             if filter(element):
                 element.boostItemAttr(*args, **kwargs)
 
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if forceProjected:
             return
-        for skill in self.skills:
-            fit.register(skill)
-            skill.calculateModifiedAttributes(fit, runTime)
+
+        # Skills modify the fit the same way as long as skill levels and fitted items stay the same,
+        # so we replay what they did last time instead of running all their effects
+        cache = fit.skillModifierCache
+        key = self.__getModifierCacheKey(fit)
+        if cache.canReplay(key, runTime):
+            cache.replay(fit, runTime)
+            return
+
+        cache.startRecording(key, runTime)
+        previousRecorder = ModifiedAttributeDict.recorder
+        ModifiedAttributeDict.recorder = cache
+        try:
+            # Skills without Skill object run their effects with the level from the level array, Skill objects
+            # are created only for those which end up modifying something (see LazySkill)
+            levels = self.__getLevels()
+            indexMap = self.getSkillIndexMap()
+            skillIDMap = self.getSkillIDMap()
+            for skillID in self.getEffectSkillIDs():
+                skill = self.__skillIdMap.get(skillID)
+                if skill is None:
+                    skill = LazySkill(self, skillIDMap[skillID], levels[indexMap[skillID]])
+                fit.register(skill)
+                skill.calculateModifiedAttributes(fit, runTime)
+            cache.stopRecording()
+        finally:
+            ModifiedAttributeDict.recorder = previousRecorder
+
+    def __getModifierCacheKey(self, fit):
+        items = chain(
+            (fit.ship, fit.mode),
+            fit.modules,
+            fit.drones,
+            fit.fighters,
+            fit.boosters,
+            fit.appliedImplants,
+            fit.projectedModules,
+            fit.projectedDrones,
+            fit.projectedFighters
+        )
+        # Items themselves are part of the key: the cache holds on to them, so a removed item can't be confused
+        # with a new one (as it could with id(), which gets reused after the object is gone)
+        itemKey = tuple(
+            (item, getattr(item.item, "ID", None), getattr(getattr(item, "charge", None), "ID", None))
+            for item in items if item is not None)
+        return self, self.__skillFingerprint, fit.isStructure, itemKey
 
     def clear(self):
         c = chain(
-                self.skills,
+                self.loadedSkills,
                 self.implants
         )
         for stuff in c:
@@ -338,6 +505,7 @@ class Skill(HandledItem):
 
     def revert(self):
         self.activeLevel = self.__level
+        self.character.skillsChanged()
 
     @property
     def isDirty(self):
@@ -371,15 +539,17 @@ class Skill(HandledItem):
             raise ReadOnlyException()
 
         self.activeLevel = level
+        self.character.skillsChanged()
 
         # todo: have a way to do bulk skill level editing. Currently, everytime a single skill is changed, this runs,
         # which affects performance. Should have a checkSkillLevels() or something that is more efficient for bulk.
         if not ignoreRestrict and eos.config.settings['strictSkillLevels']:
             start = time.time()
-            for item, rlevel in self.item.requiredFor.items():
-                if item.group.category.ID == 16:  # Skill category
+            skillIDMap = Character.getSkillIDMap()
+            for itemID, rlevel in SkillRequirements.getRequiredFor(self.itemID):
+                if itemID in skillIDMap:
                     if level is None or level < rlevel:
-                        skill = self.character.getSkill(item.ID)
+                        skill = self.character.getSkill(itemID)
                         # print "Removing skill: {}, Dependant level: {}, Required level: {}".format(skill, level, rlevel)
                         skill.setLevel(None, persist)
             pyfalog.debug("Strict Skill levels enabled, time to process {}: {}".format(self.item.ID, time.time() - start))
@@ -416,15 +586,7 @@ class Skill(HandledItem):
         if item is None:
             return
 
-        for effect in item.effects.values():
-            if effect.runTime == runTime and \
-                    effect.isType("passive") and \
-                    (not fit.isStructure or effect.isType("structure")) and \
-                    effect.activeByDefault:
-                try:
-                    effect.handler(fit, self, ("skill",))
-                except AttributeError:
-                    continue
+        applySkillEffects(fit, self, item, runTime)
 
     def clear(self):
         self.__suppressed = False
@@ -461,5 +623,103 @@ class Skill(HandledItem):
         )
 
 
+class LazySkill(object):
+    """
+    Stand-in for a skill which has no Skill object, with the level from character's level array. Its effects run
+    with it as the container; once one of them modifies anything, Fit.getModifier() replaces it with the actual
+    Skill (see resolve()), which is what afflictions and recorded skill modifications refer to.
+    """
+
+    def __init__(self, character, item, level):
+        self.character = character
+        self.item = item
+        self.itemID = item.ID
+        self.activeLevel = level if level >= 0 else None
+
+    @property
+    def level(self):
+        # Same as Skill.level
+        name = self.character.name
+        if name == "All 5":
+            return 5
+        elif name == "All 0":
+            return 0
+        elif self.character.alphaClone:
+            return min(self.activeLevel or 0, self.character.alphaClone.getSkillLevel(self) or 0)
+
+        return self.activeLevel or 0
+
+    def getModifiedItemAttr(self, key):
+        if key in self.item.attributes:
+            return self.item.attributes[key].value
+        else:
+            return 0
+
+    def calculateModifiedAttributes(self, fit, runTime):
+        applySkillEffects(fit, self, self.item, runTime)
+
+    def resolve(self):
+        return self.character.getSkill(self.item)
+
+
+def applySkillEffects(fit, container, item, runTime):
+    for effect in item.getEffectBucket(runTime, effectType="passive"):
+        if not fit.isStructure or effect.isType("structure"):
+            try:
+                effect.handler(fit, container, ("skill",))
+            except AttributeError:
+                continue
+
+
+class SkillModifierCache(object):
+    """
+    Records modifications which skills of a character apply to a fit, per run time, and replays them
+    directly into the same attribute dicts when neither skills nor fitted items have changed since.
+
+    Recordings during which skills read modified attributes depend on the state of the fit, not only on
+    skills and items, and are never replayed.
+    """
+
+    def __init__(self):
+        self.key = None
+        # {runTime: [(attrDict, operation, args, kwargs, modifier), ...]}
+        self.operations = {}
+        self.__runTime = None
+        self.__recording = None
+        self.__replayable = True
+
+    def canReplay(self, key, runTime):
+        return key == self.key and runTime in self.operations
+
+    def replay(self, fit, runTime):
+        for attrDict, operation, args, kwargs, modifier in self.operations[runTime]:
+            fit.register(modifier)
+            getattr(attrDict, operation)(*args, **kwargs)
+
+    def startRecording(self, key, runTime):
+        if key != self.key:
+            self.key = key
+            self.operations = {}
+        self.operations.pop(runTime, None)
+        self.__runTime = runTime
+        self.__recording = []
+        self.__replayable = True
+
+    def stopRecording(self):
+        if self.__replayable:
+            self.operations[self.__runTime] = self.__recording
+        self.__runTime = None
+        self.__recording = None
+
+    def record(self, attrDict, operation, args, kwargs, modifier):
+        self.__recording.append((attrDict, operation, args, kwargs, modifier))
+
+    def read(self, attrDict, key):
+        self.__replayable = False
+
+    def write(self, attrDict, key):
+        self.__replayable = False
+
+
 class ReadOnlyException(Exception):
     pass
@@ -23,6 +23,22 @@ import eos.db
 
 class DamagePattern(object):
     DAMAGE_TYPES = ("em", "thermal", "kinetic", "explosive")
+    TANK_TYPES = ("shield", "armor", "hull")
+    # Ship damage resonance attributes, [tank type][damage type]
+    RESONANCE_ATTRS = (
+        ("shieldEmDamageResonance", "shieldThermalDamageResonance", "shieldKineticDamageResonance",
+         "shieldExplosiveDamageResonance"),
+        ("armorEmDamageResonance", "armorThermalDamageResonance", "armorKineticDamageResonance",
+         "armorExplosiveDamageResonance"),
+        ("emDamageResonance", "thermalDamageResonance", "kineticDamageResonance", "explosiveDamageResonance"))
+    # Tank type repair amounts of tank stats apply to
+    TANK_FIELD_TYPES = {
+        "passiveShield": "shield",
+        "shieldRepair": "shield",
+        "armorRepair": "armor",
+        "armorRepairPreSpool": "armor",
+        "armorRepairFullSpool": "armor",
+        "hullRepair": "hull"}
 
     def __init__(self, *args, **kwargs):
         self.update(*args, **kwargs)
@@ -33,42 +49,35 @@ class DamagePattern(object):
         self.kineticAmount = kineticAmount
         self.explosiveAmount = explosiveAmount
 
+    def getWeights(self):
+        """Share of every damage type in the pattern"""
+        amounts = (self.emAmount, self.thermalAmount, self.kineticAmount, self.explosiveAmount)
+        totalDamage = float(sum(amounts) or 1)
+        return tuple(amount / totalDamage for amount in amounts)
+
     def calculateEhp(self, fit):
         ehp = {}
-        for (type, attr) in (('shield', 'shieldCapacity'), ('armor', 'armorHP'), ('hull', 'hp')):
+        resonances = fit.getResonances()
+        for (type, attr), tankResonances in zip((('shield', 'shieldCapacity'), ('armor', 'armorHP'), ('hull', 'hp')),
+                                                resonances):
             rawCapacity = fit.ship.getModifiedItemAttr(attr)
-            ehp[type] = self.effectivify(fit, rawCapacity, type)
+            ehp[type] = self.__effectivify(rawCapacity, tankResonances)
 
         return ehp
 
     def calculateEffectiveTank(self, fit, tankInfo):
-        typeMap = {
-            "passiveShield": "shield",
-            "shieldRepair": "shield",
-            "armorRepair": "armor",
-            "armorRepairPreSpool": "armor",
-            "armorRepairFullSpool": "armor",
-            "hullRepair": "hull"}
+        resonances = dict(zip(self.TANK_TYPES, fit.getResonances()))
         ereps = {}
         for field in tankInfo:
-            if field in typeMap:
-                ereps[field] = self.effectivify(fit, tankInfo[field], typeMap[field])
+            if field in self.TANK_FIELD_TYPES:
+                ereps[field] = self.__effectivify(tankInfo[field], resonances[self.TANK_FIELD_TYPES[field]])
         return ereps
 
     def effectivify(self, fit, amount, type):
-        type = type if type != "hull" else ""
-        totalDamage = sum((self.emAmount, self.thermalAmount, self.kineticAmount, self.explosiveAmount))
-        specificDivider = 0
-        for damageType in self.DAMAGE_TYPES:
-            # Compose an attribute name, then make sure the first letter is NOT capitalized
-            attrName = "%s%sDamageResonance" % (type, damageType.capitalize())
-            attrName = attrName[0].lower() + attrName[1:]
-
-            resonance = fit.ship.getModifiedItemAttr(attrName)
-            damage = getattr(self, "%sAmount" % damageType)
-
-            specificDivider += damage / float(totalDamage or 1) * resonance
+        return self.__effectivify(amount, fit.getResonances()[self.TANK_TYPES.index(type)])
 
+    def __effectivify(self, amount, resonances):
+        specificDivider = sum(weight * resonance for weight, resonance in zip(self.getWeights(), resonances))
         return amount / (specificDivider or 1)
 
     importMap = {
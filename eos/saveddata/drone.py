@@ -69,11 +69,11 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         self.__baseVolley = None
         self.__baseRemoteReps = None
         self.__miningyield = None
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create()
         self.__itemModifiedAttributes.original = self.__item.attributes
         self.__itemModifiedAttributes.overrides = self.__item.overrides
 
-        self.__chargeModifiedAttributes = ModifiedAttributeDict()
+        self.__chargeModifiedAttributes = ModifiedAttributeDict.create()
         # pheonix todo: check the attribute itself, not the modified. this will always return 0 now.
         chargeID = self.getModifiedItemAttr("entityMissileTypeID", None)
         if chargeID is not None:
@@ -234,10 +234,13 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         else:
             return val
 
-    def clear(self):
+    def clearCaches(self):
         self.__baseVolley = None
         self.__baseRemoteReps = None
         self.__miningyield = None
+
+    def clear(self):
+        self.clearCaches()
         self.itemModifiedAttributes.clear()
         self.chargeModifiedAttributes.clear()
 
@@ -267,24 +270,24 @@ class Drone(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
             context = ("drone",)
             projected = False
 
-        for effect in self.item.effects.values():
-            if effect.runTime == runTime and \
-                    effect.activeByDefault and \
-                    ((projected is True and effect.isType("projected")) or
-                                 projected is False and effect.isType("passive")):
-                # See GH issue #765
-                if effect.getattr('grouped'):
+        # Projected drones run their projected effects, local ones - passive effects only
+        if projected:
+            effects = self.item.getEffectBucket(runTime, projected=True)
+        else:
+            effects = self.item.getEffectBucket(runTime, effectType="passive")
+        for effect in effects:
+            # See GH issue #765
+            if effect.getattr('grouped'):
+                effect.handler(fit, self, context)
+            else:
+                i = 0
+                while i != self.amountActive:
                     effect.handler(fit, self, context)
-                else:
-                    i = 0
-                    while i != self.amountActive:
-                        effect.handler(fit, self, context)
-                        i += 1
+                    i += 1
 
         if self.charge:
-            for effect in self.charge.effects.values():
-                if effect.runTime == runTime and effect.activeByDefault:
-                    effect.handler(fit, self, ("droneCharge",))
+            for effect in self.charge.getEffectBucket(runTime):
+                effect.handler(fit, self, ("droneCharge",))
 
     def __deepcopy__(self, memo):
         copy = Drone(self.item)
@@ -90,8 +90,8 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         self.__charge = None
         self.__baseVolley = None
         self.__miningyield = None
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
-        self.__chargeModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create()
+        self.__chargeModifiedAttributes = ModifiedAttributeDict.create()
 
         if len(self.abilities) != len(self.item.effects):
             self.__abilities = []
@@ -196,8 +196,16 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         return volley
 
     def getDps(self, targetResists=None):
+        return max(self.getDpsOptions(targetResists=targetResists), key=lambda d: d.total)
+
+    def getDpsOptions(self, targetResists=None):
+        """
+        DPS the squadron may deal, getDps() picks the highest one. Taking reload into account, abilities with
+        limited charges can deal either their reload-adjusted peak DPS or DPS of unlimited abilities only,
+        which one is higher depends on target resists
+        """
         if not self.active or self.amountActive <= 0:
-            return DmgTypes(0, 0, 0, 0)
+            return [DmgTypes(0, 0, 0, 0)]
         # Analyze cooldowns when reload is factored in
         if self.owner.factorReload:
             activeTimes = []
@@ -237,10 +245,9 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
                     thermal=peakDps.thermal * peakAdjustFactor,
                     kinetic=peakDps.kinetic * peakAdjustFactor,
                     explosive=peakDps.explosive * peakAdjustFactor)
-                dps = max(steadyDps, peakDpsAdjusted, key=lambda d: d.total)
-                return dps
+                return [steadyDps, peakDpsAdjusted]
             else:
-                return steadyDps
+                return [steadyDps]
         # Just sum all abilities when not taking reload into consideration
         else:
             em = 0
@@ -253,7 +260,7 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
                 therm += abilityDps.thermal
                 kin += abilityDps.kinetic
                 exp += abilityDps.explosive
-            return DmgTypes(em, therm, kin, exp)
+            return [DmgTypes(em, therm, kin, exp)]
 
     @property
     def maxRange(self):
@@ -295,12 +302,15 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         else:
             return val
 
-    def clear(self):
+    def clearCaches(self):
         self.__baseVolley = None
         self.__miningyield = None
+        [x.clear() for x in self.abilities]
+
+    def clear(self):
+        self.clearCaches()
         self.itemModifiedAttributes.clear()
         self.chargeModifiedAttributes.clear()
-        [x.clear() for x in self.abilities]
 
     def canBeApplied(self, projectedOnto):
         """Check if fighter can engage specific fitting"""
@@ -331,13 +341,13 @@ class Fighter(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
             context = ("fighter",)
             projected = False
 
+        effects = self.item.getEffectBucket(runTime, projected=projected)
         for ability in self.abilities:
             if not ability.active:
                 continue
 
             effect = ability.effect
-            if effect.runTime == runTime and effect.activeByDefault and \
-                    ((projected and effect.isType("projected")) or not projected):
+            if effect in effects:
                 if ability.grouped:
                     effect.handler(fit, self, context)
                 else:
@@ -19,23 +19,30 @@
 
 import time
 from copy import deepcopy
-from itertools import chain
+from hashlib import sha1
+from itertools import chain, count
 from math import sqrt, log, asinh
 import datetime
 
 from sqlalchemy.orm import validates, reconstructor
 
 import eos.db
+import eos.config
 from eos import capSim
-from eos.effectHandlerHelpers import HandledModuleList, HandledDroneCargoList, HandledImplantList, HandledBoosterList, HandledProjectedDroneList, HandledProjectedModList
+from eos.calcTracker import CalcTracker
+from eos.effectHandlerHelpers import HandledList, HandledModuleList, HandledDroneCargoList, HandledImplantList, HandledBoosterList, \
+    HandledProjectedDroneList, HandledProjectedModList
 from eos.const import ImplantLocation, CalcType, FittingSlot
 from eos.saveddata.ship import Ship
 from eos.saveddata.drone import Drone
-from eos.saveddata.character import Character
+from eos.saveddata.character import Character, LazySkill, SkillModifierCache
 from eos.saveddata.citadel import Citadel
+from eos.saveddata.damagePattern import DamagePattern
 from eos.const import FittingModuleState, FittingHardpoint
 from eos.saveddata.module import Module
-from eos.utils.stats import DmgTypes
+from eos.modifiedAttributeDict import ModifiedAttributeDict, finalizeAttributeDicts
+from eos.utils.stats import DmgTypes, FitStats, PatternEhp, ProfileDmg
+from eos.warfareBuffs import applyBuff
 from logbook import Logger
 
 pyfalog = Logger(__name__)
@@ -46,6 +53,12 @@ class Fit(object):
 
     PEAK_RECHARGE = 0.25
 
+    # Source of calcGeneration values, unique across all fit objects
+    __calcGenerations = count(1)
+    INCREMENTAL_PASSES = 5
+    # Handled list filters which look at charges of elements; None stands for plain filter functions
+    CHARGE_FILTERS = ("chargeSkill", "chargeGroup", None)
+
     def __init__(self, ship=None, name=""):
         """Initialize a fit from the program"""
         # use @mode.setter's to set __attr and IDs. This will set mode as well
@@ -112,8 +125,10 @@ class Fit(object):
     def build(self):
         self.__extraDrains = []
         self.__ehp = None
+        self.__resonances = None
         self.__weaponDpsMap = {}
         self.__weaponVolleyMap = {}
+        self.__baseDmgMap = {}
         self.__remoteRepMap = {}
         self.__minerYield = None
         self.__droneDps = None
@@ -127,7 +142,17 @@ class Fit(object):
         self.__capState = None
         self.__capUsed = None
         self.__capRecharge = None
+        self.__capTimelines = {}
+        self.__stats = None
+        # Changes whenever calculated values may have changed, for caches of results derived from them
+        self.calcGeneration = next(Fit.__calcGenerations)
         self.__calculatedTargets = []
+        self.__calcTracker = None
+        self.skillModifierCache = SkillModifierCache()
+        # Capture "Affected By" information during calculation; headless users and background
+        # recalculations may switch it off, as only item stats views need it
+        self.trackAfflictions = True
+        self.__afflictionsCaptured = False
         self.factorReload = False
         self.boostsFits = set()
         self.gangBoosts = None
@@ -194,6 +219,11 @@ class Fit(object):
         # todo: brief explaination hwo this works
         self.__calculated = bool
 
+    @property
+    def afflictionsCaptured(self):
+        """True if "Affected By" information of the current calculation is complete"""
+        return self.__afflictionsCaptured
+
     @property
     def ship(self):
         return self.__ship
@@ -290,6 +320,36 @@ class Fit(object):
     def getTotalVolley(self, spoolOptions=None):
         return self.getDroneVolley() + self.getWeaponVolley(spoolOptions=spoolOptions)
 
+    def getBaseDmg(self, spoolOptions=None):
+        """
+        Damage of the fit before target resists, gathered once per calculation: (volley, dps, dps options)
+        where dps options lists DPS alternatives of fighters whose damage depends on resists, see
+        Fighter.getDpsOptions()
+        """
+        if spoolOptions not in self.__baseDmgMap:
+            volley = DmgTypes(0, 0, 0, 0)
+            dps = DmgTypes(0, 0, 0, 0)
+            dpsOptions = []
+            for mod in self.modules:
+                volley += mod.getVolley(spoolOptions=spoolOptions)
+                dps += mod.getDps(spoolOptions=spoolOptions)
+            for drone in self.drones:
+                volley += drone.getVolley()
+                dps += drone.getDps()
+            for fighter in self.fighters:
+                volley += fighter.getVolley()
+                options = fighter.getDpsOptions()
+                if len(options) == 1:
+                    dps += options[0]
+                else:
+                    dpsOptions.append(options)
+            self.__baseDmgMap[spoolOptions] = (volley, dps, dpsOptions)
+        return self.__baseDmgMap[spoolOptions]
+
+    def getDmgAgainstProfiles(self, profiles, spoolOptions=(None,)):
+        """ProfileDmg with volley and DPS against every given target resist profile for every spool options"""
+        return ProfileDmg(profiles, spoolOptions, [self.getBaseDmg(options) for options in spoolOptions])
+
     @property
     def minerYield(self):
         if self.__minerYield is None:
@@ -410,10 +470,11 @@ class Fit(object):
 
         return True
 
-    def clear(self, projected=False, command=False):
+    def __clearStats(self):
         self.__effectiveTank = None
         self.__weaponDpsMap = {}
         self.__weaponVolleyMap = {}
+        self.__baseDmgMap = {}
         self.__remoteRepMap = {}
         self.__minerYield = None
         self.__effectiveSustainableTank = None
@@ -422,11 +483,19 @@ class Fit(object):
         self.__droneVolley = None
         self.__droneYield = None
         self.__ehp = None
-        self.__calculated = False
         self.__capStable = None
         self.__capState = None
         self.__capUsed = None
         self.__capRecharge = None
+        self.__capTimelines = {}
+        self.__stats = None
+        self.calcGeneration = next(Fit.__calcGenerations)
+
+    def clear(self, projected=False, command=False):
+        self.__clearStats()
+        self.__calculated = False
+        self.__calcTracker = None
+        self.__afflictionsCaptured = False
         self.ecmProjectedStr = 1
         # self.commandBonuses = {}
 
@@ -436,6 +505,11 @@ class Fit(object):
         if self.ship:
             self.ship.clear()
 
+        # Items and charges of elements may have changed since lists were indexed
+        for handledList in (self.modules, self.drones, self.fighters, self.boosters, self.appliedImplants,
+                            self.projectedModules, self.projectedDrones, self.projectedFighters):
+            handledList.invalidateIndexes()
+
         c = chain(
                 self.modules,
                 self.drones,
@@ -478,7 +552,11 @@ class Fit(object):
                 currModifier.chargeModifiedAttributes.fit = origin or self
 
     def getModifier(self):
-        return self.__modifier
+        modifier = self.__modifier
+        if type(modifier) is LazySkill:
+            # Skill effect is modifying something, it needs the actual Skill from now on
+            modifier = self.__modifier = modifier.resolve()
+        return modifier
 
     def getOrigin(self):
         return self.__origin
@@ -489,9 +567,16 @@ class Fit(object):
         # (abs is old method, ccp now provides the aggregate function in their data)
         if warfareBuffID not in self.commandBonuses or abs(self.commandBonuses[warfareBuffID][1]) < abs(value):
             self.commandBonuses[warfareBuffID] = (runTime, value, module, effect)
+        if ModifiedAttributeDict.tracker is not None:
+            ModifiedAttributeDict.tracker.markVolatile()
 
     def __runCommandBoosts(self, runTime="normal"):
         pyfalog.debug("Applying gang boosts for {0}", repr(self))
+        # Boosts are applied outside of any item's calculation, record them as a step of the fit itself
+        tracker = ModifiedAttributeDict.tracker
+        if tracker is not None:
+            tracker.begin(self, runTime)
+            tracker.markVolatile()
         for warfareBuffID in list(self.commandBonuses.keys()):
             # Unpack all data required to run effect properly
             effect_runTime, value, thing, effect = self.commandBonuses[warfareBuffID]
@@ -503,241 +588,13 @@ class Fit(object):
             # @todo: Check this
             if effect.isType("gang"):
                 self.register(thing)
-
-                if warfareBuffID == 10:  # Shield Burst: Shield Harmonizing: Shield Resistance
-                    for damageType in ("Em", "Explosive", "Thermal", "Kinetic"):
-                        self.ship.boostItemAttr("shield%sDamageResonance" % damageType, value, stackingPenalties=True)
-
-                if warfareBuffID == 11:  # Shield Burst: Active Shielding: Repair Duration/Capacitor
-                    self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Shield Operation") or mod.item.requiresSkill(
-                                    "Shield Emission Systems"), "capacitorNeed", value)
-                    self.modules.filteredItemBoost(
-                            lambda mod: mod.item.requiresSkill("Shield Operation") or mod.item.requiresSkill(
-                                    "Shield Emission Systems"), "duration", value)
-
-                if warfareBuffID == 12:  # Shield Burst: Shield Extension: Shield HP
-                    self.ship.boostItemAttr("shieldCapacity", value, stackingPenalties=True)
-
-                if warfareBuffID == 13:  # Armor Burst: Armor Energizing: Armor Resistance
-                    for damageType in ("Em", "Thermal", "Explosive", "Kinetic"):
-                        self.ship.boostItemAttr("armor%sDamageResonance" % damageType, value, stackingPenalties=True)
-
-                if warfareBuffID == 14:  # Armor Burst: Rapid Repair: Repair Duration/Capacitor
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
-                                                               mod.item.requiresSkill("Repair Systems"),
-                                                   "capacitorNeed", value)
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
-                                                               mod.item.requiresSkill("Repair Systems"),
-                                                   "duration", value)
-
-                if warfareBuffID == 15:  # Armor Burst: Armor Reinforcement: Armor HP
-                    self.ship.boostItemAttr("armorHP", value, stackingPenalties=True)
-
-                if warfareBuffID == 16:  # Information Burst: Sensor Optimization: Scan Resolution
-                    self.ship.boostItemAttr("scanResolution", value, stackingPenalties=True)
-
-                if warfareBuffID == 17:  # Information Burst: Electronic Superiority: EWAR Range and Strength
-                    groups = ("ECM", "Sensor Dampener", "Weapon Disruptor", "Target Painter")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
-                                                   stackingPenalties=True)
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
-                                                   "falloffEffectiveness", value, stackingPenalties=True)
-
-                    for scanType in ("Magnetometric", "Radar", "Ladar", "Gravimetric"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
-                                                       "scan%sStrengthBonus" % scanType, value,
-                                                       stackingPenalties=True)
-
-                    for attr in ("missileVelocityBonus", "explosionDelayBonus", "aoeVelocityBonus", "falloffBonus",
-                                 "maxRangeBonus", "aoeCloudSizeBonus", "trackingSpeedBonus"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Weapon Disruptor",
-                                                       attr, value)
-
-                    for attr in ("maxTargetRangeBonus", "scanResolutionBonus"):
-                        self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
-                                                       attr, value)
-
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
-                                                   "signatureRadiusBonus", value, stackingPenalties=True)
-
-                if warfareBuffID == 18:  # Information Burst: Electronic Hardening: Scan Strength
-                    for scanType in ("Gravimetric", "Radar", "Ladar", "Magnetometric"):
-                        self.ship.boostItemAttr("scan%sStrength" % scanType, value, stackingPenalties=True)
-
-                if warfareBuffID == 19:  # Information Burst: Electronic Hardening: RSD/RWD Resistance
-                    self.ship.boostItemAttr("sensorDampenerResistance", value)
-                    self.ship.boostItemAttr("weaponDisruptionResistance", value)
-
-                if warfareBuffID == 20:  # Skirmish Burst: Evasive Maneuvers: Signature Radius
-                    self.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
-
-                if warfareBuffID == 21:  # Skirmish Burst: Interdiction Maneuvers: Tackle Range
-                    groups = ("Stasis Web", "Warp Scrambler")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
-                                                   stackingPenalties=True)
-
-                if warfareBuffID == 22:  # Skirmish Burst: Rapid Deployment: AB/MWD Speed Increase
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner") or
-                                                               mod.item.requiresSkill("High Speed Maneuvering"),
-                                                   "speedFactor", value, stackingPenalties=True)
-
-                if warfareBuffID == 23:  # Mining Burst: Mining Laser Field Enhancement: Mining/Survey Range
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
-                                                   "maxRange", value, stackingPenalties=True)
-
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("CPU Management"),
-                                                   "surveyScanRange", value, stackingPenalties=True)
-
-                if warfareBuffID == 24:  # Mining Burst: Mining Laser Optimization: Mining Capacitor/Duration
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
-                                                   "capacitorNeed", value, stackingPenalties=True)
-
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
-                                                               mod.item.requiresSkill("Ice Harvesting") or
-                                                               mod.item.requiresSkill("Gas Cloud Harvesting"),
-                                                   "duration", value, stackingPenalties=True)
-
-                if warfareBuffID == 25:  # Mining Burst: Mining Equipment Preservation: Crystal Volatility
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"),
-                                                   "crystalVolatilityChance", value, stackingPenalties=True)
-
-                if warfareBuffID == 26:  # Information Burst: Sensor Optimization: Targeting Range
-                    self.ship.boostItemAttr("maxTargetRange", value, stackingPenalties=True)
-
-                if warfareBuffID == 60:  # Skirmish Burst: Evasive Maneuvers: Agility
-                    self.ship.boostItemAttr("agility", value, stackingPenalties=True)
-
-                # Titan effects
-
-                if warfareBuffID == 39:  # Avatar Effect Generator : Capacitor Recharge bonus
-                    self.ship.boostItemAttr("rechargeRate", value, stackingPenalties=True)
-
-                if warfareBuffID == 40:  # Avatar Effect Generator : Kinetic resistance bonus
-                    for attr in ("armorKineticDamageResonance", "shieldKineticDamageResonance", "kineticDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 41:  # Avatar Effect Generator : EM resistance penalty
-                    for attr in ("armorEmDamageResonance", "shieldEmDamageResonance", "emDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 42:  # Erebus Effect Generator : Armor HP bonus
-                    self.ship.boostItemAttr("armorHP", value, stackingPenalties=True)
-
-                if warfareBuffID == 43:  # Erebus Effect Generator : Explosive resistance bonus
-                    for attr in ("armorExplosiveDamageResonance", "shieldExplosiveDamageResonance", "explosiveDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 44:  # Erebus Effect Generator : Thermal resistance penalty
-                    for attr in ("armorThermalDamageResonance", "shieldThermalDamageResonance", "thermalDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 45:  # Ragnarok Effect Generator : Signature Radius bonus
-                    self.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
-
-                if warfareBuffID == 46:  # Ragnarok Effect Generator : Thermal resistance bonus
-                    for attr in ("armorThermalDamageResonance", "shieldThermalDamageResonance", "thermalDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 47:  # Ragnarok Effect Generator : Explosive resistance penaly
-                    for attr in ("armorExplosiveDamageResonance", "shieldExplosiveDamageResonance", "explosiveDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 48:  # Leviathan Effect Generator : Shield HP bonus
-                    self.ship.boostItemAttr("shieldCapacity", value, stackingPenalties=True)
-
-                if warfareBuffID == 49:  # Leviathan Effect Generator : EM resistance bonus
-                    for attr in ("armorEmDamageResonance", "shieldEmDamageResonance", "emDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 50:  # Leviathan Effect Generator : Kinetic resistance penalty
-                    for attr in ("armorKineticDamageResonance", "shieldKineticDamageResonance", "kineticDamageResonance"):
-                        self.ship.boostItemAttr(attr, value, stackingPenalties=True)
-
-                if warfareBuffID == 51:  # Avatar Effect Generator : Velocity penalty
-                    self.ship.boostItemAttr("maxVelocity", value, stackingPenalties=True)
-
-                if warfareBuffID == 52:  # Erebus Effect Generator : Shield RR penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "shieldBonus", value, stackingPenalties=True)
-
-                if warfareBuffID == 53:  # Leviathan Effect Generator : Armor RR penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
-                                                   "armorDamageAmount", value, stackingPenalties=True)
-
-                if warfareBuffID == 54:  # Ragnarok Effect Generator : Laser and Hybrid Optimal penalty
-                    groups = ("Energy Weapon", "Hybrid Weapon")
-                    self.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value, stackingPenalties=True)
-
-                # Localized environment effects
-
-                if warfareBuffID == 79:  # AOE_Beacon_bioluminescence_cloud
-                    self.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
-
-                if warfareBuffID == 80:  # AOE_Beacon_caustic_cloud_local_repair
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
-                                                   "armorDamageAmount", value, stackingPenalties=True)
-
-                if warfareBuffID == 81:  # AOE_Beacon_caustic_cloud_remote_repair
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
-                                                   "armorDamageAmount", value, stackingPenalties=True)
-
-                if warfareBuffID == 88:  # AOE_Beacon_filament_cloud_shield_booster_shield_bonus
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
-                                                   "shieldBonus", value, stackingPenalties=True)
-
-                if warfareBuffID == 89:  # AOE_Beacon_filament_cloud_shield_booster_duration
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
-                                                   "duration", value, stackingPenalties=True)
-
-                # Abyssal Weather Effects
-
-                if warfareBuffID == 90:  # Weather_electric_storm_EM_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}EmDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("emDamageResonance", value)  # for hull
-
-                if warfareBuffID == 92:  # Weather_electric_storm_capacitor_recharge_bonus
-                    self.ship.boostItemAttr("rechargeRate", value, stackingPenalties=True)
-
-                if warfareBuffID == 93:  # Weather_xenon_gas_explosive_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}ExplosiveDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("explosiveDamageResonance", value)  # for hull
-
-                if warfareBuffID == 94:  # Weather_xenon_gas_shield_hp_bonus
-                    self.ship.boostItemAttr("shieldCapacity", value)  # for hull
-
-                if warfareBuffID == 95:  # Weather_infernal_thermal_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}ThermalDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("thermalDamageResonance", value)  # for hull
-
-                if warfareBuffID == 96:  # Weather_infernal_armor_hp_bonus
-                    self.ship.boostItemAttr("armorHP", value)  # for hull
-
-                if warfareBuffID == 97:  # Weather_darkness_turret_range_penalty
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
-                                                   "maxRange", value, stackingPenalties=True)
-                    self.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
-                                                   "falloff", value, stackingPenalties=True)
-
-                if warfareBuffID == 98:  # Weather_darkness_velocity_bonus
-                    self.ship.boostItemAttr("maxVelocity", value)
-
-                if warfareBuffID == 99:  # Weather_caustic_toxin_kinetic_resistance_penalty
-                    for tankType in ("shield", "armor"):
-                        self.ship.boostItemAttr("{}KineticDamageResonance".format(tankType), value)
-                    self.ship.boostItemAttr("kineticDamageResonance", value)  # for hull
-
-                if warfareBuffID == 100:  # Weather_caustic_toxin_scan_resolution_bonus
-                    self.ship.boostItemAttr("scanResolution", value, stackingPenalties=True)
+                applyBuff(self, warfareBuffID, value)
 
             del self.commandBonuses[warfareBuffID]
 
+        if tracker is not None:
+            tracker.end()
+
     def __resetDependentCalcs(self):
         self.calculated = False
         for value in list(self.projectedOnto.values()):
@@ -777,6 +634,7 @@ class Fit(object):
                 if value.boosted_fit:
                     value.boosted_fit.__resetDependentCalcs()
 
+        projectionInfo = None
         if targetFit and type == CalcType.PROJECTED:
             pyfalog.debug("Calculating projections from {0} to target {1}", repr(self), repr(targetFit))
             projectionInfo = self.getProjectionInfo(targetFit.ID)
@@ -817,41 +675,116 @@ class Fit(object):
         if not self.__calculated:
             pyfalog.info("Fit is not yet calculated; will be running local calcs for {}".format(repr(self)))
             self.clear()
+            self.__afflictionsCaptured = self.trackAfflictions
+            # Record what every item reads and writes, so that later changes can be recalculated incrementally
+            if type == CalcType.LOCAL and eos.config.settings["incrementalCalc"] and self.__canCalcIncrementally():
+                self.__calcTracker = CalcTracker()
+
+        previousTracker = ModifiedAttributeDict.tracker
+        ModifiedAttributeDict.tracker = HandledList.tracker = self.__calcTracker if not self.__calculated else None
+        try:
+            self.__runCalcLoop(targetFit, type, projectionInfo)
+        finally:
+            ModifiedAttributeDict.tracker = HandledList.tracker = previousTracker
 
-        # Loop through our run times here. These determine which effects are run in which order.
-        for runTime in ("early", "normal", "late"):
-            # pyfalog.debug("Run time: {0}", runTime)
-            # Items that are unrestricted. These items are run on the local fit
-            # first and then projected onto the target fit it one is designated
-            u = [
-                (self.character, self.ship),
-                self.drones,
-                self.fighters,
-                self.boosters,
-                self.appliedImplants,
-                self.modules
-            ] if not self.isStructure else [
-                # Ensure a restricted set for citadels
-                (self.character, self.ship),
-                self.fighters,
-                self.modules
-            ]
+        # Recursive command ships (A <-> B) get marked as calculated, which means that they aren't recalced when changing
+        # tabs. See GH issue 1193
+        if type == CalcType.COMMAND and targetFit in self.commandFits:
+            pyfalog.debug("{} is in the command listing for COMMAND ({}), do not mark self as calculated (recursive)".format(repr(targetFit), repr(self)))
+        else:
+            self.__calculated = True
+
+        # Only apply projected fits if fit it not projected itself.
+        if type == CalcType.LOCAL:
+            for fit in self.projectedFits:
+                projInfo = fit.getProjectionInfo(self.ID)
+                if projInfo.active:
+                    if fit == self:
+                        # If doing self projection, no need to run through the recursion process. Simply run the
+                        # projection effects on ourselves
+                        pyfalog.debug("Running self-projection for {0}", repr(self))
+                        for runTime in ("early", "normal", "late"):
+                            self.__runProjectionEffects(runTime, self, projInfo)
+                    else:
+                        fit.calculateModifiedAttributes(self, type=CalcType.PROJECTED)
 
-            # Items that are restricted. These items are only run on the local
-            # fit. They are NOT projected onto the target fit. # See issue 354
-            r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
+            self.__finalizeAttributes()
 
-            # chain unrestricted and restricted into one iterable
-            c = chain.from_iterable(u + r)
+        self.calcGeneration = next(Fit.__calcGenerations)
+        pyfalog.debug('Done with fit calculation')
 
-            for item in c:
-                # Registering the item about to affect the fit allows us to
-                # track "Affected By" relations correctly
+    def __getAttributeDicts(self):
+        c = chain(
+            (self.ship, self.mode),
+            self.modules,
+            self.drones,
+            self.fighters,
+            self.boosters,
+            self.implants,
+            self.projectedModules,
+            self.projectedDrones,
+            self.projectedFighters
+        )
+        for item in c:
+            if item is None:
+                continue
+            for attrName in ("itemModifiedAttributes", "chargeModifiedAttributes"):
+                attrDict = getattr(item, attrName, None)
+                if attrDict is not None:
+                    yield attrDict
+
+    def __finalizeAttributes(self):
+        """Calculate final values of everything modified during calculation at once, instead of on first read"""
+        count = finalizeAttributeDicts(self.__getAttributeDicts())
+        pyfalog.debug("Finalized {0} attributes of {1}", count, repr(self))
+
+    def __getCalcItems(self):
+        # Items that are unrestricted. These items are run on the local fit
+        # first and then projected onto the target fit it one is designated
+        u = [
+            (self.character, self.ship),
+            self.drones,
+            self.fighters,
+            self.boosters,
+            self.appliedImplants,
+            self.modules
+        ] if not self.isStructure else [
+            # Ensure a restricted set for citadels
+            (self.character, self.ship),
+            self.fighters,
+            self.modules
+        ]
+
+        # Items that are restricted. These items are only run on the local
+        # fit. They are NOT projected onto the target fit. # See issue 354
+        r = [(self.mode,), self.projectedDrones, self.projectedFighters, self.projectedModules]
+
+        # chain unrestricted and restricted into one iterable
+        return chain.from_iterable(u + r)
+
+    def __calculateItem(self, item, runTime):
+        tracker = ModifiedAttributeDict.tracker
+        if tracker is not None:
+            tracker.begin(item, runTime)
+            # Projected items touch fit state directly (ECM strength, ...)
+            if getattr(item, "projected", False):
+                tracker.markVolatile()
+        # Registering the item about to affect the fit allows us to
+        # track "Affected By" relations correctly
+        self.register(item)
+        item.calculateModifiedAttributes(self, runTime, False)
+        if tracker is not None:
+            tracker.end()
+
+    def __runCalcLoop(self, targetFit, type, projectionInfo):
+        # Loop through our run times here. These determine which effects are run in which order.
+        for runTime in ("early", "normal", "late"):
+            # pyfalog.debug("Run time: {0}", runTime)
+            for item in self.__getCalcItems():
                 if item is not None:
                     # apply effects locally if this is first time running them on fit
                     if not self.__calculated:
-                        self.register(item)
-                        item.calculateModifiedAttributes(self, runTime, False)
+                        self.__calculateItem(item, runTime)
 
                     # Run command effects against target fit. We only have to worry about modules
                     if type == CalcType.COMMAND and item in self.modules:
@@ -870,28 +803,152 @@ class Fit(object):
             if type == CalcType.PROJECTED and projectionInfo:
                 self.__runProjectionEffects(runTime, targetFit, projectionInfo)
 
-        # Recursive command ships (A <-> B) get marked as calculated, which means that they aren't recalced when changing
-        # tabs. See GH issue 1193
-        if type == CalcType.COMMAND and targetFit in self.commandFits:
-            pyfalog.debug("{} is in the command listing for COMMAND ({}), do not mark self as calculated (recursive)".format(repr(targetFit), repr(self)))
+    def __canCalcIncrementally(self):
+        # Fits interacting with other fits are always recalculated fully
+        return not self.commandFits and not self.projectedFits
+
+    def calculateIncremental(self, changedItems):
+        """
+        Recalculate the fit after some of its items changed (state, charge, ...), re-running only the calculation
+        steps which depend on them. Falls back to a full recalculation when the previous calculation wasn't
+        tracked, a changed item wasn't part of it, or affected steps have side effects outside of attributes
+        (command bursts, projected items and their cap drains). Fits with command or projected fits are
+        always recalculated fully.
+
+        Returns True if the fit was recalculated incrementally.
+        """
+        incremental = self.__calculateIncremental(changedItems)
+        if not incremental:
+            pyfalog.debug("Cannot recalculate {0} incrementally, running full calculation", repr(self))
+            self.clear()
+            self.calculateModifiedAttributes()
+        elif eos.config.settings["incrementalCalcVerify"]:
+            self.__verifyIncremental()
+        return incremental
+
+    def __calculateIncremental(self, changedItems):
+        tracker = self.__calcTracker
+        if tracker is None or not self.__calculated or not self.__canCalcIncrementally():
+            return False
+
+        seeds = set()
+        changedDicts = []
+        for item in changedItems:
+            itemSteps = tracker.getItemSteps(item)
+            if not itemSteps:
+                return False
+            seeds.update(itemSteps)
+            for attrName in ("itemModifiedAttributes", "chargeModifiedAttributes"):
+                attrDict = getattr(item, attrName, None)
+                if attrDict is not None:
+                    changedDicts.append(attrDict)
+
+        # Lists of swapped charges are still indexed by the old charges, and steps which filtered them may match
+        # the changed items differently now - rebuild indexes and re-run those steps
+        swapped = [item for item in changedItems if tracker.chargeChanged(item)]
+        if swapped:
+            swappedLists = [handledList for handledList in (self.modules, self.projectedModules)
+                            if any(element is item for element in handledList for item in swapped)]
+            for handledList in swappedLists:
+                handledList.invalidateIndexes()
+            seeds.update(tracker.getFilterSteps(swappedLists, self.CHARGE_FILTERS))
+            # Skill modifications replayed from skillModifierCache don't go through filters at all
+            seeds.update(tracker.getItemSteps(self.character))
+
+        # Changing an item may wipe its attribute dicts (e.g. charge swap clears them), dropping modifications
+        # other steps did to them - everything recorded on those dicts is invalidated
+        extraRefs = tracker.getDictRefs(changedDicts)
+        # Re-run steps may write attributes they didn't touch before (e.g. module got activated); whatever
+        # depends on those has to be re-run as well, which may in turn spread further
+        for _ in range(self.INCREMENTAL_PASSES):
+            steps, invalid = tracker.getDependentSteps(seeds, extraRefs)
+            if steps & tracker.volatile:
+                return False
+            self.__replaySteps(tracker, steps, invalid, changedItems)
+            if steps & tracker.volatile:
+                return False
+            newRefs = set()
+            for stepKey in steps:
+                newRefs.update(tracker.writes[stepKey])
+            newRefs.difference_update(invalid)
+            if not newRefs:
+                break
+            seeds = steps
+            extraRefs = invalid | newRefs
         else:
-            self.__calculated = True
+            return False
 
-        # Only apply projected fits if fit it not projected itself.
-        if type == CalcType.LOCAL:
-            for fit in self.projectedFits:
-                projInfo = fit.getProjectionInfo(self.ID)
-                if projInfo.active:
-                    if fit == self:
-                        # If doing self projection, no need to run through the recursion process. Simply run the
-                        # projection effects on ourselves
-                        pyfalog.debug("Running self-projection for {0}", repr(self))
-                        for runTime in ("early", "normal", "late"):
-                            self.__runProjectionEffects(runTime, self, projInfo)
-                    else:
-                        fit.calculateModifiedAttributes(self, type=CalcType.PROJECTED)
+        self.__finalizeAttributes()
+        self.__clearStats()
+        self.__resetDependentCalcs()
+        self.__calculated = True
+        # Re-run steps lost afflictions of invalidated attributes unless they captured them again
+        self.__afflictionsCaptured = self.__afflictionsCaptured and self.trackAfflictions
+        return True
 
-        pyfalog.debug('Done with fit calculation')
+    def __replaySteps(self, tracker, steps, invalid, changedItems):
+        for attrDict, keys in tracker.groupRefs(invalid):
+            attrDict.clearKeys(keys)
+
+        # Reset item state which is set by effects, but isn't stored in attributes
+        for item in changedItems:
+            if isinstance(item, Module):
+                item.reloadTime = None
+                item.forceReload = None
+        if tracker.getStepKey(self.character, "early") in steps or \
+                tracker.getStepKey(self.character, "normal") in steps or \
+                tracker.getStepKey(self.character, "late") in steps:
+            for skill in self.character.loadedSkills:
+                skill.clear()
+
+        previousTracker = ModifiedAttributeDict.tracker
+        ModifiedAttributeDict.tracker = HandledList.tracker = tracker
+        try:
+            for runTime in ("early", "normal", "late"):
+                for item in self.__getCalcItems():
+                    if item is not None and tracker.getStepKey(item, runTime) in steps:
+                        self.__calculateItem(item, runTime)
+        finally:
+            ModifiedAttributeDict.tracker = HandledList.tracker = previousTracker
+
+        for item in chain(self.modules, self.drones, self.fighters):
+            item.clearCaches()
+
+    def __getAttributeSnapshot(self):
+        snapshot = {}
+        c = chain(
+            (self.ship, self.mode),
+            self.modules,
+            self.drones,
+            self.fighters,
+            self.boosters,
+            self.appliedImplants,
+        )
+        for item in c:
+            if item is None:
+                continue
+            for attrDict in (getattr(item, "itemModifiedAttributes", None), getattr(item, "chargeModifiedAttributes", None)):
+                if attrDict is None or attrDict.original is None:
+                    continue
+                for key in attrDict:
+                    snapshot[(item, id(attrDict), key)] = attrDict[key]
+        return snapshot
+
+    def __verifyIncremental(self):
+        """Debugging aid: compare incremental calculation results against a full recalculation"""
+        incremental = self.__getAttributeSnapshot()
+        self.clear()
+        self.calculateModifiedAttributes()
+        full = self.__getAttributeSnapshot()
+        mismatches = 0
+        for key in set(incremental).union(full):
+            incrementalValue = incremental.get(key)
+            fullValue = full.get(key)
+            if incrementalValue != fullValue:
+                mismatches += 1
+                pyfalog.error("Incremental calculation mismatch on {0} {1}: {2} (incremental) != {3} (full)",
+                              repr(key[0]), key[2], incrementalValue, fullValue)
+        return mismatches
 
     def __runProjectionEffects(self, runTime, targetFit, projectionInfo):
         """
@@ -1167,6 +1224,8 @@ class Fit(object):
 
     def addDrain(self, src, cycleTime, capNeed, clipSize=0, reloadTime=0):
         """ Used for both cap drains and cap fills (fills have negative capNeed) """
+        if ModifiedAttributeDict.tracker is not None:
+            ModifiedAttributeDict.tracker.markVolatile()
 
         energyNeutralizerSignatureResolution = src.getModifiedItemAttr("energyNeutralizerSignatureResolution")
         signatureRadius = self.ship.getModifiedItemAttr("signatureRadius")
@@ -1217,19 +1276,27 @@ class Fit(object):
 
         return drains, capUsed, capAdded
 
+    def __createCapSim(self, drains):
+        sim = capSim.CapSimulator()
+        sim.init(drains)
+        sim.capacitorCapacity = self.ship.getModifiedItemAttr("capacitorCapacity")
+        sim.capacitorRecharge = self.ship.getModifiedItemAttr("rechargeRate")
+        sim.stagger = True
+        sim.scale = False
+        sim.t_max = 6 * 60 * 60 * 1000
+        sim.reload = self.factorReload
+        return sim
+
     def simulateCap(self):
         drains, self.__capUsed, self.__capRecharge = self.__generateDrain()
         self.__capRecharge += self.calculateCapRecharge()
         if len(drains) > 0:
-            sim = capSim.CapSimulator()
-            sim.init(drains)
-            sim.capacitorCapacity = self.ship.getModifiedItemAttr("capacitorCapacity")
-            sim.capacitorRecharge = self.ship.getModifiedItemAttr("rechargeRate")
-            sim.stagger = True
-            sim.scale = False
-            sim.t_max = 6 * 60 * 60 * 1000
-            sim.reload = self.factorReload
+            sim = self.__createCapSim(drains)
+            sim.analytic = eos.config.settings["analyticCapSim"]
+            sim.cache = True
             sim.run()
+            pyfalog.debug("Cap simulation for {0}: {1}{2}, {3} activations in {4:.4f}s",
+                          self.ID, sim.solver, " (cached)" if sim.cached else "", sim.iterations, sim.runtime)
 
             capState = (sim.cap_stable_low + sim.cap_stable_high) / (2 * sim.capacitorCapacity)
             self.__capStable = capState > 0
@@ -1238,6 +1305,103 @@ class Fit(object):
             self.__capStable = True
             self.__capState = 100
 
+    def dropStats(self):
+        """Forget the stats snapshot, for changes which don't need a recalculation (e.g. cargo)"""
+        self.__stats = None
+
+    def getStats(self):
+        """FitStats snapshot of the calculated fit, taken again after the fit is recalculated"""
+        defaultSpool = eos.config.settings["globalDefaultSpoolupPercentage"]
+        stats = self.__stats
+        if stats is None or stats.generation != self.calcGeneration or stats.defaultSpool != defaultSpool:
+            stats = self.__stats = FitStats(self, defaultSpool)
+        return stats
+
+    def getContentHash(self):
+        """
+        Hash of everything calculated stats of the fit depend on, besides character skills (see
+        Character.skillHash) and game data. Same across sessions as long as the fit is
+        """
+        return sha1(repr(self.__getContentKey(set())).encode()).hexdigest()
+
+    def __getContentKey(self, visited):
+        visited.add(self.ID)
+
+        def moduleKey(mod):
+            if mod.isEmpty:
+                return None
+            mutators = sorted((attrID, mutator.value) for attrID, mutator in mod.mutators.items())
+            return mod.item.ID, mod.chargeID, mod.state, mod.spoolType, mod.spoolAmount, mod.mutaplasmidID, mutators
+
+        def fighterKey(fighter):
+            abilities = sorted((ability.effectID, ability.active) for ability in fighter.abilities)
+            return fighter.item.ID, fighter.amount, fighter.active, abilities
+
+        def patternKey(pattern):
+            if pattern is None:
+                return None
+            return pattern.emAmount, pattern.thermalAmount, pattern.kineticAmount, pattern.explosiveAmount
+
+        projectedFits = []
+        for fit in self.projectedFits:
+            info = fit.getProjectionInfo(self.ID)
+            if info is not None and fit.ID not in visited:
+                projectedFits.append((fit.ID, info.amount, info.active, fit.__getContentKey(visited)))
+        commandFits = []
+        for fit in self.commandFits:
+            info = fit.getCommandInfo(self.ID)
+            if info is not None and fit.ID not in visited:
+                commandFits.append((fit.ID, info.active, fit.__getContentKey(visited)))
+
+        return (
+            self.ship.item.ID if self.ship is not None else None,
+            self.mode.item.ID if self.mode is not None else None,
+            self.characterID,
+            self.implantLocation,
+            self.factorReload,
+            self.ignoreRestrictions,
+            tuple(moduleKey(mod) for mod in self.modules),
+            tuple(moduleKey(mod) for mod in self.projectedModules),
+            tuple((drone.item.ID, drone.amount, drone.amountActive) for drone in self.drones),
+            tuple((drone.item.ID, drone.amount, drone.amountActive) for drone in self.projectedDrones),
+            tuple(fighterKey(fighter) for fighter in self.fighters),
+            tuple(fighterKey(fighter) for fighter in self.projectedFighters),
+            tuple((cargo.item.ID, cargo.amount) for cargo in self.cargo),
+            tuple((implant.item.ID, implant.active) for implant in self.implants),
+            tuple((booster.item.ID, booster.active, sorted((se.effectID, se.active) for se in booster.sideEffects))
+                  for booster in self.boosters),
+            patternKey(self.damagePattern),
+            patternKey(self.targetResists),
+            tuple(projectedFits),
+            tuple(commandFits),
+            sorted(eos.config.settings.items()),
+        )
+
+    def getCapTimeline(self, duration, samples=500):
+        """
+        Capacitor level over the first duration seconds of activating everything,
+        as (times in seconds, cap amounts) sequences of at most 2 * samples values.
+        Kept until the next recalculation; None if numpy is not available.
+        """
+        key = (duration, samples)
+        if key not in self.__capTimelines:
+            drains = self.__generateDrain()[0]
+            if len(drains) == 0:
+                capacity = self.ship.getModifiedItemAttr("capacitorCapacity")
+                timeline = ((0, duration), (capacity, capacity))
+            elif capSim.numpy is None:
+                timeline = None
+            else:
+                sim = self.__createCapSim(drains)
+                sim.t_max = duration * 1000
+                sim.timeline_samples = samples
+                sim.run()
+                times, caps = sim.timeline
+                timeline = (times / 1000.0, caps)
+            self.__capTimelines[key] = timeline
+
+        return self.__capTimelines[key]
+
     def getRemoteReps(self, spoolOptions=None):
         if spoolOptions not in self.__remoteRepMap:
             remoteReps = {}
@@ -1279,6 +1443,21 @@ class Fit(object):
 
         return self.__ehp
 
+    def getResonances(self):
+        """
+        Ship damage resonances as [shield, armor, hull][em, thermal, kinetic, explosive], read once per
+        calculation
+        """
+        if self.__resonances is None or self.__resonances[0] != self.calcGeneration:
+            resonances = tuple(tuple(self.ship.getModifiedItemAttr(attr) for attr in attrs)
+                               for attrs in DamagePattern.RESONANCE_ATTRS)
+            self.__resonances = (self.calcGeneration, resonances)
+        return self.__resonances[1]
+
+    def getEhpAgainstPatterns(self, patterns):
+        """PatternEhp with EHP against every given damage pattern"""
+        return PatternEhp(patterns, self.getResonances(), self.hp)
+
     @property
     def tank(self):
         reps = {
@@ -1346,51 +1525,49 @@ class Fit(object):
                 repairers = []
                 localAdjustment = {"shieldRepair": 0, "armorRepair": 0, "hullRepair": 0}
                 capUsed = self.capUsed
-                for tankType in localAdjustment:
-                    dict = self.extraAttributes.getAfflictions(tankType)
-                    if self in dict:
-                        for mod, _, amount, used in dict[self]:
-                            if not used:
-                                continue
-                            if mod.projected:
-                                continue
-                            if mod.item.group.name not in groupAttrMap:
-                                continue
-                            usesCap = True
-                            try:
-                                if mod.capUse:
-                                    capUsed -= mod.capUse
-                                else:
-                                    usesCap = False
-                            except AttributeError:
-                                usesCap = False
-
-                            # Normal Repairers
-                            if usesCap and not mod.charge:
-                                cycleTime = mod.rawCycleTime
-                                amount = mod.getModifiedItemAttr(groupAttrMap[mod.item.group.name])
-                                localAdjustment[tankType] -= amount / (cycleTime / 1000.0)
-                                repairers.append(mod)
-                            # Ancillary Armor reps etc
-                            elif usesCap and mod.charge:
-                                cycleTime = mod.rawCycleTime
-                                amount = mod.getModifiedItemAttr(groupAttrMap[mod.item.group.name])
-                                if mod.charge.name == "Nanite Repair Paste":
-                                    multiplier = mod.getModifiedItemAttr("chargedArmorDamageMultiplier") or 1
-                                else:
-                                    multiplier = 1
-                                localAdjustment[tankType] -= amount * multiplier / (cycleTime / 1000.0)
-                                repairers.append(mod)
-                            # Ancillary Shield boosters etc
-                            elif not usesCap and mod.item.group.name in ("Ancillary Shield Booster", "Ancillary Remote Shield Booster"):
-                                cycleTime = mod.rawCycleTime
-                                amount = mod.getModifiedItemAttr(groupAttrMap[mod.item.group.name])
-                                if self.factorReload and mod.charge:
-                                    reloadtime = mod.reloadTime
-                                else:
-                                    reloadtime = 0.0
-                                offdutycycle = reloadtime / ((max(mod.numShots, 1) * cycleTime) + reloadtime)
-                                localAdjustment[tankType] -= amount * offdutycycle / (cycleTime / 1000.0)
+                # Active local repairers; found by walking modules rather than afflictions of repair amounts, which
+                # are only there when the fit was calculated with afflictions captured
+                for mod in self.modules:
+                    if mod.isEmpty or mod.projected or mod.state < FittingModuleState.ACTIVE:
+                        continue
+                    if mod.item.group.name not in groupAttrMap:
+                        continue
+                    tankType = groupStoreMap[mod.item.group.name]
+                    usesCap = True
+                    try:
+                        if mod.capUse:
+                            capUsed -= mod.capUse
+                        else:
+                            usesCap = False
+                    except AttributeError:
+                        usesCap = False
+
+                    # Normal Repairers
+                    if usesCap and not mod.charge:
+                        cycleTime = mod.rawCycleTime
+                        amount = mod.getModifiedItemAttr(groupAttrMap[mod.item.group.name])
+                        localAdjustment[tankType] -= amount / (cycleTime / 1000.0)
+                        repairers.append(mod)
+                    # Ancillary Armor reps etc
+                    elif usesCap and mod.charge:
+                        cycleTime = mod.rawCycleTime
+                        amount = mod.getModifiedItemAttr(groupAttrMap[mod.item.group.name])
+                        if mod.charge.name == "Nanite Repair Paste":
+                            multiplier = mod.getModifiedItemAttr("chargedArmorDamageMultiplier") or 1
+                        else:
+                            multiplier = 1
+                        localAdjustment[tankType] -= amount * multiplier / (cycleTime / 1000.0)
+                        repairers.append(mod)
+                    # Ancillary Shield boosters etc
+                    elif not usesCap and mod.item.group.name in ("Ancillary Shield Booster", "Ancillary Remote Shield Booster"):
+                        cycleTime = mod.rawCycleTime
+                        amount = mod.getModifiedItemAttr(groupAttrMap[mod.item.group.name])
+                        if self.factorReload and mod.charge:
+                            reloadtime = mod.reloadTime
+                        else:
+                            reloadtime = 0.0
+                        offdutycycle = reloadtime / ((max(mod.numShots, 1) * cycleTime) + reloadtime)
+                        localAdjustment[tankType] -= amount * offdutycycle / (cycleTime / 1000.0)
 
                 # Sort repairers by efficiency. We want to use the most efficient repairers first
                 repairers.sort(key=lambda _mod: _mod.getModifiedItemAttr(
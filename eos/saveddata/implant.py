@@ -57,7 +57,7 @@ class Implant(HandledItem, ItemAttrShortcut):
 
     def build(self):
         """ Build object. Assumes proper and valid item already set """
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create()
         self.__itemModifiedAttributes.original = self.__item.attributes
         self.__itemModifiedAttributes.overrides = self.__item.overrides
         self.__slot = self.__calculateSlot(self.__item)
@@ -93,9 +93,8 @@ class Implant(HandledItem, ItemAttrShortcut):
             return
         if not self.active:
             return
-        for effect in self.item.effects.values():
-            if effect.runTime == runTime and effect.isType("passive") and effect.activeByDefault:
-                effect.handler(fit, self, ("implant",))
+        for effect in self.item.getEffectBucket(runTime, effectType="passive"):
+            effect.handler(fit, self, ("implant",))
 
     @validates("fitID", "itemID", "active")
     def validator(self, key, val):
@@ -29,7 +29,7 @@ class Mode(ItemAttrShortcut, HandledItem):
                     'Passed item "%s" (category: (%s)) is not a Ship Modifier' % (item.name, item.category.name))
 
         self.__item = item
-        self.__itemModifiedAttributes = ModifiedAttributeDict()
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create()
         self.__itemModifiedAttributes.original = self.item.attributes
         self.__itemModifiedAttributes.overrides = self.item.overrides
 
@@ -50,6 +50,5 @@ class Mode(ItemAttrShortcut, HandledItem):
 
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if self.item:
-            for effect in self.item.effects.values():
-                if effect.runTime == runTime and effect.activeByDefault:
-                    effect.handler(fit, self, context=("module",))
+            for effect in self.item.getEffectBucket(runTime):
+                effect.handler(fit, self, context=("module",))
@@ -139,8 +139,8 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         self.__reloadForce = None
         self.__chargeCycles = None
         self.__hardpoint = FittingHardpoint.NONE
-        self.__itemModifiedAttributes = ModifiedAttributeDict(parent=self)
-        self.__chargeModifiedAttributes = ModifiedAttributeDict(parent=self)
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create(parent=self)
+        self.__chargeModifiedAttributes = ModifiedAttributeDict.create(parent=self)
         self.__slot = self.dummySlot  # defaults to None
 
         if self.__item:
@@ -733,13 +733,16 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         else:
             return val
 
-    def clear(self):
+    def clearCaches(self):
         self.__baseVolley = None
         self.__baseRemoteReps = None
         self.__miningyield = None
+        self.__chargeCycles = None
+
+    def clear(self):
+        self.clearCaches()
         self.__reloadTime = None
         self.__reloadForce = None
-        self.__chargeCycles = None
         self.itemModifiedAttributes.clear()
         self.chargeModifiedAttributes.clear()
 
@@ -766,45 +769,26 @@ class Module(HandledItem, HandledCharge, ItemAttrShortcut, ChargeAttrShortcut):
         if self.charge is not None:
             # fix for #82 and it's regression #106
             if not projected or (self.projected and not forceProjected) or gang:
-                for effect in self.charge.effects.values():
-                    if effect.runTime == runTime and \
-                            effect.activeByDefault and \
-                            (effect.isType("offline") or
-                             (effect.isType("passive") and self.state >= FittingModuleState.ONLINE) or
-                             (effect.isType("active") and self.state >= FittingModuleState.ACTIVE)) and \
-                            (not gang or (gang and effect.isType("gang"))):
-
-                        chargeContext = ("moduleCharge",)
-                        # For gang effects, we pass in the effect itself as an argument. However, to avoid going through
-                        # all the effect files and defining this argument, do a simple try/catch here and be done with it.
-                        # @todo: possibly fix this
-                        try:
-                            effect.handler(fit, self, chargeContext, effect=effect)
-                        except:
-                            effect.handler(fit, self, chargeContext)
-
-        if self.item:
-            if self.state >= FittingModuleState.OVERHEATED:
-                for effect in self.item.effects.values():
-                    if effect.runTime == runTime and \
-                            effect.isType("overheat") \
-                            and not forceProjected \
-                            and effect.activeByDefault \
-                            and ((gang and effect.isType("gang")) or not gang):
-                        effect.handler(fit, self, context)
-
-            for effect in self.item.effects.values():
-                if effect.runTime == runTime and \
-                        effect.activeByDefault and \
-                        (effect.isType("offline") or
-                         (effect.isType("passive") and self.state >= FittingModuleState.ONLINE) or
-                         (effect.isType("active") and self.state >= FittingModuleState.ACTIVE)) \
-                        and ((projected and effect.isType("projected")) or not projected) \
-                        and ((gang and effect.isType("gang")) or not gang):
+                for effect in self.charge.getEffectBucket(runTime, self.state, gang=gang):
+                    chargeContext = ("moduleCharge",)
+                    # For gang effects, we pass in the effect itself as an argument. However, to avoid going through
+                    # all the effect files and defining this argument, do a simple try/catch here and be done with it.
+                    # @todo: possibly fix this
                     try:
-                        effect.handler(fit, self, context, effect=effect)
+                        effect.handler(fit, self, chargeContext, effect=effect)
                     except:
-                        effect.handler(fit, self, context)
+                        effect.handler(fit, self, chargeContext)
+
+        if self.item:
+            if self.state >= FittingModuleState.OVERHEATED and not forceProjected:
+                for effect in self.item.getEffectBucket(runTime, gang=gang, overheat=True):
+                    effect.handler(fit, self, context)
+
+            for effect in self.item.getEffectBucket(runTime, self.state, projected, gang):
+                try:
+                    effect.handler(fit, self, context, effect=effect)
+                except:
+                    effect.handler(fit, self, context)
 
     @property
     def cycleTime(self):
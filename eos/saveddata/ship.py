@@ -50,7 +50,7 @@ class Ship(ItemAttrShortcut, HandledItem):
 
         self.__item = item
         self.__modeItems = self.__getModeItems()
-        self.__itemModifiedAttributes = ModifiedAttributeDict(parent=self)
+        self.__itemModifiedAttributes = ModifiedAttributeDict.create(parent=self)
         self.__itemModifiedAttributes.original = dict(self.item.attributes)
         self.__itemModifiedAttributes.original.update(self.EXTRA_ATTRIBUTES)
         self.__itemModifiedAttributes.overrides = self.item.overrides
@@ -89,19 +89,16 @@ class Ship(ItemAttrShortcut, HandledItem):
     def calculateModifiedAttributes(self, fit, runTime, forceProjected=False):
         if forceProjected:
             return
-        for effect in self.item.effects.values():
-            if effect.runTime == runTime and \
-                    effect.isType("passive") and \
-                    effect.activeByDefault:
-                # Ships have effects that utilize the level of a skill as an
-                # additional operator to the modifier. These are defined in
-                # the effect itself, and these skillbooks are registered when
-                # they are provided. However, we must re-register the ship
-                # before each effect, otherwise effects that do not have
-                # skillbook modifiers will use the stale modifier value
-                # GH issue #351
-                fit.register(self)
-                effect.handler(fit, self, ("ship",))
+        for effect in self.item.getEffectBucket(runTime, effectType="passive"):
+            # Ships have effects that utilize the level of a skill as an
+            # additional operator to the modifier. These are defined in
+            # the effect itself, and these skillbooks are registered when
+            # they are provided. However, we must re-register the ship
+            # before each effect, otherwise effects that do not have
+            # skillbook modifiers will use the stale modifier value
+            # GH issue #351
+            fit.register(self)
+            effect.handler(fit, self, ("ship",))
 
     def validateModeItem(self, item):
         """ Checks if provided item is a valid mode """
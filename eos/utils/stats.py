@@ -17,6 +17,11 @@
 # along with eos.  If not, see <http://www.gnu.org/licenses/>.
 # ===============================================================================
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class DmgTypes:
     """Container for damage data stats."""
@@ -68,3 +73,220 @@ class DmgTypes:
         self.explosive += other.explosive
         self._calcTotal()
         return self
+
+
+class ProfileDmg:
+    """
+    Volley and DPS of a fit against several target resist profiles (None meaning no resists) and spool
+    options, computed all at once from damage the fit deals before resists (see Fit.getBaseDmg()).
+
+    volley and dps are indexed by [profile][spool options][damage type], numpy arrays when numpy is
+    available and nested lists otherwise.
+    """
+
+    resistAttrs = ("emAmount", "thermalAmount", "kineticAmount", "explosiveAmount")
+
+    def __init__(self, profiles, spoolOptions, baseDmgs):
+        self.profiles = list(profiles)
+        self.spoolOptions = list(spoolOptions)
+        # Share of damage of each type which gets through, per profile
+        factors = [[1 - getattr(profile, attr, 0) for attr in self.resistAttrs] for profile in self.profiles]
+        if numpy is not None:
+            self.__calcArrays(numpy.array(factors, dtype=float).reshape(len(factors), 4), baseDmgs)
+        else:
+            self.__calcLists(factors, baseDmgs)
+
+    def __calcArrays(self, factors, baseDmgs):
+        volley = numpy.array([list(volley)[:4] for volley, _, _ in baseDmgs], dtype=float).reshape(-1, 4)
+        dps = numpy.array([list(dps)[:4] for _, dps, _ in baseDmgs], dtype=float).reshape(-1, 4)
+        self.volley = factors[:, None, :] * volley[None, :, :]
+        self.dps = factors[:, None, :] * dps[None, :, :]
+        profileIndices = numpy.arange(len(factors))
+        for spoolIndex, (_, _, dpsOptions) in enumerate(baseDmgs):
+            for options in dpsOptions:
+                optionDps = factors[:, None, :] * numpy.array([list(option)[:4] for option in options])[None, :, :]
+                # First of the highest ones, like max() does
+                best = optionDps.sum(axis=2).argmax(axis=1)
+                self.dps[:, spoolIndex, :] += optionDps[profileIndices, best]
+
+    def __calcLists(self, factors, baseDmgs):
+        self.volley = []
+        self.dps = []
+        for profileFactors in factors:
+            def apply(dmg):
+                return [value * factor for value, factor in zip(dmg, profileFactors)]
+
+            profileVolley = []
+            profileDps = []
+            for volley, dps, dpsOptions in baseDmgs:
+                dps = apply(dps)
+                for options in dpsOptions:
+                    best = max((apply(option) for option in options), key=sum)
+                    dps = [value + extra for value, extra in zip(dps, best)]
+                profileVolley.append(apply(volley))
+                profileDps.append(dps)
+            self.volley.append(profileVolley)
+            self.dps.append(profileDps)
+
+    def getVolley(self, profileIndex, spoolIndex=0):
+        return DmgTypes(*(float(value) for value in self.volley[profileIndex][spoolIndex]))
+
+    def getDps(self, profileIndex, spoolIndex=0):
+        return DmgTypes(*(float(value) for value in self.dps[profileIndex][spoolIndex]))
+
+
+class PatternEhp:
+    """
+    EHP and effective tank of a fit against several damage patterns (None meaning raw HP), computed all at once
+    from the ship's resonance matrix (see Fit.getResonances()).
+
+    dividers is indexed by [pattern][tank type], raw amounts get divided by it. It is a numpy array when numpy
+    is available and nested lists otherwise, same goes for ehp.
+    """
+
+    tankTypes = ("shield", "armor", "hull")
+
+    def __init__(self, patterns, resonances, hp):
+        self.patterns = list(patterns)
+        weights = [pattern.getWeights() if pattern is not None else (0, 0, 0, 0) for pattern in self.patterns]
+        raw = [pattern is None for pattern in self.patterns]
+        hp = [hp[tankType] for tankType in self.tankTypes]
+        if numpy is not None:
+            weights = numpy.array(weights, dtype=float).reshape(len(weights), 4)
+            dividers = weights @ numpy.array(resonances, dtype=float).T
+            dividers[numpy.array(raw, dtype=bool)] = 1
+            dividers[dividers == 0] = 1
+            self.dividers = dividers
+            self.ehp = numpy.array(hp, dtype=float)[None, :] / dividers
+        else:
+            self.dividers = [
+                [1 if isRaw else (sum(w * r for w, r in zip(patternWeights, tankResonances)) or 1)
+                 for tankResonances in resonances]
+                for patternWeights, isRaw in zip(weights, raw)]
+            self.ehp = [[amount / divider for amount, divider in zip(hp, patternDividers)]
+                        for patternDividers in self.dividers]
+
+    def getEhp(self, patternIndex):
+        return {tankType: float(ehp) for tankType, ehp in zip(self.tankTypes, self.ehp[patternIndex])}
+
+    def getEffectiveTank(self, patternIndex, tank):
+        """Effective amounts of tank stats (like Fit.tank) against the pattern"""
+        from eos.saveddata.damagePattern import DamagePattern
+        dividers = dict(zip(self.tankTypes, self.dividers[patternIndex]))
+        return {field: amount / float(dividers[DamagePattern.TANK_FIELD_TYPES[field]])
+                for field, amount in tank.items() if field in DamagePattern.TANK_FIELD_TYPES}
+
+
+class FitStats:
+    """
+    Read-only snapshot of the stats of a calculated fit, shared by stats views, tooltips
+    and exports. Values come from Fit's own stat properties and are taken once per
+    calculation, not on every refresh. Picklable, so it can be sent across processes.
+
+    Spool dependent stats are (default spool, pre-spool, full spool) tuples.
+    """
+
+    tankTypes = ("shield", "armor", "hull")
+    damageTypes = ("em", "thermal", "kinetic", "explosive")
+
+    # Ship attributes stats views show as they are
+    shipAttributes = (
+        "capacitorCapacity", "energyWarfareResistance", "turretSlotsLeft", "launcherSlotsLeft",
+        "upgradeCapacity", "powerOutput", "cpuOutput", "droneCapacity", "droneBandwidth", "fighterCapacity",
+        "capacity", "fleetHangarCapacity", "shipMaintenanceBayCapacity", "specialAmmoHoldCapacity",
+        "specialFuelBayCapacity", "specialShipHoldCapacity", "specialSmallShipHoldCapacity",
+        "specialMediumShipHoldCapacity", "specialLargeShipHoldCapacity", "specialIndustrialShipHoldCapacity",
+        "specialOreHoldCapacity", "specialMineralHoldCapacity", "specialMaterialBayCapacity",
+        "specialGasHoldCapacity", "specialSalvageHoldCapacity", "specialCommandCenterHoldCapacity",
+        "specialPlanetaryCommoditiesHoldCapacity", "specialQuafeHoldCapacity", "scanResolution",
+        "signatureRadius", "warpScrambleStatus", "mass", "agility")
+
+    __slots__ = (
+        "generation", "defaultSpool",
+        # Firepower and remote reps
+        "weaponDps", "weaponVolley", "droneDps", "droneVolley", "totalDps", "totalVolley", "remoteReps",
+        "minerYield", "droneYield", "totalYield",
+        # Tank; resonances are {tank type: {damage type: resonance}}
+        "hp", "ehp", "tank", "effectiveTank", "sustainableTank", "effectiveSustainableTank", "resonances",
+        # Capacitor
+        "capRecharge", "capUsed", "capState", "capStable",
+        # Resources
+        "cpuUsed", "pgUsed", "calibrationUsed", "turretHardpointsUsed", "launcherHardpointsUsed",
+        "activeDrones", "maxActiveDrones", "droneBayUsed", "droneBandwidthUsed", "fighterBayUsed",
+        "fighterTubesUsed", "fighterTubesTotal", "cargoBayUsed",
+        # Targeting and navigation
+        "maxTargets", "maxTargetRange", "scanStrength", "scanType", "jamChance", "probeSize",
+        "droneControlRange", "maxSpeed", "alignTime", "warpSpeed", "maxWarpDistance",
+        # {attribute name: value} of shipAttributes
+        "ship")
+
+    def __init__(self, fit, defaultSpool):
+        # Imported here, saveddata imports this module
+        from eos.const import FittingHardpoint
+        from eos.utils.spoolSupport import SpoolType, SpoolOptions
+
+        values = {"generation": fit.calcGeneration, "defaultSpool": defaultSpool}
+        spools = (SpoolOptions(SpoolType.SCALE, defaultSpool, False), SpoolOptions(SpoolType.SCALE, 0, True),
+                  SpoolOptions(SpoolType.SCALE, 1, True))
+        values["weaponDps"] = tuple(fit.getWeaponDps(spoolOptions=spool) for spool in spools)
+        values["weaponVolley"] = tuple(fit.getWeaponVolley(spoolOptions=spool) for spool in spools)
+        values["droneDps"] = fit.getDroneDps()
+        values["droneVolley"] = fit.getDroneVolley()
+        values["totalDps"] = tuple(dps + values["droneDps"] for dps in values["weaponDps"])
+        values["totalVolley"] = tuple(volley + values["droneVolley"] for volley in values["weaponVolley"])
+        values["remoteReps"] = tuple(dict(fit.getRemoteReps(spoolOptions=spool)) for spool in spools)
+        values["minerYield"] = fit.minerYield
+        values["droneYield"] = fit.droneYield
+        values["totalYield"] = values["minerYield"] + values["droneYield"]
+
+        values["hp"] = dict(fit.hp)
+        values["ehp"] = dict(fit.ehp)
+        values["tank"] = dict(fit.tank)
+        values["effectiveTank"] = dict(fit.effectiveTank)
+        values["sustainableTank"] = dict(fit.sustainableTank)
+        values["effectiveSustainableTank"] = dict(fit.effectiveSustainableTank)
+        ship = fit.ship
+        values["resonances"] = {
+            tankType: dict(zip(self.damageTypes, tankResonances))
+            for tankType, tankResonances in zip(self.tankTypes, fit.getResonances())}
+
+        values["capRecharge"] = fit.capRecharge
+        values["capUsed"] = fit.capUsed
+        values["capState"] = fit.capState
+        values["capStable"] = fit.capStable
+
+        values["cpuUsed"] = fit.cpuUsed
+        values["pgUsed"] = fit.pgUsed
+        values["calibrationUsed"] = fit.calibrationUsed
+        values["turretHardpointsUsed"] = fit.getHardpointsUsed(FittingHardpoint.TURRET)
+        values["launcherHardpointsUsed"] = fit.getHardpointsUsed(FittingHardpoint.MISSILE)
+        values["activeDrones"] = fit.activeDrones
+        values["maxActiveDrones"] = fit.extraAttributes["maxActiveDrones"]
+        values["droneBayUsed"] = fit.droneBayUsed
+        values["droneBandwidthUsed"] = fit.droneBandwidthUsed
+        values["fighterBayUsed"] = fit.fighterBayUsed
+        values["fighterTubesUsed"] = fit.fighterTubesUsed
+        values["fighterTubesTotal"] = fit.fighterTubesTotal
+        values["cargoBayUsed"] = fit.cargoBayUsed
+
+        for name in ("maxTargets", "maxTargetRange", "scanStrength", "scanType", "jamChance", "probeSize",
+                     "maxSpeed", "alignTime", "warpSpeed", "maxWarpDistance"):
+            values[name] = getattr(fit, name)
+        values["droneControlRange"] = fit.extraAttributes["droneControlRange"]
+        values["ship"] = {name: ship.getModifiedItemAttr(name) for name in self.shipAttributes}
+
+        self.__setstate__(values)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("FitStats is read-only")
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def getShipAttr(self, name, default=None):
+        value = self.ship.get(name)
+        return default if value is None else value
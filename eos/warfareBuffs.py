@@ -0,0 +1,267 @@
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+"""
+What command bursts, titan effect generators and environment effects do to the boosted fit.
+
+Every warfare buff ID maps to a list of (target, attribute, operation, stacking) records. Targets are
+either the ship or fitted modules which require any of given skills / belong to any of given groups;
+module targets are compiled into indexed filters of the module list. Adding support for a new buff is
+a matter of adding its records to WARFARE_BUFFS.
+"""
+
+from collections import namedtuple
+
+from logbook import Logger
+
+from eos.effectHandlerHelpers import itemGroupIs, itemRequiresSkill
+
+pyfalog = Logger(__name__)
+
+SHIP = "ship"
+MODULE_SKILL = "moduleSkill"
+MODULE_GROUP = "moduleGroup"
+
+# Operation name: (ship method, module list method)
+OPERATIONS = {
+    "boost": ("boostItemAttr", "filteredItemBoost"),
+    "multiply": ("multiplyItemAttr", "filteredItemMultiply"),
+    "increase": ("increaseItemAttr", "filteredItemIncrease"),
+}
+
+# Operations which can be stacking penalized
+STACKABLE_OPERATIONS = ("boost", "multiply")
+
+# target: (SHIP,), (MODULE_SKILL, skill names) or (MODULE_GROUP, group names)
+BuffModifier = namedtuple("BuffModifier", ("target", "attribute", "operation", "stacking"))
+
+
+def ship(*attributes, stacking=True):
+    return [BuffModifier((SHIP,), attr, "boost", stacking) for attr in attributes]
+
+
+def modulesWithSkill(skills, *attributes, stacking=True):
+    return [BuffModifier((MODULE_SKILL, tuple(skills)), attr, "boost", stacking) for attr in attributes]
+
+
+def modulesInGroup(groups, *attributes, stacking=True):
+    return [BuffModifier((MODULE_GROUP, tuple(groups)), attr, "boost", stacking) for attr in attributes]
+
+
+def _resonances(damageType, tankTypes=("shield", "armor", "")):
+    # Hull resonances have no prefix and lowercase damage type
+    return ["{}{}DamageResonance".format(t, damageType) if t else "{}DamageResonance".format(damageType.lower())
+            for t in tankTypes]
+
+
+SHIELD_REPAIRERS = ("Shield Operation", "Shield Emission Systems")
+ARMOR_REPAIRERS = ("Remote Armor Repair Systems", "Repair Systems")
+MINING_MODULES = ("Mining", "Ice Harvesting", "Gas Cloud Harvesting")
+
+WARFARE_BUFFS = {
+    # Shield Burst: Shield Harmonizing: Shield Resistance
+    10: ship(*_resonances("Em", ("shield",)) + _resonances("Explosive", ("shield",)) +
+             _resonances("Thermal", ("shield",)) + _resonances("Kinetic", ("shield",))),
+    # Shield Burst: Active Shielding: Repair Duration/Capacitor
+    11: modulesWithSkill(SHIELD_REPAIRERS, "capacitorNeed", "duration", stacking=False),
+    # Shield Burst: Shield Extension: Shield HP
+    12: ship("shieldCapacity"),
+    # Armor Burst: Armor Energizing: Armor Resistance
+    13: ship(*_resonances("Em", ("armor",)) + _resonances("Thermal", ("armor",)) +
+             _resonances("Explosive", ("armor",)) + _resonances("Kinetic", ("armor",))),
+    # Armor Burst: Rapid Repair: Repair Duration/Capacitor
+    14: modulesWithSkill(ARMOR_REPAIRERS, "capacitorNeed", "duration", stacking=False),
+    # Armor Burst: Armor Reinforcement: Armor HP
+    15: ship("armorHP"),
+    # Information Burst: Sensor Optimization: Scan Resolution
+    16: ship("scanResolution"),
+    # Information Burst: Electronic Superiority: EWAR Range and Strength
+    17: (modulesInGroup(("ECM", "Sensor Dampener", "Weapon Disruptor", "Target Painter"),
+                        "maxRange", "falloffEffectiveness") +
+         modulesInGroup(("ECM",), *("scan{}StrengthBonus".format(t) for t in
+                                    ("Magnetometric", "Radar", "Ladar", "Gravimetric"))) +
+         modulesInGroup(("Weapon Disruptor",), "missileVelocityBonus", "explosionDelayBonus", "aoeVelocityBonus",
+                        "falloffBonus", "maxRangeBonus", "aoeCloudSizeBonus", "trackingSpeedBonus", stacking=False) +
+         modulesInGroup(("Sensor Dampener",), "maxTargetRangeBonus", "scanResolutionBonus", stacking=False) +
+         modulesInGroup(("Target Painter",), "signatureRadiusBonus")),
+    # Information Burst: Electronic Hardening: Scan Strength
+    18: ship(*("scan{}Strength".format(t) for t in ("Gravimetric", "Radar", "Ladar", "Magnetometric"))),
+    # Information Burst: Electronic Hardening: RSD/RWD Resistance
+    19: ship("sensorDampenerResistance", "weaponDisruptionResistance", stacking=False),
+    # Skirmish Burst: Evasive Maneuvers: Signature Radius
+    20: ship("signatureRadius"),
+    # Skirmish Burst: Interdiction Maneuvers: Tackle Range
+    21: modulesInGroup(("Stasis Web", "Warp Scrambler"), "maxRange"),
+    # Skirmish Burst: Rapid Deployment: AB/MWD Speed Increase
+    22: modulesWithSkill(("Afterburner", "High Speed Maneuvering"), "speedFactor"),
+    # Mining Burst: Mining Laser Field Enhancement: Mining/Survey Range
+    23: modulesWithSkill(MINING_MODULES, "maxRange") + modulesWithSkill(("CPU Management",), "surveyScanRange"),
+    # Mining Burst: Mining Laser Optimization: Mining Capacitor/Duration
+    24: modulesWithSkill(MINING_MODULES, "capacitorNeed", "duration"),
+    # Mining Burst: Mining Equipment Preservation: Crystal Volatility
+    25: modulesWithSkill(("Mining",), "crystalVolatilityChance"),
+    # Information Burst: Sensor Optimization: Targeting Range
+    26: ship("maxTargetRange"),
+    # Skirmish Burst: Evasive Maneuvers: Agility
+    60: ship("agility"),
+
+    # Titan effects
+
+    # Avatar Effect Generator : Capacitor Recharge bonus
+    39: ship("rechargeRate"),
+    # Avatar Effect Generator : Kinetic resistance bonus
+    40: ship(*_resonances("Kinetic")),
+    # Avatar Effect Generator : EM resistance penalty
+    41: ship(*_resonances("Em")),
+    # Erebus Effect Generator : Armor HP bonus
+    42: ship("armorHP"),
+    # Erebus Effect Generator : Explosive resistance bonus
+    43: ship(*_resonances("Explosive")),
+    # Erebus Effect Generator : Thermal resistance penalty
+    44: ship(*_resonances("Thermal")),
+    # Ragnarok Effect Generator : Signature Radius bonus
+    45: ship("signatureRadius"),
+    # Ragnarok Effect Generator : Thermal resistance bonus
+    46: ship(*_resonances("Thermal")),
+    # Ragnarok Effect Generator : Explosive resistance penaly
+    47: ship(*_resonances("Explosive")),
+    # Leviathan Effect Generator : Shield HP bonus
+    48: ship("shieldCapacity"),
+    # Leviathan Effect Generator : EM resistance bonus
+    49: ship(*_resonances("Em")),
+    # Leviathan Effect Generator : Kinetic resistance penalty
+    50: ship(*_resonances("Kinetic")),
+    # Avatar Effect Generator : Velocity penalty
+    51: ship("maxVelocity"),
+    # Erebus Effect Generator : Shield RR penalty
+    52: modulesWithSkill(("Shield Emission Systems",), "shieldBonus"),
+    # Leviathan Effect Generator : Armor RR penalty
+    53: modulesWithSkill(("Remote Armor Repair Systems",), "armorDamageAmount"),
+    # Ragnarok Effect Generator : Laser and Hybrid Optimal penalty
+    54: modulesInGroup(("Energy Weapon", "Hybrid Weapon"), "maxRange"),
+
+    # Localized environment effects
+
+    # AOE_Beacon_bioluminescence_cloud
+    79: ship("signatureRadius"),
+    # AOE_Beacon_caustic_cloud_local_repair
+    80: modulesWithSkill(("Repair Systems",), "armorDamageAmount"),
+    # AOE_Beacon_caustic_cloud_remote_repair
+    81: modulesWithSkill(("Remote Armor Repair Systems",), "armorDamageAmount"),
+    # AOE_Beacon_filament_cloud_shield_booster_shield_bonus
+    88: modulesWithSkill(("Shield Operation",), "shieldBonus"),
+    # AOE_Beacon_filament_cloud_shield_booster_duration
+    89: modulesWithSkill(("Shield Operation",), "duration"),
+
+    # Abyssal Weather Effects
+
+    # Weather_electric_storm_EM_resistance_penalty
+    90: ship(*_resonances("Em"), stacking=False),
+    # Weather_electric_storm_capacitor_recharge_bonus
+    92: ship("rechargeRate"),
+    # Weather_xenon_gas_explosive_resistance_penalty
+    93: ship(*_resonances("Explosive"), stacking=False),
+    # Weather_xenon_gas_shield_hp_bonus
+    94: ship("shieldCapacity", stacking=False),
+    # Weather_infernal_thermal_resistance_penalty
+    95: ship(*_resonances("Thermal"), stacking=False),
+    # Weather_infernal_armor_hp_bonus
+    96: ship("armorHP", stacking=False),
+    # Weather_darkness_turret_range_penalty
+    97: modulesWithSkill(("Gunnery",), "maxRange", "falloff"),
+    # Weather_darkness_velocity_bonus
+    98: ship("maxVelocity", stacking=False),
+    # Weather_caustic_toxin_kinetic_resistance_penalty
+    99: ship(*_resonances("Kinetic"), stacking=False),
+    # Weather_caustic_toxin_scan_resolution_bonus
+    100: ship("scanResolution"),
+}
+
+
+class CompiledBuffModifier(object):
+    """Buff modifier ready to be applied: operation resolved to method name and target to module filter"""
+
+    def __init__(self, modifier):
+        self.attribute = modifier.attribute
+        self.stacking = modifier.stacking
+        self.operation = modifier.operation
+        shipMethod, modulesMethod = OPERATIONS[modifier.operation]
+        kind = modifier.target[0]
+        if kind == SHIP:
+            self.method = shipMethod
+            self.filter = None
+        else:
+            self.method = modulesMethod
+            if kind == MODULE_SKILL:
+                self.filter = itemRequiresSkill(*modifier.target[1])
+            else:
+                self.filter = itemGroupIs(*modifier.target[1])
+
+    def apply(self, fit, value):
+        kwargs = {"stackingPenalties": True} if self.stacking else {}
+        if self.filter is None:
+            getattr(fit.ship, self.method)(self.attribute, value, **kwargs)
+        else:
+            getattr(fit.modules, self.method)(self.filter, self.attribute, value, **kwargs)
+
+
+def validateBuffs(buffs):
+    """Make sure every buff record is well-formed, raise ValueError otherwise"""
+    for buffID, modifiers in buffs.items():
+        if not isinstance(buffID, int):
+            raise ValueError("Warfare buff ID {!r} is not an integer".format(buffID))
+        if not modifiers:
+            raise ValueError("Warfare buff {} has no modifiers".format(buffID))
+        for modifier in modifiers:
+            if not isinstance(modifier, BuffModifier):
+                raise ValueError("Warfare buff {}: {!r} is not a BuffModifier".format(buffID, modifier))
+            target = modifier.target
+            if not target or target[0] not in (SHIP, MODULE_SKILL, MODULE_GROUP):
+                raise ValueError("Warfare buff {}: unknown target {!r}".format(buffID, target))
+            if target[0] == SHIP and len(target) != 1:
+                raise ValueError("Warfare buff {}: ship target takes no arguments".format(buffID))
+            if target[0] != SHIP and (len(target) != 2 or not target[1] or
+                                      not all(isinstance(name, str) for name in target[1])):
+                raise ValueError("Warfare buff {}: {} target needs skill or group names".format(buffID, target[0]))
+            if not isinstance(modifier.attribute, str) or not modifier.attribute:
+                raise ValueError("Warfare buff {}: bad attribute {!r}".format(buffID, modifier.attribute))
+            if modifier.operation not in OPERATIONS:
+                raise ValueError("Warfare buff {}: unknown operation {!r}".format(buffID, modifier.operation))
+            if modifier.stacking and modifier.operation not in STACKABLE_OPERATIONS:
+                raise ValueError("Warfare buff {}: {} cannot be stacking penalized".format(buffID, modifier.operation))
+
+
+def compileBuffs(buffs):
+    validateBuffs(buffs)
+    return {buffID: tuple(CompiledBuffModifier(m) for m in modifiers) for buffID, modifiers in buffs.items()}
+
+
+# Compiled once on import, so broken records are caught on startup rather than during calculation
+compiledBuffs = compileBuffs(WARFARE_BUFFS)
+
+
+def applyBuff(fit, warfareBuffID, value):
+    """Apply warfare buff to the fit, returns False if the buff is not known"""
+    modifiers = compiledBuffs.get(warfareBuffID)
+    if modifiers is None:
+        pyfalog.debug("Unknown warfare buff ID: {0}", warfareBuffID)
+        return False
+    for modifier in modifiers:
+        modifier.apply(fit, value)
+    return True
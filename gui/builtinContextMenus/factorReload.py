@@ -5,6 +5,7 @@ import gui.globalEvents as GE
 import gui.mainFrame
 from gui.contextMenu import ContextMenu
 from service.fit import Fit
+from service.fitStatsCache import FitStatsCache
 from service.settings import ContextMenuSettings
 
 
@@ -26,6 +27,7 @@ class FactorReload(ContextMenu):
     def activate(self, fullContext, selection, i):
         sFit = Fit.getInstance()
         sFit.serviceFittingOptions["useGlobalForceReload"] = not sFit.serviceFittingOptions["useGlobalForceReload"]
+        FitStatsCache.getInstance().clear()
         fitID = self.mainFrame.getActiveFit()
         sFit.refreshFit(fitID)
         wx.PostEvent(self.mainFrame, GE.FitChanged(fitID=fitID))
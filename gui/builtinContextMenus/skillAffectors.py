@@ -33,6 +33,17 @@ class ChangeAffectingSkills(ContextMenu):
         # if self.sChar.getCharName(self.charID) in ("All 0", "All 5"):
         #    return False
 
+        # Skills affecting the item are known only if afflictions were captured during calculation. If they
+        # weren't, show the item anyway and trace them when building the submenu, as tracing recalculates the fit
+        self.srcContext = srcContext
+        if not fit.afflictionsCaptured:
+            self.skills = None
+            return True
+
+        self.skills = self.__getSkills(srcContext, selection)
+        return len(self.skills) > 0
+
+    def __getSkills(self, srcContext, selection):
         if srcContext == "fittingShip":
             fitID = self.mainFrame.getActiveFit()
             sFit = Fit.getInstance()
@@ -57,12 +68,15 @@ class ChangeAffectingSkills(ContextMenu):
 
                     skills.add(afflictor)
 
-        self.skills = sorted(skills, key=lambda x: x.item.name)
-        return len(self.skills) > 0
+        return sorted(skills, key=lambda x: x.item.name)
 
     def getText(self, itmContext, selection):
         return "Change %s Skills" % itmContext
 
+    @property
+    def enabled(self):
+        return len(self.skills) > 0
+
     def addSkill(self, rootMenu, skill, i):
         if i < 0:
             label = "Not Learned"
@@ -78,6 +92,9 @@ class ChangeAffectingSkills(ContextMenu):
     def getSubMenu(self, context, selection, rootMenu, i, pitem):
         msw = True if "wxMSW" in wx.PlatformInfo else False
         self.skillIds = {}
+        if self.skills is None:
+            self.sFit.traceAfflictions(self.mainFrame.getActiveFit())
+            self.skills = self.__getSkills(self.srcContext, selection)
         sub = wx.Menu()
 
         for skill in self.skills:
@@ -0,0 +1,70 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+from gui.graph import Graph
+from eos.graph import Data
+
+
+class FitCapacitorGraph(Graph):
+    propertyLabelMap = {"time": "Time (seconds)"}
+
+    defaults = {"time": "0-300"}
+
+    # (time, cap) samples of the simulated timeline
+    samples = 500
+
+    def __init__(self):
+        Graph.__init__(self)
+        self.name = "Capacitor"
+
+    def getFields(self):
+        return self.defaults
+
+    def getLabels(self):
+        return self.propertyLabelMap
+
+    def getPoints(self, fit, fields):
+        data = Data("time", fields["time"])
+        if data.isConstant():
+            start, end = 0, data.data[0].value
+        elif len(data.data) == 1:
+            start, end = data.data[0].start, data.data[0].end
+        else:
+            return False, "Can only handle a single time range"
+
+        if end is None or start < 0 or end <= start:
+            return False, "Invalid time range"
+
+        # Fit keeps timelines until it's recalculated, redraws don't simulate again
+        timeline = fit.getCapTimeline(end, self.samples)
+        if timeline is None:
+            return False, "Capacitor timeline needs numpy"
+
+        x = []
+        y = []
+        for time, cap in zip(*timeline):
+            if time >= start:
+                x.append(time)
+                y.append(cap)
+
+        return x, y
+
+
+FitCapacitorGraph.register()
@@ -62,34 +62,20 @@ class FitDpsGraph(Graph):
 
         return icons
 
-    def getPoints(self, fit, fields):
+    def getGrid(self, fit, fields):
         fitDps = getattr(self, "fitDps", None)
         if fitDps is None or fitDps.fit != fit:
             fitDps = self.fitDps = FitDps(fit)
 
         fitDps.clearData()
-        variable = None
         for fieldName, value in fields.items():
-            d = Data(fieldName, value)
-            if not d.isConstant():
-                if variable is None:
-                    variable = fieldName
-                else:
-                    # We can't handle more then one variable atm, OOPS FUCK OUT
-                    return False, "Can only handle 1 variable"
+            fitDps.setData(Data(fieldName, value))
 
-            fitDps.setData(d)
-
-        if variable is None:
+        axes, values = fitDps.getGrid()
+        if not axes:
             return False, "No variable"
 
-        x = []
-        y = []
-        for point, val in fitDps.getIterator():
-            x.append(point[variable])
-            y.append(val)
-
-        return x, y
+        return axes, values
 
 
 FitDpsGraph.register()
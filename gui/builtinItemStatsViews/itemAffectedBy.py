@@ -13,6 +13,7 @@ from eos.saveddata.citadel import Citadel
 from eos.saveddata.fit import Fit
 
 import gui.mainFrame
+from service.fit import Fit as FitService
 from gui.contextMenu import ContextMenu
 from gui.bitmap_loader import BitmapLoader
 
@@ -32,6 +33,8 @@ class ItemAffectedBy(wx.Panel):
         self.expand = -1
 
         self.treeItems = []
+        # Tree is populated when the page is shown for the first time, see OnShown()
+        self.populated = False
 
         mainSizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -63,7 +66,6 @@ class ItemAffectedBy(wx.Panel):
 
         mainSizer.Add(bSizer, 0, wx.ALIGN_RIGHT)
         self.SetSizer(mainSizer)
-        self.PopulateTree()
         self.Layout()
         self.affectedBy.Bind(wx.EVT_CONTEXT_MENU, self.spawnMenu)
 
@@ -113,6 +115,10 @@ class ItemAffectedBy(wx.Panel):
 
         self.Thaw()
 
+    def OnShown(self):
+        if not self.populated:
+            self.UpdateTree()
+
     def UpdateTree(self):
         self.Freeze()
         self.affectedBy.DeleteAllItems()
@@ -135,6 +141,9 @@ class ItemAffectedBy(wx.Panel):
         event.Skip()
 
     def PopulateTree(self):
+        # Fits are calculated without "Affected By" information, get it now that somebody wants to see it
+        FitService.getInstance().traceAfflictions(self.activeFit)
+        self.populated = True
         # sheri was here
         del self.treeItems[:]
         root = self.affectedBy.AddRoot("WINPWNZ0R")
@@ -3,6 +3,7 @@ import logging
 import wx
 
 from service.fit import Fit
+from service.fitStatsCache import FitStatsCache
 from gui.bitmap_loader import BitmapLoader
 import gui.globalEvents as GE
 from gui.preferenceView import PreferenceView
@@ -62,6 +63,25 @@ class PFFittingEnginePref(PreferenceView):
                                                             wx.DefaultPosition, wx.DefaultSize, 0)
         mainSizer.Add(self.cbUniversalAdaptiveArmorHardener, 0, wx.ALL | wx.EXPAND, 5)
 
+        self.cbIncrementalCalc = wx.CheckBox(panel, wx.ID_ANY,
+                                             "Recalculate only what is affected when module states change (experimental)",
+                                             wx.DefaultPosition, wx.DefaultSize, 0)
+        self.cbIncrementalCalc.SetCursor(helpCursor)
+        self.cbIncrementalCalc.SetToolTip(wx.ToolTip(
+            'When enabled, pyfa tracks which attributes each fitted item affects and, when possible, re-runs only ' +
+            'the effects depending on a changed item instead of recalculating the whole fit. Fits with command or ' +
+            'projected fits, as well as changes of projected items and command bursts, are always recalculated fully'))
+        mainSizer.Add(self.cbIncrementalCalc, 0, wx.ALL | wx.EXPAND, 5)
+
+        self.cbAnalyticCapSim = wx.CheckBox(panel, wx.ID_ANY,
+                                            "Calculate stable capacitor level instead of simulating it (experimental)",
+                                            wx.DefaultPosition, wx.DefaultSize, 0)
+        self.cbAnalyticCapSim.SetCursor(helpCursor)
+        self.cbAnalyticCapSim.SetToolTip(wx.ToolTip(
+            'When enabled, capacitor stable level is calculated from average drain. Fits which use cap boosters, ' +
+            'factor in reloads or are not comfortably cap stable are still simulated'))
+        mainSizer.Add(self.cbAnalyticCapSim, 0, wx.ALL | wx.EXPAND, 5)
+
 
         spoolup_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
@@ -113,6 +133,12 @@ class PFFittingEnginePref(PreferenceView):
         self.cbUniversalAdaptiveArmorHardener.SetValue(self.engine_settings.get("useStaticAdaptiveArmorHardener"))
         self.cbUniversalAdaptiveArmorHardener.Bind(wx.EVT_CHECKBOX, self.OnCBUniversalAdaptiveArmorHardenerChange)
 
+        self.cbIncrementalCalc.SetValue(self.engine_settings.get("incrementalCalc"))
+        self.cbIncrementalCalc.Bind(wx.EVT_CHECKBOX, self.OnCBIncrementalCalcChange)
+
+        self.cbAnalyticCapSim.SetValue(self.engine_settings.get("analyticCapSim"))
+        self.cbAnalyticCapSim.Bind(wx.EVT_CHECKBOX, self.OnCBAnalyticCapSimChange)
+
         self.spoolup_value.SetValue(int(self.engine_settings.get("globalDefaultSpoolupPercentage") * 100))
         self.spoolup_value.Bind(wx.lib.intctrl.EVT_INT, self.OnSpoolupChange)
 
@@ -124,6 +150,7 @@ class PFFittingEnginePref(PreferenceView):
 
     def OnCBGlobalForceReloadStateChange(self, event):
         self.sFit.serviceFittingOptions["useGlobalForceReload"] = self.cbGlobalForceReload.GetValue()
+        FitStatsCache.getInstance().clear()
         fitID = self.mainFrame.getActiveFit()
         self.sFit.refreshFit(fitID)
         wx.PostEvent(self.mainFrame, GE.FitChanged(fitID=fitID))
@@ -134,6 +161,15 @@ class PFFittingEnginePref(PreferenceView):
     def OnCBUniversalAdaptiveArmorHardenerChange(self, event):
         self.engine_settings.set("useStaticAdaptiveArmorHardener", self.cbUniversalAdaptiveArmorHardener.GetValue())
 
+    def OnCBIncrementalCalcChange(self, event):
+        self.engine_settings.set("incrementalCalc", self.cbIncrementalCalc.GetValue())
+
+    def OnCBAnalyticCapSimChange(self, event):
+        self.engine_settings.set("analyticCapSim", self.cbAnalyticCapSim.GetValue())
+        fitID = self.mainFrame.getActiveFit()
+        self.sFit.refreshFit(fitID)
+        wx.PostEvent(self.mainFrame, GE.FitChanged(fitID=fitID))
+
     def getImage(self):
         return BitmapLoader.getBitmap("settings_fitting", "gui")
 
@@ -9,6 +9,7 @@ import gui.mainFrame
 import gui.globalEvents as GE
 from service.settings import SettingsProvider
 from service.fit import Fit
+from service.fitStatsCache import FitStatsCache
 from service.price import Price
 
 
@@ -150,6 +151,7 @@ class PFGeneralPref(PreferenceView):
 
     def OnCBGlobalDmgPatternStateChange(self, event):
         self.sFit.serviceFittingOptions["useGlobalDamagePattern"] = self.cbGlobalDmgPattern.GetValue()
+        FitStatsCache.getInstance().clear()
         event.Skip()
 
     def onCBCompactSkills(self, event):
@@ -100,6 +100,14 @@ class PFStatViewPref(PreferenceView):
         rbSizerRow3.Add(self.rbOutgoing, 1, wx.TOP | wx.RIGHT, 5)
         self.rbOutgoing.Bind(wx.EVT_RADIOBOX, self.OnOutgoingChange)
 
+        self.rbDamagePatterns = wx.RadioBox(panel, -1, "EHP vs. Damage Patterns", wx.DefaultPosition, wx.DefaultSize,
+                                            ['None', 'Minimal', 'Full'], 1, wx.RA_SPECIFY_COLS)
+        # Disable minimal as we don't have a view for this yet
+        self.rbDamagePatterns.EnableItem(1, False)
+        self.rbDamagePatterns.SetSelection(self.settings.get('damagePatterns'))
+        rbSizerRow3.Add(self.rbDamagePatterns, 1, wx.TOP | wx.RIGHT, 5)
+        self.rbDamagePatterns.Bind(wx.EVT_RADIOBOX, self.OnDamagePatternsChange)
+
         mainSizer.Add(rbSizerRow3, 1, wx.ALL | wx.EXPAND, 0)
 
         panel.SetSizer(mainSizer)
@@ -111,6 +119,9 @@ class PFStatViewPref(PreferenceView):
     def OnResistancesChange(self, event):
         self.settings.set('resistances', event.GetInt())
 
+    def OnDamagePatternsChange(self, event):
+        self.settings.set('damagePatterns', event.GetInt())
+
     def OnRechargeChange(self, event):
         self.settings.set('recharge', event.GetInt())
 
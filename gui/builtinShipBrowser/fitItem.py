@@ -16,6 +16,7 @@ import gui.utils.fonts as fonts
 from gui.bitmap_loader import BitmapLoader
 from gui.builtinShipBrowser.events import EVT_FIT_RENAMED
 from gui.builtinShipBrowser.pfBitmapFrame import PFBitmapFrame
+from gui.utils.numberFormatter import formatAmount
 from service.fit import Fit
 from .events import BoosterListUpdated, FitRemoved, FitSelected, ImportSelected, SearchSelected, Stage3Selected
 
@@ -24,7 +25,7 @@ pyfalog = Logger(__name__)
 
 class FitItem(SFItem.SFBrowserItem):
     def __init__(self, parent, fitID=None, shipFittingInfo=("Test", "TestTrait", "cnc's avatar", 0, 0, None), shipID=None,
-                 itemData=None, graphicID=None,
+                 itemData=None, graphicID=None, fitStats=None,
                  id=wx.ID_ANY, pos=wx.DefaultPosition,
                  size=(0, 40), style=0):
 
@@ -43,6 +44,9 @@ class FitItem(SFItem.SFBrowserItem):
 
         self.fitID = fitID
 
+        # Stored FitStats, if there are any
+        self.fitStats = fitStats
+
         self.shipID = shipID
 
         self.shipBrowser = self.Parent.Parent
@@ -161,7 +165,16 @@ class FitItem(SFItem.SFBrowserItem):
             notes = ""
             if self.notes:
                 notes = '─' * 20 + "\nNotes: {}\n".format(self.notes[:197] + '...' if len(self.notes) > 200 else self.notes)
-            self.SetToolTip(wx.ToolTip('{}\n{}{}\n{}'.format(self.shipName, notes, '─' * 20, self.shipTrait)))
+            stats = ""
+            if self.fitStats is not None:
+                stats = '─' * 20 + "\nDPS: {}, EHP: {}\n".format(
+                    formatAmount(self.fitStats.totalDps[0].total, 3, 0, 9),
+                    formatAmount(sum(self.fitStats.ehp.values()) if self.fitStats.ehp else 0, 3, 0, 9))
+            self.SetToolTip(wx.ToolTip('{}\n{}{}{}\n{}'.format(self.shipName, notes, stats, '─' * 20, self.shipTrait)))
+
+    def setFitStats(self, fitStats):
+        self.fitStats = fitStats
+        self.__setToolTip()
 
     def OnKeyUp(self, event):
         if event.GetKeyCode() in (32, 13):  # space and enter
@@ -109,13 +109,14 @@ class CapacitorViewFull(StatsView):
 
     def refreshPanel(self, fit):
         # If we did anything intresting, we'd update our labels to reflect the new fit's stats here
+        fitStats = fit.getStats() if fit is not None else None
         stats = (
-            ("label%sCapacitorCapacity", lambda: fit.ship.getModifiedItemAttr("capacitorCapacity"), 3, 0, 9),
-            ("label%sCapacitorRecharge", lambda: fit.capRecharge, 3, 0, 0),
-            ("label%sCapacitorDischarge", lambda: fit.capUsed, 3, 0, 0),
+            ("label%sCapacitorCapacity", lambda: fitStats.getShipAttr("capacitorCapacity"), 3, 0, 9),
+            ("label%sCapacitorRecharge", lambda: fitStats.capRecharge, 3, 0, 0),
+            ("label%sCapacitorDischarge", lambda: fitStats.capUsed, 3, 0, 0),
         )
         if fit:
-            neut_resist = fit.ship.getModifiedItemAttr("energyWarfareResistance", 0)
+            neut_resist = fitStats.getShipAttr("energyWarfareResistance", 0)
         else:
             neut_resist = 0
 
@@ -137,8 +138,8 @@ class CapacitorViewFull(StatsView):
                 label_tooltip = "Neut Resistance: {0:.0f}%".format(neut_resist)
                 label.SetToolTip(wx.ToolTip(label_tooltip))
 
-        capState = fit.capState if fit is not None else 0
-        capStable = fit.capStable if fit is not None else False
+        capState = fitStats.capState if fit is not None else 0
+        capStable = fitStats.capStable if fit is not None else False
         lblNameTime = "label%sCapacitorTime"
         lblNameState = "label%sCapacitorState"
         if isinstance(capState, tuple) and len(capState) >= 2:
@@ -0,0 +1,91 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+# noinspection PyPackageRequirements
+import wx
+
+from gui.statsView import StatsView
+from gui.utils.numberFormatter import formatAmount
+from service.damagePattern import DamagePattern
+
+
+class DamagePatternsViewFull(StatsView):
+    name = "damagePatternsViewFull"
+
+    def __init__(self, parent):
+        StatsView.__init__(self)
+        self.parent = parent
+        self._cachedValues = {}
+        self._patternNames = None
+
+    def getHeaderText(self, fit):
+        return "EHP vs. Damage Patterns"
+
+    def populatePanel(self, contentPanel, headerPanel):
+        contentSizer = contentPanel.GetSizer()
+        self.panel = contentPanel
+        self.headerPanel = headerPanel
+
+        self.sizerPatterns = wx.FlexGridSizer(0, 5, 0, 10)
+        self.sizerPatterns.AddGrowableCol(0)
+        contentSizer.Add(self.sizerPatterns, 0, wx.EXPAND, 0)
+
+    def buildRows(self, patternNames):
+        parent = self.panel
+        self.sizerPatterns.Clear(True)
+        self._cachedValues = {}
+        self.labels = []
+        for text in ("Pattern", "Shield", "Armor", "Hull", "Total"):
+            self.sizerPatterns.Add(wx.StaticText(parent, wx.ID_ANY, text), 0, wx.ALIGN_LEFT)
+        for name in patternNames:
+            self.sizerPatterns.Add(wx.StaticText(parent, wx.ID_ANY, name), 0, wx.ALIGN_LEFT)
+            rowLabels = []
+            for _ in range(4):
+                label = wx.StaticText(parent, wx.ID_ANY, "0")
+                self.sizerPatterns.Add(label, 0, wx.ALIGN_RIGHT)
+                rowLabels.append(label)
+            self.labels.append(rowLabels)
+        self._patternNames = patternNames
+
+    def refreshPanel(self, fit):
+        # If we did anything intresting, we'd update our labels to reflect the new fit's stats here
+        patterns = [None] + sorted(DamagePattern.getInstance().getDamagePatternList(), key=lambda p: p.name)
+        patternNames = ["Raw HP"] + [pattern.name for pattern in patterns[1:]]
+        if patternNames != self._patternNames:
+            self.buildRows(patternNames)
+
+        patternEhp = fit.getEhpAgainstPatterns(patterns) if fit is not None else None
+
+        for index, rowLabels in enumerate(self.labels):
+            ehp = patternEhp.getEhp(index) if patternEhp is not None else {}
+            values = [ehp.get(tankType, 0) for tankType in ("shield", "armor", "hull")]
+            values.append(sum(values))
+            for column, (label, value) in enumerate(zip(rowLabels, values)):
+                if self._cachedValues.get((index, column)) == value:
+                    continue
+                label.SetLabel(formatAmount(value, 3, 0, 9))
+                label.SetToolTip(wx.ToolTip("{:,.0f}".format(value)))
+                self._cachedValues[(index, column)] = value
+
+        self.panel.Layout()
+        self.headerPanel.Layout()
+
+
+DamagePatternsViewFull.register()
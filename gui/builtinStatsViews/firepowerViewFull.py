@@ -23,9 +23,7 @@ import gui.mainFrame
 from gui.statsView import StatsView
 from gui.bitmap_loader import BitmapLoader
 from gui.utils.numberFormatter import formatAmount, roundToPrec
-from eos.utils.spoolSupport import SpoolType, SpoolOptions
 from service.fit import Fit
-import eos.config
 
 class FirepowerViewFull(StatsView):
     name = "firepowerViewFull"
@@ -54,7 +52,7 @@ class FirepowerViewFull(StatsView):
 
         panel = "full"
 
-        sizerFirepower = wx.FlexGridSizer(1, 4, 0, 0)
+        sizerFirepower = wx.FlexGridSizer(1, 5, 0, 0)
         sizerFirepower.AddGrowableCol(1)
 
         contentSizer.Add(sizerFirepower, 0, wx.EXPAND, 0)
@@ -113,9 +111,21 @@ class FirepowerViewFull(StatsView):
         self.miningyield.Bind(wx.EVT_BUTTON, self.switchToMiningYieldView)
         sizerFirepower.Add(self.miningyield, 0, wx.ALIGN_LEFT)
 
+        image = BitmapLoader.getBitmap("damagePattern_small", "gui")
+        self.targetProfiles = wx.BitmapButton(contentPanel, -1, image)
+        self.targetProfiles.SetToolTip(wx.ToolTip("Click to toggle to Firepower vs. Target Profiles"))
+        self.targetProfiles.Bind(wx.EVT_BUTTON, self.switchToTargetProfilesView)
+        sizerFirepower.Add(self.targetProfiles, 0, wx.ALIGN_LEFT)
+
         self._cachedValues.append(0)
 
     def switchToMiningYieldView(self, event):
+        self.switchToView("miningyieldViewFull")
+
+    def switchToTargetProfilesView(self, event):
+        self.switchToView("targetProfilesViewFull")
+
+    def switchToView(self, viewName):
         # Getting the active fit
         mainFrame = gui.mainFrame.MainFrame.getInstance()
         sFit = Fit.getInstance()
@@ -133,7 +143,7 @@ class FirepowerViewFull(StatsView):
         # self.stEff.Destroy()
 
         # Get the new view
-        view = StatsView.getView("miningyieldViewFull")(self.parent)
+        view = StatsView.getView(viewName)(self.parent)
         view.populatePanel(self.panel, self.headerPanel)
         # Populate us in statsPane's view list
         self.parent.views.append(view)
@@ -157,31 +167,31 @@ class FirepowerViewFull(StatsView):
                     formatAmount(preSpool, prec, lowest, highest),
                     formatAmount(fullSpool, prec, lowest, highest))
 
-        defaultSpoolValue = eos.config.settings['globalDefaultSpoolupPercentage']
+        fitStats = fit.getStats() if fit is not None else None
         stats = (
             (
                 "labelFullDpsWeapon",
-                lambda: fit.getWeaponDps(spoolOptions=SpoolOptions(SpoolType.SCALE, defaultSpoolValue, False)).total,
-                lambda: fit.getWeaponDps(spoolOptions=SpoolOptions(SpoolType.SCALE, 0, True)).total,
-                lambda: fit.getWeaponDps(spoolOptions=SpoolOptions(SpoolType.SCALE, 1, True)).total,
+                lambda: fitStats.weaponDps[0].total,
+                lambda: fitStats.weaponDps[1].total,
+                lambda: fitStats.weaponDps[2].total,
                 3, 0, 0, "{}{} DPS"),
             (
                 "labelFullDpsDrone",
-                lambda: fit.getDroneDps().total,
-                lambda: fit.getDroneDps().total,
-                lambda: fit.getDroneDps().total,
+                lambda: fitStats.droneDps.total,
+                lambda: fitStats.droneDps.total,
+                lambda: fitStats.droneDps.total,
                 3, 0, 0, "{}{} DPS"),
             (
                 "labelFullVolleyTotal",
-                lambda: fit.getTotalVolley(spoolOptions=SpoolOptions(SpoolType.SCALE, defaultSpoolValue, False)).total,
-                lambda: fit.getTotalVolley(spoolOptions=SpoolOptions(SpoolType.SCALE, 0, True)).total,
-                lambda: fit.getTotalVolley(spoolOptions=SpoolOptions(SpoolType.SCALE, 1, True)).total,
+                lambda: fitStats.totalVolley[0].total,
+                lambda: fitStats.totalVolley[1].total,
+                lambda: fitStats.totalVolley[2].total,
                 3, 0, 0, "{}{}"),
             (
                 "labelFullDpsTotal",
-                lambda: fit.getTotalDps(spoolOptions=SpoolOptions(SpoolType.SCALE, defaultSpoolValue, False)).total,
-                lambda: fit.getTotalDps(spoolOptions=SpoolOptions(SpoolType.SCALE, 0, True)).total,
-                lambda: fit.getTotalDps(spoolOptions=SpoolOptions(SpoolType.SCALE, 1, True)).total,
+                lambda: fitStats.totalDps[0].total,
+                lambda: fitStats.totalDps[1].total,
+                lambda: fitStats.totalDps[2].total,
                 3, 0, 0, "{}{}"))
 
         counter = 0
@@ -129,9 +129,10 @@ class MiningYieldViewFull(StatsView):
     def refreshPanel(self, fit):
         # If we did anything intresting, we'd update our labels to reflect the new fit's stats here
 
-        stats = (("labelFullminingyieldMiner", lambda: fit.minerYield, 3, 0, 0, "%s m\u00B3/s", None),
-                 ("labelFullminingyieldDrone", lambda: fit.droneYield, 3, 0, 0, "%s m\u00B3/s", None),
-                 ("labelFullminingyieldTotal", lambda: fit.totalYield, 3, 0, 0, "%s m\u00B3/s", None))
+        fitStats = fit.getStats() if fit is not None else None
+        stats = (("labelFullminingyieldMiner", lambda: fitStats.minerYield, 3, 0, 0, "%s m\u00B3/s", None),
+                 ("labelFullminingyieldDrone", lambda: fitStats.droneYield, 3, 0, 0, "%s m\u00B3/s", None),
+                 ("labelFullminingyieldTotal", lambda: fitStats.totalYield, 3, 0, 0, "%s m\u00B3/s", None))
 
         counter = 0
         for labelName, value, prec, lowest, highest, valueFormat, altFormat in stats:
@@ -22,34 +22,32 @@ import wx
 from gui.statsView import StatsView
 from gui.bitmap_loader import BitmapLoader
 from gui.utils.numberFormatter import formatAmount, roundToPrec
-from eos.utils.spoolSupport import SpoolType, SpoolOptions
-import eos.config
 
 
 stats = [
     (
         "labelRemoteCapacitor", "Capacitor:", "{}{} GJ/s", "capacitorInfo", "Capacitor restored",
-        lambda fit, spool: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, spool, False)).get("Capacitor", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 0, True)).get("Capacitor", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 1, True)).get("Capacitor", 0),
+        lambda fitStats: fitStats.remoteReps[0].get("Capacitor", 0),
+        lambda fitStats: fitStats.remoteReps[1].get("Capacitor", 0),
+        lambda fitStats: fitStats.remoteReps[2].get("Capacitor", 0),
         3, 0, 0),
     (
         "labelRemoteShield", "Shield:", "{}{} HP/s", "shieldActive", "Shield restored",
-        lambda fit, spool: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, spool, False)).get("Shield", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 0, True)).get("Shield", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 1, True)).get("Shield", 0),
+        lambda fitStats: fitStats.remoteReps[0].get("Shield", 0),
+        lambda fitStats: fitStats.remoteReps[1].get("Shield", 0),
+        lambda fitStats: fitStats.remoteReps[2].get("Shield", 0),
         3, 0, 0),
     (
         "labelRemoteArmor", "Armor:", "{}{} HP/s", "armorActive", "Armor restored",
-        lambda fit, spool: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, spool, False)).get("Armor", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 0, True)).get("Armor", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 1, True)).get("Armor", 0),
+        lambda fitStats: fitStats.remoteReps[0].get("Armor", 0),
+        lambda fitStats: fitStats.remoteReps[1].get("Armor", 0),
+        lambda fitStats: fitStats.remoteReps[2].get("Armor", 0),
         3, 0, 0),
     (
         "labelRemoteHull", "Hull:", "{}{} HP/s", "hullActive", "Hull restored",
-        lambda fit, spool: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, spool, False)).get("Hull", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 0, True)).get("Hull", 0),
-        lambda fit: fit.getRemoteReps(spoolOptions=SpoolOptions(SpoolType.SCALE, 1, True)).get("Hull", 0),
+        lambda fitStats: fitStats.remoteReps[0].get("Hull", 0),
+        lambda fitStats: fitStats.remoteReps[1].get("Hull", 0),
+        lambda fitStats: fitStats.remoteReps[2].get("Hull", 0),
         3, 0, 0)]
 
 
@@ -102,13 +100,13 @@ class OutgoingViewFull(StatsView):
                     formatAmount(preSpool, prec, lowest, highest),
                     formatAmount(fullSpool, prec, lowest, highest))
 
-        defaultSpoolValue = eos.config.settings['globalDefaultSpoolupPercentage']
+        fitStats = fit.getStats() if fit is not None else None
         counter = 0
         for labelName, labelDesc, valueFormat, image, tooltip, val, preSpoolVal, fullSpoolVal, prec, lowest, highest in stats:
             label = getattr(self, labelName)
-            val = val(fit, defaultSpoolValue) if fit is not None else 0
-            preSpoolVal = preSpoolVal(fit) if fit is not None else 0
-            fullSpoolVal = fullSpoolVal(fit) if fit is not None else 0
+            val = val(fitStats) if fit is not None else 0
+            preSpoolVal = preSpoolVal(fitStats) if fit is not None else 0
+            fullSpoolVal = fullSpoolVal(fitStats) if fit is not None else 0
             if self._cachedValues[counter] != val:
                 hasSpool, tooltipText = formatTooltip(tooltip, preSpoolVal, fullSpoolVal, prec, lowest, highest)
                 label.SetLabel(valueFormat.format(
@@ -105,12 +105,13 @@ class RechargeViewFull(StatsView):
         # If we did anything interesting, we'd update our labels to reflect the new fit's stats here
 
         unit = " EHP/s" if self.parent.nameViewMap['resistancesViewFull'].showEffective else " HP/s"
+        fitStats = fit.getStats() if fit is not None else None
 
         for stability in ("reinforced", "sustained"):
             if stability == "reinforced" and fit is not None:
-                tank = fit.effectiveTank if self.effective else fit.tank
+                tank = fitStats.effectiveTank if self.effective else fitStats.tank
             elif stability == "sustained" and fit is not None:
-                tank = fit.effectiveSustainableTank if self.effective else fit.sustainableTank
+                tank = fitStats.effectiveSustainableTank if self.effective else fitStats.sustainableTank
             else:
                 tank = None
 
@@ -139,7 +140,7 @@ class RechargeViewFull(StatsView):
 
         if fit is not None:
             label = getattr(self, "labelTankSustainedShieldPassive")
-            value = fit.effectiveTank["passiveShield"] if self.effective else fit.tank["passiveShield"]
+            value = fitStats.effectiveTank["passiveShield"] if self.effective else fitStats.tank["passiveShield"]
             label.SetLabel(formatAmount(value, 3, 0, 9))
             unitlbl = getattr(self, "unitLabelTankSustainedShieldPassive")
             unitlbl.SetLabel(unit)
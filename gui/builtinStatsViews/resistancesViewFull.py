@@ -175,14 +175,12 @@ class ResistancesViewFull(StatsView):
 
         self.stEHPs.SetLabel("EHP" if self.showEffective else "HP")
         self.activeFit = fit.ID if fit is not None else None
+        fitStats = fit.getStats() if fit is not None else None
 
         for tankType in ("shield", "armor", "hull"):
             for damageType in ("em", "thermal", "kinetic", "explosive"):
                 if fit is not None:
-                    resonanceType = tankType if tankType != "hull" else ""
-                    resonance = "%s%sDamageResonance" % (resonanceType, damageType.capitalize())
-                    resonance = resonance[0].lower() + resonance[1:]
-                    resonance = (1 - fit.ship.getModifiedItemAttr(resonance)) * 100
+                    resonance = (1 - fitStats.resonances[tankType][damageType]) * 100
                 else:
                     resonance = 0
 
@@ -190,13 +188,13 @@ class ResistancesViewFull(StatsView):
 
                 lbl.SetValue(resonance)
 
-        ehp = (fit.ehp if self.showEffective else fit.hp) if fit is not None else None
+        ehp = (fitStats.ehp if self.showEffective else fitStats.hp) if fit is not None else None
         total = 0
         for tankType in ("shield", "armor", "hull"):
             lbl = getattr(self, "labelResistance%sEhp" % tankType.capitalize())
             if ehp is not None:
                 total += ehp[tankType]
-                rrFactor = fit.ehp[tankType] / fit.hp[tankType]
+                rrFactor = fitStats.ehp[tankType] / fitStats.hp[tankType]
                 lbl.SetLabel(formatAmount(ehp[tankType], 3, 0, 9))
                 lbl.SetToolTip(
                     wx.ToolTip("%s: %d\nResist Multiplier: x%.2f" % (tankType.capitalize(), ehp[tankType], rrFactor)))
@@ -26,7 +26,6 @@ import gui.mainFrame
 from gui.chrome_tabs import EVT_NOTEBOOK_PAGE_CHANGED
 from gui.utils import fonts
 
-from eos.const import FittingHardpoint
 
 from gui.utils.numberFormatter import formatAmount
 
@@ -195,29 +194,30 @@ class ResourcesViewFull(StatsView):
     def refreshPanel(self, fit):
         # If we did anything intresting, we'd update our labels to reflect the new fit's stats here
 
+        fitStats = fit.getStats() if fit is not None else None
         stats = (
-            ("label%sUsedTurretHardpoints", lambda: fit.getHardpointsUsed(FittingHardpoint.TURRET), 0, 0, 0),
-            ("label%sTotalTurretHardpoints", lambda: fit.ship.getModifiedItemAttr('turretSlotsLeft'), 0, 0, 0),
-            ("label%sUsedLauncherHardpoints", lambda: fit.getHardpointsUsed(FittingHardpoint.MISSILE), 0, 0, 0),
-            ("label%sTotalLauncherHardpoints", lambda: fit.ship.getModifiedItemAttr('launcherSlotsLeft'), 0, 0, 0),
-            ("label%sUsedDronesActive", lambda: fit.activeDrones, 0, 0, 0),
-            ("label%sTotalDronesActive", lambda: fit.extraAttributes["maxActiveDrones"], 0, 0, 0),
-            ("label%sUsedFighterTubes", lambda: fit.fighterTubesUsed, 3, 0, 9),
-            ("label%sTotalFighterTubes", lambda: fit.fighterTubesTotal, 3, 0, 9),
-            ("label%sUsedCalibrationPoints", lambda: fit.calibrationUsed, 0, 0, 0),
-            ("label%sTotalCalibrationPoints", lambda: fit.ship.getModifiedItemAttr('upgradeCapacity'), 0, 0, 0),
-            ("label%sUsedPg", lambda: fit.pgUsed, 4, 0, 9),
-            ("label%sUsedCpu", lambda: fit.cpuUsed, 4, 0, 9),
-            ("label%sTotalPg", lambda: fit.ship.getModifiedItemAttr("powerOutput"), 4, 0, 9),
-            ("label%sTotalCpu", lambda: fit.ship.getModifiedItemAttr("cpuOutput"), 4, 0, 9),
-            ("label%sUsedDroneBay", lambda: fit.droneBayUsed, 3, 0, 9),
-            ("label%sUsedFighterBay", lambda: fit.fighterBayUsed, 3, 0, 9),
-            ("label%sUsedDroneBandwidth", lambda: fit.droneBandwidthUsed, 3, 0, 9),
-            ("label%sTotalDroneBay", lambda: fit.ship.getModifiedItemAttr("droneCapacity"), 3, 0, 9),
-            ("label%sTotalDroneBandwidth", lambda: fit.ship.getModifiedItemAttr("droneBandwidth"), 3, 0, 9),
-            ("label%sTotalFighterBay", lambda: fit.ship.getModifiedItemAttr("fighterCapacity"), 3, 0, 9),
-            ("label%sUsedCargoBay", lambda: fit.cargoBayUsed, 3, 0, 9),
-            ("label%sTotalCargoBay", lambda: fit.ship.getModifiedItemAttr("capacity"), 3, 0, 9),
+            ("label%sUsedTurretHardpoints", lambda: fitStats.turretHardpointsUsed, 0, 0, 0),
+            ("label%sTotalTurretHardpoints", lambda: fitStats.getShipAttr("turretSlotsLeft"), 0, 0, 0),
+            ("label%sUsedLauncherHardpoints", lambda: fitStats.launcherHardpointsUsed, 0, 0, 0),
+            ("label%sTotalLauncherHardpoints", lambda: fitStats.getShipAttr("launcherSlotsLeft"), 0, 0, 0),
+            ("label%sUsedDronesActive", lambda: fitStats.activeDrones, 0, 0, 0),
+            ("label%sTotalDronesActive", lambda: fitStats.maxActiveDrones, 0, 0, 0),
+            ("label%sUsedFighterTubes", lambda: fitStats.fighterTubesUsed, 3, 0, 9),
+            ("label%sTotalFighterTubes", lambda: fitStats.fighterTubesTotal, 3, 0, 9),
+            ("label%sUsedCalibrationPoints", lambda: fitStats.calibrationUsed, 0, 0, 0),
+            ("label%sTotalCalibrationPoints", lambda: fitStats.getShipAttr("upgradeCapacity"), 0, 0, 0),
+            ("label%sUsedPg", lambda: fitStats.pgUsed, 4, 0, 9),
+            ("label%sUsedCpu", lambda: fitStats.cpuUsed, 4, 0, 9),
+            ("label%sTotalPg", lambda: fitStats.getShipAttr("powerOutput"), 4, 0, 9),
+            ("label%sTotalCpu", lambda: fitStats.getShipAttr("cpuOutput"), 4, 0, 9),
+            ("label%sUsedDroneBay", lambda: fitStats.droneBayUsed, 3, 0, 9),
+            ("label%sUsedFighterBay", lambda: fitStats.fighterBayUsed, 3, 0, 9),
+            ("label%sUsedDroneBandwidth", lambda: fitStats.droneBandwidthUsed, 3, 0, 9),
+            ("label%sTotalDroneBay", lambda: fitStats.getShipAttr("droneCapacity"), 3, 0, 9),
+            ("label%sTotalDroneBandwidth", lambda: fitStats.getShipAttr("droneBandwidth"), 3, 0, 9),
+            ("label%sTotalFighterBay", lambda: fitStats.getShipAttr("fighterCapacity"), 3, 0, 9),
+            ("label%sUsedCargoBay", lambda: fitStats.cargoBayUsed, 3, 0, 9),
+            ("label%sTotalCargoBay", lambda: fitStats.getShipAttr("capacity"), 3, 0, 9),
         )
         panel = "Full"
 
@@ -324,12 +324,12 @@ class ResourcesViewFull(StatsView):
 
         if fit is not None:
             resMax = (
-                lambda: fit.ship.getModifiedItemAttr("cpuOutput"),
-                lambda: fit.ship.getModifiedItemAttr("powerOutput"),
-                lambda: fit.ship.getModifiedItemAttr("droneCapacity"),
-                lambda: fit.ship.getModifiedItemAttr("fighterCapacity"),
-                lambda: fit.ship.getModifiedItemAttr("droneBandwidth"),
-                lambda: fit.ship.getModifiedItemAttr("capacity"),
+                lambda: fitStats.getShipAttr("cpuOutput"),
+                lambda: fitStats.getShipAttr("powerOutput"),
+                lambda: fitStats.getShipAttr("droneCapacity"),
+                lambda: fitStats.getShipAttr("fighterCapacity"),
+                lambda: fitStats.getShipAttr("droneBandwidth"),
+                lambda: fitStats.getShipAttr("capacity"),
             )
         else:
             resMax = None
@@ -340,7 +340,7 @@ class ResourcesViewFull(StatsView):
                 capitalizedType = resourceType[0].capitalize() + resourceType[1:]
 
                 gauge = getattr(self, "gauge%s%s" % (panel, capitalizedType))
-                resUsed = getattr(fit, "%sUsed" % resourceType)
+                resUsed = getattr(fitStats, "%sUsed" % resourceType)
 
                 gauge.SetValueRange(resUsed or 0, resMax[i]() or 0)
 
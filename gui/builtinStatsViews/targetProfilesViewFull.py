@@ -0,0 +1,136 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+
+# noinspection PyPackageRequirements
+import wx
+
+import eos.config
+import gui.mainFrame
+from eos.utils.spoolSupport import SpoolType, SpoolOptions
+from gui.statsView import StatsView
+from gui.bitmap_loader import BitmapLoader
+from gui.utils.numberFormatter import formatAmount, roundToPrec
+from service.fit import Fit
+from service.targetResists import TargetResists
+
+
+class TargetProfilesViewFull(StatsView):
+    name = "targetProfilesViewFull"
+
+    def __init__(self, parent):
+        StatsView.__init__(self)
+        self.parent = parent
+        self._cachedValues = {}
+        self._profileNames = None
+
+    def getHeaderText(self, fit):
+        return "Firepower vs. Target Profiles"
+
+    def populatePanel(self, contentPanel, headerPanel):
+        contentSizer = contentPanel.GetSizer()
+        self.panel = contentPanel
+        self.headerPanel = headerPanel
+
+        mainSizer = wx.BoxSizer(wx.HORIZONTAL)
+        contentSizer.Add(mainSizer, 0, wx.EXPAND, 0)
+
+        self.sizerProfiles = wx.FlexGridSizer(0, 3, 0, 10)
+        self.sizerProfiles.AddGrowableCol(0)
+        mainSizer.Add(self.sizerProfiles, 1, wx.EXPAND)
+
+        image = BitmapLoader.getBitmap("turret_small", "gui")
+        firepower = wx.BitmapButton(contentPanel, -1, image)
+        firepower.SetToolTip(wx.ToolTip("Click to toggle to Firepower View"))
+        firepower.Bind(wx.EVT_BUTTON, self.switchToFirepowerView)
+        mainSizer.Add(firepower, 0, wx.ALIGN_TOP | wx.LEFT, 5)
+
+    def switchToFirepowerView(self, event):
+        # Getting the active fit
+        mainFrame = gui.mainFrame.MainFrame.getInstance()
+        sFit = Fit.getInstance()
+        fit = sFit.getFit(mainFrame.getActiveFit())
+        # Remove ourselves from statsPane's view list
+        self.parent.views.remove(self)
+        self._cachedValues = {}
+        # And no longer display us
+        self.panel.GetSizer().Clear(True)
+        self.panel.GetSizer().Layout()
+        # Get the new view
+        view = StatsView.getView("firepowerViewFull")(self.parent)
+        view.populatePanel(self.panel, self.headerPanel)
+        # Populate us in statsPane's view list
+        self.parent.views.append(view)
+        # Get the TogglePanel
+        tp = self.panel.GetParent()
+        tp.SetLabel(view.getHeaderText(fit))
+        view.refreshPanel(fit)
+
+    def buildRows(self, profileNames):
+        parent = self.panel
+        self.sizerProfiles.Clear(True)
+        self._cachedValues = {}
+        self.labels = []
+        for text in ("Profile", "DPS", "Volley"):
+            self.sizerProfiles.Add(wx.StaticText(parent, wx.ID_ANY, text), 0, wx.ALIGN_LEFT)
+        for name in profileNames:
+            self.sizerProfiles.Add(wx.StaticText(parent, wx.ID_ANY, name), 0, wx.ALIGN_LEFT)
+            dpsLabel = wx.StaticText(parent, wx.ID_ANY, "0.0")
+            volleyLabel = wx.StaticText(parent, wx.ID_ANY, "0.0")
+            self.sizerProfiles.Add(dpsLabel, 0, wx.ALIGN_RIGHT)
+            self.sizerProfiles.Add(volleyLabel, 0, wx.ALIGN_RIGHT)
+            self.labels.append((dpsLabel, volleyLabel))
+        self._profileNames = profileNames
+
+    def refreshPanel(self, fit):
+        # If we did anything intresting, we'd update our labels to reflect the new fit's stats here
+        profiles = [None] + sorted(TargetResists.getInstance().getTargetResistsList(), key=lambda p: p.name)
+        profileNames = ["No resists"] + [profile.name for profile in profiles[1:]]
+        if profileNames != self._profileNames:
+            self.buildRows(profileNames)
+
+        spoolOptions = (
+            SpoolOptions(SpoolType.SCALE, eos.config.settings["globalDefaultSpoolupPercentage"], False),
+            SpoolOptions(SpoolType.SCALE, 0, True),
+            SpoolOptions(SpoolType.SCALE, 1, True))
+        profileDmg = fit.getDmgAgainstProfiles(profiles, spoolOptions) if fit is not None else None
+
+        for index, (dpsLabel, volleyLabel) in enumerate(self.labels):
+            for label, getter in ((dpsLabel, "getDps"), (volleyLabel, "getVolley")):
+                if profileDmg is not None:
+                    value, preSpool, fullSpool = (
+                        getattr(profileDmg, getter)(index, spoolIndex).total for spoolIndex in range(3))
+                else:
+                    value = preSpool = fullSpool = 0
+                if self._cachedValues.get((index, getter)) == value:
+                    continue
+                if roundToPrec(preSpool, 3) == roundToPrec(fullSpool, 3):
+                    tooltipText = ""
+                else:
+                    tooltipText = "Spool up: {}-{}".format(formatAmount(preSpool, 3, 0, 0),
+                                                          formatAmount(fullSpool, 3, 0, 0))
+                label.SetLabel("{}{}".format(formatAmount(value, 3, 0, 0), "\u02e2" if tooltipText else ""))
+                label.SetToolTip(wx.ToolTip(tooltipText))
+                self._cachedValues[(index, getter)] = value
+
+        self.panel.Layout()
+        self.headerPanel.Layout()
+
+
+TargetProfilesViewFull.register()
@@ -99,6 +99,7 @@ class TargetingMiscViewMinimal(StatsView):
 
     def refreshPanel(self, fit):
         # If we did anything interesting, we'd update our labels to reflect the new fit's stats here
+        fitStats = fit.getStats() if fit is not None else None
 
         cargoNamesOrder = OrderedDict((
             ("fleetHangarCapacity", "Fleet hangar"),
@@ -121,35 +122,35 @@ class TargetingMiscViewMinimal(StatsView):
         ))
 
         cargoValues = {
-            "main": lambda: fit.ship.getModifiedItemAttr("capacity"),
-            "fleetHangarCapacity": lambda: fit.ship.getModifiedItemAttr("fleetHangarCapacity"),
-            "shipMaintenanceBayCapacity": lambda: fit.ship.getModifiedItemAttr("shipMaintenanceBayCapacity"),
-            "specialAmmoHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialAmmoHoldCapacity"),
-            "specialFuelBayCapacity": lambda: fit.ship.getModifiedItemAttr("specialFuelBayCapacity"),
-            "specialShipHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialShipHoldCapacity"),
-            "specialSmallShipHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialSmallShipHoldCapacity"),
-            "specialMediumShipHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialMediumShipHoldCapacity"),
-            "specialLargeShipHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialLargeShipHoldCapacity"),
-            "specialIndustrialShipHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialIndustrialShipHoldCapacity"),
-            "specialOreHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialOreHoldCapacity"),
-            "specialMineralHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialMineralHoldCapacity"),
-            "specialMaterialBayCapacity": lambda: fit.ship.getModifiedItemAttr("specialMaterialBayCapacity"),
-            "specialGasHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialGasHoldCapacity"),
-            "specialSalvageHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialSalvageHoldCapacity"),
-            "specialCommandCenterHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialCommandCenterHoldCapacity"),
-            "specialPlanetaryCommoditiesHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialPlanetaryCommoditiesHoldCapacity"),
-            "specialQuafeHoldCapacity": lambda: fit.ship.getModifiedItemAttr("specialQuafeHoldCapacity")
+            "main": lambda: fitStats.getShipAttr("capacity"),
+            "fleetHangarCapacity": lambda: fitStats.getShipAttr("fleetHangarCapacity"),
+            "shipMaintenanceBayCapacity": lambda: fitStats.getShipAttr("shipMaintenanceBayCapacity"),
+            "specialAmmoHoldCapacity": lambda: fitStats.getShipAttr("specialAmmoHoldCapacity"),
+            "specialFuelBayCapacity": lambda: fitStats.getShipAttr("specialFuelBayCapacity"),
+            "specialShipHoldCapacity": lambda: fitStats.getShipAttr("specialShipHoldCapacity"),
+            "specialSmallShipHoldCapacity": lambda: fitStats.getShipAttr("specialSmallShipHoldCapacity"),
+            "specialMediumShipHoldCapacity": lambda: fitStats.getShipAttr("specialMediumShipHoldCapacity"),
+            "specialLargeShipHoldCapacity": lambda: fitStats.getShipAttr("specialLargeShipHoldCapacity"),
+            "specialIndustrialShipHoldCapacity": lambda: fitStats.getShipAttr("specialIndustrialShipHoldCapacity"),
+            "specialOreHoldCapacity": lambda: fitStats.getShipAttr("specialOreHoldCapacity"),
+            "specialMineralHoldCapacity": lambda: fitStats.getShipAttr("specialMineralHoldCapacity"),
+            "specialMaterialBayCapacity": lambda: fitStats.getShipAttr("specialMaterialBayCapacity"),
+            "specialGasHoldCapacity": lambda: fitStats.getShipAttr("specialGasHoldCapacity"),
+            "specialSalvageHoldCapacity": lambda: fitStats.getShipAttr("specialSalvageHoldCapacity"),
+            "specialCommandCenterHoldCapacity": lambda: fitStats.getShipAttr("specialCommandCenterHoldCapacity"),
+            "specialPlanetaryCommoditiesHoldCapacity": lambda: fitStats.getShipAttr("specialPlanetaryCommoditiesHoldCapacity"),
+            "specialQuafeHoldCapacity": lambda: fitStats.getShipAttr("specialQuafeHoldCapacity")
         }
 
-        stats = (("labelTargets", {"main": lambda: fit.maxTargets}, 3, 0, 0, ""),
-                 ("labelRange", {"main": lambda: fit.maxTargetRange / 1000}, 3, 0, 0, "km"),
-                 ("labelScanRes", {"main": lambda: fit.ship.getModifiedItemAttr("scanResolution")}, 3, 0, 0, "mm"),
-                 ("labelSensorStr", {"main": lambda: fit.scanStrength}, 3, 0, 0, ""),
-                 ("labelCtrlRange", {"main": lambda: fit.extraAttributes["droneControlRange"] / 1000}, 3, 0, 0, "km"),
-                 ("labelFullSpeed", {"main": lambda: fit.maxSpeed}, 3, 0, 0, "m/s"),
-                 ("labelFullAlignTime", {"main": lambda: fit.alignTime}, 3, 0, 0, "s"),
-                 ("labelFullSigRadius", {"main": lambda: fit.ship.getModifiedItemAttr("signatureRadius")}, 3, 0, 9, ""),
-                 ("labelFullWarpSpeed", {"main": lambda: fit.warpSpeed}, 3, 0, 0, "AU/s"),
+        stats = (("labelTargets", {"main": lambda: fitStats.maxTargets}, 3, 0, 0, ""),
+                 ("labelRange", {"main": lambda: fitStats.maxTargetRange / 1000}, 3, 0, 0, "km"),
+                 ("labelScanRes", {"main": lambda: fitStats.getShipAttr("scanResolution")}, 3, 0, 0, "mm"),
+                 ("labelSensorStr", {"main": lambda: fitStats.scanStrength}, 3, 0, 0, ""),
+                 ("labelCtrlRange", {"main": lambda: fitStats.droneControlRange / 1000}, 3, 0, 0, "km"),
+                 ("labelFullSpeed", {"main": lambda: fitStats.maxSpeed}, 3, 0, 0, "m/s"),
+                 ("labelFullAlignTime", {"main": lambda: fitStats.alignTime}, 3, 0, 0, "s"),
+                 ("labelFullSigRadius", {"main": lambda: fitStats.getShipAttr("signatureRadius")}, 3, 0, 9, ""),
+                 ("labelFullWarpSpeed", {"main": lambda: fitStats.warpSpeed}, 3, 0, 0, "AU/s"),
                  ("labelFullCargo", cargoValues, 4, 0, 9, "m\u00B3"))
 
         counter = 0
@@ -188,24 +189,24 @@ class TargetingMiscViewMinimal(StatsView):
                             lockTime += "%5s\t%s\n" % (left, right)
                         label.SetToolTip(wx.ToolTip(lockTime))
                     elif labelName == "labelFullWarpSpeed":
-                        maxWarpDistance = "Max Warp Distance: %.1f AU" % fit.maxWarpDistance
-                        if fit.ship.getModifiedItemAttr("warpScrambleStatus"):
-                            warpScrambleStatus = "Warp Core Strength: %.1f" % (fit.ship.getModifiedItemAttr("warpScrambleStatus") * -1)
+                        maxWarpDistance = "Max Warp Distance: %.1f AU" % fitStats.maxWarpDistance
+                        if fitStats.getShipAttr("warpScrambleStatus"):
+                            warpScrambleStatus = "Warp Core Strength: %.1f" % (fitStats.getShipAttr("warpScrambleStatus") * -1)
                         else:
                             warpScrambleStatus = "Warp Core Strength: %.1f" % 0
                         label.SetToolTip(wx.ToolTip("%s\n%s" % (maxWarpDistance, warpScrambleStatus)))
                     elif labelName == "labelSensorStr":
-                        if fit.jamChance > 0:
-                            label.SetToolTip(wx.ToolTip("Type: %s\n%.1f%% Chance of Jam" % (fit.scanType, fit.jamChance)))
+                        if fitStats.jamChance > 0:
+                            label.SetToolTip(wx.ToolTip("Type: %s\n%.1f%% Chance of Jam" % (fitStats.scanType, fitStats.jamChance)))
                         else:
-                            label.SetToolTip(wx.ToolTip("Type: %s" % fit.scanType))
+                            label.SetToolTip(wx.ToolTip("Type: %s" % fitStats.scanType))
                     elif labelName == "labelFullAlignTime":
                         alignTime = "Align:\t%.3fs" % mainValue
-                        mass = 'Mass:\t{:,.0f}kg'.format(fit.ship.getModifiedItemAttr("mass"))
-                        agility = "Agility:\t%.3fx" % (fit.ship.getModifiedItemAttr("agility") or 0)
+                        mass = 'Mass:\t{:,.0f}kg'.format(fitStats.getShipAttr("mass"))
+                        agility = "Agility:\t%.3fx" % (fitStats.getShipAttr("agility") or 0)
                         label.SetToolTip(wx.ToolTip("%s\n%s\n%s" % (alignTime, mass, agility)))
                     elif labelName == "labelFullCargo":
-                        tipLines = ["Cargohold: {:,.2f}m\u00B3 / {:,.2f}m\u00B3".format(fit.cargoBayUsed, newValues["main"])]
+                        tipLines = ["Cargohold: {:,.2f}m\u00B3 / {:,.2f}m\u00B3".format(fitStats.cargoBayUsed, newValues["main"])]
                         for attrName, tipAlias in list(cargoNamesOrder.items()):
                             if newValues[attrName] > 0:
                                 tipLines.append("{}: {:,.2f}m\u00B3".format(tipAlias, newValues[attrName]))
@@ -217,9 +218,9 @@ class TargetingMiscViewMinimal(StatsView):
                 self._cachedValues[counter] = newValues
             elif labelName == "labelFullWarpSpeed":
                 if fit:
-                    maxWarpDistance = "Max Warp Distance: %.1f AU" % fit.maxWarpDistance
-                    if fit.ship.getModifiedItemAttr("warpScrambleStatus"):
-                        warpScrambleStatus = "Warp Core Strength: %.1f" % (fit.ship.getModifiedItemAttr("warpScrambleStatus") * -1)
+                    maxWarpDistance = "Max Warp Distance: %.1f AU" % fitStats.maxWarpDistance
+                    if fitStats.getShipAttr("warpScrambleStatus"):
+                        warpScrambleStatus = "Warp Core Strength: %.1f" % (fitStats.getShipAttr("warpScrambleStatus") * -1)
                     else:
                         warpScrambleStatus = "Warp Core Strength: %.1f" % 0
                     label.SetToolTip(wx.ToolTip("%s\n%s" % (maxWarpDistance, warpScrambleStatus)))
@@ -227,10 +228,10 @@ class TargetingMiscViewMinimal(StatsView):
                     label.SetToolTip(wx.ToolTip(""))
             elif labelName == "labelSensorStr":
                 if fit:
-                    if fit.jamChance > 0:
-                        label.SetToolTip(wx.ToolTip("Type: %s\n%.1f%% Chance of Jam" % (fit.scanType, fit.jamChance)))
+                    if fitStats.jamChance > 0:
+                        label.SetToolTip(wx.ToolTip("Type: %s\n%.1f%% Chance of Jam" % (fitStats.scanType, fitStats.jamChance)))
                     else:
-                        label.SetToolTip(wx.ToolTip("Type: %s" % fit.scanType))
+                        label.SetToolTip(wx.ToolTip("Type: %s" % fitStats.scanType))
                 else:
                     label.SetToolTip(wx.ToolTip(""))
             elif labelName == "labelFullCargo":
@@ -238,7 +239,7 @@ class TargetingMiscViewMinimal(StatsView):
                     cachedCargo = self._cachedValues[counter]
                     # if you add stuff to cargo, the capacity doesn't change and thus it is still cached
                     # This assures us that we force refresh of cargo tooltip
-                    tipLines = ["Cargohold: {:,.2f}m\u00B3 / {:,.2f}m\u00B3".format(fit.cargoBayUsed, cachedCargo["main"])]
+                    tipLines = ["Cargohold: {:,.2f}m\u00B3 / {:,.2f}m\u00B3".format(fitStats.cargoBayUsed, cachedCargo["main"])]
                     for attrName, tipAlias in list(cargoNamesOrder.items()):
                         if cachedCargo[attrName] > 0:
                             tipLines.append("{}: {:,.2f}m\u00B3".format(tipAlias, cachedCargo[attrName]))
@@ -249,7 +250,7 @@ class TargetingMiscViewMinimal(StatsView):
             # forces update of probe size, since this stat is used by both sig radius and sensor str
             if labelName == "labelFullSigRadius":
                 if fit:
-                    label.SetToolTip(wx.ToolTip("Probe Size: %.3f" % (fit.probeSize or 0)))
+                    label.SetToolTip(wx.ToolTip("Probe Size: %.3f" % (fitStats.probeSize or 0)))
                 else:
                     label.SetToolTip(wx.ToolTip(""))
 
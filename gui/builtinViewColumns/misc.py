@@ -544,8 +544,9 @@ class Miscellanea(ViewColumn):
                 return "", None
 
             fit = Fit.getInstance().getFit(self.fittingView.getActiveFit())
-            ehpTotal = fit.ehp
-            hpTotal = fit.hp
+            fitStats = fit.getStats()
+            ehpTotal = fitStats.ehp
+            hpTotal = fitStats.hp
             useEhp = self.mainFrame.statsPane.nameViewMap["resistancesViewFull"].showEffective
             tooltip = "{0} restored over duration using charges (plus reload)".format(boosted_attribute)
 
@@ -32,6 +32,7 @@ class CalcAddCargoCommand(wx.Command):
                 if self.commit:
                     eos.db.commit()
                 return False
+        fit.dropStats()
         if self.commit:
             eos.db.commit()
         return True
@@ -28,6 +28,7 @@ class CalcChangeCargoAmountCommand(wx.Command):
         if self.cargoInfo.amount == self.savedCargoInfo.amount:
             return False
         cargo.amount = self.cargoInfo.amount
+        fit.dropStats()
         eos.db.commit()
         return True
 
@@ -29,6 +29,7 @@ class CalcRemoveCargoCommand(wx.Command):
         cargo.amount -= self.savedRemovedAmount
         if cargo.amount <= 0:
             fit.cargo.remove(cargo)
+        fit.dropStats()
         if self.commit:
             eos.db.commit()
         return True
@@ -46,7 +46,7 @@ class CalcChangeLocalModuleStatesCommand(wx.Command):
                 mod.state = proposedState
         if not changed:
             return False
-        sFit.recalc(fit)
+        sFit.recalc(fit, changedItems=[fit.modules[pos] for pos in positions])
         self.savedStateCheckChanges = sFit.checkStates(fit, mainMod)
         eos.db.commit()
         return True
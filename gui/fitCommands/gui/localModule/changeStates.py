@@ -16,20 +16,34 @@ class GuiChangeLocalModuleStatesCommand(wx.Command):
         self.mainPosition = mainPosition
         self.positions = positions
         self.click = click
+        self.cmd = None
 
     def Do(self):
-        cmd = CalcChangeLocalModuleStatesCommand(
+        self.cmd = CalcChangeLocalModuleStatesCommand(
             fitID=self.fitID,
             mainPosition=self.mainPosition,
             positions=self.positions,
             click=self.click)
-        success = self.internalHistory.submit(cmd)
-        Fit.getInstance().recalc(self.fitID)
+        success = self.internalHistory.submit(self.cmd)
+        # Calc command has recalculated changes it made, only state check changes are left
+        sFit = Fit.getInstance()
+        sFit.recalc(self.fitID, changedItems=self.__getCheckedItems(sFit.getFit(self.fitID)))
         wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitID=self.fitID))
         return success
 
     def Undo(self):
         success = self.internalHistory.undoAll()
-        Fit.getInstance().recalc(self.fitID)
+        sFit = Fit.getInstance()
+        fit = sFit.getFit(self.fitID)
+        changedItems = [fit.modules[pos] for pos in self.cmd.savedStates] + self.__getCheckedItems(fit)
+        sFit.recalc(self.fitID, changedItems=changedItems)
         wx.PostEvent(gui.mainFrame.MainFrame.getInstance(), GE.FitChanged(fitID=self.fitID))
         return success
+
+    def __getCheckedItems(self, fit):
+        if self.cmd is None or self.cmd.savedStateCheckChanges is None:
+            return []
+        changedMods, changedProjMods, changedProjDrones = self.cmd.savedStateCheckChanges
+        return [fit.modules[pos] for pos in changedMods] + \
+               [fit.projectedModules[pos] for pos in changedProjMods] + \
+               [fit.projectedDrones[pos] for pos in changedProjDrones]
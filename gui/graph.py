@@ -34,6 +34,14 @@ class Graph(object):
     def getIcons(self):
         return None
 
+    def getGrid(self, fit, fields):
+        """
+        Results over every combination of ranged fields, as list of (field, samples) pairs and
+        ndarray with one dimension per pair, or (False, error message). Returns None if the view
+        plots single curves through getPoints() instead.
+        """
+        return None
+
 
 # noinspection PyUnresolvedReferences
-from gui.builtinGraphs import fitDps  # noqa: E402, F401
+from gui.builtinGraphs import fitDps, fitCapacitor  # noqa: E402, F401
@@ -66,6 +66,10 @@ except Exception:
     mplImported = False
 
 
+# Default matplotlib colors of the first curves, fit legends and contour lines use them
+legendColors = ("blue", "orange", "green", "red", "purple", "brown", "pink", "grey")
+
+
 class GraphFrame(wx.Frame):
     def __init__(self, parent, style=wx.DEFAULT_FRAME_STYLE | wx.NO_FULL_REPAINT_ON_RESIZE | wx.FRAME_FLOAT_ON_PARENT):
         global graphFrame_enabled
@@ -73,6 +77,7 @@ class GraphFrame(wx.Frame):
         global mpl_version
 
         self.legendFix = False
+        self.colorbar = None
 
         if not graphFrame_enabled:
             pyfalog.warning("Matplotlib is not enabled. Skipping initialization.")
@@ -240,21 +245,29 @@ class GraphFrame(wx.Frame):
 
         values = self.getValues()
         view = self.getView()
+        if self.colorbar is not None:
+            self.colorbar.remove()
+            self.colorbar = None
         self.subplot.clear()
         self.subplot.grid(True)
         legend = []
 
-        for fit in self.fits:
+        for i, fit in enumerate(self.fits):
             try:
-                success, status = view.getPoints(fit, values)
+                grid = view.getGrid(fit, values)
+                success, status = view.getPoints(fit, values) if grid is None else grid
                 if not success:
                     # TODO: Add a pwetty statys bar to report errors with
                     self.SetStatusText(status)
                     return
 
-                x, y = success, status
-
-                self.subplot.plot(x, y)
+                if grid is None:
+                    x, y = success, status
+                    self.subplot.plot(x, y)
+                elif not self.plotGrid(view, success, status, legendColors[i % len(legendColors)]):
+                    self.SetStatusText("Can only plot up to 2 ranged fields")
+                    self.canvas.draw()
+                    return
                 legend.append(fit.name)
             except Exception as ex:
                 pyfalog.warning("Invalid values in '{0}'", fit.name)
@@ -280,20 +293,10 @@ class GraphFrame(wx.Frame):
                     l.set_linewidth(1)
         elif mpl_version >= 2:
             legend2 = []
-            legend_colors = {
-                0: "blue",
-                1: "orange",
-                2: "green",
-                3: "red",
-                4: "purple",
-                5: "brown",
-                6: "pink",
-                7: "grey",
-            }
 
             for i, i_name in enumerate(legend):
                 try:
-                    selected_color = legend_colors[i]
+                    selected_color = legendColors[i]
                 except:
                     selected_color = None
                 legend2.append(Patch(color=selected_color, label=i_name), )
@@ -309,6 +312,31 @@ class GraphFrame(wx.Frame):
         self.canvas.draw()
         self.SetStatusText("")
 
+    def plotGrid(self, view, axes, values, color):
+        """
+        Plot results of one fit over ranged fields: a curve for one field, heatmap for two if
+        it's the only fit, contour lines otherwise
+        """
+        if len(axes) == 1:
+            self.subplot.plot(axes[0][1], values)
+            return True
+
+        if len(axes) != 2:
+            return False
+
+        labels = view.getLabels() or {}
+        (xName, x), (yName, y) = axes
+        self.subplot.set_xlabel(labels.get(xName, xName))
+        self.subplot.set_ylabel(labels.get(yName, yName))
+        # Results are indexed by (x, y), matplotlib wants rows of y
+        if len(self.fits) == 1:
+            heatmap = self.subplot.contourf(x, y, values.T, 20)
+            self.colorbar = self.figure.colorbar(heatmap, ax=self.subplot)
+        else:
+            contours = self.subplot.contour(x, y, values.T, colors=color)
+            self.subplot.clabel(contours, fontsize="small")
+        return True
+
     def onFieldChanged(self, event):
         self.draw()
 
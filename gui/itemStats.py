@@ -199,12 +199,20 @@ class ItemStatsContainer(wx.Panel):
             self.nbContainer.AddPage(self.properties, "Properties")
 
         self.nbContainer.Bind(wx.EVT_LEFT_DOWN, self.mouseHit)
+        self.nbContainer.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self.pageChanged)
         self.SetSizer(mainSizer)
         self.Layout()
 
     def __del__(self):
         pass
 
+    def pageChanged(self, event):
+        if event.GetEventObject() is self.nbContainer:
+            page = self.nbContainer.GetPage(event.GetSelection())
+            if page is getattr(self, "affectedby", None):
+                page.OnShown()
+        event.Skip()
+
     def mouseHit(self, event):
         tab, _ = self.nbContainer.HitTest(event.Position)
         if tab != -1:
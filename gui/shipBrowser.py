@@ -9,6 +9,7 @@ from gui.builtinShipBrowser.categoryItem import CategoryItem
 from gui.builtinShipBrowser.fitItem import FitItem
 from gui.builtinShipBrowser.shipItem import ShipItem
 from service.fit import Fit
+from service.fitStatsCache import FitStatsCache
 from service.market import Market
 
 from gui.builtinShipBrowser.events import EVT_SB_IMPORT_SEL, EVT_SB_STAGE1_SEL, EVT_SB_STAGE2_SEL, EVT_SB_STAGE3_SEL, EVT_SB_SEARCH_SEL
@@ -335,13 +336,34 @@ class ShipBrowser(wx.Panel):
 
         shipTrait = ship.traits.traitText if (ship.traits is not None) else ""  # empty string if no traits
 
+        fitStats = FitStatsCache.getInstance().getStats([fit[0] for fit in fitList])
+        fitItems = {}
         for ID, name, booster, timestamp, notes, graphicID in fitList:
-            self.lpane.AddWidget(FitItem(self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID, graphicID=graphicID))
+            fitItems[ID] = FitItem(self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID,
+                                   graphicID=graphicID, fitStats=fitStats.get(ID))
+            self.lpane.AddWidget(fitItems[ID])
+        self.fillFitStats(fitItems, fitStats)
 
         self.lpane.RefreshList()
         self.lpane.Thaw()
         self.raceselect.RebuildRaces(self.RACE_ORDER)
 
+    @staticmethod
+    def fillFitStats(fitItems, fitStats):
+        """Calculate fits listed without stored stats in the background, and show their stats once done"""
+        missing = [fitID for fitID in fitItems if fitID not in fitStats]
+        if not missing:
+            return
+
+        def cb(statsMap):
+            for fitID, stats in statsMap.items():
+                fitItem = fitItems.get(fitID)
+                # Item may be gone by now if the list was changed
+                if fitItem:
+                    fitItem.setFitStats(stats)
+
+        FitStatsCache.getInstance().fill(missing, cb)
+
     def searchStage(self, event):
 
         self.lpane.ShowLoading(False)
@@ -376,6 +398,8 @@ class ShipBrowser(wx.Panel):
                     ShipItem(self.lpane, ship.ID, (ship.name, shipTrait, len(sFit.getFitsWithShip(ship.ID))),
                              ship.race, ship.graphicID))
 
+            fitStats = FitStatsCache.getInstance().getStats([fit[0] for fit in fitList])
+            fitItems = {}
             for ID, name, shipID, shipName, booster, timestamp, notes in fitList:
                 ship = sMkt.getItem(shipID)
 
@@ -384,7 +408,10 @@ class ShipBrowser(wx.Panel):
 
                 shipTrait = ship.traits.traitText if (ship.traits is not None) else ""  # empty string if no traits
 
-                self.lpane.AddWidget(FitItem(self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID, graphicID=ship.graphicID))
+                fitItems[ID] = FitItem(self.lpane, ID, (shipName, shipTrait, name, booster, timestamp, notes), shipID,
+                                       graphicID=ship.graphicID, fitStats=fitStats.get(ID))
+                self.lpane.AddWidget(fitItems[ID])
+            self.fillFitStats(fitItems, fitStats)
             if len(ships) == 0 and len(fitList) == 0:
                 self.lpane.AddWidget(PFStaticText(self.lpane, label="No matching results."))
             self.lpane.RefreshList(doFocus=False)
@@ -46,8 +46,10 @@ class StatsView(object):
 from gui.builtinStatsViews import (  # noqa: E402, F401
     resourcesViewFull,
     resistancesViewFull,
+    damagePatternsViewFull,
     firepowerViewFull,
     miningyieldViewFull,
+    targetProfilesViewFull,
     capacitorViewFull,
     rechargeViewFull,
     targetingMiscViewMinimal,
@@ -8,7 +8,7 @@ from service.fit import Fit
 from service.port import Port
 from service.market import Market
 from logbook import Logger
-from eos.db import getFit
+from eos.db import getFitStream
 
 pyfalog = Logger(__name__)
 
@@ -205,11 +205,11 @@ class exportHtmlThread(threading.Thread):
                                          'data-corners="false">\n'
                     )
 
-                    for fit in fits:
+                    for fit in getFitStream([fitInfo[0] for fitInfo in fits]):
                         if self.stopRunning:
                             return
                         try:
-                            eftFit = Port.exportEft(getFit(fit[0]), options={
+                            eftFit = Port.exportEft(fit, options={
                                 PortEftOptions.IMPLANTS: True,
                                 PortEftOptions.MUTATIONS: True,
                                 PortEftOptions.LOADED_CHARGES: True})
@@ -217,9 +217,9 @@ class exportHtmlThread(threading.Thread):
                             HTMLfit = (
                                     '           <li data-role="collapsible" data-iconpos="right" data-shadow="false" '
                                     'data-corners="false">\n'
-                                    '           <h2>' + fit[1] + '</h2>\n'
+                                    '           <h2>' + fit.name + '</h2>\n'
                                     '               <ul data-role="listview" data-shadow="false" data-inset="true" '
-                                                                 'data-corners="false">\n'
+                                    'data-corners="false">\n'
                             )
 
                             HTMLfit += '                   <li><pre>' + eftFit + '\n                   </pre></li>\n'
@@ -273,14 +273,14 @@ class exportHtmlThread(threading.Thread):
 
             for ship in ships:
                 fits = sFit.getFitsWithShip(ship.ID)
-                for fit in fits:
+                for fit in getFitStream([fitInfo[0] for fitInfo in fits]):
                     if self.stopRunning:
                         return
                     try:
-                        dnaFit = Port.exportDna(getFit(fit[0]))
+                        dnaFit = Port.exportDna(fit)
                         HTML += '<a class="outOfGameBrowserLink" target="_blank" href="' + dnaUrl + dnaFit + '">' \
                                 + ship.name + ': ' + \
-                                fit[1] + '</a><br> \n'
+                                fit.name + '</a><br> \n'
                     except:
                         pyfalog.error("Failed to export line")
                         continue
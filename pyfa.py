@@ -20,6 +20,7 @@
 
 
 import datetime
+import multiprocessing
 import os
 import sys
 from optparse import AmbiguousOptionError, BadOptionError, OptionParser
@@ -76,6 +77,8 @@ parser.add_option("-p", "--profile", action="store", dest="profile_path", help="
 (options, args) = parser.parse_args()
 
 if __name__ == "__main__":
+    # Fit stats are calculated in worker processes, which frozen builds have to be able to start
+    multiprocessing.freeze_support()
 
     try:
         # first and foremost - check required libraries
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+This script compares memory usage and lookup/modification speed of the
+regular and compact ModifiedAttributeDict backends. It uses synthetic
+attributes, so no game database is needed.
+"""
+
+import argparse
+import os.path
+import sys
+import time
+import tracemalloc
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.realpath(os.path.join(script_dir, "..")))
+
+import eos.modifiedAttributeDict as mad  # noqa: E402
+
+
+class FakeAttribute(object):
+    def __init__(self, value):
+        self.value = value
+
+
+def makeAttributeNames(count):
+    names = ["benchmarkAttribute{}".format(i) for i in range(count)]
+    # Keep the engine away from the database
+    for name in names:
+        mad.cappingAttrKeyCache[name] = None
+        mad.defaultValuesCache[name] = 0.0
+    return names
+
+
+def populate(cls, names, dictCount, modifiedShare):
+    original = {name: FakeAttribute(float(i)) for i, name in enumerate(names)}
+    modifiedNames = names[:int(len(names) * modifiedShare)]
+    dicts = []
+    for _ in range(dictCount):
+        attrDict = cls()
+        attrDict.original = original
+        for i, name in enumerate(modifiedNames):
+            attrDict.increase(name, 1)
+            attrDict.multiply(name, 1.05)
+            if i % 3 == 0:
+                attrDict.multiply(name, 1.1, stackingPenalties=True)
+        dicts.append(attrDict)
+    return dicts
+
+
+def measureMemory(cls, names, dictCount, modifiedShare):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    dicts = populate(cls, names, dictCount, modifiedShare)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return dicts, after - before
+
+
+def measureLookups(dicts, names, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for attrDict in dicts:
+            for name in names:
+                attrDict[name]
+    return time.perf_counter() - start
+
+
+def measureModifications(cls, names, dictCount, modifiedShare):
+    start = time.perf_counter()
+    populate(cls, names, dictCount, modifiedShare)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ModifiedAttributeDict backends")
+    parser.add_argument("-a", "--attributes", type=int, default=150, help="attributes per item")
+    parser.add_argument("-d", "--dicts", type=int, default=500, help="number of attribute dicts")
+    parser.add_argument("-m", "--modified", type=float, default=0.2, help="share of attributes which get modified")
+    parser.add_argument("-r", "--rounds", type=int, default=5, help="lookup rounds over all dicts")
+    args = parser.parse_args()
+
+    names = makeAttributeNames(args.attributes)
+    for cls in (mad.ModifiedAttributeDict, mad.CompactModifiedAttributeDict):
+        dicts, memory = measureMemory(cls, names, args.dicts, args.modified)
+        modifyTime = measureModifications(cls, names, args.dicts, args.modified)
+        # First pass calculates modified values, following ones hit calculated ones
+        firstLookupTime = measureLookups(dicts, names, 1)
+        lookupTime = measureLookups(dicts, names, args.rounds)
+        print("{}:".format(cls.__name__))
+        print("  memory:        {:.1f} KiB ({:.0f} bytes per dict)".format(memory / 1024, memory / args.dicts))
+        print("  modifications: {:.3f} s".format(modifyTime))
+        print("  first lookups: {:.3f} s".format(firstLookupTime))
+        print("  lookups:       {:.3f} s ({} rounds)".format(lookupTime, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
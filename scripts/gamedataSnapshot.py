@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# ===============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of eos.
+#
+# eos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# eos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with eos.  If not, see <http://www.gnu.org/licenses/>.
+# ===============================================================================
+
+
+"""
+This script writes a memory-mapped gamedata snapshot for a gamedata database
+generated by jsonToSql.py. Pyfa and batch workers pick up eve.snapshot next to
+eve.db automatically, as long as it was written for the same gamedata build.
+"""
+
+import argparse
+import os.path
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.realpath(os.path.join(script_dir, "..")))
+
+
+def main(db, output):
+    # Import eos.config first and change it
+    import eos.config
+    eos.config.gamedata_connectionstring = "sqlite:///{}".format(os.path.abspath(db))
+    eos.config.saveddata_connectionstring = "sqlite:///:memory:"
+    eos.config.debug = False
+
+    # Now thats done, we can import the eos modules using the config
+    import eos.db
+    from eos.db.gamedata.snapshot import GamedataSnapshot, writeSnapshot
+
+    start = time.perf_counter()
+    count = writeSnapshot(eos.db.gamedata_engine.execute, output)
+    snapshot = GamedataSnapshot(output)
+    print("Wrote {} types of build {} to {} ({:.1f} MiB) in {:.2f}s".format(
+        count, snapshot.build, output, os.path.getsize(output) / 1024 / 1024, time.perf_counter() - start))
+    snapshot.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write memory-mapped gamedata snapshot")
+    parser.add_argument("-d", "--db", default=os.path.join(script_dir, "..", "eve.db"), help="path to gamedata database")
+    parser.add_argument("-o", "--output", help="snapshot path, database path with .snapshot extension by default")
+    args = parser.parse_args()
+
+    main(args.db, args.output or os.path.splitext(args.db)[0] + ".snapshot")
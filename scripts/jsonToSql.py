@@ -414,6 +414,9 @@ def main(db, json_path):
     # fix for #1722 until CCP gets their shit together
     eos.db.gamedata_engine.execute('UPDATE invtypes SET typeName = \'Small Abyssal Energy Nosferatu\' WHERE typeID = ? AND typeName = ?', (48419, ''))
 
+    # Rows were changed bypassing the session, drop anything loaded from them before
+    eos.db.clearQueryCaches()
+
     print()
     for x in CATEGORIES_TO_REMOVE:
         cat = eos.db.gamedata_session.query(eos.gamedata.Category).filter(eos.gamedata.Category.ID == x).first()
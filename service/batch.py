@@ -0,0 +1,312 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+"""
+Headless batch fit calculation.
+
+Fits are passed as EFT, DNA or XML strings, or as IDs of fits stored in a saveddata database, and are
+calculated by a pool of worker processes. Every worker configures its own eos databases (gamedata is
+opened read-only), so nothing here needs wx or the GUI's database session. Example:
+
+    with BatchCalculator(processes=4) as calculator:
+        for result in calculator.calculate(eftStrings):
+            print(result["name"], result["stats"]["dps"]["total"], result["timing"]["total"])
+
+This module must not import eos.db or services at module level: they set up database connections on import,
+which workers have to configure first.
+"""
+
+import functools
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+import urllib.request
+
+from logbook import Logger
+
+pyfalog = Logger(__name__)
+
+DEFAULT_GAMEDATA = os.path.realpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "eve.db"))
+
+
+def _readOnlyConnector(path):
+    uri = "file:{}?mode=ro".format(urllib.request.pathname2url(os.path.abspath(path)))
+    return functools.partial(sqlite3.connect, uri, uri=True, check_same_thread=False)
+
+
+# Per-process worker state, set up by _initWorker()
+_worker = {}
+
+
+def _initWorker(gameDB, saveDB, savePath, characterName, gameSnapshot):
+    import logbook
+    # Per-fit calculation logging would dominate the run time; keep warnings and worse only
+    logbook.NullHandler().push_application()
+    logbook.StderrHandler(level=logbook.WARNING, bubble=False).push_application()
+
+    try:
+        _setUpWorker(gameDB, saveDB, savePath, characterName, gameSnapshot)
+    except Exception as e:
+        # Pool would replace a worker whose initializer failed over and over; keep it and fail its jobs instead
+        pyfalog.error("Failed to set up batch worker: {0}", e)
+        _worker["error"] = "Worker setup failed: {}".format(e)
+
+
+def _setUpWorker(gameDB, saveDB, savePath, characterName, gameSnapshot):
+    import config
+    config.savePath = savePath or tempfile.mkdtemp(prefix="pyfa-batch-")
+    config.gameDB = gameDB
+    config.saveDB = saveDB
+
+    import eos.config
+    eos.config.gamedata_connectionstring = _readOnlyConnector(gameDB)
+    eos.config.saveddata_connectionstring = _readOnlyConnector(saveDB) if saveDB else "sqlite:///:memory:"
+    eos.config.gamedataSnapshot = gameSnapshot
+
+    import eos.db
+    if not saveDB:
+        from eos.db.saveddata.loadDefaultDatabaseValues import DefaultDatabaseValues
+        DefaultDatabaseValues.importRequiredDefaults()
+        DefaultDatabaseValues.importDamageProfileDefaults()
+        DefaultDatabaseValues.importResistProfileDefaults()
+
+    from eos.saveddata.character import Character
+    from service.fit import Fit
+    from service.fitStatsCache import FitStatsCache
+    from service.port import Port
+
+    # Databases are read-only or thrown away, don't keep calculated stats around for them
+    FitStatsCache.enabled = False
+    sFit = Fit.getInstance()
+    _worker["sFit"] = sFit
+    _worker["port"] = Port
+    _worker["character"] = eos.db.getCharacter(characterName) or Character.getAll5()
+    _worker["targetProfiles"] = sorted(eos.db.getTargetResistsList(), key=lambda p: p.name)
+    _worker["damagePatterns"] = sorted(eos.db.getDamagePatternList(), key=lambda p: p.name)
+
+
+def _loadFits(source):
+    import eos.db
+    from eos.const import ImplantLocation
+
+    if "error" in _worker:
+        raise ValueError(_worker["error"])
+    if isinstance(source, int):
+        fit = eos.db.getFit(source)
+        if fit is None:
+            raise ValueError("Fit {} not found".format(source))
+        return "ID", [fit]
+
+    imported = _worker["port"].importAuto(source)
+    if imported is None or imported[0] == "MutatedItem":
+        raise ValueError("Unrecognized fit format")
+    importType, fits = imported
+    sFit = _worker["sFit"]
+    for fit in fits:
+        fit.character = _worker["character"]
+        fit.damagePattern = sFit.pattern
+        fit.targetResists = sFit.targetResists
+        if len(fit.implants) > 0:
+            fit.implantLocation = ImplantLocation.FIT
+        else:
+            useCharImplants = sFit.serviceFittingOptions["useCharacterImplantsByDefault"]
+            fit.implantLocation = ImplantLocation.CHARACTER if useCharImplants else ImplantLocation.FIT
+    return importType, list(fits)
+
+
+def _dmgTypesDict(dmg):
+    return {"em": dmg.em, "thermal": dmg.thermal, "kinetic": dmg.kinetic, "explosive": dmg.explosive,
+            "total": dmg.total}
+
+
+def getFitStats(fit, targetProfiles=(), damagePatterns=()):
+    """
+    Plain (picklable) dictionary with the commonly needed stats of a calculated fit, including DPS and volley
+    against the given target resist profiles and EHP against the given damage patterns
+    """
+    stats = fit.getStats()
+    profileDmg = fit.getDmgAgainstProfiles(targetProfiles)
+    patternEhp = fit.getEhpAgainstPatterns(damagePatterns)
+
+    def resource(used, totalAttr):
+        return {"used": used, "total": stats.getShipAttr(totalAttr)}
+
+    return {
+        "dps": _dmgTypesDict(stats.totalDps[0]),
+        "volley": _dmgTypesDict(stats.totalVolley[0]),
+        "hp": dict(stats.hp),
+        "ehp": dict(stats.ehp),
+        "capStable": stats.capStable,
+        "capState": stats.capState,
+        "capUsed": stats.capUsed,
+        "capRecharge": stats.capRecharge,
+        "maxSpeed": stats.maxSpeed,
+        "alignTime": stats.alignTime,
+        "resources": {
+            "cpu": resource(stats.cpuUsed, "cpuOutput"),
+            "pg": resource(stats.pgUsed, "powerOutput"),
+            "calibration": resource(stats.calibrationUsed, "upgradeCapacity"),
+            "droneBandwidth": resource(stats.droneBandwidthUsed, "droneBandwidth"),
+            "droneBay": resource(stats.droneBayUsed, "droneCapacity"),
+        },
+        "targetProfiles": {
+            profile.name: {"dps": profileDmg.getDps(i).total, "volley": profileDmg.getVolley(i).total}
+            for i, profile in enumerate(targetProfiles)},
+        "damagePatterns": {
+            pattern.name: dict(patternEhp.getEhp(i), total=sum(patternEhp.getEhp(i).values()))
+            for i, pattern in enumerate(damagePatterns)},
+    }
+
+
+def _calculate(job):
+    """Worker entry point: calculate every fit described by the job, returns list of result dicts"""
+    import eos.db
+
+    index, source = job
+    start = time.perf_counter()
+    base = {"index": index, "pid": os.getpid(), "format": None, "name": None, "ship": None, "stats": None,
+            "error": None}
+    try:
+        importType, fits = _loadFits(source)
+    except Exception as e:
+        pyfalog.warning("Failed to load fit #{0}: {1}", index, e)
+        return [dict(base, error=str(e), timing={"load": time.perf_counter() - start, "calc": 0, "stats": 0,
+                                                 "total": time.perf_counter() - start})]
+    loadTime = (time.perf_counter() - start) / max(len(fits), 1)
+
+    results = []
+    sFit = _worker["sFit"]
+    for fit in fits:
+        result = dict(base, format=importType, name=fit.name)
+        calcStart = time.perf_counter()
+        statsStart = calcStart
+        try:
+            result["ship"] = fit.ship.item.name
+            sFit.recalc(fit)
+            statsStart = time.perf_counter()
+            result["stats"] = getFitStats(fit, _worker["targetProfiles"], _worker["damagePatterns"])
+        except Exception as e:
+            pyfalog.warning("Failed to calculate fit #{0} ({1}): {2}", index, fit.name, e)
+            result["error"] = str(e)
+        end = time.perf_counter()
+        result["timing"] = {"load": loadTime, "calc": statsStart - calcStart, "stats": end - statsStart,
+                            "total": loadTime + end - calcStart}
+        # Don't let thousands of fits pile up in the session
+        if fit in eos.db.saveddata_session:
+            eos.db.saveddata_session.expunge(fit)
+        results.append(result)
+    return results
+
+
+def _calculateStored(fitID):
+    """Worker entry point: calculate stored fit, returns (fit ID, stats key, FitStats) as FitStatsCache needs them"""
+    import eos.db
+    from service.fitStatsCache import FitStatsCache
+
+    if "error" in _worker:
+        return fitID, None, None
+    fit = None
+    try:
+        fit = eos.db.getFit(fitID)
+        if fit is None or fit.isInvalid:
+            return fitID, None, None
+        _worker["sFit"].recalc(fit)
+        return fitID, FitStatsCache.getKey(fit), fit.getStats()
+    except Exception as e:
+        pyfalog.warning("Failed to calculate stats of fit {0}: {1}", fitID, e)
+        return fitID, None, None
+    finally:
+        if fit is not None and fit in eos.db.saveddata_session:
+            eos.db.saveddata_session.expunge(fit)
+
+
+class BatchCalculator(object):
+    """
+    Pool of worker processes calculating fits.
+
+    gameDB: path to gamedata database, pyfa's eve.db by default; opened read-only
+    saveDB: path to saveddata database, needed only to calculate stored fits by ID; opened read-only. Without it,
+        workers use an in-memory database with default profiles
+    processes: number of workers, CPU count by default
+    characterName: character imported fits are calculated with
+    savePath: directory for settings and other files services may want to write, temporary one by default
+    gameSnapshot: path to gamedata snapshot (see scripts/gamedataSnapshot.py) workers share, the one next to gameDB
+        by default if it exists
+    """
+
+    def __init__(self, gameDB=None, saveDB=None, processes=None, characterName="All 5", savePath=None, chunkSize=4,
+                 gameSnapshot=None):
+        self.gameDB = gameDB or DEFAULT_GAMEDATA
+        if gameSnapshot is None:
+            gameSnapshot = os.path.splitext(self.gameDB)[0] + ".snapshot"
+            gameSnapshot = gameSnapshot if os.path.isfile(gameSnapshot) else None
+        self.gameSnapshot = gameSnapshot
+        self.saveDB = saveDB
+        self.processes = processes or os.cpu_count() or 1
+        self.chunkSize = chunkSize
+        self.lastRunTime = None
+        # Spawned workers start clean even if this process already set up its own databases
+        context = multiprocessing.get_context("spawn")
+        self.pool = context.Pool(self.processes, initializer=_initWorker,
+                                 initargs=(self.gameDB, self.saveDB, savePath, characterName, self.gameSnapshot))
+
+    def iterResults(self, fits):
+        """
+        Calculate fits (EFT/DNA/XML strings or saveddata fit IDs), yielding result dicts in input order. Every
+        result carries the input index (an XML string can describe several fits), fit and ship names, stats
+        (see getFitStats()), error message if the fit couldn't be loaded or calculated, and timing in seconds.
+        """
+        start = time.perf_counter()
+        try:
+            for results in self.pool.imap(_calculate, enumerate(fits), chunksize=self.chunkSize):
+                for result in results:
+                    yield result
+        finally:
+            self.lastRunTime = time.perf_counter() - start
+
+    def iterFitStats(self, fitIDs):
+        """
+        Calculate fits stored in saveDB, yielding (fit ID, stats key, FitStats) tuples as FitStatsCache stores them,
+        in order of completion. Key and stats are None for fits which couldn't be calculated.
+        """
+        return self.pool.imap_unordered(_calculateStored, fitIDs, chunksize=self.chunkSize)
+
+    def calculate(self, fits):
+        results = list(self.iterResults(fits))
+        pyfalog.info("Calculated {0} fits in {1:.2f}s using {2} processes", len(results), self.lastRunTime,
+                     self.processes)
+        return results
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def calculateFits(fits, **kwargs):
+    """One-off batch calculation, see BatchCalculator"""
+    with BatchCalculator(**kwargs) as calculator:
+        return calculator.calculate(fits)
@@ -28,12 +28,9 @@ from xml.etree import ElementTree
 from xml.dom import minidom
 import gzip
 
-# noinspection PyPackageRequirements
-import wx
-
 import config
 import eos.db
-from service.esi import Esi
+from utils.dispatch import callAfter
 
 from eos.saveddata.implant import Implant as es_Implant
 from eos.saveddata.character import Character as es_Character, Skill
@@ -54,11 +51,8 @@ class CharacterImportThread(threading.Thread):
     def run(self):
         paths = self.paths
         sCharacter = Character.getInstance()
-        all5_character = es_Character("All 5", 5)
-        all_skill_ids = []
-        for skill in all5_character.skills:
-            # Parse out the skill item IDs to make searching it easier later on
-            all_skill_ids.append(skill.itemID)
+        # Parse out the skill item IDs to make searching it easier later on
+        all_skill_ids = list(es_Character.getSkillIDMap().keys())
 
         for path in paths:
             try:
@@ -91,7 +85,7 @@ class CharacterImportThread(threading.Thread):
                 pyfalog.error(e)
                 continue
 
-        wx.CallAfter(self.callback)
+        callAfter(self.callback)
 
 
 class SkillBackupThread(threading.Thread):
@@ -119,7 +113,7 @@ class SkillBackupThread(threading.Thread):
             with open(path, mode='w', encoding='utf-8') as backupFile:
                 backupFile.write(backupData)
 
-        wx.CallAfter(self.callback)
+        callAfter(self.callback)
 
 
 class Character(object):
@@ -368,7 +362,7 @@ class Character(object):
 
     def apiFetchCallback(self, guiCallback, e=None):
         eos.db.commit()
-        wx.CallAfter(guiCallback, e)
+        callAfter(guiCallback, e)
 
     @staticmethod
     def apiUpdateCharSheet(charID, skills, securitystatus):
@@ -473,6 +467,8 @@ class UpdateAPIThread(threading.Thread):
         try:
             char = eos.db.getCharacter(self.charID)
 
+            # ESI service is GUI-bound, don't pull it in unless it's needed
+            from service.esi import Esi
             sEsi = Esi.getInstance()
             sChar = Character.getInstance()
             ssoChar = sChar.getSsoCharacter(char.ID)
@@ -21,6 +21,7 @@ import copy
 
 import eos.db
 from eos.saveddata.damagePattern import DamagePattern as es_DamagePattern
+from service.fitStatsCache import FitStatsCache
 
 
 class ImportError(Exception):
@@ -60,6 +61,7 @@ class DamagePattern(object):
     @staticmethod
     def deletePattern(p):
         eos.db.remove(p)
+        FitStatsCache.getInstance().clear()
 
     @staticmethod
     def copyPattern(p):
@@ -70,9 +72,14 @@ class DamagePattern(object):
     @staticmethod
     def saveChanges(p):
         eos.db.save(p)
+        # Stored stats of fits using the pattern are stale now
+        FitStatsCache.getInstance().clear()
 
     def importPatterns(self, text):
         imports, num = es_DamagePattern.importPatterns(text)
+        if imports:
+            # Existing patterns may have been updated
+            FitStatsCache.getInstance().clear()
         lenImports = len(imports)
 
         if lenImports == 0:
@@ -21,9 +21,9 @@ import copy
 import datetime
 from time import time
 
-import wx
 from logbook import Logger
 
+import eos.config
 import eos.db
 from eos.saveddata.character import Character as saveddata_Character
 from eos.saveddata.citadel import Citadel as es_Citadel
@@ -35,6 +35,7 @@ from eos.saveddata.ship import Ship as es_Ship
 from service.character import Character
 from service.damagePattern import DamagePattern
 from service.fitDeprecated import FitDeprecated
+from service.fitStatsCache import FitStatsCache
 from service.settings import SettingsProvider
 from utils.deprecated import deprecated
 
@@ -48,7 +49,7 @@ class DeferRecalc:
 
     def __enter__(self):
         self._recalc = self.sFit.recalc
-        self.sFit.recalc = lambda x: pyfalog.debug('Deferred Recalc')
+        self.sFit.recalc = lambda *args, **kwargs: pyfalog.debug('Deferred Recalc')
 
     def __exit__(self, *args):
         self.sFit.recalc = self._recalc
@@ -104,6 +105,12 @@ class Fit(FitDeprecated):
         fits = eos.db.getFitList()
         return fits
 
+    @staticmethod
+    def iterAllFits(chunkSize=100):
+        """Sized iterable of all fits, loaded in bulk chunkSize fits at a time; for operations going over every fit"""
+        pyfalog.debug("Streaming all fits")
+        return eos.db.getFitStream(chunkSize=chunkSize)
+
     @staticmethod
     def getFitsWithShip(shipID):
         """ Lists fits of shipID, used with shipBrowser """
@@ -208,6 +215,7 @@ class Fit(FitDeprecated):
                 refreshFits.add(booster.boosted_fit)
 
         eos.db.remove(fit)
+        FitStatsCache.getInstance().remove(fitID)
 
         if fitID in Fit.processors:
             del Fit.processors[fitID]
@@ -221,6 +229,8 @@ class Fit(FitDeprecated):
     @classmethod
     def getCommandProcessor(cls, fitID):
         if fitID not in cls.processors:
+            # noinspection PyPackageRequirements
+            import wx
             cls.processors[fitID] = wx.CommandProcessor()
         return cls.processors[fitID]
 
@@ -291,6 +301,7 @@ class Fit(FitDeprecated):
         # pyfalog.debug("Getting fit for fit ID: {0}", fitID)
         if fitID is None:
             return None
+        queryCounts = dict(eos.db.queryCounts)
         fit = eos.db.getFit(fitID)
 
         if fit is None:
@@ -319,6 +330,10 @@ class Fit(FitDeprecated):
 
             eos.db.commit()
             fit.inited = True
+            if not projected:
+                fit.loadQueryCounts = {name: eos.db.queryCounts[name] - count for name, count in queryCounts.items()}
+                pyfalog.debug("Loaded fit {0} using {1[gamedata]} gamedata and {1[saveddata]} saveddata queries",
+                              fitID, fit.loadQueryCounts)
         return fit
 
     @staticmethod
@@ -513,15 +528,38 @@ class Fit(FitDeprecated):
         eos.db.commit()
         self.recalc(fit)
 
-    def recalc(self, fit):
+    def recalc(self, fit, changedItems=None, trackAfflictions=False):
+        """
+        Recalculate fit. If changedItems is passed and only those items were changed since last calculation,
+        fit may be recalculated incrementally (see the incrementalCalc engine setting). "Affected By" information
+        is captured only if trackAfflictions is set, see traceAfflictions().
+        """
         if isinstance(fit, int):
             fit = self.getFit(fit)
         start_time = time()
         pyfalog.info("=" * 10 + "recalc: {0}" + "=" * 10, fit.name)
 
-        fit.factorReload = self.serviceFittingOptions["useGlobalForceReload"]
-        fit.clear()
+        fit.trackAfflictions = trackAfflictions
 
-        fit.calculateModifiedAttributes()
+        factorReload = self.serviceFittingOptions["useGlobalForceReload"]
+        if changedItems is not None and eos.config.settings["incrementalCalc"] and fit.factorReload == factorReload:
+            fit.calculateIncremental(changedItems)
+        else:
+            fit.factorReload = factorReload
+            fit.clear()
+            fit.calculateModifiedAttributes()
         fit.fill()
+        FitStatsCache.getInstance().store(fit)
         pyfalog.info("=" * 10 + "recalc time: " + str(time() - start_time) + "=" * 10)
+
+    def traceAfflictions(self, fitID):
+        """
+        Make sure "Affected By" information of the fit is available, recalculating it once with affliction
+        capture enabled if needed. Returns True if fit had to be recalculated.
+        """
+        fit = self.getFit(fitID)
+        if fit is None or fit.afflictionsCaptured:
+            return False
+        pyfalog.debug("Recalculating fit {0} to capture afflictions", fitID)
+        self.recalc(fit, trackAfflictions=True)
+        return True
@@ -0,0 +1,214 @@
+# =============================================================================
+# Copyright (C) 2010 Diego Duclos
+#
+# This file is part of pyfa.
+#
+# pyfa is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# pyfa is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with pyfa.  If not, see <http://www.gnu.org/licenses/>.
+# =============================================================================
+
+import queue
+import threading
+import weakref
+from itertools import chain
+
+from logbook import Logger
+
+import config
+import eos.config
+import eos.db
+from eos.saveddata.cachedFitStats import CachedFitStats
+from eos.saveddata.character import Character
+from utils.dispatch import callAfter
+
+pyfalog = Logger(__name__)
+
+
+class FitStatsCache:
+    """
+    Calculated stats of stored fits, kept in the saveddata database so fit lists can show them without loading
+    and calculating every fit. Stats are stored along with the fit content hash, the character skill hash and
+    the game data version, changing any of them invalidates stored stats. Content hash is checked for fits which
+    are loaded, changes of fits which aren't (damage pattern values, calculation settings) have to clear() stats.
+    """
+    instance = None
+    # Headless batch calculations work with databases they don't write to
+    enabled = True
+    # Number of worker processes fill() calculates fits with
+    workerProcesses = 2
+
+    @classmethod
+    def getInstance(cls):
+        if cls.instance is None:
+            cls.instance = FitStatsCache()
+        return cls.instance
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        # {fit ID: weak reference to fit} calculated since stats were last written
+        self.__calculated = {}
+        # {fit ID: ((fit hash, skill hash, game data version), FitStats)} waiting to be written, None to remove
+        self.__pending = {}
+        self.fitStatsWorkerThread = FitStatsWorkerThread(self)
+        self.fitStatsWorkerThread.daemon = True
+        self.fitStatsWorkerThread.start()
+
+    @staticmethod
+    def getKey(fit):
+        return fit.getContentHash(), fit.character.skillHash, eos.config.gamedata_version
+
+    def store(self, fit):
+        """
+        Remember the just calculated fit. Its stats and hash are taken only when stored stats are read next (see
+        write()), so recalculations don't pay for them when nobody is looking
+        """
+        if not self.enabled or fit.ID is None or fit.isInvalid:
+            return
+        with self.__lock:
+            self.__calculated[fit.ID] = weakref.ref(fit)
+            self.__pending.pop(fit.ID, None)
+            # Stats of fits this one is projected onto or boosts depend on it
+            for dependentID in chain(fit.projectedOnto.keys(), fit.boostedOnto.keys()):
+                if dependentID != fit.ID:
+                    self.__calculated.pop(dependentID, None)
+                    self.__pending[dependentID] = None
+
+    def storeStats(self, fitID, key, stats):
+        """Remember stats calculated elsewhere, key is what getKey() returned for the fit"""
+        with self.__lock:
+            if fitID not in self.__calculated:
+                self.__pending[fitID] = (key, stats)
+
+    def remove(self, fitID):
+        with self.__lock:
+            self.__calculated.pop(fitID, None)
+            self.__pending[fitID] = None
+
+    def write(self):
+        """Write remembered stats to the database; must be called from the thread fits are calculated in"""
+        with self.__lock:
+            calculated, self.__calculated = self.__calculated, {}
+        # Fits are changed and recalculated in one go on this thread, so a fit which is still calculated has
+        # stats matching its content
+        for fitID, fitRef in calculated.items():
+            fit = fitRef()
+            if fit is not None and fit.calculated:
+                stats = fit.getStats()
+                key = self.getKey(fit)
+                with self.__lock:
+                    self.__pending[fitID] = (key, stats)
+        with self.__lock:
+            pending, self.__pending = self.__pending, {}
+        if not pending:
+            return
+        cachedMap = {cached.fitID: cached for cached, _, _ in eos.db.getCachedFitStats(pending.keys())}
+        for fitID, entry in pending.items():
+            cached = cachedMap.get(fitID)
+            if entry is None:
+                if cached is not None:
+                    eos.db.remove(cached)
+                continue
+            (fitHash, skillHash, gamedataVersion), stats = entry
+            if cached is None:
+                cached = CachedFitStats(fitID)
+                eos.db.add(cached)
+            if not cached.isValid(fitHash, skillHash, gamedataVersion):
+                cached.update(fitHash, skillHash, gamedataVersion, stats)
+        eos.db.commit()
+        pyfalog.debug("Stored stats of {0} fits", len(pending))
+
+    def getStats(self, fitIDs=None):
+        """
+        {fit ID: FitStats} of the given fits (all by default) which have valid stored stats, read with a single
+        query. See fill() for the rest
+        """
+        self.write()
+        gamedataVersion = eos.config.gamedata_version
+        skillHashes = {}
+        statsMap = {}
+        for cached, fitID, characterID in eos.db.getCachedFitStats(fitIDs):
+            if fitID is None or cached.gamedataVersion != gamedataVersion:
+                continue
+            if characterID not in skillHashes:
+                character = eos.db.getCharacter(characterID) if characterID is not None else Character.getAll0()
+                skillHashes[characterID] = character.skillHash if character is not None else None
+            if cached.skillHash != skillHashes[characterID]:
+                continue
+            # Loaded fits may have been changed without a recalculation (e.g. cargo)
+            fit = eos.db.getLoadedFit(fitID)
+            if fit is not None and cached.fitHash != fit.getContentHash():
+                continue
+            stats = cached.stats
+            if stats is not None:
+                statsMap[fitID] = stats
+        return statsMap
+
+    def fill(self, fitIDs, callback):
+        """
+        Calculate the given fits in worker processes and store their stats. Callback receives {fit ID: FitStats} on
+        the GUI thread, once they are written to the database
+        """
+        def cb(statsMap):
+            self.write()
+            callback(statsMap)
+
+        self.fitStatsWorkerThread.trigger(list(fitIDs), cb)
+
+    def clear(self):
+        """Forget all stored stats, for changes which affect fits without changing them"""
+        if not self.enabled:
+            return
+        with self.__lock:
+            self.__calculated.clear()
+            self.__pending.clear()
+        eos.db.clearCachedFitStats()
+
+    def createCalculator(self):
+        """Batch calculator working with the databases in use, see service.batch"""
+        # Imported here, batch imports this module in its workers
+        from service.batch import BatchCalculator
+        return BatchCalculator(gameDB=config.gameDB, saveDB=config.saveDB, processes=self.workerProcesses,
+                               savePath=config.savePath, chunkSize=1)
+
+
+class FitStatsWorkerThread(threading.Thread):
+
+    def __init__(self, cache):
+        threading.Thread.__init__(self)
+        self.name = "FitStatsWorker"
+        self.cache = cache
+        self.queue = queue.Queue()
+        pyfalog.debug("Initialize FitStatsWorkerThread.")
+
+    def run(self):
+        # Fits are calculated in worker processes, each with its own database session. Calculation state (the
+        # saveddata session, calculation tracker, skill modifier recorder, character skills) isn't thread-safe,
+        # so doing it here would interfere with calculations on the GUI thread
+        calculator = None
+        while True:
+            fitIDs, callback = self.queue.get()
+            statsMap = {}
+            try:
+                if calculator is None:
+                    calculator = self.cache.createCalculator()
+                for fitID, key, stats in calculator.iterFitStats(fitIDs):
+                    if stats is not None:
+                        self.cache.storeStats(fitID, key, stats)
+                        statsMap[fitID] = stats
+            except Exception as e:
+                pyfalog.error("Failed to calculate stats of fits: {0}", e)
+            callAfter(callback, statsMap)
+            self.queue.task_done()
+
+    def trigger(self, fitIDs, callback):
+        self.queue.put((fitIDs, callback))
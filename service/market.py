@@ -21,8 +21,6 @@ import queue
 import threading
 from collections import OrderedDict
 
-# noinspection PyPackageRequirements
-import wx
 from logbook import Logger
 from sqlalchemy.sql import or_
 
@@ -33,6 +31,7 @@ from eos.gamedata import Category as types_Category, Group as types_Group, Item
 from service import conversions
 from service.jargon import JargonLoader
 from service.settings import SettingsProvider
+from utils.dispatch import callAfter
 
 pyfalog = Logger(__name__)
 
@@ -66,7 +65,7 @@ class ShipBrowserWorkerThread(threading.Thread):
                     set_ = sMkt.getShipList(id_)
                     cache[id_] = set_
 
-                wx.CallAfter(callback, (id_, set_))
+                callAfter(callback, (id_, set_))
             except Exception as e:
                 pyfalog.critical("Callback failed.")
                 pyfalog.critical(e)
@@ -131,7 +130,7 @@ class SearchWorkerThread(threading.Thread):
             for item in [*results, *jargon_results]:
                 if sMkt.getPublicityByItem(item):
                     items.add(item)
-            wx.CallAfter(callback, items)
+            callAfter(callback, items)
 
     def scheduleSearch(self, text, callback, filterOn=True):
         self.cv.acquire()
@@ -5,7 +5,7 @@ from numbers import Number
 from logbook import Logger
 
 import eos.db
-from config import version as pyfaVersion
+import config
 from service.fit import Fit
 from service.market import Market
 from eos.const import FittingModuleState, FittingHardpoint, FittingSlot
@@ -16,9 +16,6 @@ from eos.effectHandlerHelpers import HandledList
 from eos.db import gamedata_session, getCategory, getAttributeInfo, getGroup
 from eos.gamedata import Attribute, Effect, Group, Item, ItemEffect
 from eos.utils.spoolSupport import SpoolType, SpoolOptions
-from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
-from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModuleCommand
-from gui.fitCommands.helpers import ModuleInfo
 
 
 pyfalog = Logger(__name__)
@@ -66,6 +63,10 @@ class EfsPort:
 
         if propID is None:
             return None
+        # Fit commands live in GUI package; import them here so that service.port works headless
+        from gui.fitCommands.calc.module.localAdd import CalcAddLocalModuleCommand
+        from gui.fitCommands.calc.module.localRemove import CalcRemoveLocalModuleCommand
+        from gui.fitCommands.helpers import ModuleInfo
         CalcAddLocalModuleCommand(fitID, ModuleInfo(itemID=propID)).Do()
         sFit.recalc(fit)
         fit = eos.db.getFit(fitID)
@@ -590,7 +591,9 @@ class EfsPort:
         pyfalog.info("Creating Eve Fleet Simulator data for: " + fit.name)
         fitModAttr = fit.ship.getModifiedItemAttr
         propData = EfsPort.getPropData(fit, sFit)
-        mwdPropSpeed = fit.maxSpeed
+        # Taken after prop data, which recalculates the fit with its prop module offlined
+        fitStats = fit.getStats()
+        mwdPropSpeed = fitStats.maxSpeed
         if includeShipTypeData:
             mwdPropSpeed = EfsPort.getT2MwdSpeed(fit, sFit)
         projections = EfsPort.getOutgoingProjectionData(fit)
@@ -625,8 +628,8 @@ class EfsPort:
         resonance = {"hull": hullResonance, "armor": armorResonance, "shield": shieldResonance}
         shipSize = EfsPort.getShipSize(fit.ship.item.groupID)
         # Export at maximum spool for consistency, spoolup data is exported anyway.
-        defaultSpoolValue = 1
-        spoolOptions = SpoolOptions(SpoolType.SCALE, defaultSpoolValue, True)
+        # Index of full spool in spool dependent FitStats tuples
+        fullSpool = 2
 
         def roundNumbers(data, digits):
             if isinstance(data, str):
@@ -648,14 +651,15 @@ class EfsPort:
             return
 
         try:
+            # Stats dicts are copied, rounding below changes them in place
             dataDict = {
-                "name": fitName, "ehp": fit.ehp, "droneDPS": fit.getDroneDps().total,
-                "droneVolley": fit.getDroneVolley().total, "hp": fit.hp, "maxTargets": fit.maxTargets,
-                "maxSpeed": fit.maxSpeed, "weaponVolley": fit.getWeaponVolley(spoolOptions=spoolOptions).total,
-                "totalVolley": fit.getTotalVolley(spoolOptions=spoolOptions).total, "maxTargetRange": fit.maxTargetRange,
-                "scanStrength": fit.scanStrength, "weaponDPS": fit.getWeaponDps(spoolOptions=spoolOptions).total,
-                "alignTime": fit.alignTime, "signatureRadius": fitModAttr("signatureRadius"), "weapons": weaponSystems,
-                "scanRes": fitModAttr("scanResolution"), "capUsed": fit.capUsed, "capRecharge": fit.capRecharge,
+                "name": fitName, "ehp": dict(fitStats.ehp), "droneDPS": fitStats.droneDps.total,
+                "droneVolley": fitStats.droneVolley.total, "hp": dict(fitStats.hp), "maxTargets": fitStats.maxTargets,
+                "maxSpeed": fitStats.maxSpeed, "weaponVolley": fitStats.weaponVolley[fullSpool].total,
+                "totalVolley": fitStats.totalVolley[fullSpool].total, "maxTargetRange": fitStats.maxTargetRange,
+                "scanStrength": fitStats.scanStrength, "weaponDPS": fitStats.weaponDps[fullSpool].total,
+                "alignTime": fitStats.alignTime, "signatureRadius": fitModAttr("signatureRadius"), "weapons": weaponSystems,
+                "scanRes": fitModAttr("scanResolution"), "capUsed": fitStats.capUsed, "capRecharge": fitStats.capRecharge,
                 "rigSlots": fitModAttr("rigSlots"), "lowSlots": fitModAttr("lowSlots"),
                 "midSlots": fitModAttr("medSlots"), "highSlots": fitModAttr("hiSlots"),
                 "turretSlots": fitModAttr("turretSlotsLeft"), "launcherSlots": fitModAttr("launcherSlotsLeft"),
@@ -667,7 +671,7 @@ class EfsPort:
                 "unpropedSpeed": propData["unpropedSpeed"], "unpropedSig": propData["unpropedSig"],
                 "usingMWD": propData["usingMWD"], "mwdPropSpeed": mwdPropSpeed, "projections": projections,
                 "modTypeIDs": modTypeIDs, "moduleNames": moduleNames,
-                "pyfaVersion": pyfaVersion, "efsExportVersion": EfsPort.version
+                "pyfaVersion": config.version, "efsExportVersion": EfsPort.version
             }
             # Recursively round any numbers in dicts to 6 decimal places.
             # This prevents meaningless rounding errors from changing the output whenever pyfa changes.
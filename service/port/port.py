@@ -76,7 +76,7 @@ class Port(object):
             success = True
             try:
                 iportuser.on_port_process_start()
-                backedUpFits = Port.exportXml(svcFit.getInstance().getAllFits(), iportuser)
+                backedUpFits = Port.exportXml(svcFit.getInstance().iterAllFits(), iportuser)
                 backupFile = open(path, "w", encoding="utf-8")
                 backupFile.write(backedUpFits)
                 backupFile.close()
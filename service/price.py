@@ -23,7 +23,6 @@ import threading
 from itertools import chain
 
 import math
-import wx
 from logbook import Logger
 
 from eos import db
@@ -31,6 +30,7 @@ from eos.saveddata.price import PriceStatus
 from service.fit import Fit
 from service.market import Market
 from service.network import TimeoutError
+from utils.dispatch import callAfter
 
 
 pyfalog = Logger(__name__)
@@ -227,7 +227,7 @@ class PriceWorkerThread(threading.Thread):
             if len(requests) > 0:
                 Price.fetchPrices(requests, fetchTimeout, validityOverride)
 
-            wx.CallAfter(callback)
+            callAfter(callback)
             queue.task_done()
 
             # After we fetch prices, go through the list of waiting items and call their callbacks
@@ -235,7 +235,7 @@ class PriceWorkerThread(threading.Thread):
                 callbacks = self.wait.pop(price.typeID, None)
                 if callbacks:
                     for callback in callbacks:
-                        wx.CallAfter(callback)
+                        callAfter(callback)
 
     def trigger(self, prices, callbacks, fetchTimeout, validityOverride):
         self.queue.put((callbacks, prices, fetchTimeout, validityOverride))
@@ -397,6 +397,7 @@ class StatViewSettings(object):
         serviceStatViewDefaultSettings = {
             "resources"    : 2,
             "resistances"  : 2,
+            "damagePatterns": 0,
             "recharge"     : 2,
             "firepower"    : 2,
             "capacitor"    : 2,
@@ -518,6 +519,11 @@ class EOSSettings(object):
             return self.EOSSettings[type]
 
         def set(self, type, value):
+            if self.EOSSettings[type] != value:
+                # Imported here, it depends on this module through eos and config
+                from service.fitStatsCache import FitStatsCache
+                # Calculation settings apply to every fit, stored stats may be off now
+                FitStatsCache.getInstance().clear()
             self.EOSSettings[type] = value
 
 # @todo: migrate fit settings (from fit service) here?
@@ -21,6 +21,7 @@ import copy
 
 from eos import db
 from eos.saveddata.targetResists import TargetResists as es_TargetResists
+from service.fitStatsCache import FitStatsCache
 
 
 class ImportError(Exception):
@@ -60,6 +61,7 @@ class TargetResists(object):
     @staticmethod
     def deletePattern(p):
         db.remove(p)
+        FitStatsCache.getInstance().clear()
 
     @staticmethod
     def copyPattern(p):
@@ -70,9 +72,14 @@ class TargetResists(object):
     @staticmethod
     def saveChanges(p):
         db.save(p)
+        # Stored stats of fits using the pattern are stale now
+        FitStatsCache.getInstance().clear()
 
     def importPatterns(self, text):
         imports, num = es_TargetResists.importPatterns(text)
+        if imports:
+            # Existing patterns may have been updated
+            FitStatsCache.getInstance().clear()
         lenImports = len(imports)
 
         if lenImports == 0:
@@ -0,0 +1,173 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+from math import exp, sqrt
+
+from eos.capSim import CapSimulator
+
+
+def getSimulator(modules, capacity=400.0, recharge=120000.0):
+    sim = CapSimulator()
+    sim.capacitorCapacity = capacity
+    sim.capacitorRecharge = recharge
+    sim.init(modules)
+    return sim
+
+
+def test_timelineSamplesRecharge():
+    """Activations far apart from each other still give samples once per step, following cap recharge"""
+    pytest.importorskip("numpy")
+    sim = getSimulator([(60000, 300.0, 0, False, 0)], recharge=40000.0)
+    sim.t_max = 180000
+    sim.timeline_samples = 90
+    sim.run()
+    times, caps = sim.timeline
+    step = float(sim.t_max) / sim.timeline_samples
+
+    assert times[0] == 0
+    assert times[-1] >= sim.t_max - step
+    for i in range(1, len(times)):
+        assert times[i] - times[i - 1] <= step + 1e-6
+
+    # Between activations cap only recharges, following simulator's recharge formula
+    tau = sim.capacitorRecharge / 5.0
+    afterActivation = caps[1]
+    for t, cap in zip(times, caps):
+        if 0 < t < 60000:
+            expected = ((1.0 + (sqrt(afterActivation / sim.capacitorCapacity) - 1.0) * exp(-t / tau)) ** 2) * \
+                sim.capacitorCapacity
+            assert cap == pytest.approx(expected)
+
+
+STABLE_SETUPS = (
+    (400.0, 120000.0, [(5000, 10.0, 0, False, 0)]),
+    (1000.0, 200000.0, [(3000, 10.0, 0, False, 0), (5000, 15.0, 0, False, 0)]),
+    (2000.0, 300000.0, [(4000, 12.0, 0, False, 0)] * 3 + [(10000, 30.0, 0, False, 0)]),
+    (5000.0, 500000.0, [(2500, 20.0, 0, False, 0), (12000, 80.0, 0, False, 0)]),
+)
+
+
+def test_analyticMatchesSimulation():
+    for capacity, recharge, modules in STABLE_SETUPS:
+        simulated = getSimulator(modules, capacity, recharge)
+        simulated.run()
+        solved = getSimulator(modules, capacity, recharge)
+        solved.analytic = True
+        solved.run()
+
+        assert simulated.solver == "simulation"
+        assert solved.solver == "analytic"
+        assert simulated.cap_stable_low > 0
+        assert solved.cap_stable_eve == pytest.approx(simulated.cap_stable_eve)
+        assert solved.cap_stable_low == pytest.approx(simulated.cap_stable_low, abs=capacity * 0.01)
+        assert solved.cap_stable_high == pytest.approx(simulated.cap_stable_high, abs=capacity * 0.01)
+
+
+NEAR_BOUNDARY_SETUPS = (
+    # Average drain close to peak recharge rate
+    (1933.0, 133208.0, [(2500, 90.0, 0, False, 0)]),
+    (1933.0, 133208.0, [(2500, 90.7, 0, False, 0)]),
+    # Stable level is only a few activations above empty
+    (100.0, 60000.0, [(10000, 40.0, 0, False, 0)]),
+    (100.0, 60000.0, [(30000, 75.0, 0, False, 0)]),
+)
+
+
+def test_analyticNearBoundaryIsSimulated():
+    """Setups too close to running dry for the analytic estimate are simulated, and get simulation's answer"""
+    for capacity, recharge, modules in NEAR_BOUNDARY_SETUPS:
+        simulated = getSimulator(modules, capacity, recharge)
+        simulated.stagger = True
+        simulated.run()
+        solved = getSimulator(modules, capacity, recharge)
+        solved.stagger = True
+        solved.analytic = True
+        solved.run()
+
+        assert solved.solver == "simulation"
+        assert solved.cap_stable_low == simulated.cap_stable_low
+        assert solved.t == simulated.t
+
+
+def test_analyticFallsBackToSimulation():
+    # Unstable setup
+    sim = getSimulator([(3000, 50.0, 0, False, 0)])
+    sim.analytic = True
+    sim.run()
+    assert sim.solver == "simulation"
+    assert sim.cap_stable_low == 0
+
+    # Cap boosters are simulated even when stable
+    sim = getSimulator([(5000, 10.0, 0, False, 0), (12000, -100.0, 8, False, 10000)])
+    sim.analytic = True
+    sim.reload = True
+    sim.run()
+    assert sim.solver == "simulation"
+
+
+def test_resultCacheHitsAndMisses():
+    from eos.capSim import resultCache
+
+    resultCache.clear()
+    modules = [(3000, 10.0, 0, False, 0), (5000, 15.0, 0, False, 0)]
+
+    first = getSimulator(modules, 1000.0, 200000.0)
+    first.cache = True
+    first.run()
+    assert not first.cached
+    assert (resultCache.hits, resultCache.misses) == (0, 1)
+
+    # Module order doesn't matter
+    second = getSimulator(list(reversed(modules)), 1000.0, 200000.0)
+    second.cache = True
+    second.run()
+    assert second.cached
+    assert (resultCache.hits, resultCache.misses) == (1, 1)
+    assert (second.cap_stable_eve, second.cap_stable_low, second.cap_stable_high, second.t) == \
+        (first.cap_stable_eve, first.cap_stable_low, first.cap_stable_high, first.t)
+
+    # Anything simulation depends on is part of the key
+    third = getSimulator(modules, 1000.0, 200000.0)
+    third.cache = True
+    third.stagger = True
+    third.run()
+    assert not third.cached
+    assert (resultCache.hits, resultCache.misses) == (1, 2)
+
+    # Timelines are always simulated
+    pytest.importorskip("numpy")
+    fourth = getSimulator(modules, 1000.0, 200000.0)
+    fourth.cache = True
+    fourth.timeline_samples = 10
+    fourth.run()
+    assert not fourth.cached
+    assert fourth.timeline is not None
+    assert (resultCache.hits, resultCache.misses) == (1, 2)
+    resultCache.clear()
+
+
+def test_resultCacheEviction():
+    from eos.capSim import CapSimResultCache
+
+    cache = CapSimResultCache(size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    # "b" is least recently used now
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,84 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+ITEM_NAMES = (
+    "Rifter", "Keepstar", "Curse", "Heron", "200mm AutoCannon II", "Small Shield Booster II", "Gyrostabilizer II",
+    "Medium Energy Neutralizer II", "Remote Sensor Booster II", "Prototype Cloaking Device I", "Warrior II",
+    "EMP S", "Strong Blue Pill Booster", "Gunnery", "Navigation", "Drones",
+)
+RUN_TIMES = ("early", "normal", "late")
+
+
+@pytest.fixture
+def Items(DB, Gamedata):
+    Item = Gamedata['Item']
+    items = DB['gamedata_session'].query(Item).filter(Item.name.in_(ITEM_NAMES)).all()
+    assert items
+    return items
+
+
+def getOldEffects(item, filterFunc):
+    return {effect for effect in item.effects.values() if filterFunc(effect)}
+
+
+def test_passiveBuckets(Items):
+    """
+    Ships, implants, skills and local drones used to run passive effects only; offline effects such as the
+    cloak scan resolution penalty must not get into their buckets
+    """
+    for item in Items:
+        for runTime in RUN_TIMES:
+            old = getOldEffects(item, lambda e: e.runTime == runTime and e.isType("passive") and e.activeByDefault)
+            bucket = item.getEffectBucket(runTime, effectType="passive")
+            assert set(bucket) == old
+            assert len(bucket) == len(old)
+
+
+def test_offlineEffectNotPassive(DB):
+    cloak = DB['db'].getItem("Prototype Cloaking Device I")
+    offline = [e for e in cloak.effects.values() if e.isType("offline")]
+    assert offline
+    for runTime in RUN_TIMES:
+        for effect in cloak.getEffectBucket(runTime, effectType="passive"):
+            assert not effect.isType("offline")
+
+
+def test_moduleBuckets(Saveddata, Items):
+    """Module buckets have to hold exactly what the old per-calculation effect checks ran"""
+    State = Saveddata['State']
+    states = (State.OFFLINE, State.ONLINE, State.ACTIVE, State.OVERHEATED)
+    for item in Items:
+        for runTime in RUN_TIMES:
+            for state in states:
+                for projected in (False, True):
+                    for gang in (False, True):
+                        old = getOldEffects(item, lambda e: (
+                            e.runTime == runTime and e.activeByDefault and
+                            (e.isType("offline") or
+                             (e.isType("passive") and state >= State.ONLINE) or
+                             (e.isType("active") and state >= State.ACTIVE)) and
+                            ((projected and e.isType("projected")) or not projected) and
+                            ((gang and e.isType("gang")) or not gang)))
+                        assert set(item.getEffectBucket(runTime, state, projected, gang)) == old
+            for gang in (False, True):
+                old = getOldEffects(item, lambda e: (
+                    e.runTime == runTime and e.isType("overheat") and e.activeByDefault and
+                    ((gang and e.isType("gang")) or not gang)))
+                assert set(item.getEffectBucket(runTime, gang=gang, overheat=True)) == old
+
+
+def test_projectedAndChargeBuckets(Items):
+    """Projected drones and fighters run projected effects of any type, charges of drones and modes - everything"""
+    for item in Items:
+        for runTime in RUN_TIMES:
+            old = getOldEffects(item, lambda e: e.runTime == runTime and e.activeByDefault and e.isType("projected"))
+            assert set(item.getEffectBucket(runTime, projected=True)) == old
+            old = getOldEffects(item, lambda e: e.runTime == runTime and e.activeByDefault)
+            assert set(item.getEffectBucket(runTime)) == old
@@ -0,0 +1,88 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+from eos.effectHandlerHelpers import chargeGroupIs, chargeRequiresSkill, itemGroupIs, itemRequiresSkill
+
+
+def requiresSkill(item, skill):
+    # Direct skill requirement check, as it was done by effect lambdas
+    return any(s.name == skill or s.ID == skill for s in item.requiredSkills)
+
+
+FILTERS = (
+    (itemRequiresSkill("Small Projectile Turret"), lambda mod: requiresSkill(mod.item, "Small Projectile Turret")),
+    (itemRequiresSkill("Gunnery"), lambda mod: requiresSkill(mod.item, "Gunnery")),
+    (itemRequiresSkill(3300, "Navigation"), lambda mod: requiresSkill(mod.item, 3300) or requiresSkill(mod.item, "Navigation")),
+    (itemGroupIs("Projectile Weapon"), lambda mod: mod.item.group.name == "Projectile Weapon"),
+    (itemGroupIs("Gyrostabilizer", "Shield Booster"),
+     lambda mod: mod.item.group.name in ("Gyrostabilizer", "Shield Booster")),
+    (chargeGroupIs("Projectile Ammo"), lambda mod: mod.charge.group.name == "Projectile Ammo"),
+    (chargeRequiresSkill("Gunnery"), lambda mod: requiresSkill(mod.charge, "Gunnery")),
+)
+
+
+@pytest.fixture
+def Modules(DB, Saveddata, RifterFit):
+    for name in ("200mm AutoCannon II", "Small Shield Booster II", "200mm AutoCannon II", "Gyrostabilizer II"):
+        RifterFit.modules.append(Saveddata['Module'](DB['db'].getItem(name)))
+    RifterFit.modules[0].charge = DB['db'].getItem("EMP S")
+    return RifterFit.modules
+
+
+def scan(handledList, filterFunc):
+    matched = []
+    for element in handledList:
+        try:
+            if filterFunc(element):
+                matched.append(element)
+        except AttributeError:
+            continue
+    return matched
+
+
+def assertFiltersMatch(handledList):
+    for indexedFilter, oldFilter in FILTERS:
+        expected = scan(handledList, oldFilter)
+        assert [id(e) for e in handledList._HandledList__filter(indexedFilter)] == [id(e) for e in expected]
+        assert scan(handledList, indexedFilter) == expected
+
+
+def test_indexedFilters(Modules):
+    assertFiltersMatch(Modules)
+
+
+def test_indexedFiltersAfterChanges(DB, Saveddata, Modules):
+    # Build indexes first, so that list changes have to update them
+    assertFiltersMatch(Modules)
+
+    Modules.append(Saveddata['Module'](DB['db'].getItem("200mm AutoCannon II")))
+    assertFiltersMatch(Modules)
+
+    Modules.insert(1, Saveddata['Module'](DB['db'].getItem("Gyrostabilizer II")))
+    assertFiltersMatch(Modules)
+
+    Modules.remove(Modules[0])
+    assertFiltersMatch(Modules)
+
+    Modules.pop()
+    assertFiltersMatch(Modules)
+
+    Modules[1] = Saveddata['Module'](DB['db'].getItem("200mm AutoCannon II"))
+    assertFiltersMatch(Modules)
+
+    del Modules[0]
+    assertFiltersMatch(Modules)
+
+    Modules.extend([Saveddata['Module'](DB['db'].getItem("Small Shield Booster II"))])
+    assertFiltersMatch(Modules)
+
+    Modules[0].charge = DB['db'].getItem("Republic Fleet Phased Plasma S")
+    Modules.invalidateIndexes()
+    assertFiltersMatch(Modules)
@@ -0,0 +1,46 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+
+
+def test_mutatedModuleWithSnapshot(DB, Saveddata, tmpdir):
+    """
+    Mutated module has to get attributes of its base item when attributes are read from gamedata snapshot
+    """
+    from eos.db.gamedata.snapshot import getSnapshot, resetSnapshot, writeSnapshot
+    from eos.gamedata import DynamicItemItem
+
+    applicable = DB['gamedata_session'].query(DynamicItemItem).first()
+    mutaplasmid = applicable.mutaplasmid
+    baseItem = DB['db'].getItem(applicable.applicableTypeID)
+
+    path = str(tmpdir.join("eve.snapshot"))
+    writeSnapshot(DB['db'].gamedata_engine.execute, path)
+    DB['config'].gamedataSnapshot = path
+    resetSnapshot()
+    try:
+        snapshot = getSnapshot()
+        assert snapshot is not None
+        ownAttributes = snapshot.getItemAttributes(mutaplasmid.resultingItem.ID)
+
+        mod = Saveddata['Module'](mutaplasmid.resultingItem, baseItem, mutaplasmid)
+
+        for name, attr in baseItem.attributes.items():
+            assert name in mod.item.attributes
+            if name not in ownAttributes:
+                assert mod.item.attributes[name].value == attr.value
+        for name, attr in ownAttributes.items():
+            assert mod.item.attributes[name].value == attr.value
+        for dynamicAttr in mutaplasmid.attributes:
+            attr = mod.item.attributes[dynamicAttr.name]
+            assert attr.ID in mod.mutators
+            assert attr.displayName == dynamicAttr.displayName
+            assert attr.published == dynamicAttr.published
+    finally:
+        DB['config'].gamedataSnapshot = None
+        resetSnapshot()
@@ -0,0 +1,145 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+from itertools import product
+from types import SimpleNamespace
+
+from eos.const import FittingHardpoint, FittingModuleState
+from eos.graph.fitDps import FitDpsGraph
+from eos.utils.stats import DmgTypes
+
+numpy = pytest.importorskip("numpy")
+
+
+class FakeItem(object):
+    """Stands in for modules, drones and fighters, with only what DPS graph reads"""
+
+    def __init__(self, dps=0, attrs=None, chargeAttrs=None, effects=(), hardpoint=FittingHardpoint.NONE,
+                 state=FittingModuleState.ACTIVE):
+        self.dps = dps
+        self.attrs = attrs or {}
+        self.chargeAttrs = chargeAttrs or {}
+        self.item = SimpleNamespace(effects=set(effects))
+        self.hardpoint = hardpoint
+        self.state = state
+        self.isEmpty = False
+        self.active = True
+        self.abilities = []
+
+    @property
+    def maxRange(self):
+        return self.attrs.get("maxRange")
+
+    @property
+    def falloff(self):
+        return self.attrs.get("falloff")
+
+    def getModifiedItemAttr(self, key, default=0):
+        return self.attrs.get(key) or default
+
+    def getModifiedChargeAttr(self, key, default=0):
+        return self.chargeAttrs.get(key) or default
+
+    def getDps(self, targetResists=None):
+        return DmgTypes(self.dps, 0, 0, 0)
+
+
+def turret(dps, optimal, falloff, tracking, sigRes=40, state=FittingModuleState.ACTIVE):
+    return FakeItem(dps, {"maxRange": optimal, "falloff": falloff, "trackingSpeed": tracking,
+                          "optimalSigRadius": sigRes}, hardpoint=FittingHardpoint.TURRET, state=state)
+
+
+def missile(dps, flightRange, explosionRadius, explosionVelocity, drf):
+    return FakeItem(dps, {"maxRange": flightRange}, {"aoeCloudSize": explosionRadius,
+                                                     "aoeVelocity": explosionVelocity,
+                                                     "aoeDamageReductionFactor": drf},
+                    hardpoint=FittingHardpoint.MISSILE)
+
+
+def web(speedFactor, optimal, falloff=0):
+    return FakeItem(attrs={"speedFactor": speedFactor, "maxRange": optimal, "falloff": falloff,
+                           "falloffEffectiveness": falloff}, effects=("remoteWebifierFalloff",))
+
+
+def painter(bonus, optimal, falloff):
+    return FakeItem(attrs={"signatureRadiusBonus": bonus, "maxRange": optimal, "falloff": falloff},
+                    effects=("remoteTargetPaintFalloff",))
+
+
+def drone(dps, speed=3000):
+    return FakeItem(dps, {"maxVelocity": speed})
+
+
+def sentry(dps, optimal, falloff, tracking):
+    return FakeItem(dps, {"maxVelocity": 0, "maxRange": optimal, "falloff": falloff, "trackingSpeed": tracking,
+                          "optimalSigRadius": 125})
+
+
+def fighter(dps, explosionRadius, explosionVelocity, reductionFactor, reductionSensitivity):
+    prefix = "fighterAbilityMissiles"
+    squad = FakeItem(attrs={
+        "{}ExplosionRadius".format(prefix): explosionRadius,
+        "{}ExplosionVelocity".format(prefix): explosionVelocity,
+        "{}DamageReductionFactor".format(prefix): reductionFactor,
+        "{}DamageReductionSensitivity".format(prefix): reductionSensitivity})
+    squad.abilities.append(SimpleNamespace(dealsDamage=True, active=True, attrPrefix=prefix, fighter=squad,
+                                           getDps=lambda targetResists=None: DmgTypes(0, dps, 0, 0)))
+    return squad
+
+
+SETUPS = {
+    "turrets": dict(modules=[turret(100, 1200, 6000, 0.4), turret(80, 15000, 10000, 0.05),
+                             turret(500, 1000, 1000, 1, state=FittingModuleState.ONLINE)]),
+    "missiles": dict(modules=[missile(60, 45000, 40, 170, 0.604), missile(150, 20000, 125, 69, 0.882)]),
+    "drones": dict(drones=[drone(70), sentry(120, 30000, 20000, 0.03), sentry(90, 50000, 30000, 0.015)]),
+    "ewar": dict(modules=[turret(100, 1200, 6000, 0.4), missile(60, 45000, 40, 170, 0.604),
+                          web(-60, 10000), web(-50, 13000, 6500), painter(30, 30000, 45000),
+                          painter(25, 60000, 20000)]),
+    "fighters": dict(fighters=[fighter(250, 1000, 50, 5.5, 0.55), fighter(150, 8250, 100, 2.5, 0.5)]),
+}
+
+DISTANCES = (0.5, 2, 8, 15, 30, 70)
+VELOCITIES = (0, 150, 1200)
+SIGNATURES = (None, 40, 400)
+ANGLES = (0, 45, 90)
+
+
+@pytest.fixture(params=sorted(SETUPS))
+def Graph(request):
+    setup = SETUPS[request.param]
+    fit = SimpleNamespace(modules=setup.get("modules", []), drones=setup.get("drones", []),
+                          fighters=setup.get("fighters", []), targetResists=None,
+                          extraAttributes={"droneControlRange": 60000}, calcGeneration=0)
+    return FitDpsGraph(fit)
+
+
+def test_calcDpsArrayMatchesCalcDps(Graph):
+    """Vectorized DPS has to be what calcDps() gives point by point"""
+    nonZero = False
+    for distance, velocity, signatureRadius, angle in product(DISTANCES, VELOCITIES, SIGNATURES, ANGLES):
+        # calcDps() applies webs and painters to the data it gets
+        expected = Graph.calcDps({"distance": distance, "velocity": velocity,
+                                  "signatureRadius": signatureRadius, "angle": angle})
+        assert float(Graph.calcDpsArray(distance, velocity, signatureRadius, angle)) == \
+            pytest.approx(expected, rel=1e-9, abs=1e-9)
+        nonZero = nonZero or expected > 0
+    assert nonZero
+
+
+def test_calcDpsArrayBroadcasts(Graph):
+    """Whole grid at once gives the same as one point at a time"""
+    distances, velocities, angles = numpy.meshgrid(DISTANCES, VELOCITIES, ANGLES, indexing="ij", sparse=True)
+    for signatureRadius in SIGNATURES:
+        grid = Graph.calcDpsArray(distances, velocities, signatureRadius, angles)
+        assert grid.shape == (len(DISTANCES), len(VELOCITIES), len(ANGLES))
+        for (i, distance), (j, velocity), (k, angle) in product(
+                enumerate(DISTANCES), enumerate(VELOCITIES), enumerate(ANGLES)):
+            assert grid[i, j, k] == pytest.approx(
+                float(Graph.calcDpsArray(distance, velocity, signatureRadius, angle)), rel=1e-12)
@@ -9,6 +9,8 @@ print(script_dir)
 sys.path.append(script_dir)
 
 # noinspection PyPackageRequirements
+import pytest
+
 
 def test_multiply_stacking_penalties(DB, Saveddata, RifterFit):
     """
@@ -46,3 +48,137 @@ def test_multiply_stacking_penalties(DB, Saveddata, RifterFit):
 
         assert em_resist == calculated_resist
         # print(str(em_resist) + "==" + str(calculated_resist))
+
+
+class FakeAttribute(object):
+    def __init__(self, value):
+        self.value = value
+
+
+def getSyntheticDict(cls, count=10):
+    import eos.modifiedAttributeDict as mad
+
+    names = ["testAttribute{}".format(i) for i in range(count)]
+    # Keep the engine away from the database
+    for name in names:
+        mad.cappingAttrKeyCache[name] = None
+        mad.defaultValuesCache[name] = 0.0
+    attrDict = cls()
+    attrDict.original = {name: FakeAttribute(float(i + 1) * 10) for i, name in enumerate(names)}
+    return attrDict, names
+
+
+def modifySyntheticDict(attrDict, names):
+    attrDict.preAssign(names[0], 50)
+    attrDict.increase(names[0], 5)
+    attrDict.increase(names[1], 3, position="post")
+    attrDict.multiply(names[1], 1.1)
+    for multiplier in (1.2, 1.3, 0.8, 1.05):
+        attrDict.multiply(names[2], multiplier, stackingPenalties=True)
+    attrDict.multiply(names[2], 1.5, stackingPenalties=True, penaltyGroup="other")
+    attrDict.boost(names[3], 10)
+    attrDict.boost(names[3], -25)
+    attrDict.force(names[4], 7)
+    attrDict.multiply(names[5], None)
+    attrDict.increase(names[6], -2)
+    for multiplier in (0.5, 0.9, 1.05, 1.1, 0.95):
+        attrDict.multiply(names[6], multiplier, stackingPenalties=True)
+    attrDict[names[7]] = 99
+
+
+def getSyntheticValues(attrDict, names):
+    return {name: attrDict[name] for name in names}, set(attrDict), len(attrDict)
+
+
+def test_compactMatchesRegular():
+    """Compact backend gives the same values as the regular one for every kind of modification"""
+    from eos.modifiedAttributeDict import CompactModifiedAttributeDict, ModifiedAttributeDict
+
+    results = []
+    for cls in (ModifiedAttributeDict, CompactModifiedAttributeDict):
+        attrDict, names = getSyntheticDict(cls)
+        modifySyntheticDict(attrDict, names)
+        values = getSyntheticValues(attrDict, names)
+        # Same modifications after clearing have to give the same result
+        attrDict.clear()
+        assert attrDict[names[0]] == 10
+        modifySyntheticDict(attrDict, names)
+        assert getSyntheticValues(attrDict, names) == values
+        results.append(values)
+    assert results[0] == results[1]
+
+
+def test_compactFitMatchesRegular(DB, Saveddata, monkeypatch):
+    """Fit calculated with compact attribute dicts has the same attributes and afflictions"""
+    from eos.modifiedAttributeDict import CompactModifiedAttributeDict
+
+    results = []
+    for compact in (False, True):
+        monkeypatch.setitem(DB['config'].settings, "compactAttributeDicts", compact)
+        fit = Saveddata['Fit'](Saveddata['Ship'](DB['db'].getItem("Rifter")), "Compact Rifter")
+        fit.character = Saveddata['Character'].getAll5()
+        for name in ("200mm AutoCannon II", "200mm AutoCannon II", "Small Shield Booster II", "Gyrostabilizer II"):
+            mod = Saveddata['Module'](DB['db'].getItem(name))
+            mod.state = Saveddata['State'].ACTIVE if mod.isValidState(Saveddata['State'].ACTIVE) else \
+                Saveddata['State'].ONLINE
+            fit.modules.append(mod)
+        fit.modules[0].charge = DB['db'].getItem("EMP S")
+        fit.calculateModifiedAttributes()
+        assert isinstance(fit.ship.itemModifiedAttributes, CompactModifiedAttributeDict) is compact
+
+        values = {}
+        for index, item in enumerate([fit.ship] + list(fit.modules)):
+            for attrName in ("itemModifiedAttributes", "chargeModifiedAttributes"):
+                attrDict = getattr(item, attrName, None)
+                if attrDict is None or attrDict.original is None:
+                    continue
+                for key in attrDict:
+                    afflictions = [(type(modifier).__name__, modifier.item.name, operation, bonus, used)
+                                   for afflictors in attrDict.getAfflictions(key).values()
+                                   for modifier, operation, bonus, used in afflictors]
+                    values[(index, attrName, key)] = (attrDict[key], afflictions)
+        results.append(values)
+    assert results[0] == results[1]
+
+
+def getOldPenalizedValue(val, penalizedMultiplierGroups):
+    # Stacking penalties as they were applied by each attribute's own calculation
+    for penalizedMultipliers in penalizedMultiplierGroups:
+        l1 = sorted((_val for _val in penalizedMultipliers if _val > 1), key=lambda _val: -abs(_val - 1))
+        l2 = sorted((_val for _val in penalizedMultipliers if _val < 1), key=lambda _val: -abs(_val - 1))
+        for l in (l1, l2):
+            for i in range(len(l)):
+                val *= 1 + (l[i] - 1) * math.exp(- i ** 2 / 7.1289)
+    return val
+
+
+def test_finalizeMatchesPenalizedProducts(monkeypatch):
+    """Batch finalization gives the same values as stacking penalties applied attribute by attribute"""
+    import random
+    import eos.modifiedAttributeDict as mad
+
+    rng = random.Random(1)
+    for useNumpy in (True, False):
+        if not useNumpy:
+            monkeypatch.setattr(mad, "numpy", None)
+        for cls in (mad.ModifiedAttributeDict, mad.CompactModifiedAttributeDict):
+            attrDicts = []
+            expected = []
+            for _ in range(5):
+                attrDict, names = getSyntheticDict(cls, 20)
+                for i, name in enumerate(names):
+                    groups = []
+                    for group in range(i % 3 + 1):
+                        multipliers = [rng.choice((rng.uniform(0.5, 0.99), rng.uniform(1.01, 1.6)))
+                                       for _ in range(rng.randint(0, 12))]
+                        for multiplier in multipliers:
+                            attrDict.multiply(name, multiplier, stackingPenalties=True, penaltyGroup=str(group))
+                        groups.append(multipliers)
+                    attrDict.multiply(name, 1.25)
+                    base = attrDict.getOriginal(name) * 1.25
+                    expected.append((attrDict, name, getOldPenalizedValue(base, groups)))
+                attrDicts.append(attrDict)
+
+            assert mad.finalizeAttributeDicts(attrDicts) == len(expected)
+            for attrDict, name, value in expected:
+                assert attrDict[name] == pytest.approx(value, rel=1e-12)
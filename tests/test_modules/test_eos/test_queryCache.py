@@ -0,0 +1,61 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+
+from eos.db.util import QueryCache
+
+
+def test_queryCacheEviction():
+    cache = QueryCache("test", 2)
+    cache.put(("a",), 1)
+    cache.put(("b",), 2)
+    assert cache.get(("a",)) == 1
+    # ("b",) is least recently used now
+    cache.put(("c",), 3)
+    assert len(cache) == 2
+    assert ("b",) not in cache
+    assert cache.get(("b",)) is QueryCache.MISSING
+    assert cache.get(("a",)) == 1
+    assert cache.get(("c",)) == 3
+    # Updating existing key doesn't evict anything
+    cache.put(("a",), 4)
+    assert cache.get(("a",)) == 4
+    assert cache.getStats() == {"size": 2, "maxSize": 2, "hits": 4, "misses": 1, "evictions": 1}
+
+
+def test_queryCacheInvalidate():
+    cache = QueryCache("test", 4)
+    for key in range(3):
+        cache.put(key, key)
+    cache.invalidate(1)
+    assert cache.get(1, None) is None
+    assert len(cache) == 2
+    cache.invalidate()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 1, 0)
+
+
+def test_clearQueryCaches(DB):
+    from eos.db.gamedata.queries import getItem, queryCaches
+    from eos.gamedata import SkillRequirements
+    from eos.saveddata.character import Character
+
+    item = getItem("200mm AutoCannon II")
+    assert len(queryCaches["getItem"]) > 0
+    skills = Character.getSkillList()
+    assert SkillRequirements.getRequirements(item.ID)
+
+    DB['db'].clearQueryCaches()
+    assert len(queryCaches["getItem"]) == 0
+    assert SkillRequirements._SkillRequirements__requirements is None
+    assert Character._Character__itemList is None
+
+    # Everything is loaded again on next use
+    assert getItem("200mm AutoCannon II").ID == item.ID
+    assert Character.getSkillList() is not skills
+    assert SkillRequirements.getRequirements(item.ID)
@@ -0,0 +1,79 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import gc
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+
+
+def test_skillModifiersAfterModuleReplace(DB, Saveddata, RifterFit):
+    """
+    Replayed skill modifications must not be applied to removed modules, even when a new module gets
+    the same id() as the removed one
+    """
+    RifterFit.character = Saveddata['Character'].getAll5()
+    item = DB['db'].getItem("200mm AutoCannon II")
+
+    mod = Saveddata['Module'](item)
+    mod.state = Saveddata['State'].ONLINE
+    RifterFit.modules.append(mod)
+    RifterFit.calculateModifiedAttributes()
+    expected = mod.getModifiedItemAttr("damageMultiplier")
+    assert expected != item.attributes["damageMultiplier"].value
+
+    for _ in range(5):
+        RifterFit.modules.remove(mod)
+        del mod
+        gc.collect()
+        mod = Saveddata['Module'](item)
+        mod.state = Saveddata['State'].ONLINE
+        RifterFit.modules.append(mod)
+        RifterFit.clear()
+        RifterFit.calculateModifiedAttributes()
+        assert mod.getModifiedItemAttr("damageMultiplier") == expected
+
+
+def test_skillModifiersReplayed(DB, Saveddata, RifterFit):
+    """Recalculating unchanged fit replays skill modifications and gives the same values"""
+    RifterFit.character = Saveddata['Character'].getAll5()
+    mod = Saveddata['Module'](DB['db'].getItem("200mm AutoCannon II"))
+    mod.state = Saveddata['State'].ONLINE
+    RifterFit.modules.append(mod)
+    RifterFit.calculateModifiedAttributes()
+    expected = (mod.getModifiedItemAttr("damageMultiplier"), RifterFit.ship.getModifiedItemAttr("maxVelocity"))
+
+    RifterFit.clear()
+    RifterFit.calculateModifiedAttributes()
+    assert RifterFit.skillModifierCache.operations
+    assert (mod.getModifiedItemAttr("damageMultiplier"), RifterFit.ship.getModifiedItemAttr("maxVelocity")) == expected
+
+
+def test_skillObjectsOnlyForAffectingSkills(DB, Saveddata, RifterFit):
+    """Skill objects are created only for skills whose effects modify the fit, values stay the same"""
+    character = Saveddata['Character']("Lazy Skills", 4)
+    RifterFit.character = character
+    RifterFit.trackAfflictions = True
+    mod = Saveddata['Module'](DB['db'].getItem("Gyrostabilizer II"))
+    mod.state = Saveddata['State'].ONLINE
+    RifterFit.modules.append(mod)
+    RifterFit.calculateModifiedAttributes()
+
+    loaded = {skill.item.name for skill in character.loadedSkills}
+    assert "Navigation" in loaded
+    # Fit has nothing these skills modify
+    assert not loaded.intersection(("Gunnery", "Small Projectile Turret", "Surgical Strike"))
+    velocity = RifterFit.ship.getModifiedItemAttr("maxVelocity")
+    assert velocity != RifterFit.ship.item.attributes["maxVelocity"].value
+    afflictors = [afflictor for afflictor, _, _, _ in RifterFit.ship.itemModifiedAttributes.getAfflictions(
+        "maxVelocity")[RifterFit]]
+    assert afflictors == [character.getSkill("Navigation")]
+
+    # Same values with all Skill objects created upfront
+    assert len(character.skills) > len(loaded)
+    RifterFit.clear()
+    RifterFit.calculateModifiedAttributes()
+    assert RifterFit.ship.getModifiedItemAttr("maxVelocity") == velocity
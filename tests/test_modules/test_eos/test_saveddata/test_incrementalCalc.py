@@ -0,0 +1,95 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+
+@pytest.fixture
+def IncrementalRifterFit(DB, Saveddata, RifterFit, monkeypatch):
+    monkeypatch.setitem(DB['config'].settings, "incrementalCalc", True)
+    monkeypatch.setitem(DB['config'].settings, "incrementalCalcVerify", False)
+    RifterFit.character = Saveddata['Character'].getAll5()
+    for name in ("200mm AutoCannon II", "200mm AutoCannon II", "Small Shield Booster II", "Gyrostabilizer II"):
+        mod = Saveddata['Module'](DB['db'].getItem(name))
+        mod.state = Saveddata['State'].OFFLINE
+        RifterFit.modules.append(mod)
+    RifterFit.clear()
+    RifterFit.calculateModifiedAttributes()
+    return RifterFit
+
+
+def getAttributeValues(fit):
+    values = {}
+    for index, item in enumerate([fit.ship] + list(fit.modules) + list(fit.drones)):
+        for name in ("itemModifiedAttributes", "chargeModifiedAttributes"):
+            attrDict = getattr(item, name, None)
+            if attrDict is None or attrDict.original is None:
+                continue
+            for key in attrDict:
+                values[(index, name, key)] = attrDict[key]
+    return values
+
+
+def assertIncrementalMatchesFull(fit, changedItems):
+    """Recalculate fit incrementally, and compare every attribute to what a full recalculation gives"""
+    fit.calculateIncremental(changedItems)
+    incremental = getAttributeValues(fit)
+    maxSpeed = fit.maxSpeed
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    assert incremental == getAttributeValues(fit)
+    assert maxSpeed == fit.maxSpeed
+
+
+def test_incrementalModuleStates(Saveddata, IncrementalRifterFit):
+    State = Saveddata['State']
+    for mod in IncrementalRifterFit.modules:
+        for state in (State.ONLINE, State.ACTIVE, State.OVERHEATED, State.ACTIVE, State.OFFLINE):
+            if mod.isValidState(state):
+                mod.state = state
+                assertIncrementalMatchesFull(IncrementalRifterFit, [mod])
+
+
+def test_incrementalCharges(DB, Saveddata, IncrementalRifterFit):
+    gun = IncrementalRifterFit.modules[0]
+    gun.state = Saveddata['State'].ACTIVE
+    assertIncrementalMatchesFull(IncrementalRifterFit, [gun])
+    for chargeName in ("EMP S", "Republic Fleet Phased Plasma S", None):
+        gun.charge = DB['db'].getItem(chargeName) if chargeName is not None else None
+        assertIncrementalMatchesFull(IncrementalRifterFit, [gun])
+
+    # Skill bonus to charges is applied by skill steps which didn't touch the launcher before the swap
+    launcher = Saveddata['Module'](DB['db'].getItem("Light Missile Launcher II"))
+    launcher.state = Saveddata['State'].ACTIVE
+    IncrementalRifterFit.modules.append(launcher)
+    IncrementalRifterFit.clear()
+    IncrementalRifterFit.calculateModifiedAttributes()
+    missile = DB['db'].getItem("Scourge Light Missile")
+    speedFactor = DB['db'].getItem("Missile Projection").getAttribute("speedFactor")
+    for charge in (missile, None, missile):
+        launcher.charge = charge
+        assert IncrementalRifterFit.calculateIncremental([launcher])
+        if charge is not None:
+            assert launcher.getModifiedChargeAttr("maxVelocity") == \
+                pytest.approx(missile.getAttribute("maxVelocity") * (1 + speedFactor * 5 / 100))
+        assertIncrementalMatchesFull(IncrementalRifterFit, [launcher])
+
+
+def test_incrementalDrones(DB, IncrementalRifterFit):
+    from eos.saveddata.drone import Drone
+
+    drone = Drone(DB['db'].getItem("Warrior II"))
+    drone.amount = 1
+    drone.amountActive = 0
+    IncrementalRifterFit.drones.append(drone)
+    IncrementalRifterFit.clear()
+    IncrementalRifterFit.calculateModifiedAttributes()
+    for amountActive in (1, 0, 1):
+        drone.amountActive = amountActive
+        assertIncrementalMatchesFull(IncrementalRifterFit, [drone])
@@ -0,0 +1,31 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+
+
+def getSustainableTank(fit, trackAfflictions):
+    fit.trackAfflictions = trackAfflictions
+    fit.clear()
+    fit.calculateModifiedAttributes()
+    assert fit.afflictionsCaptured == trackAfflictions
+    return dict(fit.sustainableTank)
+
+
+def test_sustainableTankWithoutAfflictions(DB, Saveddata, RifterFit):
+    """Cap unstable repairers have to be accounted for whether afflictions were captured or not"""
+    RifterFit.character = Saveddata['Character'].getAll5()
+    mod = Saveddata['Module'](DB['db'].getItem("Small Shield Booster II"))
+    mod.state = Saveddata['State'].ACTIVE
+    mod.owner = RifterFit
+    RifterFit.modules.append(mod)
+
+    captured = getSustainableTank(RifterFit, True)
+    assert not RifterFit.capStable
+    assert captured["shieldRepair"] < RifterFit.extraAttributes["shieldRepair"]
+    assert getSustainableTank(RifterFit, False) == captured
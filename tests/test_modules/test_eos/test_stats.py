@@ -0,0 +1,153 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+from eos.utils.stats import DmgTypes, PatternEhp, ProfileDmg
+
+RESISTS = (
+    None,
+    (0, 0, 0, 0),
+    (0.5, 0.45, 0.25, 0.1),
+    (0.2, 0.3, 0.7, 0.85),
+    (0.9, 0.9, 0.9, 0.9),
+)
+PATTERNS = (
+    None,
+    (25, 25, 25, 25),
+    (0, 0, 100, 0),
+    (10, 50, 0, 40),
+    (0, 0, 0, 0),
+)
+
+
+@pytest.fixture(params=("numpy", "lists"))
+def Backend(request, monkeypatch):
+    """Runs the test with numpy arrays and with the plain list fallback"""
+    import eos.utils.stats
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(eos.utils.stats, "numpy", None)
+    return request.param
+
+
+@pytest.fixture
+def Profiles():
+    from eos.saveddata.targetResists import TargetResists
+    return [None if resists is None else TargetResists(*resists) for resists in RESISTS]
+
+
+@pytest.fixture
+def Patterns():
+    from eos.saveddata.damagePattern import DamagePattern
+    return [None if amounts is None else DamagePattern(*amounts) for amounts in PATTERNS]
+
+
+@pytest.fixture
+def DamageFit(DB, Saveddata, RifterFit):
+    from eos.saveddata.drone import Drone
+    RifterFit.character = Saveddata['Character'].getAll5()
+    for name in ("200mm AutoCannon II", "200mm AutoCannon II", "Gyrostabilizer II"):
+        mod = Saveddata['Module'](DB['db'].getItem(name))
+        mod.state = Saveddata['State'].ACTIVE if mod.item.group.name == "Projectile Weapon" else \
+            Saveddata['State'].ONLINE
+        mod.owner = RifterFit
+        RifterFit.modules.append(mod)
+    RifterFit.modules[0].charge = DB['db'].getItem("EMP S")
+    RifterFit.modules[1].charge = DB['db'].getItem("Republic Fleet Phased Plasma S")
+    drone = Drone(DB['db'].getItem("Warrior II"))
+    drone.amount = 1
+    drone.amountActive = 1
+    RifterFit.drones.append(drone)
+    RifterFit.calculateModifiedAttributes()
+    return RifterFit
+
+
+def assertDmgEqual(actual, expected):
+    for value, expectedValue in zip(actual, expected):
+        assert value == pytest.approx(expectedValue, rel=1e-12, abs=1e-12)
+
+
+def test_profileDmgMatchesPerProfileDps(Backend, Profiles, DamageFit):
+    """Damage against every profile at once has to be what per-profile getDps()/getVolley() give"""
+    from eos.utils.spoolSupport import SpoolOptions, SpoolType
+    spools = (None, SpoolOptions(SpoolType.SCALE, 0, True), SpoolOptions(SpoolType.SCALE, 1, True))
+    profileDmg = DamageFit.getDmgAgainstProfiles(Profiles, spools)
+    assert DamageFit.getBaseDmg()[1].total > 0
+
+    for profileIndex, profile in enumerate(Profiles):
+        for spoolIndex, spool in enumerate(spools):
+            dps = DmgTypes(0, 0, 0, 0)
+            volley = DmgTypes(0, 0, 0, 0)
+            for mod in DamageFit.modules:
+                dps += mod.getDps(spoolOptions=spool, targetResists=profile)
+                volley += mod.getVolley(spoolOptions=spool, targetResists=profile)
+            for drone in DamageFit.drones:
+                dps += drone.getDps(targetResists=profile)
+                volley += drone.getVolley(targetResists=profile)
+            assertDmgEqual(profileDmg.getDps(profileIndex, spoolIndex), dps)
+            assertDmgEqual(profileDmg.getVolley(profileIndex, spoolIndex), volley)
+
+
+def test_profileDmgPicksBestDpsOption(Backend, Profiles):
+    """Fighters whose DPS depends on resists get the option which is best against each profile"""
+    volley = DmgTypes(100, 0, 50, 0)
+    dps = DmgTypes(10, 20, 30, 40)
+    # Peak and steady DPS alternatives of two fighter squads
+    dpsOptions = [
+        [DmgTypes(80, 0, 0, 0), DmgTypes(0, 0, 0, 70)],
+        [DmgTypes(0, 30, 30, 0), DmgTypes(5, 5, 5, 5), DmgTypes(0, 0, 0, 50)]]
+    profileDmg = ProfileDmg(Profiles, (None,), [(volley, dps, dpsOptions)])
+
+    for profileIndex, profile in enumerate(Profiles):
+        def apply(dmg):
+            return DmgTypes(*(value * (1 - getattr(profile, attr, 0))
+                              for value, attr in zip(dmg, ProfileDmg.resistAttrs)))
+
+        expected = apply(dps)
+        for options in dpsOptions:
+            expected += max((apply(option) for option in options), key=lambda d: d.total)
+        assertDmgEqual(profileDmg.getDps(profileIndex), expected)
+        assertDmgEqual(profileDmg.getVolley(profileIndex), apply(volley))
+
+
+def test_fitStatsAfterCargoChange(DB, DamageFit):
+    """Cargo changes don't recalculate the fit, dropping stats has to be enough"""
+    from eos.saveddata.cargo import Cargo
+    stats = DamageFit.getStats()
+    assert DamageFit.getStats() is stats
+    cargo = Cargo(DB['db'].getItem("EMP S"))
+    cargo.amount = 100
+    DamageFit.cargo.append(cargo)
+    DamageFit.dropStats()
+    assert DamageFit.getStats().cargoBayUsed == pytest.approx(stats.cargoBayUsed + 100 * cargo.item.volume)
+
+
+def test_patternEhpMatchesCalculateEhp(Backend, Patterns, DamageFit):
+    """EHP against every pattern at once has to be what per-pattern calculateEhp() gives"""
+    from eos.saveddata.damagePattern import DamagePattern
+    patternEhp = DamageFit.getEhpAgainstPatterns(Patterns)
+    tank = DamageFit.tank
+    assert tank
+
+    for patternIndex, pattern in enumerate(Patterns):
+        if pattern is None:
+            expectedEhp = DamageFit.hp
+            expectedTank = {field: amount for field, amount in tank.items() if field in DamagePattern.TANK_FIELD_TYPES}
+        else:
+            expectedEhp = pattern.calculateEhp(DamageFit)
+            expectedTank = pattern.calculateEffectiveTank(DamageFit, tank)
+        ehp = patternEhp.getEhp(patternIndex)
+        assert set(ehp) == set(expectedEhp)
+        for tankType, amount in expectedEhp.items():
+            assert ehp[tankType] == pytest.approx(amount, rel=1e-12)
+        effectiveTank = patternEhp.getEffectiveTank(patternIndex, tank)
+        assert set(effectiveTank) == set(expectedTank)
+        for field, amount in expectedTank.items():
+            assert effectiveTank[field] == pytest.approx(amount, rel=1e-12)
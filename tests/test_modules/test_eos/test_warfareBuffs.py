@@ -0,0 +1,336 @@
+# Add root folder to python paths
+# This must be done on every test in order to pass in Travis
+import os
+import sys
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+import pytest
+
+from eos.effectHandlerHelpers import IndexedFilter
+from eos.warfareBuffs import MODULE_GROUP, MODULE_SKILL, WARFARE_BUFFS, applyBuff
+
+
+def runOldBuff(fit, warfareBuffID, value):
+    # Fit.__runCommandBoosts() if-chain which the buff registry replaced
+    if warfareBuffID == 10:  # Shield Burst: Shield Harmonizing: Shield Resistance
+        for damageType in ("Em", "Explosive", "Thermal", "Kinetic"):
+            fit.ship.boostItemAttr("shield%sDamageResonance" % damageType, value, stackingPenalties=True)
+
+    if warfareBuffID == 11:  # Shield Burst: Active Shielding: Repair Duration/Capacitor
+        fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill("Shield Operation") or mod.item.requiresSkill(
+                        "Shield Emission Systems"), "capacitorNeed", value)
+        fit.modules.filteredItemBoost(
+                lambda mod: mod.item.requiresSkill("Shield Operation") or mod.item.requiresSkill(
+                        "Shield Emission Systems"), "duration", value)
+
+    if warfareBuffID == 12:  # Shield Burst: Shield Extension: Shield HP
+        fit.ship.boostItemAttr("shieldCapacity", value, stackingPenalties=True)
+
+    if warfareBuffID == 13:  # Armor Burst: Armor Energizing: Armor Resistance
+        for damageType in ("Em", "Thermal", "Explosive", "Kinetic"):
+            fit.ship.boostItemAttr("armor%sDamageResonance" % damageType, value, stackingPenalties=True)
+
+    if warfareBuffID == 14:  # Armor Burst: Rapid Repair: Repair Duration/Capacitor
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
+                                                   mod.item.requiresSkill("Repair Systems"),
+                                       "capacitorNeed", value)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems") or
+                                                   mod.item.requiresSkill("Repair Systems"),
+                                       "duration", value)
+
+    if warfareBuffID == 15:  # Armor Burst: Armor Reinforcement: Armor HP
+        fit.ship.boostItemAttr("armorHP", value, stackingPenalties=True)
+
+    if warfareBuffID == 16:  # Information Burst: Sensor Optimization: Scan Resolution
+        fit.ship.boostItemAttr("scanResolution", value, stackingPenalties=True)
+
+    if warfareBuffID == 17:  # Information Burst: Electronic Superiority: EWAR Range and Strength
+        groups = ("ECM", "Sensor Dampener", "Weapon Disruptor", "Target Painter")
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
+                                       stackingPenalties=True)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups,
+                                       "falloffEffectiveness", value, stackingPenalties=True)
+
+        for scanType in ("Magnetometric", "Radar", "Ladar", "Gravimetric"):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "ECM",
+                                           "scan%sStrengthBonus" % scanType, value,
+                                           stackingPenalties=True)
+
+        for attr in ("missileVelocityBonus", "explosionDelayBonus", "aoeVelocityBonus", "falloffBonus",
+                     "maxRangeBonus", "aoeCloudSizeBonus", "trackingSpeedBonus"):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Weapon Disruptor",
+                                           attr, value)
+
+        for attr in ("maxTargetRangeBonus", "scanResolutionBonus"):
+            fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Sensor Dampener",
+                                           attr, value)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name == "Target Painter",
+                                       "signatureRadiusBonus", value, stackingPenalties=True)
+
+    if warfareBuffID == 18:  # Information Burst: Electronic Hardening: Scan Strength
+        for scanType in ("Gravimetric", "Radar", "Ladar", "Magnetometric"):
+            fit.ship.boostItemAttr("scan%sStrength" % scanType, value, stackingPenalties=True)
+
+    if warfareBuffID == 19:  # Information Burst: Electronic Hardening: RSD/RWD Resistance
+        fit.ship.boostItemAttr("sensorDampenerResistance", value)
+        fit.ship.boostItemAttr("weaponDisruptionResistance", value)
+
+    if warfareBuffID == 20:  # Skirmish Burst: Evasive Maneuvers: Signature Radius
+        fit.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
+
+    if warfareBuffID == 21:  # Skirmish Burst: Interdiction Maneuvers: Tackle Range
+        groups = ("Stasis Web", "Warp Scrambler")
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value,
+                                       stackingPenalties=True)
+
+    if warfareBuffID == 22:  # Skirmish Burst: Rapid Deployment: AB/MWD Speed Increase
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Afterburner") or
+                                                   mod.item.requiresSkill("High Speed Maneuvering"),
+                                       "speedFactor", value, stackingPenalties=True)
+
+    if warfareBuffID == 23:  # Mining Burst: Mining Laser Field Enhancement: Mining/Survey Range
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
+                                                   mod.item.requiresSkill("Ice Harvesting") or
+                                                   mod.item.requiresSkill("Gas Cloud Harvesting"),
+                                       "maxRange", value, stackingPenalties=True)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("CPU Management"),
+                                       "surveyScanRange", value, stackingPenalties=True)
+
+    if warfareBuffID == 24:  # Mining Burst: Mining Laser Optimization: Mining Capacitor/Duration
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
+                                                   mod.item.requiresSkill("Ice Harvesting") or
+                                                   mod.item.requiresSkill("Gas Cloud Harvesting"),
+                                       "capacitorNeed", value, stackingPenalties=True)
+
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining") or
+                                                   mod.item.requiresSkill("Ice Harvesting") or
+                                                   mod.item.requiresSkill("Gas Cloud Harvesting"),
+                                       "duration", value, stackingPenalties=True)
+
+    if warfareBuffID == 25:  # Mining Burst: Mining Equipment Preservation: Crystal Volatility
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Mining"),
+                                       "crystalVolatilityChance", value, stackingPenalties=True)
+
+    if warfareBuffID == 26:  # Information Burst: Sensor Optimization: Targeting Range
+        fit.ship.boostItemAttr("maxTargetRange", value, stackingPenalties=True)
+
+    if warfareBuffID == 60:  # Skirmish Burst: Evasive Maneuvers: Agility
+        fit.ship.boostItemAttr("agility", value, stackingPenalties=True)
+
+    # Titan effects
+
+    if warfareBuffID == 39:  # Avatar Effect Generator : Capacitor Recharge bonus
+        fit.ship.boostItemAttr("rechargeRate", value, stackingPenalties=True)
+
+    if warfareBuffID == 40:  # Avatar Effect Generator : Kinetic resistance bonus
+        for attr in ("armorKineticDamageResonance", "shieldKineticDamageResonance", "kineticDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 41:  # Avatar Effect Generator : EM resistance penalty
+        for attr in ("armorEmDamageResonance", "shieldEmDamageResonance", "emDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 42:  # Erebus Effect Generator : Armor HP bonus
+        fit.ship.boostItemAttr("armorHP", value, stackingPenalties=True)
+
+    if warfareBuffID == 43:  # Erebus Effect Generator : Explosive resistance bonus
+        for attr in ("armorExplosiveDamageResonance", "shieldExplosiveDamageResonance", "explosiveDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 44:  # Erebus Effect Generator : Thermal resistance penalty
+        for attr in ("armorThermalDamageResonance", "shieldThermalDamageResonance", "thermalDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 45:  # Ragnarok Effect Generator : Signature Radius bonus
+        fit.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
+
+    if warfareBuffID == 46:  # Ragnarok Effect Generator : Thermal resistance bonus
+        for attr in ("armorThermalDamageResonance", "shieldThermalDamageResonance", "thermalDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 47:  # Ragnarok Effect Generator : Explosive resistance penaly
+        for attr in ("armorExplosiveDamageResonance", "shieldExplosiveDamageResonance", "explosiveDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 48:  # Leviathan Effect Generator : Shield HP bonus
+        fit.ship.boostItemAttr("shieldCapacity", value, stackingPenalties=True)
+
+    if warfareBuffID == 49:  # Leviathan Effect Generator : EM resistance bonus
+        for attr in ("armorEmDamageResonance", "shieldEmDamageResonance", "emDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 50:  # Leviathan Effect Generator : Kinetic resistance penalty
+        for attr in ("armorKineticDamageResonance", "shieldKineticDamageResonance", "kineticDamageResonance"):
+            fit.ship.boostItemAttr(attr, value, stackingPenalties=True)
+
+    if warfareBuffID == 51:  # Avatar Effect Generator : Velocity penalty
+        fit.ship.boostItemAttr("maxVelocity", value, stackingPenalties=True)
+
+    if warfareBuffID == 52:  # Erebus Effect Generator : Shield RR penalty
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Emission Systems"), "shieldBonus", value, stackingPenalties=True)
+
+    if warfareBuffID == 53:  # Leviathan Effect Generator : Armor RR penalty
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+                                       "armorDamageAmount", value, stackingPenalties=True)
+
+    if warfareBuffID == 54:  # Ragnarok Effect Generator : Laser and Hybrid Optimal penalty
+        groups = ("Energy Weapon", "Hybrid Weapon")
+        fit.modules.filteredItemBoost(lambda mod: mod.item.group.name in groups, "maxRange", value, stackingPenalties=True)
+
+    # Localized environment effects
+
+    if warfareBuffID == 79:  # AOE_Beacon_bioluminescence_cloud
+        fit.ship.boostItemAttr("signatureRadius", value, stackingPenalties=True)
+
+    if warfareBuffID == 80:  # AOE_Beacon_caustic_cloud_local_repair
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Repair Systems"),
+                                       "armorDamageAmount", value, stackingPenalties=True)
+
+    if warfareBuffID == 81:  # AOE_Beacon_caustic_cloud_remote_repair
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Remote Armor Repair Systems"),
+                                       "armorDamageAmount", value, stackingPenalties=True)
+
+    if warfareBuffID == 88:  # AOE_Beacon_filament_cloud_shield_booster_shield_bonus
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+                                       "shieldBonus", value, stackingPenalties=True)
+
+    if warfareBuffID == 89:  # AOE_Beacon_filament_cloud_shield_booster_duration
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Shield Operation"),
+                                       "duration", value, stackingPenalties=True)
+
+    # Abyssal Weather Effects
+
+    if warfareBuffID == 90:  # Weather_electric_storm_EM_resistance_penalty
+        for tankType in ("shield", "armor"):
+            fit.ship.boostItemAttr("{}EmDamageResonance".format(tankType), value)
+        fit.ship.boostItemAttr("emDamageResonance", value)  # for hull
+
+    if warfareBuffID == 92:  # Weather_electric_storm_capacitor_recharge_bonus
+        fit.ship.boostItemAttr("rechargeRate", value, stackingPenalties=True)
+
+    if warfareBuffID == 93:  # Weather_xenon_gas_explosive_resistance_penalty
+        for tankType in ("shield", "armor"):
+            fit.ship.boostItemAttr("{}ExplosiveDamageResonance".format(tankType), value)
+        fit.ship.boostItemAttr("explosiveDamageResonance", value)  # for hull
+
+    if warfareBuffID == 94:  # Weather_xenon_gas_shield_hp_bonus
+        fit.ship.boostItemAttr("shieldCapacity", value)  # for hull
+
+    if warfareBuffID == 95:  # Weather_infernal_thermal_resistance_penalty
+        for tankType in ("shield", "armor"):
+            fit.ship.boostItemAttr("{}ThermalDamageResonance".format(tankType), value)
+        fit.ship.boostItemAttr("thermalDamageResonance", value)  # for hull
+
+    if warfareBuffID == 96:  # Weather_infernal_armor_hp_bonus
+        fit.ship.boostItemAttr("armorHP", value)  # for hull
+
+    if warfareBuffID == 97:  # Weather_darkness_turret_range_penalty
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+                                       "maxRange", value, stackingPenalties=True)
+        fit.modules.filteredItemBoost(lambda mod: mod.item.requiresSkill("Gunnery"),
+                                       "falloff", value, stackingPenalties=True)
+
+    if warfareBuffID == 98:  # Weather_darkness_velocity_bonus
+        fit.ship.boostItemAttr("maxVelocity", value)
+
+    if warfareBuffID == 99:  # Weather_caustic_toxin_kinetic_resistance_penalty
+        for tankType in ("shield", "armor"):
+            fit.ship.boostItemAttr("{}KineticDamageResonance".format(tankType), value)
+        fit.ship.boostItemAttr("kineticDamageResonance", value)  # for hull
+
+    if warfareBuffID == 100:  # Weather_caustic_toxin_scan_resolution_bonus
+        fit.ship.boostItemAttr("scanResolution", value, stackingPenalties=True)
+
+
+class FakeItem(object):
+    def __init__(self, skill=None, group=None):
+        self.skills = (skill,) if skill else ()
+        self.group = type("FakeGroup", (object,), {"name": group})()
+        self.asked = set()
+
+    def requiresSkill(self, skill):
+        self.asked.add(skill)
+        return skill in self.skills
+
+
+class FakeModule(object):
+    def __init__(self, skill=None, group=None):
+        self.item = FakeItem(skill, group)
+        self.name = skill or group or "other"
+
+
+class RecordingShip(object):
+    def __init__(self, calls):
+        self.calls = calls
+
+    def __getattr__(self, method):
+        def record(attr, value, **kwargs):
+            self.calls.append(("ship", method, attr, value, sorted(kwargs.items())))
+        return record
+
+
+class RecordingModules(list):
+    def __init__(self, calls, modules):
+        list.__init__(self, modules)
+        self.calls = calls
+
+    def __getattr__(self, method):
+        def record(filter, attr, value, **kwargs):
+            matched = sorted(mod.name for mod in self if filter(mod))
+            self.calls.append(("modules", method, tuple(matched), attr, value, sorted(kwargs.items())))
+        return record
+
+
+class RecordingFit(object):
+    def __init__(self, modules):
+        self.calls = []
+        self.ship = RecordingShip(self.calls)
+        self.modules = RecordingModules(self.calls, modules)
+
+
+@pytest.fixture
+def FakeFilterKeys(monkeypatch):
+    # Resolve indexed filters against fake modules instead of the database
+    monkeypatch.setitem(IndexedFilter.INDEX_KEYS, "itemSkill", lambda mod: mod.item.skills)
+    monkeypatch.setitem(IndexedFilter.INDEX_KEYS, "itemGroup", lambda mod: (mod.item.group.name,))
+
+
+def getModules(skills, groups):
+    return [FakeModule(skill=s) for s in sorted(skills)] + [FakeModule(group=g) for g in sorted(groups)] + \
+        [FakeModule()]
+
+
+def test_registryMatchesOldChain(FakeFilterKeys):
+    """Every buff ID known to the old if-chain does exactly the same thing through the registry"""
+    skills = set()
+    groups = set()
+    for modifiers in WARFARE_BUFFS.values():
+        for modifier in modifiers:
+            if modifier.target[0] == MODULE_SKILL:
+                skills.update(modifier.target[1])
+            elif modifier.target[0] == MODULE_GROUP:
+                groups.update(modifier.target[1])
+    # Skills asked by the old filters have to be known even if the registry lacks them
+    probe = RecordingFit(getModules(skills, groups))
+    for warfareBuffID in range(1, 200):
+        runOldBuff(probe, warfareBuffID, 10)
+    for mod in probe.modules:
+        skills.update(mod.item.asked)
+
+    oldIDs = set()
+    for warfareBuffID in range(1, 200):
+        for value in (10, -15.5):
+            old = RecordingFit(getModules(skills, groups))
+            runOldBuff(old, warfareBuffID, value)
+            new = RecordingFit(getModules(skills, groups))
+            known = applyBuff(new, warfareBuffID, value)
+            assert known == bool(old.calls), warfareBuffID
+            assert sorted(new.calls) == sorted(old.calls), warfareBuffID
+            if old.calls:
+                oldIDs.add(warfareBuffID)
+    assert oldIDs == set(WARFARE_BUFFS)
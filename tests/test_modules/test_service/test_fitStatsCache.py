@@ -0,0 +1,34 @@
+# Add root folder to python paths
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.realpath(os.path.join(script_dir, '..', '..', '..')))
+
+# noinspection PyPackageRequirements
+from service.fitStatsCache import FitStatsCache
+
+
+def test_staleStatsOfChangedFit(DB, Saveddata, RifterFit):
+    """Stored stats of a loaded fit changed without recalculation are not valid anymore"""
+    from eos.const import ImplantLocation
+    from eos.saveddata.cargo import Cargo
+
+    RifterFit.implantLocation = ImplantLocation.FIT
+    RifterFit.character = Saveddata['Character'].getAll5()
+    DB['db'].save(RifterFit)
+    RifterFit.calculateModifiedAttributes()
+
+    cache = FitStatsCache()
+    cache.store(RifterFit)
+    try:
+        assert RifterFit.ID in cache.getStats([RifterFit.ID])
+
+        cargo = Cargo(DB['db'].getItem("EMP S"))
+        cargo.amount = 100
+        RifterFit.cargo.append(cargo)
+        DB['db'].commit()
+        assert RifterFit.ID not in cache.getStats([RifterFit.ID])
+    finally:
+        cache.clear()
+        DB['db'].remove(RifterFit)
@@ -0,0 +1,13 @@
+def callAfter(callback, *args, **kwargs):
+    """
+    Run callback on the GUI thread via wx.CallAfter when there is a wx application; without it
+    (headless use, e.g. batch calculations), callback is called right away.
+    """
+    try:
+        import wx
+    except ImportError:
+        wx = None
+    if wx is not None and wx.GetApp() is not None:
+        wx.CallAfter(callback, *args, **kwargs)
+    else:
+        callback(*args, **kwargs)